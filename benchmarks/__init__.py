@@ -0,0 +1,18 @@
+"""Offline benchmarks for SOSenki.
+
+Runnable modules (``python -m benchmarks.<name>``):
+    llm_bench       Drive OllamaService.chat against a fake Ollama server
+    service_bench   Time services and Mini App endpoints on synthetic communities
+
+``benchmarks.synthetic`` generates those communities at a configurable scale.
+
+Benchmarks build their own engines for the database they measure.
+``src.services`` still creates the shared engines from DATABASE_URL at import
+time, so an in-memory URL is used when none is configured. Mini App requests
+are signed with TELEGRAM_BOT_TOKEN, which gets a placeholder when unset.
+"""
+
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("TELEGRAM_BOT_TOKEN", "benchmark-token")
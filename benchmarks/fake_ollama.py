@@ -0,0 +1,253 @@
+"""Deterministic stand-in for the Ollama HTTP API.
+
+Serves ``POST /api/chat`` (streamed and non-streamed) by replaying scripted
+conversations, so the tool-calling loop of OllamaService can be measured
+without a model:
+
+- A Script is chosen by the first keyword found in the user's question; its
+  turns are replayed in order, the turn index being the number of assistant
+  messages already in the request.
+- A turn either requests tool calls or answers with text; answers are
+  streamed word by word.
+- Latency is configurable (time to first token, time per streamed token), and
+  ``parallel`` limits requests generated at once like OLLAMA_NUM_PARALLEL.
+
+Usage:
+    async with FakeOllamaServer(latency=Latency(first_token=0.2)) as server:
+        service = OllamaService(session, user_id, host=server.url)
+"""
+
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+@dataclass(frozen=True)
+class ScriptedTurn:
+    """One model response: tool calls (name, arguments) or a text answer."""
+
+    content: str = ""
+    tool_calls: tuple[tuple[str, dict[str, Any]], ...] = ()
+
+
+@dataclass(frozen=True)
+class Script:
+    """Conversation replayed for questions containing ``keyword`` ("" matches all)."""
+
+    keyword: str
+    turns: tuple[ScriptedTurn, ...]
+
+
+DEFAULT_SCRIPTS: tuple[Script, ...] = (
+    Script(
+        "overview",
+        (
+            ScriptedTurn(
+                tool_calls=(
+                    ("get_balance", {}),
+                    ("list_bills", {"limit": 5}),
+                    ("get_period_info", {"period_id": 1}),
+                )
+            ),
+            ScriptedTurn(content="Here is your overview: balance, recent bills and the period."),
+        ),
+    ),
+    Script(
+        "balance",
+        (
+            ScriptedTurn(tool_calls=(("get_balance", {}),)),
+            ScriptedTurn(content="Your current balance is shown above in your account."),
+        ),
+    ),
+    Script(
+        "bills",
+        (
+            ScriptedTurn(tool_calls=(("list_bills", {"limit": 10}),)),
+            ScriptedTurn(content="These are your most recent bills for the current period."),
+        ),
+    ),
+    Script(
+        "period",
+        (
+            ScriptedTurn(tool_calls=(("get_period_info", {"period_id": 1}),)),
+            ScriptedTurn(content="The service period is open and runs for twelve months."),
+        ),
+    ),
+    Script("", (ScriptedTurn(content="I can help with balances, bills and service periods."),)),
+)
+
+DEFAULT_QUESTIONS: tuple[str, ...] = (
+    "What is my balance?",
+    "Show me my recent bills",
+    "Tell me about service period 1",
+    "Give me an overview of my account",
+    "Hello",
+)
+
+
+@dataclass(frozen=True)
+class Latency:
+    """Simulated generation time in seconds."""
+
+    first_token: float = 0.2
+    per_token: float = 0.02
+
+
+@dataclass
+class FakeOllamaStats:
+    requests: int = 0
+    streamed: int = 0
+    tool_turns: int = 0
+    max_in_flight: int = 0
+
+
+@dataclass
+class FakeOllama:
+    """Replays scripts for chat requests (the ASGI app is built by ``create_app``)."""
+
+    scripts: tuple[Script, ...] = DEFAULT_SCRIPTS
+    latency: Latency = field(default_factory=Latency)
+    parallel: int | None = None
+    stats: FakeOllamaStats = field(default_factory=FakeOllamaStats)
+
+    def __post_init__(self):
+        self._slots = asyncio.Semaphore(self.parallel) if self.parallel else None
+        self._in_flight = 0
+
+    def select_turn(self, messages: list[dict[str, Any]]) -> ScriptedTurn:
+        question = next(
+            (m.get("content") or "" for m in messages if m.get("role") == "user"), ""
+        ).lower()
+        script = next((s for s in self.scripts if s.keyword in question), self.scripts[-1])
+        index = sum(1 for m in messages if m.get("role") == "assistant")
+        return script.turns[min(index, len(script.turns) - 1)]
+
+    def create_app(self) -> FastAPI:
+        app = FastAPI()
+
+        @app.post("/api/chat")
+        async def chat(request: Request):
+            body = await request.json()
+            turn = self.select_turn(body.get("messages") or [])
+            model = body.get("model", "fake")
+            self.stats.requests += 1
+            if turn.tool_calls:
+                self.stats.tool_turns += 1
+            if body.get("stream", True):
+                self.stats.streamed += 1
+                return StreamingResponse(
+                    self._stream(model, turn), media_type="application/x-ndjson"
+                )
+            async with self._generating():
+                await asyncio.sleep(
+                    self.latency.first_token
+                    + self.latency.per_token * max(len(turn.content.split()) - 1, 0)
+                )
+            return JSONResponse(_chunk(model, turn.content, turn.tool_calls, done=True))
+
+        return app
+
+    async def _stream(self, model: str, turn: ScriptedTurn) -> AsyncIterator[bytes]:
+        async with self._generating():
+            await asyncio.sleep(self.latency.first_token)
+            if turn.tool_calls:
+                yield _line(_chunk(model, "", turn.tool_calls, done=False))
+            words = turn.content.split(" ") if turn.content else []
+            for index, word in enumerate(words):
+                if index:
+                    await asyncio.sleep(self.latency.per_token)
+                yield _line(_chunk(model, word if index == 0 else " " + word, (), done=False))
+        yield _line(_chunk(model, "", (), done=True))
+
+    @asynccontextmanager
+    async def _generating(self) -> AsyncIterator[None]:
+        """Hold one of the ``parallel`` generation slots (if limited)."""
+        if self._slots is not None:
+            await self._slots.acquire()
+        self._in_flight += 1
+        self.stats.max_in_flight = max(self.stats.max_in_flight, self._in_flight)
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            if self._slots is not None:
+                self._slots.release()
+
+
+def _chunk(
+    model: str, content: str, tool_calls: tuple[tuple[str, dict[str, Any]], ...], done: bool
+) -> dict[str, Any]:
+    message: dict[str, Any] = {"role": "assistant", "content": content}
+    if tool_calls:
+        message["tool_calls"] = [
+            {"function": {"name": name, "arguments": arguments}} for name, arguments in tool_calls
+        ]
+    chunk: dict[str, Any] = {
+        "model": model,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "message": message,
+        "done": done,
+    }
+    if done:
+        chunk["done_reason"] = "stop"
+    return chunk
+
+
+def _line(chunk: dict[str, Any]) -> bytes:
+    return (json.dumps(chunk) + "\n").encode()
+
+
+class FakeOllamaServer:
+    """Run a FakeOllama on a free localhost port for the duration of ``async with``."""
+
+    def __init__(
+        self,
+        scripts: tuple[Script, ...] = DEFAULT_SCRIPTS,
+        latency: Latency | None = None,
+        parallel: int | None = None,
+    ):
+        self.fake = FakeOllama(scripts=scripts, latency=latency or Latency(), parallel=parallel)
+        self.url = ""
+        self._server: uvicorn.Server | None = None
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "FakeOllamaServer":
+        config = uvicorn.Config(
+            self.fake.create_app(),
+            host="127.0.0.1",
+            port=0,
+            log_level="warning",
+            lifespan="off",
+        )
+        self._server = uvicorn.Server(config)
+        self._task = asyncio.create_task(self._server.serve())
+        while not self._server.started:
+            if self._task.done():
+                self._task.result()
+            await asyncio.sleep(0.01)
+        port = self._server.servers[0].sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self._server.should_exit = True
+        await self._task
+
+
+__all__ = [
+    "DEFAULT_QUESTIONS",
+    "DEFAULT_SCRIPTS",
+    "FakeOllama",
+    "FakeOllamaServer",
+    "FakeOllamaStats",
+    "Latency",
+    "Script",
+    "ScriptedTurn",
+]
@@ -0,0 +1,263 @@
+"""Benchmark the /ask tool-calling loop offline.
+
+Drives ``OllamaService.chat`` against FakeOllamaServer and a seeded SQLite
+database at several concurrency levels, and reports per level:
+
+- latency p50/p95/max per question (including admission-queue wait)
+- throughput (questions per second)
+- tool calls and SQL statements per question
+
+Without ``--database-url`` a synthetic community (``benchmarks.synthetic``)
+is built in a temporary SQLite file.
+
+Usage:
+    python -m benchmarks.llm_bench
+    python -m benchmarks.llm_bench --concurrency 1 4 16 --questions 48 --parallel 2
+    python -m benchmarks.llm_bench --stream --json results.json
+    make bench-llm  (via Makefile)
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from benchmarks.fake_ollama import DEFAULT_QUESTIONS, FakeOllamaServer, Latency
+from benchmarks.synthetic import Scale, build_community
+from src.models.user import User
+from src.services.database import create_async_engines
+from src.services.llm_pool import OLLAMA_MAX_CONCURRENCY, LLMAdmissionQueue
+from src.services.llm_service import OllamaService
+from src.services.query_stats import install_query_instrumentation, track_queries
+
+logger = logging.getLogger("sosenki.bench.llm")
+
+
+@dataclass(frozen=True)
+class QuestionResult:
+    """Measurements of one answered question."""
+
+    question: str
+    latency: float
+    tool_calls: int
+    queries: int
+
+
+@dataclass(frozen=True)
+class LevelReport:
+    """Aggregated measurements of one concurrency level."""
+
+    concurrency: int
+    questions: int
+    wall_seconds: float
+    throughput: float
+    p50: float
+    p95: float
+    max: float
+    tool_calls_per_question: float
+    queries_per_question: float
+    max_queries_per_question: int
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile (``pct`` in 0..100) of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize(concurrency: int, results: list[QuestionResult], wall: float) -> LevelReport:
+    latencies = [result.latency for result in results]
+    queries = [result.queries for result in results]
+    return LevelReport(
+        concurrency=concurrency,
+        questions=len(results),
+        wall_seconds=round(wall, 4),
+        throughput=round(len(results) / wall, 2) if wall else 0.0,
+        p50=round(percentile(latencies, 50), 4),
+        p95=round(percentile(latencies, 95), 4),
+        max=round(max(latencies), 4),
+        tool_calls_per_question=round(statistics.mean(r.tool_calls for r in results), 2),
+        queries_per_question=round(statistics.mean(queries), 2),
+        max_queries_per_question=max(queries),
+    )
+
+
+async def run_question(
+    question: str,
+    user_id: int,
+    writer: async_sessionmaker[AsyncSession],
+    reader: async_sessionmaker[AsyncSession],
+    host: str,
+    admission: LLMAdmissionQueue,
+    stream: bool,
+) -> QuestionResult:
+    """Answer one question like /ask does and measure it."""
+    tool_calls = 0
+
+    async def count_tool_calls(names: list[str]) -> None:
+        nonlocal tool_calls
+        tool_calls += len(names)
+
+    async def ignore_text(text: str) -> None:
+        return None
+
+    started = time.perf_counter()
+    with track_queries() as stats:
+        async with writer() as session:
+            service = OllamaService(
+                session=session,
+                user_id=user_id,
+                model="fake",
+                host=host,
+                read_session_factory=reader,
+                admission=admission,
+            )
+            await service.chat(
+                question,
+                on_text=ignore_text if stream else None,
+                on_tool_calls=count_tool_calls,
+            )
+    return QuestionResult(
+        question=question,
+        latency=time.perf_counter() - started,
+        tool_calls=tool_calls,
+        queries=stats.statements,
+    )
+
+
+async def run_level(
+    concurrency: int,
+    questions: int,
+    user_ids: list[int],
+    writer: async_sessionmaker[AsyncSession],
+    reader: async_sessionmaker[AsyncSession],
+    host: str,
+    slots: int = OLLAMA_MAX_CONCURRENCY,
+    stream: bool = False,
+    queue_timeout: float = 600,
+) -> LevelReport:
+    """Ask ``questions`` questions with ``concurrency`` users asking at once."""
+    admission = LLMAdmissionQueue(limit=slots, timeout=queue_timeout)
+    jobs = [
+        (DEFAULT_QUESTIONS[index % len(DEFAULT_QUESTIONS)], user_ids[index % len(user_ids)])
+        for index in range(questions)
+    ]
+    results: list[QuestionResult] = []
+
+    async def worker() -> None:
+        while jobs:
+            question, user_id = jobs.pop(0)
+            results.append(
+                await run_question(question, user_id, writer, reader, host, admission, stream)
+            )
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(concurrency, results, time.perf_counter() - started)
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Run the benchmark and print (and optionally save) the report."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # Per-request logs of the HTTP client and the tool loop would drown the report
+    for name in ("httpx", "src.services.llm_service"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        writer_engine, reader_engine = create_async_engines(database_url)
+        try:
+            if args.database_url:
+                async with writer_engine.connect() as conn:
+                    rows = await conn.execute(
+                        select(User.id).where(User.is_owner.is_(True), User.is_active.is_(True))
+                    )
+                    user_ids = list(rows.scalars())
+            else:
+                community = await build_community(
+                    writer_engine, Scale(owners=args.users, years=args.years, seed=args.seed)
+                )
+                user_ids = list(community.owner_ids)
+            if not user_ids:
+                logger.error("No owner users found in %s", database_url)
+                return 1
+
+            install_query_instrumentation()
+            writer = async_sessionmaker(writer_engine, class_=AsyncSession, expire_on_commit=False)
+            reader = async_sessionmaker(reader_engine, class_=AsyncSession, expire_on_commit=False)
+            latency = Latency(
+                first_token=args.first_token_ms / 1000, per_token=args.token_ms / 1000
+            )
+
+            reports = []
+            async with FakeOllamaServer(latency=latency, parallel=args.parallel) as server:
+                for concurrency in args.concurrency:
+                    report = await run_level(
+                        concurrency,
+                        args.questions,
+                        user_ids,
+                        writer,
+                        reader,
+                        server.url,
+                        slots=args.slots,
+                        stream=args.stream,
+                    )
+                    reports.append(report)
+                    logger.info(
+                        "concurrency=%-3d q/s=%-7.2f p50=%.3fs p95=%.3fs max=%.3fs "
+                        "tools/q=%.2f queries/q=%.2f (max %d)",
+                        report.concurrency,
+                        report.throughput,
+                        report.p50,
+                        report.p95,
+                        report.max,
+                        report.tool_calls_per_question,
+                        report.queries_per_question,
+                        report.max_queries_per_question,
+                    )
+                logger.info("fake ollama: %s", asdict(server.fake.stats))
+        finally:
+            await writer_engine.dispose()
+            await reader_engine.dispose()
+
+    if args.json:
+        Path(args.json).write_text(json.dumps([r.as_dict() for r in reports], indent=2))
+    return 0
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark OllamaService.chat offline")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--questions", type=int, default=40, help="Questions per level")
+    parser.add_argument("--users", type=int, default=50, help="Owners in the synthetic community")
+    parser.add_argument("--years", type=int, default=1, help="Service periods of history")
+    parser.add_argument("--seed", type=int, default=Scale.seed)
+    parser.add_argument("--database-url", help="Existing seeded database (default: synthetic)")
+    parser.add_argument("--first-token-ms", type=float, default=200)
+    parser.add_argument("--token-ms", type=float, default=20)
+    parser.add_argument(
+        "--parallel", type=int, default=None, help="Requests the fake model serves at once"
+    )
+    parser.add_argument(
+        "--slots", type=int, default=OLLAMA_MAX_CONCURRENCY, help="LLM admission queue slots"
+    )
+    parser.add_argument("--stream", action="store_true", help="Use the streaming chat mode")
+    parser.add_argument("--json", help="Write the reports to this file")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
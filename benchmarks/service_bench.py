@@ -0,0 +1,426 @@
+"""Benchmark the service layer and the Mini App API on synthetic communities.
+
+For every requested scale a synthetic community (``benchmarks.synthetic``) is
+generated into a temporary SQLite file, then each case is run ``--repeat``
+times on its own read session and reported with:
+
+- latency p50/p95/max per call
+- SQL statements, rows fetched and repeated statement shapes per call
+
+Cases cover BalanceCalculationService, the BillsService ``calculate_*`` and
+``distribute_shared_costs`` methods, ElectricityReadingService and every
+``/api/mini-app/*`` endpoint (called in-process with signed Telegram init
+data). Comparing the JSON output of two commits shows which cases got slower
+or started issuing more statements as the community grows.
+
+Usage:
+    python -m benchmarks.service_bench
+    python -m benchmarks.service_bench --scale small large --repeat 50
+    python -m benchmarks.service_bench --owners 500 --years 4 --json results.json
+    make bench-services  (via Makefile)
+"""
+
+import argparse
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable
+from unittest.mock import patch
+from urllib.parse import urlencode
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from benchmarks.llm_bench import percentile
+from benchmarks.synthetic import ELECTRICITY_RATE, SCALES, Community, Scale, build_community
+from src.api import mini_app
+from src.models.property import Property
+from src.models.service_period import ServicePeriod
+from src.services import get_async_read_session
+from src.services.admin_utils import invalidate_admin_cache
+from src.services.balance_service import BalanceCalculationService
+from src.services.bills_service import BillsService
+from src.services.database import create_async_engines
+from src.services.electricity_reading_service import ElectricityReadingService
+from src.services.identity_cache import invalidate_identities
+from src.services.query_stats import install_query_instrumentation, track_queries
+
+logger = logging.getLogger("sosenki.bench.services")
+
+ServiceCase = Callable[[AsyncSession, Community], Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class CaseReport:
+    """Measurements of one case at one scale."""
+
+    group: str
+    name: str
+    runs: int
+    p50: float
+    p95: float
+    max: float
+    queries: float
+    max_queries: int
+    rows: float
+    repeated_shapes: int
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class ScaleReport:
+    """All case measurements for one generated community."""
+
+    scale: Scale
+    rows: dict[str, int]
+    build_seconds: float
+    cases: list[CaseReport]
+
+    def as_dict(self) -> dict:
+        return {
+            "scale": self.scale.as_dict(),
+            "rows": self.rows,
+            "build_seconds": self.build_seconds,
+            "cases": [case.as_dict() for case in self.cases],
+        }
+
+
+# === Service cases ===
+
+
+async def _latest_period(session: AsyncSession, community: Community) -> ServicePeriod:
+    return await session.get(ServicePeriod, community.latest_period_id)
+
+
+async def _user_balance(session: AsyncSession, community: Community) -> Any:
+    return await BalanceCalculationService(session).calculate_user_balance(community.owner_ids[0])
+
+
+async def _all_owner_balances(session: AsyncSession, community: Community) -> Any:
+    service = BalanceCalculationService(session)
+    return await service.calculate_multiple_user_balances(list(community.owner_ids))
+
+
+async def _all_account_balances(session: AsyncSession, community: Community) -> Any:
+    return await BalanceCalculationService(session).calculate_account_balances()
+
+
+async def _user_bills(session: AsyncSession, community: Community) -> Any:
+    return await BalanceCalculationService(session).list_bills_for_user(community.owner_ids[0])
+
+
+async def _main_bills(session: AsyncSession, community: Community) -> Any:
+    return await BillsService(session).calculate_main_bills(Decimal("3000000"), 12)
+
+
+async def _conservation_bills(session: AsyncSession, community: Community) -> Any:
+    return await BillsService(session).calculate_conservation_bills(Decimal("300000"), 12)
+
+
+async def _personal_electricity_bills(session: AsyncSession, community: Community) -> Any:
+    period = await _latest_period(session, community)
+    return await BillsService(session).calculate_personal_electricity_bills_from_readings(
+        service_period=period, electricity_rate=ELECTRICITY_RATE
+    )
+
+
+async def _total_electricity(session: AsyncSession, community: Community) -> Any:
+    return BillsService.calculate_total_electricity(
+        Decimal(0), Decimal(100_000), Decimal(1), ELECTRICITY_RATE, Decimal("0.2")
+    )
+
+
+async def _owner_shares(session: AsyncSession, community: Community) -> Any:
+    period = await _latest_period(session, community)
+    return await BillsService(session).calculate_owner_shares(period)
+
+
+async def _shared_costs(session: AsyncSession, community: Community) -> Any:
+    period = await _latest_period(session, community)
+    return await BillsService(session).distribute_shared_costs(Decimal("150000"), period)
+
+
+async def _shared_costs_exact(session: AsyncSession, community: Community) -> Any:
+    period = await _latest_period(session, community)
+    return await BillsService(session).distribute_shared_costs(
+        Decimal("150000"), period, exact=True
+    )
+
+
+async def _properties_with_readings(session: AsyncSession, community: Community) -> Any:
+    return await ElectricityReadingService(session).get_properties_with_latest_readings()
+
+
+async def _readings_at_period_end(session: AsyncSession, community: Community) -> Any:
+    period = await _latest_period(session, community)
+    property_ids = list((await session.execute(select(Property.id))).scalars())
+    return await ElectricityReadingService(session).get_latest_readings_for_properties_at_or_before(
+        property_ids, period.end_date
+    )
+
+
+async def _latest_reading(session: AsyncSession, community: Community) -> Any:
+    return await ElectricityReadingService(session).get_latest_reading_globally()
+
+
+SERVICE_CASES: dict[str, dict[str, ServiceCase]] = {
+    "balance": {
+        "calculate_user_balance": _user_balance,
+        "calculate_multiple_user_balances": _all_owner_balances,
+        "calculate_account_balances": _all_account_balances,
+        "list_bills_for_user": _user_bills,
+    },
+    "bills": {
+        "calculate_main_bills": _main_bills,
+        "calculate_conservation_bills": _conservation_bills,
+        "calculate_personal_electricity_bills_from_readings": _personal_electricity_bills,
+        "calculate_total_electricity": _total_electricity,
+        "calculate_owner_shares": _owner_shares,
+        "distribute_shared_costs": _shared_costs,
+        "distribute_shared_costs_exact": _shared_costs_exact,
+    },
+    "electricity": {
+        "get_properties_with_latest_readings": _properties_with_readings,
+        "get_latest_readings_for_properties_at_or_before": _readings_at_period_end,
+        "get_latest_reading_globally": _latest_reading,
+    },
+}
+
+
+# === Mini App endpoint cases ===
+
+
+def sign_init_data(telegram_id: int, bot_token: str) -> str:
+    """Build Telegram WebApp init data for ``telegram_id`` signed with ``bot_token``."""
+    fields = {"auth_date": str(int(time.time())), "user": json.dumps({"id": telegram_id})}
+    data_check_string = "\n".join(f"{key}={value}" for key, value in sorted(fields.items()))
+    secret_key = hmac.new(b"WebAppData", bot_token.encode(), hashlib.sha256).digest()
+    fields["hash"] = hmac.new(secret_key, data_check_string.encode(), hashlib.sha256).hexdigest()
+    return urlencode(fields)
+
+
+def endpoint_cases(community: Community) -> dict[str, tuple[int, str, dict[str, Any]]]:
+    """Endpoint cases: name -> (acting user ID, path, query parameters)."""
+    owner = community.owner_ids[0]
+    account = community.owner_account_ids[0]
+    return {
+        "init": (owner, "/init", {}),
+        "user-context": (community.admin_id, "/user-context", {"selected_user_id": owner}),
+        "properties": (owner, "/properties", {}),
+        "transactions": (owner, "/transactions", {"account_id": account, "scope": "personal"}),
+        "transactions_all_page": (
+            owner,
+            "/transactions",
+            {"account_id": community.organization_account_id, "scope": "all", "limit": 50},
+        ),
+        "bills": (owner, "/bills", {"account_id": account}),
+        "account": (owner, "/account", {"account_id": account}),
+        "accounts": (owner, "/accounts", {}),
+        "dashboard": (owner, "/dashboard", {"account_id": account}),
+    }
+
+
+def _reset_auth_caches() -> None:
+    # Communities of different scales reuse user and telegram IDs
+    invalidate_identities()
+    invalidate_admin_cache()
+
+
+@asynccontextmanager
+async def mini_app_client(
+    reader: async_sessionmaker[AsyncSession],
+) -> AsyncIterator[httpx.AsyncClient]:
+    """In-process client for the Mini App router reading from ``reader``."""
+    app = FastAPI()
+    app.include_router(mini_app.router)
+
+    async def read_session() -> AsyncIterator[AsyncSession]:
+        async with reader() as session:
+            yield session
+
+    app.dependency_overrides[get_async_read_session] = read_session
+    # The dashboard and NDJSON streaming open their own reader sessions
+    with patch.object(mini_app, "AsyncReadSessionLocal", reader):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            yield client
+
+
+# === Runner ===
+
+
+async def _measure(
+    group: str, name: str, call: Callable[[], Awaitable[Any]], repeat: int
+) -> CaseReport:
+    """Run ``call`` once to warm up, then ``repeat`` times measured."""
+    await call()
+    latencies: list[float] = []
+    queries: list[int] = []
+    rows: list[int] = []
+    repeated = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with track_queries() as stats:
+            await call()
+        latencies.append(time.perf_counter() - started)
+        queries.append(stats.statements)
+        rows.append(stats.rows)
+        repeated = max(repeated, len(stats.repeated()))
+    return CaseReport(
+        group=group,
+        name=name,
+        runs=repeat,
+        p50=round(percentile(latencies, 50), 5),
+        p95=round(percentile(latencies, 95), 5),
+        max=round(max(latencies), 5),
+        queries=round(statistics.mean(queries), 2),
+        max_queries=max(queries),
+        rows=round(statistics.mean(rows), 2),
+        repeated_shapes=repeated,
+    )
+
+
+async def run_service_cases(
+    reader: async_sessionmaker[AsyncSession], community: Community, repeat: int
+) -> list[CaseReport]:
+    """Measure every SERVICE_CASES entry, each call on a fresh read session."""
+    reports = []
+    for group, cases in SERVICE_CASES.items():
+        for name, case in cases.items():
+
+            async def call(case: ServiceCase = case) -> Any:
+                async with reader() as session:
+                    return await case(session, community)
+
+            reports.append(await _measure(group, name, call, repeat))
+    return reports
+
+
+async def run_endpoint_cases(
+    reader: async_sessionmaker[AsyncSession], community: Community, repeat: int
+) -> list[CaseReport]:
+    """Measure every Mini App endpoint through the ASGI app."""
+    bot_token = os.environ["TELEGRAM_BOT_TOKEN"]
+    _reset_auth_caches()
+    reports = []
+    async with mini_app_client(reader) as client:
+        for name, (user_id, path, params) in endpoint_cases(community).items():
+            headers = {
+                "Authorization": f"tma {sign_init_data(community.telegram_id(user_id), bot_token)}"
+            }
+
+            async def call(path: str = path, params: dict = params, headers: dict = headers) -> Any:
+                response = await client.post(
+                    f"/api/mini-app{path}", params=params, headers=headers, json={}
+                )
+                response.raise_for_status()
+                return response
+
+            reports.append(await _measure("mini_app", name, call, repeat))
+    return reports
+
+
+async def run_scale(scale: Scale, repeat: int, database_dir: Path) -> ScaleReport:
+    """Generate a community of ``scale`` and measure all cases on it."""
+    database_url = f"sqlite:///{database_dir / f'community-{scale.owners}-{scale.years}.db'}"
+    writer_engine, reader_engine = create_async_engines(database_url)
+    try:
+        started = time.perf_counter()
+        community = await build_community(writer_engine, scale)
+        build_seconds = round(time.perf_counter() - started, 3)
+
+        reader = async_sessionmaker(reader_engine, class_=AsyncSession, expire_on_commit=False)
+        cases = await run_service_cases(reader, community, repeat)
+        cases += await run_endpoint_cases(reader, community, repeat)
+    finally:
+        await writer_engine.dispose()
+        await reader_engine.dispose()
+    return ScaleReport(scale=scale, rows=community.rows, build_seconds=build_seconds, cases=cases)
+
+
+def _git_revision() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def _scales(args: argparse.Namespace) -> list[Scale]:
+    if args.owners:
+        return [Scale(owners=owners, years=args.years, seed=args.seed) for owners in args.owners]
+    return [Scale(**{**SCALES[name].as_dict(), "seed": args.seed}) for name in args.scale]
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Run the benchmark and print (and optionally save) the report."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # Per-request logs of the HTTP client and the endpoints would drown the report
+    for name in ("httpx", "src.api.mini_app", "src.services"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    install_query_instrumentation()
+
+    reports = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in _scales(args):
+            report = await run_scale(scale, args.repeat, Path(tmp))
+            reports.append(report)
+            logger.info(
+                "owners=%d years=%d: %d transactions, %d bills, %d readings (built in %.2fs)",
+                scale.owners,
+                scale.years,
+                report.rows["transactions"],
+                report.rows["bills"],
+                report.rows["electricity_readings"],
+                report.build_seconds,
+            )
+            for case in report.cases:
+                logger.info(
+                    "  %-11s %-50s p50=%8.2fms p95=%8.2fms queries=%-5g rows=%g",
+                    case.group,
+                    case.name,
+                    case.p50 * 1000,
+                    case.p95 * 1000,
+                    case.queries,
+                    case.rows,
+                )
+
+    if args.json:
+        result = {"revision": _git_revision(), "scales": [r.as_dict() for r in reports]}
+        Path(args.json).write_text(json.dumps(result, indent=2))
+    return 0
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark services and Mini App endpoints")
+    parser.add_argument("--scale", nargs="+", choices=sorted(SCALES), default=["small", "medium"])
+    parser.add_argument(
+        "--owners", type=int, nargs="+", help="Custom scales by owner count (overrides --scale)"
+    )
+    parser.add_argument("--years", type=int, default=2, help="Years of history for --owners")
+    parser.add_argument("--seed", type=int, default=Scale.seed)
+    parser.add_argument("--repeat", type=int, default=20, help="Measured calls per case")
+    parser.add_argument("--json", help="Write the reports to this file")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
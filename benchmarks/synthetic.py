@@ -0,0 +1,407 @@
+"""Deterministic synthetic community for benchmarks and scaling tests.
+
+``build_community(engine, scale)`` creates the schema and fills it through the
+real models with a community of the requested size:
+
+- an administrator, staff members and owners (every tenth one a stakeholder,
+  every twentieth one with a representative)
+- one to ``properties_per_owner`` main properties per owner, some flagged for
+  conservation, plus an additional (weightless) property for every third owner
+- owner, staff and organization accounts
+- one service period per year (July to July) with MAIN, CONSERVATION,
+  SHARED_ELECTRICITY and per-property ELECTRICITY bills
+- monthly owner payments, monthly staff salaries and expenses by budget item
+- monthly meter readings per property, consistent with the electricity bills
+
+The same ``Scale`` (including its seed) always produces the same rows and
+ids, so measurements are comparable between commits. Rows are written with
+bulk INSERTs; the balance ledger and latest-reading projections are then
+rebuilt with the statements the seeding pipeline uses.
+"""
+
+import random
+from dataclasses import asdict, dataclass, field, replace
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.models import Base
+from src.models.account import Account, AccountType
+from src.models.bill import Bill, BillType
+from src.models.budget_item import AllocationStrategy, BudgetItem
+from src.models.electricity_reading import ElectricityReading
+from src.models.property import Property
+from src.models.service_period import PeriodStatus, ServicePeriod
+from src.models.transaction import Transaction
+from src.models.user import User
+from src.services.balance_ledger_service import build_rebuild_statements
+from src.services.electricity_reading_service import build_latest_reading_rebuild_statements
+
+# Telegram IDs are derived from user IDs so callers can sign init data for them
+TELEGRAM_ID_BASE = 1_000_000
+FIRST_YEAR = 2020
+ELECTRICITY_RATE = Decimal("6.50")
+
+_PROPERTY_TYPES = ("Small", "Medium", "Large")
+_ADDITIONAL_TYPES = ("Cottage", "Garage", "Storage")
+_BUDGET_ITEMS = (
+    ("Security", AllocationStrategy.PROPORTIONAL),
+    ("Road maintenance", AllocationStrategy.PROPORTIONAL),
+    ("Garbage collection", AllocationStrategy.FIXED_FEE),
+    ("Shared electricity", AllocationStrategy.USAGE_BASED),
+)
+_KOPECK = Decimal("0.01")
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Size of a synthetic community."""
+
+    owners: int = 100
+    properties_per_owner: int = 2
+    years: int = 2
+    staff: int = 3
+    seed: int = 42
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+# Named scales for the CLI (``--scale small medium``)
+SCALES = {
+    "small": Scale(owners=25, years=1),
+    "medium": Scale(owners=200, years=3),
+    "large": Scale(owners=1000, years=5),
+}
+
+
+@dataclass(frozen=True)
+class Community:
+    """IDs of a generated community that benchmarks address requests to."""
+
+    scale: Scale
+    admin_id: int
+    owner_ids: tuple[int, ...]
+    owner_account_ids: tuple[int, ...]
+    organization_account_id: int
+    latest_period_id: int
+    rows: dict[str, int] = field(default_factory=dict)
+
+    @staticmethod
+    def telegram_id(user_id: int) -> int:
+        return TELEGRAM_ID_BASE + user_id
+
+
+def _money(value: float) -> Decimal:
+    return Decimal(str(value)).quantize(_KOPECK)
+
+
+class _Rows:
+    """Row dicts per model with explicit, sequential ids."""
+
+    def __init__(self) -> None:
+        self.tables: dict[type, list[dict[str, Any]]] = {}
+
+    def add(self, model: type, **values: Any) -> int:
+        rows = self.tables.setdefault(model, [])
+        row_id = len(rows) + 1
+        rows.append({"id": row_id, **values})
+        return row_id
+
+    def parameters(self, model: type) -> list[dict[str, Any]]:
+        """Rows of ``model`` with the same keys each (executemany needs uniform rows).
+
+        Keys a row leaves out get the column's scalar default, else NULL.
+        """
+        rows = self.tables.get(model, [])
+        keys = {key for row in rows for key in row}
+        defaults = {}
+        for key in keys:
+            default = model.__table__.c[key].default
+            defaults[key] = default.arg if default is not None and default.is_scalar else None
+        return [{**defaults, **row} for row in rows]
+
+
+class _Generator:
+    """Adds the rows of one community, drawing every random value from one seeded RNG."""
+
+    def __init__(self, scale: Scale):
+        self.scale = scale
+        self.rng = random.Random(scale.seed)
+        self.rows = _Rows()
+        # Reading dates: the 1st of every month from the first period start to the last end
+        self.months = [
+            date(FIRST_YEAR + (6 + offset) // 12, (6 + offset) % 12 + 1, 1)
+            for offset in range(scale.years * 12 + 1)
+        ]
+        # Main properties: (property_id, owner_id, is_conservation)
+        self.properties: list[tuple[int, int, bool]] = []
+        self.meter: dict[tuple[int, date], Decimal] = {}
+
+    def people(self) -> None:
+        rows = self.rows
+        self.admin_id = rows.add(
+            User, name="Administrator", is_administrator=True, is_staff=True, is_active=True
+        )
+        self.staff_ids = [
+            rows.add(User, name=f"Staff {index:03d}", is_staff=True, is_active=True)
+            for index in range(self.scale.staff)
+        ]
+        self.owner_ids = [
+            rows.add(
+                User,
+                name=f"Owner {index:05d}",
+                is_owner=True,
+                is_stakeholder=index % 10 == 0,
+                is_active=True,
+            )
+            for index in range(self.scale.owners)
+        ]
+        for index in range(0, self.scale.owners, 20):
+            rows.add(
+                User,
+                name=f"Representative {index:05d}",
+                is_active=True,
+                representative_id=self.owner_ids[index],
+            )
+        for user in rows.tables[User]:
+            user["telegram_id"] = TELEGRAM_ID_BASE + user["id"]
+            user["username"] = f"user{user['id']}"
+
+    def accounts(self) -> None:
+        rows = self.rows
+        self.organization_id = rows.add(
+            Account, name="Community fund", account_type=AccountType.ORGANIZATION
+        )
+        rows.add(Account, name="Reserve fund", account_type=AccountType.ORGANIZATION)
+        self.staff_accounts = [
+            rows.add(
+                Account, name=f"Staff {index:03d}", account_type=AccountType.STAFF, user_id=uid
+            )
+            for index, uid in enumerate([self.admin_id, *self.staff_ids])
+        ]
+        self.owner_accounts = {
+            owner_id: rows.add(
+                Account, name=f"Owner {index:05d}", account_type=AccountType.OWNER, user_id=owner_id
+            )
+            for index, owner_id in enumerate(self.owner_ids)
+        }
+        self.budget_items = [
+            rows.add(
+                BudgetItem,
+                expense_type=name,
+                allocation_strategy=strategy,
+                year_budget=_money(self.rng.uniform(1e5, 1e6)),
+            )
+            for name, strategy in _BUDGET_ITEMS
+        ]
+
+    def properties_and_readings(self) -> None:
+        rng, rows = self.rng, self.rows
+        for index, owner_id in enumerate(self.owner_ids):
+            main_ids = []
+            for number in range(rng.randint(1, max(1, self.scale.properties_per_owner))):
+                is_conservation = rng.random() < 0.15
+                property_id = rows.add(
+                    Property,
+                    owner_id=owner_id,
+                    property_name=f"{index + 1}{chr(ord('A') + number)}",
+                    type=rng.choice(_PROPERTY_TYPES),
+                    share_weight=_money(rng.uniform(0.2, 1.5)),
+                    is_active=True,
+                    is_ready=rng.random() < 0.8,
+                    is_for_tenant=rng.random() < 0.1,
+                    is_conservation=is_conservation,
+                    sale_price=_money(rng.uniform(1e6, 9e6)) if rng.random() < 0.05 else None,
+                )
+                main_ids.append(property_id)
+                self.properties.append((property_id, owner_id, is_conservation))
+            if index % 3 == 0:
+                rows.add(
+                    Property,
+                    owner_id=owner_id,
+                    property_name=f"{index + 1}X",
+                    type=rng.choice(_ADDITIONAL_TYPES),
+                    share_weight=None,
+                    is_active=True,
+                    is_ready=True,
+                    is_for_tenant=False,
+                    is_conservation=False,
+                    main_property_id=main_ids[0],
+                )
+
+        for property_id, owner_id, _ in self.properties:
+            value = Decimal(rng.randint(0, 5000))
+            for reading_date in self.months:
+                value += rng.randint(50, 400)
+                self.meter[(property_id, reading_date)] = value
+                rows.add(
+                    ElectricityReading,
+                    user_id=owner_id,
+                    property_id=property_id,
+                    reading_value=value,
+                    reading_date=reading_date,
+                )
+
+    def period(self, year: int) -> int:
+        """Add the service period of ``year`` (0-based) with its bills."""
+        rng, rows = self.rng, self.rows
+        start, end = self.months[year * 12], self.months[(year + 1) * 12]
+        period_id = rows.add(
+            ServicePeriod,
+            name=f"{start.year}-{end.year}",
+            start_date=start,
+            end_date=end,
+            status=PeriodStatus.OPEN if year == self.scale.years - 1 else PeriodStatus.CLOSED,
+            period_months=12,
+            year_budget=_money(rng.uniform(2e6, 5e6)),
+            conservation_year_budget=_money(rng.uniform(1e5, 5e5)),
+            electricity_start=Decimal(100_000 * year),
+            electricity_end=Decimal(100_000 * (year + 1)),
+            electricity_multiplier=Decimal(1),
+            electricity_rate=ELECTRICITY_RATE,
+            electricity_losses=Decimal("0.2"),
+        )
+        for property_id, owner_id, is_conservation in self.properties:
+            used = self.meter[(property_id, end)] - self.meter[(property_id, start)]
+            rows.add(
+                Bill,
+                service_period_id=period_id,
+                account_id=self.owner_accounts[owner_id],
+                property_id=property_id,
+                bill_type=BillType.ELECTRICITY,
+                bill_amount=(used * ELECTRICITY_RATE).quantize(_KOPECK),
+            )
+            if is_conservation:
+                rows.add(
+                    Bill,
+                    service_period_id=period_id,
+                    account_id=self.owner_accounts[owner_id],
+                    property_id=property_id,
+                    bill_type=BillType.CONSERVATION,
+                    bill_amount=_money(rng.uniform(1e3, 2e4)),
+                )
+        for account_id in self.owner_accounts.values():
+            for bill_type, low, high in (
+                (BillType.MAIN, 2e4, 8e4),
+                (BillType.SHARED_ELECTRICITY, 5e2, 5e3),
+            ):
+                rows.add(
+                    Bill,
+                    service_period_id=period_id,
+                    account_id=account_id,
+                    bill_type=bill_type,
+                    bill_amount=_money(rng.uniform(low, high)),
+                )
+        return period_id
+
+    def _day_in(self, month: date) -> date:
+        return month.replace(day=self.rng.randint(1, 28))
+
+    def transactions(self, year: int) -> None:
+        """Add the monthly payments, salaries and expenses of ``year`` (0-based)."""
+        rng, rows = self.rng, self.rows
+        for month in self.months[year * 12 : (year + 1) * 12]:
+            for account_id in self.owner_accounts.values():
+                if rng.random() < 0.9:
+                    rows.add(
+                        Transaction,
+                        from_account_id=account_id,
+                        to_account_id=self.organization_id,
+                        amount=_money(rng.uniform(2e3, 1e4)),
+                        transaction_date=self._day_in(month),
+                        description=f"Contribution {month:%Y/%m}",
+                    )
+            for account_id in self.staff_accounts:
+                rows.add(
+                    Transaction,
+                    from_account_id=self.organization_id,
+                    to_account_id=account_id,
+                    amount=_money(rng.uniform(3e4, 6e4)),
+                    transaction_date=self._day_in(month),
+                    description="Salary",
+                )
+            for budget_item_id in self.budget_items:
+                rows.add(
+                    Transaction,
+                    from_account_id=self.organization_id,
+                    to_account_id=rng.choice(self.staff_accounts),
+                    amount=_money(rng.uniform(5e3, 5e4)),
+                    transaction_date=self._day_in(month),
+                    description="Expense",
+                    budget_item_id=budget_item_id,
+                )
+
+
+def generate_rows(scale: Scale) -> tuple[_Rows, Community]:
+    """Build every row of the community in memory (no database access)."""
+    generator = _Generator(scale)
+    generator.people()
+    generator.accounts()
+    generator.properties_and_readings()
+    period_id = 0
+    for year in range(scale.years):
+        period_id = generator.period(year)
+        generator.transactions(year)
+
+    community = Community(
+        scale=scale,
+        admin_id=generator.admin_id,
+        owner_ids=tuple(generator.owner_ids),
+        owner_account_ids=tuple(generator.owner_accounts.values()),
+        organization_account_id=generator.organization_id,
+        latest_period_id=period_id,
+    )
+    return generator.rows, community
+
+
+async def build_community(engine: AsyncEngine, scale: Scale) -> Community:
+    """Create the schema on ``engine`` and insert a community of ``scale``.
+
+    The database should be empty (e.g. a fresh SQLite file).
+
+    Returns:
+        Community with the IDs benchmarks need and row counts per table
+    """
+    rows, community = generate_rows(scale)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        # Parents before children: users reference users, properties reference properties
+        for model in (
+            User,
+            Account,
+            Property,
+            BudgetItem,
+            ServicePeriod,
+            ElectricityReading,
+            Bill,
+            Transaction,
+        ):
+            table_rows = rows.parameters(model)
+            if table_rows:
+                await conn.execute(insert(model), table_rows)
+        for statement in [*build_rebuild_statements(), *build_latest_reading_rebuild_statements()]:
+            await conn.execute(statement)
+
+        counts = {}
+        for table in Base.metadata.sorted_tables:
+            counts[table.name] = (
+                await conn.execute(select(func.count()).select_from(table))
+            ).scalar_one()
+
+    return replace(community, rows=counts)
+
+
+__all__ = [
+    "Community",
+    "ELECTRICITY_RATE",
+    "SCALES",
+    "Scale",
+    "TELEGRAM_ID_BASE",
+    "build_community",
+    "generate_rows",
+]
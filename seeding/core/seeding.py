@@ -751,11 +751,31 @@ class SeededService:
             except Exception as e:
                 self.logger.error(f"Failed to process bills: {e}")
 
-            # Step 12: Commit transaction and get actual counts
+            # Step 12: Rebuild materialized projections (seeding bypasses the service layer)
+            from src.services.balance_ledger_service import build_rebuild_statements
+
+            for stmt in build_rebuild_statements():
+                self.session.execute(stmt)
+            self.logger.info("✓ Rebuilt account balance ledger")
+
+            from src.services.electricity_reading_service import (
+                build_latest_reading_rebuild_statements,
+            )
+
+            for stmt in build_latest_reading_rebuild_statements():
+                self.session.execute(stmt)
+            self.logger.info("✓ Rebuilt latest electricity readings")
+
+            # Step 13: Commit transaction and get actual counts
             try:
                 self.session.commit()
                 self.logger.info("✓ Seed committed successfully")
 
+                # Users and accounts were replaced; drop cached Mini App identities
+                from src.services.identity_cache import invalidate_identities
+
+                invalidate_identities()
+
                 # Query actual counts from database
                 from sqlalchemy import func
 
@@ -7,55 +7,20 @@ from datetime import date
 from typing import Any
 
 from fastmcp import FastMCP
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from fastmcp.server.middleware import Middleware
 
+from src.services import AsyncSessionLocal, async_engine, dispose_engines
 from src.services.balance_service import BalanceCalculationService
 from src.services.locale_service import CURRENCY, format_local_datetime
+from src.services.metrics import MCP_TOOL_SECONDS
 from src.services.period_service import AsyncServicePeriodService
+from src.services.query_stats import query_budget
 from src.services.transaction_service import TransactionService
 from src.utils.parsers import parse_date
 
 logger = logging.getLogger(__name__)
 
 
-# ============================================================================
-# Database Engine Setup
-# ============================================================================
-
-
-async def _get_database_engine():
-    """Create async database engine for MCP operations."""
-    import os
-    from pathlib import Path
-
-    from sqlalchemy.pool import NullPool
-
-    database_url = os.getenv("DATABASE_URL", "sqlite:///sosenki.dev.db")
-
-    # Convert relative paths to absolute paths for SQLite
-    if database_url.startswith("sqlite:///"):
-        # Extract the path part
-        db_path = database_url.replace("sqlite:///", "")
-        # If relative, resolve from project root
-        if not db_path.startswith("/"):
-            project_root = Path(__file__).parent.parent.parent  # src/api/mcp_server.py -> root
-            db_path = str(project_root / db_path)
-        # Ensure parent directory exists
-        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-        database_url = f"sqlite+aiosqlite:///{db_path}"
-    elif database_url.startswith("sqlite://"):
-        database_url = database_url.replace("sqlite://", "sqlite+aiosqlite:///")
-
-    engine = create_async_engine(
-        database_url,
-        echo=False,
-        poolclass=NullPool,  # Disable connection pooling for simplicity
-    )
-
-    return engine
-
-
 # ============================================================================
 # MCP Lifespan Context Manager
 # ============================================================================
@@ -78,35 +43,42 @@ async def mcp_lifespan(_app: Any = None):
 
     logger.info("MCP lifespan starting...")
 
-    # Setup
-    try:
-        _engine = await _get_database_engine()
-        _session_maker = sessionmaker(_engine, class_=AsyncSession, expire_on_commit=False)
-        logger.info("✓ MCP database engine initialized")
-    except Exception as e:
-        logger.error(f"Failed to initialize MCP database: {e}", exc_info=True)
-        raise
+    # Setup: reuse the process-wide engine shared with the bot and Mini App
+    # (one writer connection plus a reader pool) instead of a private engine
+    _engine = async_engine
+    _session_maker = AsyncSessionLocal
+    logger.info("✓ MCP using shared database engine")
 
     try:
         yield
     finally:
-        # Cleanup
+        # Cleanup: this lifespan is the application's, so release pooled connections
         try:
-            if _engine:
-                await _engine.dispose()
-                logger.info("✓ MCP database engine disposed")
+            await dispose_engines()
+            logger.info("✓ Shared database engines disposed")
         except Exception as e:
-            logger.error(f"Error disposing MCP database engine: {e}", exc_info=True)
+            logger.error(f"Error disposing database engines: {e}", exc_info=True)
 
 
 # ============================================================================
 # FastMCP Server with Tools
 # ============================================================================
 
+
+class ToolMetricsMiddleware(Middleware):
+    """Observe each tool call's latency on /metrics."""
+
+    async def on_call_tool(self, context, call_next):
+        with MCP_TOOL_SECONDS.time(context.message.name):
+            return await call_next(context)
+
+
 mcp = FastMCP("SOSenki", lifespan=mcp_lifespan)
+mcp.add_middleware(ToolMetricsMiddleware())
 
 
 @mcp.tool
+@query_budget(3)
 async def get_balance(user_id: int) -> str:
     """Get current account balance for a user.
 
@@ -156,6 +128,7 @@ async def get_balance(user_id: int) -> str:
 
 
 @mcp.tool
+@query_budget(3)
 async def list_bills(user_id: int, limit: int = 10) -> str:
     """List recent bills for a user.
 
@@ -209,6 +182,7 @@ async def list_bills(user_id: int, limit: int = 10) -> str:
 
 
 @mcp.tool
+@query_budget(1)
 async def get_period_info(period_id: int) -> str:
     """Get service period information.
 
@@ -249,6 +223,7 @@ async def get_period_info(period_id: int) -> str:
 
 
 @mcp.tool
+@query_budget(3)
 async def create_service_period(
     name: str,
     start_date: str,
@@ -285,7 +260,7 @@ async def create_service_period(
     try:
         async with _session_maker() as session:
             service = AsyncServicePeriodService(session)
-            new_period = await service.create_period(start, end, name)
+            new_period = await service.create_period_until(start, end, name=name)
 
             return json.dumps(
                 {
@@ -333,6 +308,7 @@ def _parse_tool_transaction_date(value: str | None) -> date | None:
 
 
 @mcp.tool
+@query_budget(5)
 async def create_transaction(
     from_account_id: int,
     to_account_id: int,
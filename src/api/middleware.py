@@ -0,0 +1,110 @@
+"""ASGI middleware shared by the FastAPI app."""
+
+import logging
+import re
+import time
+import uuid
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.services.logging import log_context
+from src.services.metrics import HTTP_REQUEST_SECONDS
+from src.services.query_stats import track_queries
+
+logger = logging.getLogger(__name__)
+
+# Response header with the request's SQL statistics (only when DEBUG logging is on)
+QUERY_STATS_HEADER = "X-Query-Stats"
+# Request ID taken from the client (if well-formed) or generated, echoed in the response
+REQUEST_ID_HEADER = "X-Request-ID"
+
+_VALID_REQUEST_ID = re.compile(r"[A-Za-z0-9._-]{1,64}")
+
+
+class RequestContextMiddleware:
+    """Bind a request ID to every log record of the request (see log_context)."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = MutableHeaders(scope=scope).get(REQUEST_ID_HEADER, "")
+        if not _VALID_REQUEST_ID.fullmatch(request_id):
+            request_id = uuid.uuid4().hex[:16]
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(REQUEST_ID_HEADER, request_id)
+            await send(message)
+
+        with log_context(request_id=request_id):
+            await self.app(scope, receive, send_with_request_id)
+
+
+class QueryStatsMiddleware:
+    """Collect SQL statistics per HTTP request (see src.services.query_stats).
+
+    With DEBUG logging the statistics are logged and returned in the
+    ``X-Query-Stats`` header. The header is sent before a streamed body, so it
+    covers the statements run until the response started.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        label = f"{scope['method']} {scope['path']}"
+        debug = logger.isEnabledFor(logging.DEBUG)
+        with track_queries(label) as stats:
+
+            async def send_with_stats(message: Message) -> None:
+                if debug and message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).append(QUERY_STATS_HEADER, stats.summary())
+                await send(message)
+
+            await self.app(scope, receive, send_with_stats)
+
+        if debug:
+            logger.debug("http %s: %s", label, stats.summary())
+
+
+class RequestMetricsMiddleware:
+    """Observe HTTP request latency per route template on ``/metrics``.
+
+    The route is only known after routing, so it is read from the scope once
+    the request finished; unmatched paths (404s) are not recorded.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            route = getattr(scope.get("route"), "path", None)
+            if route is not None:
+                HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started, scope["method"], route)
+
+
+__all__ = [
+    "QUERY_STATS_HEADER",
+    "REQUEST_ID_HEADER",
+    "QueryStatsMiddleware",
+    "RequestContextMiddleware",
+    "RequestMetricsMiddleware",
+]
@@ -1,19 +1,25 @@
 """Mini App API endpoints."""
 
+import asyncio
+import base64
+import json
 import logging
 import os
 import time
-from typing import Any
+from datetime import date
+from typing import Any, AsyncIterator, Awaitable, Callable, TypeVar
 
 from fastapi import APIRouter, Body, Depends, Header, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import select
+from sqlalchemy import CTE, ColumnElement, Select, and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from src.models.account import Account
 from src.models.transaction import Transaction
 from src.models.user import User
-from src.services import get_async_session
+from src.services import AsyncReadSessionLocal, get_async_read_session
 from src.services.auth_service import (
     _extract_init_data,
     authorize_account_access,
@@ -22,15 +28,23 @@ from src.services.auth_service import (
     get_authenticated_user,
     verify_telegram_auth,
 )
+from src.services.query_stats import current_query_stats, query_budget
 from src.services.user_service import UserService, UserStatusService
 
 logger = logging.getLogger(__name__)
 
+_ResponseT = TypeVar("_ResponseT", bound=BaseModel)
+
+# Upper bound for /transactions page size
+TRANSACTIONS_MAX_LIMIT = 500
+# Rows fetched per keyset batch when streaming NDJSON
+TRANSACTIONS_STREAM_BATCH_SIZE = 500
+
 
 def _log_debug(
     endpoint: str, start_time: float, telegram_id: int, user: Any, **kwargs: Any
 ) -> None:
-    """Log API request with timing and user context at DEBUG level.
+    """Log API request with timing, SQL statistics and user context at DEBUG level.
 
     Args:
         endpoint: Endpoint name (e.g., 'init', 'bills')
@@ -42,13 +56,22 @@ def _log_debug(
     duration_ms = int((time.time() - start_time) * 1000)
     user_id = getattr(user, "id", "?")
     extra = " ".join(f"{k}={v}" for k, v in kwargs.items())
+    stats = current_query_stats()
     logger.debug(
-        "mini_app.%s: telegram_id=%d user_id=%s %sduration_ms=%d",
+        "mini_app.%s: telegram_id=%d user_id=%s %sduration_ms=%d%s",
         endpoint,
         telegram_id,
         user_id,
         f"{extra} " if extra else "",
         duration_ms,
+        f" {stats.summary()}" if stats is not None else "",
+        extra={
+            "endpoint": endpoint,
+            "telegram_id": telegram_id,
+            "user_id": getattr(user, "id", None),
+            "duration_ms": duration_ms,
+            **kwargs,
+        },
     )
 
 
@@ -219,9 +242,10 @@ async def _build_user_context_data(
 
 
 @router.post("/init", response_model=InitResponse)
+@query_budget(2)
 async def init(
     selected_user_id: int | None = None,
-    session: AsyncSession = Depends(get_async_session),  # noqa: B008
+    session: AsyncSession = Depends(get_async_read_session),  # noqa: B008
     authorization: str | None = Header(None, alias="Authorization"),  # noqa: B008
     body: dict[str, Any] | None = Body(None),  # noqa: B008
 ) -> InitResponse:
@@ -284,9 +308,10 @@ async def init(
 
 
 @router.post("/user-context", response_model=UserContextResponse)
+@query_budget(3)
 async def get_user_context(
     selected_user_id: int,
-    session: AsyncSession = Depends(get_async_session),  # noqa: B008
+    session: AsyncSession = Depends(get_async_read_session),  # noqa: B008
     authorization: str | None = Header(None, alias="Authorization"),  # noqa: B008
     body: dict[str, Any] | None = Body(None),  # noqa: B008
 ) -> UserContextResponse:
@@ -345,10 +370,60 @@ async def get_user_context(
         raise HTTPException(status_code=500, detail="Server error") from e
 
 
+async def _build_properties_response(
+    session: AsyncSession, target_user_id: int
+) -> PropertiesResponse:
+    """Build PropertiesResponse with active properties owned by the target user.
+
+    Shared by /properties and /dashboard.
+
+    Args:
+        session: Database session
+        target_user_id: Owner whose properties are listed
+
+    Returns:
+        PropertiesResponse with list of properties and total count
+    """
+    from src.models.property import Property
+
+    stmt = (
+        select(Property)
+        .where(
+            Property.owner_id == target_user_id,
+            Property.is_active == True,  # noqa: E712
+        )
+        .order_by(Property.id)
+    )
+
+    result = await session.execute(stmt)
+    properties = result.scalars().all()
+
+    property_responses = [
+        PropertyResponse(
+            id=prop.id,
+            property_name=prop.property_name,
+            type=prop.type,
+            share_weight=str(prop.share_weight) if prop.share_weight else None,
+            is_ready=prop.is_ready,
+            is_for_tenant=prop.is_for_tenant,
+            photo_link=prop.photo_link,
+            sale_price=str(prop.sale_price) if prop.sale_price else None,
+            main_property_id=prop.main_property_id,
+        )
+        for prop in properties
+    ]
+
+    return PropertiesResponse(
+        properties=property_responses,
+        total_count=len(property_responses),
+    )
+
+
 @router.post("/properties", response_model=PropertiesResponse)
+@query_budget(2)
 async def get_properties(
     selected_user_id: int | None = None,
-    session: AsyncSession = Depends(get_async_session),  # noqa: B008
+    session: AsyncSession = Depends(get_async_read_session),  # noqa: B008
     authorization: str | None = Header(None, alias="Authorization"),  # noqa: B008
     body: dict[str, Any] | None = Body(None),  # noqa: B008
 ) -> PropertiesResponse:
@@ -384,42 +459,7 @@ async def get_properties(
             session, authenticated_user, required_role="is_owner", selected_user_id=selected_user_id
         )
 
-        # Fetch properties for target user
-        from src.models.property import Property
-
-        stmt = (
-            select(Property)
-            .where(
-                Property.owner_id == auth_context.target_user.id,
-                Property.is_active == True,  # noqa: E712
-            )
-            .order_by(Property.id)
-        )
-
-        result = await session.execute(stmt)
-        properties = result.scalars().all()
-
-        # Format response
-        property_responses = []
-        for prop in properties:
-            property_responses.append(
-                PropertyResponse(
-                    id=prop.id,
-                    property_name=prop.property_name,
-                    type=prop.type,
-                    share_weight=str(prop.share_weight) if prop.share_weight else None,
-                    is_ready=prop.is_ready,
-                    is_for_tenant=prop.is_for_tenant,
-                    photo_link=prop.photo_link,
-                    sale_price=str(prop.sale_price) if prop.sale_price else None,
-                    main_property_id=prop.main_property_id,
-                )
-            )
-
-        response = PropertiesResponse(
-            properties=property_responses,
-            total_count=len(property_responses),
-        )
+        response = await _build_properties_response(session, auth_context.target_user.id)
 
         _log_debug(
             "properties",
@@ -427,7 +467,7 @@ async def get_properties(
             telegram_id,
             authenticated_user,
             target_user_id=getattr(auth_context.target_user, "id", "?"),
-            count=len(property_responses),
+            count=response.total_count,
         )
         return response
 
@@ -439,41 +479,52 @@ async def get_properties(
 
 
 # Helper functions for bills endpoint
-def _build_electricity_reading_subqueries() -> tuple:
-    """Build start and end reading subqueries for electricity bills.
+def _build_reading_intervals_cte(property_ids: Select) -> CTE:
+    """Build a "reading at or before date" lookup for electricity readings.
+
+    Each reading is paired with the date of the next reading of the same property
+    (LEAD window), so the reading in effect on date D is the single row with
+    ``reading_date <= D < next_reading_date``. Bills join this once per period date
+    instead of running two correlated ORDER BY ... LIMIT 1 subqueries per bill row.
+
+    Args:
+        property_ids: Subquery restricting the lookup to properties of listed bills
 
     Returns:
-        Tuple of (start_reading_alias, end_reading_alias) scalar subqueries
+        CTE with property_id, reading_value, reading_date, next_reading_date
     """
-    from src.models.bill import Bill
     from src.models.electricity_reading import ElectricityReading
-    from src.models.service_period import ServicePeriod
 
-    start_reading_alias = (
-        select(ElectricityReading.reading_value)
-        .where(
-            (ElectricityReading.property_id == Bill.property_id)
-            & (ElectricityReading.reading_date <= ServicePeriod.start_date)
+    return (
+        select(
+            ElectricityReading.property_id,
+            ElectricityReading.reading_value,
+            ElectricityReading.reading_date,
+            func.lead(ElectricityReading.reading_date)
+            .over(
+                partition_by=ElectricityReading.property_id,
+                order_by=(ElectricityReading.reading_date, ElectricityReading.id),
+            )
+            .label("next_reading_date"),
         )
-        .order_by(ElectricityReading.reading_date.desc())
-        .limit(1)
-        .correlate(Bill, ServicePeriod)
-        .scalar_subquery()
+        .where(ElectricityReading.property_id.in_(property_ids))
+        .cte("reading_intervals")
     )
 
-    end_reading_alias = (
-        select(ElectricityReading.reading_value)
-        .where(
-            (ElectricityReading.property_id == Bill.property_id)
-            & (ElectricityReading.reading_date <= ServicePeriod.end_date)
-        )
-        .order_by(ElectricityReading.reading_date.desc())
-        .limit(1)
-        .correlate(Bill, ServicePeriod)
-        .scalar_subquery()
-    )
 
-    return start_reading_alias, end_reading_alias
+def _reading_on_date(reading: Any, bill: Any, on_date: Any) -> ColumnElement[bool]:
+    """Join condition matching the reading interval in effect on ``on_date``.
+
+    Only electricity bills carry meter readings, so other bill types skip the lookup.
+    """
+    from src.models.bill import BillType
+
+    return and_(
+        bill.bill_type == BillType.ELECTRICITY,
+        reading.c.property_id == bill.property_id,
+        reading.c.reading_date <= on_date,
+        or_(reading.c.next_reading_date.is_(None), reading.c.next_reading_date > on_date),
+    )
 
 
 def _format_bill_response(bill, service_period, property_obj, start_reading, end_reading) -> dict:
@@ -541,6 +592,9 @@ class TransactionsResponse(BaseModel):
 
     transactions: list[TransactionResponse]
 
+    next_cursor: str | None = None
+    """Opaque keyset cursor for the next page (None when there are no more rows)."""
+
 
 class ElectricityBillResponse(BaseModel):
     """Response schema for a single electricity bill."""
@@ -587,30 +641,225 @@ class BillsResponse(BaseModel):
     bills: list[ElectricityBillResponse]
 
 
+def _encode_transactions_cursor(transaction_date: date, transaction_id: int) -> str:
+    """Encode a (date, id) keyset position as an opaque URL-safe cursor."""
+    raw = f"{transaction_date.isoformat()}|{transaction_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_transactions_cursor(cursor: str) -> tuple[date, int]:
+    """Decode a cursor produced by _encode_transactions_cursor.
+
+    Raises:
+        HTTPException 400: Malformed cursor
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw_date, raw_id = base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+        return date.fromisoformat(raw_date), int(raw_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+
+def _build_transactions_stmt(
+    account_id: int,
+    scope: str,
+    cursor: tuple[date, int] | None = None,
+    limit: int | None = None,
+) -> Select:
+    """Build the keyset-paginated transactions query.
+
+    Rows are ordered by (transaction_date, id) descending; ``cursor`` is the last
+    row of the previous page. idx_transaction_date already covers this order in
+    SQLite (secondary indexes end with the rowid), so each page is an index range scan.
+    Account names come from two joins instead of per-row correlated subqueries.
+
+    Args:
+        account_id: Account to fetch transactions for
+        scope: 'personal' (account's own transactions) or 'all'
+        cursor: Keyset position to continue after, or None for the first page
+        limit: Page size; one extra row is fetched to detect a next page
+
+    Returns:
+        Select yielding (id, from_account_id, from_ac_name, to_account_id,
+        to_ac_name, amount, transaction_date, description)
+    """
+    from_account = aliased(Account)
+    to_account = aliased(Account)
+
+    stmt = (
+        select(
+            Transaction.id,
+            Transaction.from_account_id,
+            from_account.name,
+            Transaction.to_account_id,
+            to_account.name,
+            Transaction.amount,
+            Transaction.transaction_date,
+            Transaction.description,
+        )
+        .outerjoin(from_account, from_account.id == Transaction.from_account_id)
+        .outerjoin(to_account, to_account.id == Transaction.to_account_id)
+        .order_by(Transaction.transaction_date.desc(), Transaction.id.desc())
+    )
+
+    if scope == "personal":
+        stmt = stmt.where(
+            (Transaction.from_account_id == account_id) | (Transaction.to_account_id == account_id)
+        )
+
+    if cursor is not None:
+        cursor_date, cursor_id = cursor
+        stmt = stmt.where(
+            or_(
+                Transaction.transaction_date < cursor_date,
+                and_(Transaction.transaction_date == cursor_date, Transaction.id < cursor_id),
+            )
+        )
+
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
+
+    return stmt
+
+
+def _transaction_from_row(row: Any) -> TransactionResponse:
+    """Format a row of _build_transactions_stmt into a TransactionResponse."""
+    return TransactionResponse(
+        from_account_id=row[1],
+        from_ac_name=row[2] or "Unknown",
+        to_account_id=row[3],
+        to_ac_name=row[4] or "Unknown",
+        amount=float(row[5]),
+        date=row[6].isoformat() if row[6] else "",
+        description=row[7],
+    )
+
+
+def _validate_transactions_limit(limit: int | None) -> None:
+    if limit is not None and not 1 <= limit <= TRANSACTIONS_MAX_LIMIT:
+        raise HTTPException(
+            status_code=400, detail=f"limit must be between 1 and {TRANSACTIONS_MAX_LIMIT}"
+        )
+
+
+async def _build_transactions_response(
+    session: AsyncSession,
+    account_id: int,
+    scope: str,
+    limit: int | None = None,
+    cursor: str | None = None,
+) -> TransactionsResponse:
+    """Build TransactionsResponse for an already authorized account.
+
+    Shared by /transactions and /dashboard.
+
+    Args:
+        session: Database session
+        account_id: Account to fetch transactions for
+        scope: 'personal' (account's own transactions) or 'all'
+        limit: Page size (None returns all remaining rows)
+        cursor: next_cursor from the previous page
+
+    Returns:
+        TransactionsResponse ordered by date, most recent first
+    """
+    keyset = _decode_transactions_cursor(cursor) if cursor else None
+    stmt = _build_transactions_stmt(account_id, scope, keyset, limit)
+
+    result = await session.execute(stmt)
+    rows = result.all()
+
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_transactions_cursor(rows[-1][6], rows[-1][0])
+
+    return TransactionsResponse(
+        transactions=[_transaction_from_row(row) for row in rows],
+        next_cursor=next_cursor,
+    )
+
+
+async def _stream_transactions_ndjson(
+    account_id: int,
+    scope: str,
+    limit: int | None = None,
+    cursor: str | None = None,
+) -> AsyncIterator[bytes]:
+    """Stream transactions as NDJSON, one TransactionResponse object per line.
+
+    Rows are read in keyset batches of TRANSACTIONS_STREAM_BATCH_SIZE, so memory use
+    and time-to-first-byte do not grow with the ledger, and no read cursor is held
+    open while the client consumes the body. When ``limit`` cuts the page short, a
+    final ``{"next_cursor": "..."}`` line is emitted.
+
+    Runs in its own session: the response body is produced after the endpoint returns.
+    """
+    keyset = _decode_transactions_cursor(cursor) if cursor else None
+    remaining = limit
+
+    async with AsyncReadSessionLocal() as stream_session:
+        while True:
+            batch_size = TRANSACTIONS_STREAM_BATCH_SIZE
+            if remaining is not None:
+                batch_size = min(batch_size, remaining)
+
+            stmt = _build_transactions_stmt(account_id, scope, keyset, batch_size)
+            rows = (await stream_session.execute(stmt)).all()
+            has_more = len(rows) > batch_size
+            rows = rows[:batch_size]
+
+            for row in rows:
+                yield (_transaction_from_row(row).model_dump_json() + "\n").encode()
+
+            if not has_more:
+                return
+
+            keyset = (rows[-1][6], rows[-1][0])
+            if remaining is not None:
+                remaining -= len(rows)
+                if remaining == 0:
+                    next_cursor = _encode_transactions_cursor(*keyset)
+                    yield (json.dumps({"next_cursor": next_cursor}) + "\n").encode()
+                    return
+
+
 @router.post("/transactions", response_model=TransactionsResponse)
+@query_budget(3)
 async def get_transactions(
     account_id: int,
     scope: str = "all",
+    limit: int | None = None,
+    cursor: str | None = None,
+    stream: bool = False,
     authorization: str | None = Header(None),  # noqa: B008
     x_telegram_init_data: str | None = Header(None),  # noqa: B008
     body: dict[str, Any] | None = Body(None),  # noqa: B008
-    db: AsyncSession = Depends(get_async_session),  # noqa: B008
-) -> TransactionsResponse:
+    db: AsyncSession = Depends(get_async_read_session),  # noqa: B008
+) -> TransactionsResponse | StreamingResponse:
     """Get list of transactions for a specific account.
 
     Authorization: Admin can access any account, owners can access ORGANIZATION accounts
     and their own personal accounts, staff can access their own accounts.
 
+    Pagination is keyset-based on (date, id): pass ``limit`` and then the returned
+    ``next_cursor`` as ``cursor`` to fetch the following page.
+
     Args:
         account_id: Account ID to fetch transactions for (required).
         scope: Filter scope - 'personal' returns only account's transactions,
                'all' (default) returns all organization transactions visible to account.
+        limit: Page size (1..TRANSACTIONS_MAX_LIMIT); omitted returns all rows.
+        cursor: Opaque cursor from a previous page's next_cursor.
+        stream: If true, respond with NDJSON (one transaction per line) instead of JSON.
 
     Returns:
-        TransactionsResponse with filtered transactions.
+        TransactionsResponse with filtered transactions, or an application/x-ndjson
+        StreamingResponse when stream=true.
 
     Raises:
-        400: Missing or invalid account_id
+        400: Missing or invalid account_id, invalid limit or cursor
         401: Invalid Telegram signature or unauthorized account access
         404: Account not found
         500: Server error
@@ -626,57 +875,27 @@ async def get_transactions(
         # Authorize account access
         await authorize_account_access(db, authenticated_user, account_id)
 
-        from_account_alias = (
-            select(Account.name.label("from_ac_name"))
-            .where(Account.id == Transaction.from_account_id)
-            .correlate(Transaction)
-            .scalar_subquery()
-        )
-
-        to_account_alias = (
-            select(Account.name.label("to_ac_name"))
-            .where(Account.id == Transaction.to_account_id)
-            .correlate(Transaction)
-            .scalar_subquery()
-        )
-
-        where_clause = []
-        if scope == "personal":
-            where_clause = [
-                (Transaction.from_account_id == account_id)
-                | (Transaction.to_account_id == account_id)
-            ]
-
-        trans_stmt = select(
-            Transaction.from_account_id,
-            from_account_alias.label("from_ac_name"),
-            Transaction.to_account_id,
-            to_account_alias.label("to_ac_name"),
-            Transaction.amount,
-            Transaction.transaction_date,
-            Transaction.description,
-        ).order_by(Transaction.transaction_date.desc())
-
-        if where_clause:
-            trans_stmt = trans_stmt.where(*where_clause)
-
-        result = await db.execute(trans_stmt)
-        transactions_data = result.all()
-
-        transactions_list_data = [
-            TransactionResponse(
-                from_account_id=row[0],
-                from_ac_name=row[1] or "Unknown",
-                to_account_id=row[2],
-                to_ac_name=row[3] or "Unknown",
-                amount=float(row[4]),
-                date=row[5].isoformat() if row[5] else "",
-                description=row[6],
+        _validate_transactions_limit(limit)
+        if cursor:
+            _decode_transactions_cursor(cursor)  # Reject malformed cursors before streaming
+
+        if stream:
+            _log_debug(
+                "transactions",
+                start_time,
+                telegram_id,
+                authenticated_user,
+                account_id=account_id,
+                scope=scope,
+                limit=limit,
+                stream=True,
+            )
+            return StreamingResponse(
+                _stream_transactions_ndjson(account_id, scope, limit, cursor),
+                media_type="application/x-ndjson",
             )
-            for row in transactions_data
-        ]
 
-        response = TransactionsResponse(transactions=transactions_list_data)
+        response = await _build_transactions_response(db, account_id, scope, limit, cursor)
 
         _log_debug(
             "transactions",
@@ -685,7 +904,8 @@ async def get_transactions(
             authenticated_user,
             account_id=account_id,
             scope=scope,
-            count=len(transactions_list_data),
+            limit=limit,
+            count=len(response.transactions),
         )
         return response
 
@@ -696,13 +916,88 @@ async def get_transactions(
         raise HTTPException(status_code=500, detail="Server error") from e
 
 
+async def _build_bills_response(
+    session: AsyncSession, account_id: int, account_user_id: int | None
+) -> BillsResponse:
+    """Build BillsResponse for an already authorized account.
+
+    Includes bills of the account itself and of properties owned by the account's user.
+    Shared by /bills and /dashboard.
+
+    Args:
+        session: Database session
+        account_id: Account to fetch bills for
+        account_user_id: Owner of the account (None for organization accounts)
+
+    Returns:
+        BillsResponse sorted by period (most recent first)
+    """
+    from src.models.bill import Bill
+    from src.models.property import Property
+    from src.models.service_period import ServicePeriod
+
+    # Bills of the account itself and of properties owned by the account's user
+    where_clause = [Bill.account_id == account_id]
+    if account_user_id:
+        user_property_ids = select(Property.id).where(Property.owner_id == account_user_id)
+        where_clause = [or_(Bill.account_id == account_id, Bill.property_id.in_(user_property_ids))]
+
+    # Meter readings at period start and end, from one windowed lookup
+    reading_intervals = _build_reading_intervals_cte(
+        select(Bill.property_id).where(*where_clause, Bill.property_id.is_not(None))
+    )
+    start_reading = reading_intervals.alias("start_reading")
+    end_reading = reading_intervals.alias("end_reading")
+
+    # Query bills
+    bills_stmt = (
+        select(
+            Bill,
+            ServicePeriod,
+            Property,
+            start_reading.c.reading_value,
+            end_reading.c.reading_value,
+        )
+        .join(ServicePeriod, Bill.service_period_id == ServicePeriod.id)
+        .outerjoin(Property, Bill.property_id == Property.id)
+        .outerjoin(start_reading, _reading_on_date(start_reading, Bill, ServicePeriod.start_date))
+        .outerjoin(end_reading, _reading_on_date(end_reading, Bill, ServicePeriod.end_date))
+        .where(*where_clause)
+        .order_by(ServicePeriod.start_date.desc())
+    )
+
+    result = await session.execute(bills_stmt)
+    bills_data = result.all()
+
+    # Build response list
+    bills_response = []
+    for row_data in bills_data:
+        bill = row_data[0]
+        service_period = row_data[1]
+        property_obj = row_data[2]
+
+        start_reading = None
+        end_reading = None
+        if bill.bill_type.value == "electricity":
+            start_reading = float(row_data[3]) if row_data[3] else None
+            end_reading = float(row_data[4]) if row_data[4] else None
+
+        bill_response = _format_bill_response(
+            bill, service_period, property_obj, start_reading, end_reading
+        )
+        bills_response.append(ElectricityBillResponse(**bill_response))
+
+    return BillsResponse(bills=bills_response)
+
+
 @router.post("/bills", response_model=BillsResponse)
+@query_budget(3)
 async def get_bills(
     account_id: int,
     authorization: str | None = Header(None),  # noqa: B008
     x_telegram_init_data: str | None = Header(None),  # noqa: B008
     body: dict[str, Any] | None = Body(None),  # noqa: B008
-    db: AsyncSession = Depends(get_async_session),  # noqa: B008
+    db: AsyncSession = Depends(get_async_read_session),  # noqa: B008
 ) -> BillsResponse:
     """Get list of all bills for a specific account.
 
@@ -722,10 +1017,6 @@ async def get_bills(
         404: Account not found
         500: Server error
     """
-    from src.models.bill import Bill
-    from src.models.property import Property
-    from src.models.service_period import ServicePeriod
-
     start_time = time.time()
     try:
         # Verify Telegram auth and extract telegram_id
@@ -737,56 +1028,7 @@ async def get_bills(
         # Authorize account access
         account = await authorize_account_access(db, authenticated_user, account_id)
 
-        # Get properties owned by account's user
-        user_property_ids = []
-        if account.user_id:
-            user_properties_stmt = select(Property.id).where(Property.owner_id == account.user_id)
-            result = await db.execute(user_properties_stmt)
-            user_property_ids = [row[0] for row in result.all()]
-
-        # Build reading subqueries
-        start_reading_alias, end_reading_alias = _build_electricity_reading_subqueries()
-
-        # Build where clause for account and owner properties
-        where_clause = [Bill.account_id == account_id]
-        if user_property_ids:
-            from sqlalchemy import or_
-
-            where_clause = [
-                or_(Bill.account_id == account_id, Bill.property_id.in_(user_property_ids))
-            ]
-
-        # Query bills
-        bills_stmt = (
-            select(Bill, ServicePeriod, Property, start_reading_alias, end_reading_alias)
-            .join(ServicePeriod, Bill.service_period_id == ServicePeriod.id)
-            .outerjoin(Property, Bill.property_id == Property.id)
-            .where(*where_clause)
-            .order_by(ServicePeriod.start_date.desc())
-        )
-
-        result = await db.execute(bills_stmt)
-        bills_data = result.all()
-
-        # Build response list
-        bills_response = []
-        for row_data in bills_data:
-            bill = row_data[0]
-            service_period = row_data[1]
-            property_obj = row_data[2]
-
-            start_reading = None
-            end_reading = None
-            if bill.bill_type.value == "electricity":
-                start_reading = float(row_data[3]) if row_data[3] else None
-                end_reading = float(row_data[4]) if row_data[4] else None
-
-            bill_response = _format_bill_response(
-                bill, service_period, property_obj, start_reading, end_reading
-            )
-            bills_response.append(ElectricityBillResponse(**bill_response))
-
-        response = BillsResponse(bills=bills_response)
+        response = await _build_bills_response(db, account_id, account.user_id)
 
         _log_debug(
             "bills",
@@ -794,7 +1036,7 @@ async def get_bills(
             telegram_id,
             authenticated_user,
             account_id=account_id,
-            count=len(bills_response),
+            count=len(response.bills),
         )
         return response
 
@@ -838,12 +1080,33 @@ class AccountsResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+async def _build_account_response(session: AsyncSession, account_id: int) -> AccountResponse:
+    """Build AccountResponse from the materialized ledger (single-row lookup).
+
+    Shared by /account and /dashboard.
+
+    Args:
+        session: Database session
+        account_id: Already authorized account
+
+    Returns:
+        AccountResponse with balance and display hint
+    """
+    from src.services.balance_ledger_service import BalanceLedgerService
+
+    ledger_service = BalanceLedgerService(session)
+    result = await ledger_service.get_account_balance(account_id)
+
+    return AccountResponse(balance=result.balance, invert_for_display=result.invert_for_display)
+
+
 @router.post("/account", response_model=AccountResponse)
+@query_budget(3)
 async def get_account(
     account_id: int,
     authorization: str | None = Header(None),  # noqa: B008
     x_telegram_init_data: str | None = Header(None),  # noqa: B008
-    session: AsyncSession = Depends(get_async_session),  # noqa: B008
+    session: AsyncSession = Depends(get_async_read_session),  # noqa: B008
     body: dict[str, Any] | None = Body(None),  # noqa: B008
 ) -> AccountResponse:
     """Get balance (payments - bills) for a specific account.
@@ -874,15 +1137,7 @@ async def get_account(
         # Authorize account access
         await authorize_account_access(session, authenticated_user, account_id)
 
-        # Calculate balance using service
-        from src.services.balance_service import BalanceCalculationService
-
-        balance_service = BalanceCalculationService(session)
-        result = await balance_service.calculate_account_balance_with_display(account_id)
-
-        response = AccountResponse(
-            balance=result.balance, invert_for_display=result.invert_for_display
-        )
+        response = await _build_account_response(session, account_id)
 
         _log_debug(
             "account",
@@ -890,7 +1145,7 @@ async def get_account(
             telegram_id,
             authenticated_user,
             account_id=account_id,
-            balance=f"{result.balance:.2f}",
+            balance=f"{response.balance:.2f}",
         )
         return response
 
@@ -902,10 +1157,11 @@ async def get_account(
 
 
 @router.post("/accounts", response_model=AccountsResponse)
+@query_budget(5)
 async def get_accounts(
     authorization: str | None = Header(None),  # noqa: B008
     x_telegram_init_data: str | None = Header(None),  # noqa: B008
-    session: AsyncSession = Depends(get_async_session),  # noqa: B008
+    session: AsyncSession = Depends(get_async_read_session),  # noqa: B008
     body: dict[str, Any] | None = Body(None),  # noqa: B008
 ) -> AccountsResponse:
     """Get all accounts with balances for authorized users.
@@ -936,18 +1192,19 @@ async def get_accounts(
         # Get all accounts for balance display
         from sqlalchemy.orm import selectinload
 
-        from src.services.balance_service import BalanceCalculationService
+        from src.services.balance_ledger_service import BalanceLedgerService
 
         stmt = select(Account).options(selectinload(Account.user))
         result = await session.execute(stmt)
         accounts = result.scalars().all()
 
-        accounts_list = []
-        balance_service = BalanceCalculationService(session)
+        # Read all balances from the materialized ledger in a single query
+        ledger_service = BalanceLedgerService(session)
+        balances = await ledger_service.get_account_balances([account.id for account in accounts])
 
+        accounts_list = []
         for account in accounts:
-            # Calculate balance using service with display info
-            result = await balance_service.calculate_account_balance_with_display(account.id)
+            balance = balances.get(account.id)
 
             # Handle account_type as either Enum or string
             account_type_str = (
@@ -964,8 +1221,8 @@ async def get_accounts(
                     account_id=account.id,
                     account_name=account.name,
                     account_type=account_type_str,
-                    balance=result.balance,
-                    invert_for_display=result.invert_for_display,
+                    balance=balance.balance if balance else 0.0,
+                    invert_for_display=balance.invert_for_display if balance else False,
                     representative_id=representative_id,
                 )
             )
@@ -984,4 +1241,115 @@ async def get_accounts(
         raise HTTPException(status_code=500, detail="Server error") from e
 
 
+class DashboardResponse(BaseModel):
+    """Response schema for dashboard endpoint (all welcome-screen datasets)."""
+
+    properties: PropertiesResponse | None = None  # None when user is not an owner
+    account: AccountResponse
+    transactions: TransactionsResponse
+    bills: BillsResponse
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+async def _build_in_own_session(
+    build: Callable[..., Awaitable[_ResponseT]], *args: Any
+) -> _ResponseT:
+    """Run a response builder in a dedicated session.
+
+    An AsyncSession must not be shared between concurrent tasks, so each dashboard
+    payload gets its own session from the reader pool and the builders run side by side.
+    """
+    async with AsyncReadSessionLocal() as own_session:
+        return await build(own_session, *args)
+
+
+@router.post("/dashboard", response_model=DashboardResponse)
+@query_budget(6)
+async def get_dashboard(
+    account_id: int,
+    selected_user_id: int | None = None,
+    scope: str = "personal",
+    authorization: str | None = Header(None),  # noqa: B008
+    x_telegram_init_data: str | None = Header(None),  # noqa: B008
+    session: AsyncSession = Depends(get_async_read_session),  # noqa: B008
+    body: dict[str, Any] | None = Body(None),  # noqa: B008
+) -> DashboardResponse:
+    """Get all welcome-screen datasets in one call (properties, balance, transactions, bills).
+
+    Verifies auth once, then builds the four payloads concurrently. Authorization matches
+    the individual endpoints: account access as in /account, /transactions and /bills;
+    properties only for owners as in /properties (with admin context switching).
+
+    Args:
+        account_id: Account ID for balance, transactions and bills (required).
+        selected_user_id: User ID selected by admin for context switching (properties).
+        scope: Transactions scope - 'personal' (default) or 'all'.
+
+    Returns:
+        DashboardResponse with all datasets (properties is None for non-owners).
+
+    Raises:
+        400: Missing or invalid account_id
+        401: Invalid Telegram signature or unauthorized account access
+        404: Account or selected user not found
+        500: Server error
+    """
+    start_time = time.time()
+    try:
+        # Verify Telegram auth and extract telegram_id
+        telegram_id = await verify_telegram_auth(session, authorization, x_telegram_init_data, body)
+
+        # Get authenticated user (checks is_active)
+        authenticated_user = await get_authenticated_user(session, telegram_id)
+
+        # Authorize account access
+        account = await authorize_account_access(session, authenticated_user, account_id)
+
+        builds: list[Awaitable[BaseModel]] = [
+            _build_in_own_session(_build_account_response, account_id),
+            _build_in_own_session(_build_transactions_response, account_id, scope),
+            _build_in_own_session(_build_bills_response, account_id, account.user_id),
+        ]
+
+        # Properties are owner-only (same rule as /properties)
+        if authenticated_user.is_owner:
+            auth_context = await authorize_user_context_access(
+                session,
+                authenticated_user,
+                required_role="is_owner",
+                selected_user_id=selected_user_id,
+            )
+            builds.append(
+                _build_in_own_session(_build_properties_response, auth_context.target_user.id)
+            )
+
+        account_response, transactions, bills, *properties = await asyncio.gather(*builds)
+
+        response = DashboardResponse(
+            properties=properties[0] if properties else None,
+            account=account_response,
+            transactions=transactions,
+            bills=bills,
+        )
+
+        _log_debug(
+            "dashboard",
+            start_time,
+            telegram_id,
+            authenticated_user,
+            account_id=account_id,
+            scope=scope,
+            transactions=len(transactions.transactions),
+            bills=len(bills.bills),
+        )
+        return response
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in /api/mini-app/dashboard: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Server error") from e
+
+
 __all__ = ["router", "_extract_init_data"]
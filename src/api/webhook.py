@@ -2,16 +2,27 @@
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from telegram import Update
 from telegram.ext import Application
 
 from src.api.mcp_server import mcp_http_app
+from src.api.middleware import (
+    QueryStatsMiddleware,
+    RequestContextMiddleware,
+    RequestMetricsMiddleware,
+)
 from src.api.mini_app import router as mini_app_router
+from src.bot.update_dedup import UpdateDeduplicator
+from src.bot.update_queue import UpdateQueue
+from src.services import AsyncSessionLocal
+from src.services.logging import log_context
+from src.services.metrics import CONTENT_TYPE, registry
+from src.services.query_stats import track_queries
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +44,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# SQL statement counts per request (debug logs, X-Query-Stats header, N+1 warnings)
+app.add_middleware(QueryStatsMiddleware)
+# Latency histograms per route for /metrics
+app.add_middleware(RequestMetricsMiddleware)
+# Request ID on every log record of a request (outermost, so all middleware logs carry it)
+app.add_middleware(RequestContextMiddleware)
+
 # Mount static files for Mini App (002-welcome-mini-app)
 static_path = Path(__file__).parent.parent / "static" / "mini_app"
 if static_path.exists():
@@ -48,16 +66,66 @@ app.mount("/mcp", mcp_http_app, name="mcp")
 # Global bot application reference (set via setup_webhook_route or directly for testing)
 _bot_app: Optional[Application] = None
 
+# Update queue drained by background workers (None: updates are processed inline)
+_update_queue: Optional[UpdateQueue] = None
+
+# Window of recently accepted update_ids (None: no dedup)
+_update_dedup: Optional[UpdateDeduplicator] = None
+
 
 async def setup_webhook_route(bot_app: Application) -> None:
     """Set up the bot application for webhook processing.
 
+    Starts the update queue so the webhook acks before handlers run, and the
+    update_id dedup window (restored from the database) so redeliveries are dropped.
+
     Args:
         bot_app: Telegram bot Application instance
     """
-    global _bot_app
+    global _bot_app, _update_queue, _update_dedup
+    await shutdown_webhook_route()
     _bot_app = bot_app
 
+    _update_dedup = UpdateDeduplicator()
+    try:
+        async with AsyncSessionLocal() as session:
+            await _update_dedup.load(session)
+    except Exception as e:
+        logger.warning("Could not restore processed update_ids: %s", e)
+    _update_dedup.start(AsyncSessionLocal)
+
+    _update_queue = UpdateQueue(_instrument_update(bot_app.process_update))
+    _update_queue.start()
+
+
+async def shutdown_webhook_route() -> None:
+    """Stop accepting updates, drain the update queue and persist the dedup window."""
+    global _update_queue, _update_dedup
+    if _update_queue is not None:
+        await _update_queue.stop()
+        _update_queue = None
+    if _update_dedup is not None:
+        await _update_dedup.stop(AsyncSessionLocal)
+        _update_dedup = None
+
+
+def _instrument_update(
+    process: Callable[[Update], Awaitable[None]],
+) -> Callable[[Update], Awaitable[None]]:
+    """Wrap update processing with per-update log context and SQL statistics."""
+
+    async def process_update(update: Update) -> None:
+        label = f"update_id={update.update_id}"
+        user = update.effective_user
+        with log_context(
+            request_id=f"update-{update.update_id}", telegram_id=user.id if user else None
+        ):
+            with track_queries(label) as stats:
+                await process(update)
+            logger.debug("webhook.telegram: %s processed %s", label, stats.summary())
+
+    return process_update
+
 
 # Register health check endpoint
 @app.get("/health")
@@ -66,11 +134,48 @@ async def health_check() -> dict:
     return {"status": "ok"}
 
 
+@app.get("/health/updates")
+async def update_queue_health() -> dict:
+    """Backpressure metrics of the webhook update queue."""
+    if _update_queue is None:
+        return {"running": False}
+    return {
+        "running": _update_queue.running,
+        **_update_queue.stats().as_dict(),
+        "duplicates": _update_dedup.duplicates if _update_dedup else 0,
+    }
+
+
+@app.get("/metrics")
+async def metrics() -> Response:
+    """Latency histograms, queue depths and DB pool usage in Prometheus text format."""
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
+
+
+def _collect_update_queue_metrics() -> None:
+    if _update_queue is None:
+        return
+    stats = _update_queue.stats()
+    _update_queue_gauge.set(stats.pending, "pending")
+    _update_queue_gauge.set(stats.in_flight, "in_flight")
+
+
+_update_queue_gauge = registry.gauge(
+    "sosenki_update_queue_updates", "Telegram updates in the webhook queue by state", ("state",)
+)
+registry.add_collector(_collect_update_queue_metrics)
+
+
 # Register Telegram webhook endpoint
 @app.post("/webhook/telegram")
 async def telegram_webhook(update: dict) -> dict:
     """Receive Telegram updates and dispatch to bot handlers.
 
+    With the update queue running, the update is enqueued and acknowledged
+    immediately; handler errors are logged by the queue workers. A full queue
+    answers 503 so Telegram redelivers the update later. Updates whose update_id
+    was already accepted are acknowledged without being parsed or processed.
+
     Args:
         update: Telegram Update object (as JSON)
 
@@ -82,6 +187,12 @@ async def telegram_webhook(update: dict) -> dict:
         logger.error("Bot application not initialized")
         raise HTTPException(status_code=503, detail="Bot not initialized")
 
+    update_id = update.get("update_id")
+    if _update_dedup is not None and isinstance(update_id, int):
+        if not _update_dedup.remember(update_id):
+            logger.info("webhook.telegram: dropped duplicate update_id=%d", update_id)
+            return {"ok": True}
+
     try:
         telegram_update = Update.de_json(update, _bot_app.bot)
         if telegram_update:
@@ -100,11 +211,24 @@ async def telegram_webhook(update: dict) -> dict:
                 chat_id,
                 update_type,
             )
-            await _bot_app.process_update(telegram_update)
+            if _update_queue is None:
+                await _instrument_update(_bot_app.process_update)(telegram_update)
+            elif not _update_queue.submit(telegram_update):
+                raise HTTPException(status_code=503, detail="Update queue full")
         return {"ok": True}
+    except HTTPException:
+        _forget_update(update_id)
+        raise
     except Exception as e:
+        _forget_update(update_id)
         logger.error("Error processing update: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error") from e
 
 
-__all__ = ["app", "setup_webhook_route"]
+def _forget_update(update_id) -> None:
+    """Let Telegram's redelivery of an update we failed to accept through the dedup window."""
+    if _update_dedup is not None and isinstance(update_id, int):
+        _update_dedup.forget(update_id)
+
+
+__all__ = ["app", "setup_webhook_route", "shutdown_webhook_route"]
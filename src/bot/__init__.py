@@ -1,9 +1,11 @@
 """Telegram bot application factory."""
 
 import warnings
+from itertools import chain
 
 from telegram.ext import (
     Application,
+    BaseHandler,
     CallbackQueryHandler,
     CommandHandler,
     ConversationHandler,
@@ -70,6 +72,7 @@ from src.bot.handlers.admin_periods import (
 from src.bot.handlers.admin_requests import handle_admin_callback, handle_admin_response
 from src.bot.handlers.ask import handle_ask_command
 from src.bot.handlers.common import handle_request_command, handle_start_command
+from src.services.metrics import BOT_HANDLER_SECONDS
 
 # logger = logging.getLogger(__name__)
 
@@ -290,7 +293,26 @@ async def create_bot_app() -> Application:
 
     # Initialize any other bot-level setup here
 
+    # Latency of every handler callback (conversation states included) on /metrics
+    for handler in chain.from_iterable(app.handlers.values()):
+        _instrument_handler(handler)
+
     return app
 
 
+def _instrument_handler(handler: BaseHandler) -> None:
+    """Wrap the handler's callback (or a conversation's handlers) in a latency histogram."""
+    if isinstance(handler, ConversationHandler):
+        nested = chain(
+            handler.entry_points, chain.from_iterable(handler.states.values()), handler.fallbacks
+        )
+        for inner in nested:
+            _instrument_handler(inner)
+        return
+    callback = handler.callback
+    # Module-qualified: handlers of different conversations share names
+    name = f"{callback.__module__.rsplit('.', 1)[-1]}.{callback.__name__}"
+    handler.callback = BOT_HANDLER_SECONDS.timed(name)(callback)
+
+
 __all__ = ["create_bot_app"]
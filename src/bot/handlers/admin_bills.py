@@ -208,35 +208,35 @@ async def handle_bills_command(  # noqa: C901
             period_service = ServicePeriodService(session)
             open_periods = await period_service.get_open_periods()
 
-            # Build inline buttons for period selection
-            buttons = []
-            for period in open_periods:
-                buttons.append(
-                    [
-                        InlineKeyboardButton(
-                            f"📅 {period.name}", callback_data=f"bill_period:{period.id}"
-                        )
-                    ]
-                )
+        # Build inline buttons for period selection
+        buttons = []
+        for period in open_periods:
+            buttons.append(
+                [
+                    InlineKeyboardButton(
+                        f"📅 {period.name}", callback_data=f"bill_period:{period.id}"
+                    )
+                ]
+            )
 
-            keyboard = InlineKeyboardMarkup(buttons)
+        keyboard = InlineKeyboardMarkup(buttons)
 
-            await update.message.reply_text(
-                t("prompt_select_period"),
-                reply_markup=keyboard,
-            )
+        await update.message.reply_text(
+            t("prompt_select_period"),
+            reply_markup=keyboard,
+        )
 
-            logger.info(
-                "Bills workflow started by admin user_id=%d (telegram_id=%d)",
-                admin_user.id,
-                telegram_id,
-            )
+        logger.info(
+            "Bills workflow started by admin user_id=%d (telegram_id=%d)",
+            admin_user.id,
+            telegram_id,
+        )
 
-            # Store authenticated admin user context
-            context.user_data["authorized_admin"] = admin_user
-            context.user_data["bills_admin_id"] = telegram_id
+        # Store authenticated admin user context
+        context.user_data["authorized_admin"] = admin_user
+        context.user_data["bills_admin_id"] = telegram_id
 
-            return States.SELECT_PERIOD
+        return States.SELECT_PERIOD
 
     except Exception as e:
         logger.error("Error starting bills workflow: %s", e, exc_info=True)
@@ -265,51 +265,49 @@ async def handle_period_selection(  # noqa: C901
 
         await cq.answer()
 
-        async with AsyncSessionLocal() as session:
-            period_service = ServicePeriodService(session)
-
-            # Extract period ID
-            try:
-                period_id = int(cq.data.split(":")[1])
-            except (IndexError, ValueError):
-                logger.warning("Invalid period callback data: %s", cq.data)
-                await cq.edit_message_text(t("err_processing"))
-                return States.END
+        # Extract period ID
+        try:
+            period_id = int(cq.data.split(":")[1])
+        except (IndexError, ValueError):
+            logger.warning("Invalid period callback data: %s", cq.data)
+            await cq.edit_message_text(t("err_processing"))
+            return States.END
 
-            # Fetch period
-            period = await period_service.get_by_id(period_id)
-            if not period:
-                logger.warning("Period %d not found", period_id)
-                await cq.edit_message_text(t("err_processing"))
-                return States.END
+        # Fetch period
+        async with AsyncSessionLocal() as session:
+            period = await ServicePeriodService(session).get_by_id(period_id)
+        if not period:
+            logger.warning("Period %d not found", period_id)
+            await cq.edit_message_text(t("err_processing"))
+            return States.END
 
-            # Store selected period (in both contexts for compatibility)
-            context.user_data["bills_period_id"] = period_id
-            context.user_data["bills_period_name"] = period.name
+        # Store selected period (in both contexts for compatibility)
+        context.user_data["bills_period_id"] = period_id
+        context.user_data["bills_period_name"] = period.name
 
-            # Show 2 action buttons
-            buttons = [
-                [
-                    InlineKeyboardButton(
-                        t("btn_create_by_readings"),
-                        callback_data=f"bill_action:readings:{period_id}",
-                    )
-                ],
-                [
-                    InlineKeyboardButton(
-                        t("btn_create_by_budget"),
-                        callback_data=f"bill_action:budget:{period_id}",
-                    )
-                ],
-            ]
-            keyboard = InlineKeyboardMarkup(buttons)
+        # Show 2 action buttons
+        buttons = [
+            [
+                InlineKeyboardButton(
+                    t("btn_create_by_readings"),
+                    callback_data=f"bill_action:readings:{period_id}",
+                )
+            ],
+            [
+                InlineKeyboardButton(
+                    t("btn_create_by_budget"),
+                    callback_data=f"bill_action:budget:{period_id}",
+                )
+            ],
+        ]
+        keyboard = InlineKeyboardMarkup(buttons)
 
-            await cq.edit_message_text(
-                t("msg_bills_action", period_name=period.name),
-                reply_markup=keyboard,
-            )
+        await cq.edit_message_text(
+            t("msg_bills_action", period_name=period.name),
+            reply_markup=keyboard,
+        )
 
-            return States.SELECT_ACTION
+        return States.SELECT_ACTION
 
     except Exception as e:
         logger.error("Error in period selection: %s", e, exc_info=True)
@@ -369,32 +367,33 @@ async def _start_electricity_workflow(
             period_service = ServicePeriodService(session)
             period = await period_service.get_by_id(period_id)
 
-            if not period:
-                await update.callback_query.edit_message_text(t("err_processing"))
-                return States.END
+            # Fetch previous period values for defaults
+            if period:
+                defaults = await period_service.get_previous_period_defaults(period.start_date)
 
-            # Store period info
-            context.user_data["electricity_period_id"] = period_id
-            context.user_data["electricity_period_name"] = period.name
+        if not period:
+            await update.callback_query.edit_message_text(t("err_processing"))
+            return States.END
 
-            # Fetch previous period values for defaults
-            defaults = await period_service.get_previous_period_defaults(period.start_date)
+        # Store period info
+        context.user_data["electricity_period_id"] = period_id
+        context.user_data["electricity_period_name"] = period.name
 
-            # Store all previous period values for keyboard buttons
-            context.user_data["electricity_previous_rate"] = defaults.electricity_rate
-            context.user_data["electricity_previous_multiplier"] = defaults.electricity_multiplier
-            context.user_data["electricity_previous_losses"] = defaults.electricity_losses
+        # Store all previous period values for keyboard buttons
+        context.user_data["electricity_previous_rate"] = defaults.electricity_rate
+        context.user_data["electricity_previous_multiplier"] = defaults.electricity_multiplier
+        context.user_data["electricity_previous_losses"] = defaults.electricity_losses
 
-            # Ask for electricity_start
-            default_start = defaults.electricity_end if defaults.electricity_end else "?"
-            prompt = f"{t('prompt_meter_start')}\n\n{t('hint_previous_value', value=default_start)}"
+        # Ask for electricity_start
+        default_start = defaults.electricity_end if defaults.electricity_end else "?"
+        prompt = f"{t('prompt_meter_start')}\n\n{t('hint_previous_value', value=default_start)}"
 
-            keyboard = _build_previous_value_keyboard(defaults.electricity_end)
+        keyboard = _build_previous_value_keyboard(defaults.electricity_end)
 
-            await update.callback_query.edit_message_text(t("msg_starting_readings"))
-            await update.callback_query.message.reply_text(prompt, reply_markup=keyboard)
+        await update.callback_query.edit_message_text(t("msg_starting_readings"))
+        await update.callback_query.message.reply_text(prompt, reply_markup=keyboard)
 
-            return States.INPUT_METER_START
+        return States.INPUT_METER_START
 
     except Exception as e:
         logger.error("Error starting electricity workflow: %s", e, exc_info=True)
@@ -410,51 +409,52 @@ async def _start_budget_workflow(
             period_service = ServicePeriodService(session)
             period = await period_service.get_by_id(period_id)
 
-            if not period:
-                await update.callback_query.edit_message_text(t("err_processing"))
-                return States.END
-
-            # Store period info
-            context.user_data["budget_period_id"] = period_id
-            context.user_data["budget_period_name"] = period.name
-
             # Fetch previous period for budget defaults
-            from sqlalchemy import select
+            if period:
+                from sqlalchemy import select
+
+                prev_period_stmt = (
+                    select(ServicePeriod)
+                    .filter(ServicePeriod.start_date < period.start_date)
+                    .order_by(ServicePeriod.start_date.desc())
+                    .limit(1)
+                )
+                prev_result = await session.execute(prev_period_stmt)
+                prev_period = prev_result.scalar_one_or_none()
 
-            prev_period_stmt = (
-                select(ServicePeriod)
-                .filter(ServicePeriod.start_date < period.start_date)
-                .order_by(ServicePeriod.start_date.desc())
-                .limit(1)
-            )
-            prev_result = await session.execute(prev_period_stmt)
-            prev_period = prev_result.scalar_one_or_none()
+        if not period:
+            await update.callback_query.edit_message_text(t("err_processing"))
+            return States.END
 
-            prev_year_budget = None
-            prev_conservation_budget = None
+        # Store period info
+        context.user_data["budget_period_id"] = period_id
+        context.user_data["budget_period_name"] = period.name
 
-            if prev_period:
-                if prev_period.year_budget:
-                    prev_year_budget = str(prev_period.year_budget)
-                if prev_period.conservation_year_budget:
-                    prev_conservation_budget = str(prev_period.conservation_year_budget)
+        prev_year_budget = None
+        prev_conservation_budget = None
 
-            context.user_data["budget_previous_year_budget"] = prev_year_budget
-            context.user_data["budget_previous_conservation_year_budget"] = prev_conservation_budget
+        if prev_period:
+            if prev_period.year_budget:
+                prev_year_budget = str(prev_period.year_budget)
+            if prev_period.conservation_year_budget:
+                prev_conservation_budget = str(prev_period.conservation_year_budget)
 
-            # Ask for year_budget
-            default_text = ""
-            if prev_year_budget:
-                formatted_budget = format_currency(Decimal(prev_year_budget))
-                default_text = t("hint_previous_value", value=formatted_budget)
-            prompt = f"{t('prompt_budget_main')}{default_text}"
+        context.user_data["budget_previous_year_budget"] = prev_year_budget
+        context.user_data["budget_previous_conservation_year_budget"] = prev_conservation_budget
 
-            keyboard = _build_previous_value_keyboard(prev_year_budget)
+        # Ask for year_budget
+        default_text = ""
+        if prev_year_budget:
+            formatted_budget = format_currency(Decimal(prev_year_budget))
+            default_text = t("hint_previous_value", value=formatted_budget)
+        prompt = f"{t('prompt_budget_main')}{default_text}"
 
-            await update.callback_query.edit_message_text(t("msg_starting_budget"))
-            await update.callback_query.message.reply_text(prompt, reply_markup=keyboard)
+        keyboard = _build_previous_value_keyboard(prev_year_budget)
 
-            return States.INPUT_MAIN_BUDGET
+        await update.callback_query.edit_message_text(t("msg_starting_budget"))
+        await update.callback_query.message.reply_text(prompt, reply_markup=keyboard)
+
+        return States.INPUT_MAIN_BUDGET
 
     except Exception as e:
         logger.error("Error starting budget workflow: %s", e, exc_info=True)
@@ -582,6 +582,65 @@ async def handle_electricity_rate(update: Update, context: ContextTypes.DEFAULT_
         return States.END
 
 
+async def _calculate_electricity_bills(
+    session, context: ContextTypes.DEFAULT_TYPE, total_cost: Decimal, rate: Decimal
+) -> str | None:
+    """Compute personal bills and shared cost shares into user_data.
+
+    Returns:
+        Localized error message, or None when the bills table can be shown
+    """
+    bills_service = BillsService(session)
+    period_service = ServicePeriodService(session)
+    period_id = context.user_data.get("electricity_period_id")
+
+    # Fetch the service period
+    period = await period_service.get_by_id(period_id)
+    if not period:
+        return t("err_processing")
+
+    # Guard: fail if any electricity bills already exist for this period
+    existing_count = await bills_service.count_electricity_bills_for_period(period_id)
+    if existing_count > 0:
+        return t(
+            "err_electricity_bills_already_created",
+            period_name=period.name,
+            count=existing_count,
+        )
+
+    # Compute personal electricity bills from readings
+    try:
+        (
+            personal_bills,
+            personal_bills_sum,
+        ) = await bills_service.calculate_personal_electricity_bills_from_readings(
+            service_period=period,
+            electricity_rate=rate,
+        )
+    except ValueError as exc:
+        message = str(exc)
+        if message.startswith("MISSING_READINGS:"):
+            details = message.removeprefix("MISSING_READINGS:")
+            return t("err_missing_electricity_readings", details=details)
+        if message.startswith("INCONSISTENT_READINGS:"):
+            details = message.removeprefix("INCONSISTENT_READINGS:")
+            return t("err_inconsistent_electricity_readings", details=details)
+        raise
+
+    context.user_data["electricity_personal_bills"] = personal_bills
+    context.user_data["electricity_personal_bills_sum"] = personal_bills_sum
+
+    # Calculate shared cost (clip to 0 if personal bills exceed total)
+    shared_cost = max(Decimal(0), total_cost - personal_bills_sum)
+
+    # Distribute shared costs
+    owner_shares = await bills_service.distribute_shared_costs(shared_cost, period, exact=True)
+
+    context.user_data["electricity_owner_shares"] = owner_shares
+    context.user_data["electricity_shared_cost"] = shared_cost
+    return None
+
+
 async def handle_electricity_losses(  # noqa: C901
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> int:
@@ -599,88 +658,29 @@ async def handle_electricity_losses(  # noqa: C901
 
         context.user_data["electricity_losses"] = value
 
-        # Calculate total electricity cost
-        async with AsyncSessionLocal() as session:
-            bills_service = BillsService(session)
-            period_service = ServicePeriodService(session)
+        start = context.user_data.get("electricity_start")
+        end = context.user_data.get("electricity_end")
+        multiplier = context.user_data.get("electricity_multiplier")
+        rate = context.user_data.get("electricity_rate")
 
-            start = context.user_data.get("electricity_start")
-            end = context.user_data.get("electricity_end")
-            multiplier = context.user_data.get("electricity_multiplier")
-            rate = context.user_data.get("electricity_rate")
-
-            # calculate_total_electricity is a static method (no await needed)
-            total_cost = BillsService.calculate_total_electricity(
-                start, end, multiplier, rate, value
-            )
-
-            context.user_data["electricity_total_cost"] = total_cost
-
-            # Proceed directly to distribute costs among owners (skip confirmation step)
-            period_id = context.user_data.get("electricity_period_id")
-
-            # Fetch the service period
-            period = await period_service.get_by_id(period_id)
-            if not period:
-                await update.message.reply_text(t("err_processing"))
-                return States.END
-
-            # Guard: fail if any electricity bills already exist for this period
-            existing_count = await bills_service.count_electricity_bills_for_period(period_id)
-            if existing_count > 0:
-                await update.message.reply_text(
-                    t(
-                        "err_electricity_bills_already_created",
-                        period_name=period.name,
-                        count=existing_count,
-                    )
-                )
-                _clear_electricity_context(context)
-                return States.END
-
-            # Compute personal electricity bills from readings
-            try:
-                (
-                    personal_bills,
-                    personal_bills_sum,
-                ) = await bills_service.calculate_personal_electricity_bills_from_readings(
-                    service_period=period,
-                    electricity_rate=rate,
-                )
-            except ValueError as exc:
-                message = str(exc)
-                if message.startswith("MISSING_READINGS:"):
-                    details = message.removeprefix("MISSING_READINGS:")
-                    await update.message.reply_text(
-                        t("err_missing_electricity_readings", details=details)
-                    )
-                    _clear_electricity_context(context)
-                    return States.END
-                if message.startswith("INCONSISTENT_READINGS:"):
-                    details = message.removeprefix("INCONSISTENT_READINGS:")
-                    await update.message.reply_text(
-                        t("err_inconsistent_electricity_readings", details=details)
-                    )
-                    _clear_electricity_context(context)
-                    return States.END
-                raise
-
-            context.user_data["electricity_personal_bills"] = personal_bills
-            context.user_data["electricity_personal_bills_sum"] = personal_bills_sum
-
-            # Calculate shared cost (clip to 0 if personal bills exceed total)
-            shared_cost = max(Decimal(0), total_cost - personal_bills_sum)
+        # Calculate total electricity cost
+        # calculate_total_electricity is a static method (no await needed)
+        total_cost = BillsService.calculate_total_electricity(start, end, multiplier, rate, value)
 
-            context.user_data["electricity_shared_cost"] = shared_cost
+        context.user_data["electricity_total_cost"] = total_cost
 
-            # Distribute shared costs
-            owner_shares = await bills_service.distribute_shared_costs(shared_cost, period)
+        # Proceed directly to distribute costs among owners (skip confirmation step)
+        async with AsyncSessionLocal() as session:
+            error = await _calculate_electricity_bills(session, context, total_cost, rate)
 
-            context.user_data["electricity_owner_shares"] = owner_shares
-            context.user_data["electricity_shared_cost"] = shared_cost
+        # Reply once the session is closed, so the writer connection is not held meanwhile
+        if error:
+            await update.message.reply_text(error)
+            _clear_electricity_context(context)
+            return States.END
 
-            # Show the proposed bills table with owner shares and summary (skip state 9)
-            return await _show_electricity_bills_table(update, context)
+        # Show the proposed bills table with owner shares and summary (skip state 9)
+        return await _show_electricity_bills_table(update, context)
 
     except Exception as e:
         logger.error("Error in losses input: %s", e, exc_info=True)
@@ -790,85 +790,91 @@ async def handle_electricity_create_bills(  # noqa: C901
             logger.warning("Unexpected callback data: %s", cq.data)
             return States.CONFIRM_ELECTRICITY_BILLS
 
-        # Create bills
+        owner_shares = context.user_data.get("electricity_owner_shares", [])
+        personal_bills = context.user_data.get("electricity_personal_bills", [])
+        period_id = context.user_data.get("electricity_period_id")
+
+        if not owner_shares or not period_id:
+            await cq.edit_message_text(t("err_processing"))
+            return States.END
+
+        admin_user = context.user_data.get("authorized_admin")
+        actor_id = admin_user.id if admin_user else None
+
+        # Create bills; replies are sent once the session is closed
+        failed = False
         async with AsyncSessionLocal() as session:
             try:
                 period_service = ServicePeriodService(session)
                 bills_service = BillsService(session)
-                owner_shares = context.user_data.get("electricity_owner_shares", [])
-                personal_bills = context.user_data.get("electricity_personal_bills", [])
-                period_id = context.user_data.get("electricity_period_id")
-
-                if not owner_shares or not period_id:
-                    await cq.edit_message_text(t("err_processing"))
-                    return States.END
-
-                admin_user = context.user_data.get("authorized_admin")
-                actor_id = admin_user.id if admin_user else None
 
                 # Guard again: fail if bills already exist
                 existing_count = await bills_service.count_electricity_bills_for_period(period_id)
-                if existing_count > 0:
-                    await cq.edit_message_text(
-                        t(
-                            "err_electricity_bills_already_created",
-                            period_name=context.user_data.get("electricity_period_name", ""),
-                            count=existing_count,
-                        )
+                if existing_count == 0:
+                    # Update service period with electricity values
+                    await period_service.update_electricity_data(
+                        period_id=period_id,
+                        electricity_start=context.user_data.get("electricity_start"),
+                        electricity_end=context.user_data.get("electricity_end"),
+                        electricity_multiplier=context.user_data.get("electricity_multiplier"),
+                        electricity_rate=context.user_data.get("electricity_rate"),
+                        electricity_losses=context.user_data.get("electricity_losses"),
+                        actor_id=actor_id,
                     )
-                    _clear_electricity_context(context)
-                    return States.END
-
-                # Update service period with electricity values
-                await period_service.update_electricity_data(
-                    period_id=period_id,
-                    electricity_start=context.user_data.get("electricity_start"),
-                    electricity_end=context.user_data.get("electricity_end"),
-                    electricity_multiplier=context.user_data.get("electricity_multiplier"),
-                    electricity_rate=context.user_data.get("electricity_rate"),
-                    electricity_losses=context.user_data.get("electricity_losses"),
-                    actor_id=actor_id,
-                )
 
-                (
-                    personal_count,
-                    shared_count,
-                ) = await bills_service.create_personal_and_shared_electricity_bills(
-                    period_id=period_id,
-                    personal_bills=personal_bills,
-                    owner_shares=owner_shares,
-                    actor_id=actor_id,
-                )
+                    (
+                        personal_count,
+                        shared_count,
+                    ) = await bills_service.create_personal_and_shared_electricity_bills(
+                        period_id=period_id,
+                        personal_bills=personal_bills,
+                        owner_shares=owner_shares,
+                        actor_id=actor_id,
+                    )
 
-                # Confirm success with period name (send as reply to preserve message history)
-                period_name = context.user_data.get("electricity_period_name", t("label_period"))
-                message = t(
-                    "msg_bills_created_electricity",
-                    personal_count=personal_count,
-                    shared_count=shared_count,
-                    period_name=period_name,
-                )
-                await cq.message.reply_text(message)
+            except Exception as e:
+                await session.rollback()
+                logger.error("Error creating bills: %s", e, exc_info=True)
+                failed = True
 
-                logger.info(
-                    "Created electricity bills for period %d: personal=%d shared=%d",
-                    period_id,
-                    personal_count,
-                    shared_count,
+        if failed:
+            try:
+                await cq.edit_message_text(t("err_processing"))
+            except Exception:
+                pass
+            return States.END
+
+        if existing_count > 0:
+            await cq.edit_message_text(
+                t(
+                    "err_electricity_bills_already_created",
+                    period_name=context.user_data.get("electricity_period_name", ""),
+                    count=existing_count,
                 )
+            )
+            _clear_electricity_context(context)
+            return States.END
+
+        # Confirm success with period name (send as reply to preserve message history)
+        period_name = context.user_data.get("electricity_period_name", t("label_period"))
+        message = t(
+            "msg_bills_created_electricity",
+            personal_count=personal_count,
+            shared_count=shared_count,
+            period_name=period_name,
+        )
+        await cq.message.reply_text(message)
 
-                _clear_electricity_context(context)
+        logger.info(
+            "Created electricity bills for period %d: personal=%d shared=%d",
+            period_id,
+            personal_count,
+            shared_count,
+        )
 
-                return States.END
+        _clear_electricity_context(context)
 
-            except Exception as e:
-                await session.rollback()
-                logger.error("Error creating bills: %s", e, exc_info=True)
-                try:
-                    await cq.edit_message_text(t("err_processing"))
-                except Exception:
-                    pass
-                return States.END
+        return States.END
 
     except Exception as e:
         logger.error("Error in create bills handler: %s", e, exc_info=True)
@@ -941,63 +947,64 @@ async def handle_budget_conservation_input(  # noqa: C901
             period_id = context.user_data.get("budget_period_id")
             period = await period_service.get_by_id(period_id)
 
-            if not period:
-                await update.message.reply_text(t("err_processing"))
-                return States.END
-
-            year_budget = context.user_data["budget_year_budget"]
-            conservation_year_budget = value
+            if period:
+                year_budget = context.user_data["budget_year_budget"]
+                conservation_year_budget = value
 
-            # Calculate both bill types
-            main_calculations = await bills_service.calculate_main_bills(
-                year_budget, period.period_months
-            )
-            conservation_calculations = await bills_service.calculate_conservation_bills(
-                conservation_year_budget, period.period_months
-            )
+                # Calculate both bill types
+                main_calculations = await bills_service.calculate_main_bills(
+                    year_budget, period.period_months
+                )
+                conservation_calculations = await bills_service.calculate_conservation_bills(
+                    conservation_year_budget, period.period_months
+                )
 
-            # Enrich with usernames (fetch all active owners for complete list)
-            from sqlalchemy import select
+                # Enrich with usernames (fetch all active owners for complete list)
+                from sqlalchemy import select
 
-            # Get all user IDs from calculations
-            main_by_user = dict(main_calculations)
-            conservation_by_user = dict(conservation_calculations)
-            all_user_ids_set = set(main_by_user.keys()) | set(conservation_by_user.keys())
+                # Get all user IDs from calculations
+                main_by_user = dict(main_calculations)
+                conservation_by_user = dict(conservation_calculations)
+                all_user_ids_set = set(main_by_user.keys()) | set(conservation_by_user.keys())
 
-            # Fetch all users for mapping
-            stmt = (
-                select(User).where(User.id.in_(all_user_ids_set))
-                if all_user_ids_set
-                else select(User).filter(False)
-            )
-            result = await session.execute(stmt)
-            users = {user.id: user.name for user in result.scalars().all()}
-
-            # Transform into OwnerShare objects with names, including owners with 0 amounts
-            main_shares = [
-                OwnerShare(
-                    user_id=user_id,
-                    user_name=users.get(user_id, f"User #{user_id}"),
-                    total_share_weight=Decimal("0"),  # Not used for budget bills display
-                    calculated_bill_amount=main_by_user.get(user_id, Decimal("0")),
-                )
-                for user_id in sorted(main_by_user.keys()) or all_user_ids_set
-            ]
-            conservation_shares = [
-                OwnerShare(
-                    user_id=user_id,
-                    user_name=users.get(user_id, f"User #{user_id}"),
-                    total_share_weight=Decimal("0"),  # Not used for budget bills display
-                    calculated_bill_amount=conservation_by_user.get(user_id, Decimal("0")),
+                # Fetch all users for mapping
+                stmt = (
+                    select(User).where(User.id.in_(all_user_ids_set))
+                    if all_user_ids_set
+                    else select(User).filter(False)
                 )
-                for user_id in sorted(conservation_by_user.keys())
-            ]
+                result = await session.execute(stmt)
+                users = {user.id: user.name for user in result.scalars().all()}
+
+                # Transform into OwnerShare objects with names, including owners with 0 amounts
+                main_shares = [
+                    OwnerShare(
+                        user_id=user_id,
+                        user_name=users.get(user_id, f"User #{user_id}"),
+                        total_share_weight=Decimal("0"),  # Not used for budget bills display
+                        calculated_bill_amount=main_by_user.get(user_id, Decimal("0")),
+                    )
+                    for user_id in sorted(main_by_user.keys()) or all_user_ids_set
+                ]
+                conservation_shares = [
+                    OwnerShare(
+                        user_id=user_id,
+                        user_name=users.get(user_id, f"User #{user_id}"),
+                        total_share_weight=Decimal("0"),  # Not used for budget bills display
+                        calculated_bill_amount=conservation_by_user.get(user_id, Decimal("0")),
+                    )
+                    for user_id in sorted(conservation_by_user.keys())
+                ]
 
-            context.user_data["budget_main_calculations"] = main_shares
-            context.user_data["budget_conservation_calculations"] = conservation_shares
+                context.user_data["budget_main_calculations"] = main_shares
+                context.user_data["budget_conservation_calculations"] = conservation_shares
 
-            # Show confirmation table
-            return await _show_budget_bills_table(update, context)
+        if not period:
+            await update.message.reply_text(t("err_processing"))
+            return States.END
+
+        # Show confirmation table (outside the session: it opens one of its own)
+        return await _show_budget_bills_table(update, context)
 
     except Exception as e:
         logger.error("Error in conservation budget input: %s", e, exc_info=True)
@@ -1167,17 +1174,17 @@ async def handle_budget_create_bills(  # noqa: C901
                 actor_id=actor_id,
             )
 
-            # Send success message as reply to preserve calculations table
-            message = t(
-                "msg_bills_created_both",
-                main_count=main_count,
-                conservation_count=conservation_count,
-                period_name=period_name,
-            )
-            await cq.message.reply_text(message)
+        # Send success message as reply to preserve calculations table
+        message = t(
+            "msg_bills_created_both",
+            main_count=main_count,
+            conservation_count=conservation_count,
+            period_name=period_name,
+        )
+        await cq.message.reply_text(message)
 
-            _clear_budget_context(context)
-            return States.END
+        _clear_budget_context(context)
+        return States.END
 
     except Exception as e:
         logger.error("Error in create budget bills handler: %s", e, exc_info=True)
@@ -114,84 +114,82 @@ async def _show_property_selection(  # noqa: C901
             service = ElectricityReadingService(session)
             properties_with_readings = await service.get_properties_with_latest_readings()
 
-            if not properties_with_readings:
-                error_msg = t("err_no_properties")
-                if update.callback_query:
-                    await update.callback_query.edit_message_text(error_msg)
-                elif update.message:
-                    await update.message.reply_text(error_msg)
-                return States.END
-
-            # Split properties into two groups: with readings and without readings
-            properties_with_data = []
-            properties_without_data = []
-
-            for property_obj, latest_reading in properties_with_readings:
-                if latest_reading:
-                    properties_with_data.append((property_obj, latest_reading))
-                else:
-                    properties_without_data.append((property_obj, None))
-
-            # Build property selection keyboard - show properties with readings first
-            keyboard = []
-            for property_obj, latest_reading in properties_with_data:
-                button_text = f"📊 {property_obj.property_name} ({latest_reading.reading_date.strftime('%d.%m.%Y')}): {latest_reading.reading_value} {t('label_unit_kwh')}"
-                keyboard.append(
-                    [
-                        InlineKeyboardButton(
-                            text=button_text,
-                            callback_data=f"meter_property_{property_obj.id}",
-                        )
-                    ]
-                )
+        if not properties_with_readings:
+            error_msg = t("err_no_properties")
+            if update.callback_query:
+                await update.callback_query.edit_message_text(error_msg)
+            elif update.message:
+                await update.message.reply_text(error_msg)
+            return States.END
 
-            # Add button to show properties without readings (if any exist)
-            if properties_without_data:
-                keyboard.append(
-                    [
-                        InlineKeyboardButton(
-                            text=t("btn_show_properties_without_readings"),
-                            callback_data="meter_show_empty",
-                        )
-                    ]
-                )
+        # Split properties into two groups: with readings and without readings
+        properties_with_data = []
+        properties_without_data = []
+
+        for property_obj, latest_reading in properties_with_readings:
+            if latest_reading:
+                properties_with_data.append((property_obj, latest_reading))
+            else:
+                properties_without_data.append((property_obj, None))
 
+        # Build property selection keyboard - show properties with readings first
+        keyboard = []
+        for property_obj, latest_reading in properties_with_data:
+            button_text = f"📊 {property_obj.property_name} ({latest_reading.reading_date.strftime('%d.%m.%Y')}): {latest_reading.reading_value} {t('label_unit_kwh')}"
             keyboard.append(
-                [InlineKeyboardButton(text=t("btn_cancel"), callback_data="meter_cancel")]
+                [
+                    InlineKeyboardButton(
+                        text=button_text,
+                        callback_data=f"meter_property_{property_obj.id}",
+                    )
+                ]
             )
 
-            message_text = t("prompt_select_property_meter")
-            if success_message:
-                message_text = f"{success_message}\n\n{message_text}"
+        # Add button to show properties without readings (if any exist)
+        if properties_without_data:
+            keyboard.append(
+                [
+                    InlineKeyboardButton(
+                        text=t("btn_show_properties_without_readings"),
+                        callback_data="meter_show_empty",
+                    )
+                ]
+            )
 
-            reply_markup = InlineKeyboardMarkup(keyboard)
+        keyboard.append([InlineKeyboardButton(text=t("btn_cancel"), callback_data="meter_cancel")])
 
-            # Check if we have a callback query (from button click) or message (from command)
-            if update.callback_query is not None:
-                try:
-                    await update.callback_query.edit_message_text(
-                        message_text,
-                        reply_markup=reply_markup,
-                        parse_mode="HTML",
-                    )
-                except BadRequest as e:
-                    # If message is not modified (pressing Cancel twice on same step)
-                    # Replace with cancellation message and end conversation
-                    if "message is not modified" in str(e).lower():
-                        await update.callback_query.edit_message_text(
-                            t("msg_operation_cancelled"),
-                            parse_mode="HTML",
-                        )
-                        return States.END
-                    raise
-            elif update.message is not None:
-                await update.message.reply_text(
+        message_text = t("prompt_select_property_meter")
+        if success_message:
+            message_text = f"{success_message}\n\n{message_text}"
+
+        reply_markup = InlineKeyboardMarkup(keyboard)
+
+        # Check if we have a callback query (from button click) or message (from command)
+        if update.callback_query is not None:
+            try:
+                await update.callback_query.edit_message_text(
                     message_text,
                     reply_markup=reply_markup,
                     parse_mode="HTML",
                 )
+            except BadRequest as e:
+                # If message is not modified (pressing Cancel twice on same step)
+                # Replace with cancellation message and end conversation
+                if "message is not modified" in str(e).lower():
+                    await update.callback_query.edit_message_text(
+                        t("msg_operation_cancelled"),
+                        parse_mode="HTML",
+                    )
+                    return States.END
+                raise
+        elif update.message is not None:
+            await update.message.reply_text(
+                message_text,
+                reply_markup=reply_markup,
+                parse_mode="HTML",
+            )
 
-            return States.SELECT_PROPERTY
+        return States.SELECT_PROPERTY
 
     except Exception as e:
         logger.exception(f"Error showing property selection: {e}")
@@ -277,41 +275,39 @@ async def handle_show_empty_properties(update: Update, context: ContextTypes.DEF
             service = ElectricityReadingService(session)
             properties_with_readings = await service.get_properties_with_latest_readings()
 
-            # Filter to show only properties without readings
-            properties_without_data = [
-                (property_obj, latest_reading)
-                for property_obj, latest_reading in properties_with_readings
-                if not latest_reading
-            ]
-
-            if not properties_without_data:
-                await query.edit_message_text(t("msg_all_properties_have_readings"))
-                _clear_meter_context(context)
-                return States.END
-
-            # Build keyboard with properties without readings
-            keyboard = []
-            for property_obj, _ in properties_without_data:
-                button_text = f"📊 {property_obj.property_name} ({t('empty_data')})"
-                keyboard.append(
-                    [
-                        InlineKeyboardButton(
-                            text=button_text,
-                            callback_data=f"meter_property_{property_obj.id}",
-                        )
-                    ]
-                )
+        # Filter to show only properties without readings
+        properties_without_data = [
+            (property_obj, latest_reading)
+            for property_obj, latest_reading in properties_with_readings
+            if not latest_reading
+        ]
+
+        if not properties_without_data:
+            await query.edit_message_text(t("msg_all_properties_have_readings"))
+            _clear_meter_context(context)
+            return States.END
 
+        # Build keyboard with properties without readings
+        keyboard = []
+        for property_obj, _ in properties_without_data:
+            button_text = f"📊 {property_obj.property_name} ({t('empty_data')})"
             keyboard.append(
-                [InlineKeyboardButton(text=t("btn_cancel"), callback_data="meter_cancel")]
+                [
+                    InlineKeyboardButton(
+                        text=button_text,
+                        callback_data=f"meter_property_{property_obj.id}",
+                    )
+                ]
             )
 
-            await query.edit_message_text(
-                t("prompt_select_property_meter"),
-                reply_markup=InlineKeyboardMarkup(keyboard),
-            )
+        keyboard.append([InlineKeyboardButton(text=t("btn_cancel"), callback_data="meter_cancel")])
+
+        await query.edit_message_text(
+            t("prompt_select_property_meter"),
+            reply_markup=InlineKeyboardMarkup(keyboard),
+        )
 
-            return States.SELECT_PROPERTY
+        return States.SELECT_PROPERTY
 
     except Exception as e:
         logger.exception(f"Error showing empty properties: {e}")
@@ -357,69 +353,64 @@ async def handle_property_selection(update: Update, context: ContextTypes.DEFAUL
             result = await session.execute(stmt)
             property_obj = result.scalar_one_or_none()
 
-            if not property_obj:
-                await query.edit_message_text(t("err_no_properties"))
-                _clear_meter_context(context)
-                return States.END
+            # Get latest reading
+            if property_obj:
+                latest_reading = await service.get_latest_reading_for_property(property_id)
+
+        if not property_obj:
+            await query.edit_message_text(t("err_no_properties"))
+            _clear_meter_context(context)
+            return States.END
 
-            context.user_data["meter_property_name"] = property_obj.property_name
+        context.user_data["meter_property_name"] = property_obj.property_name
+        context.user_data["meter_previous_reading"] = latest_reading
 
-            # Get latest reading
-            latest_reading = await service.get_latest_reading_for_property(property_id)
-            context.user_data["meter_previous_reading"] = latest_reading
+        # Build action selection keyboard
+        keyboard = []
 
-            # Build action selection keyboard
-            keyboard = []
+        # Always show "New reading" action
+        keyboard.append(
+            [InlineKeyboardButton(text=t("btn_meter_new"), callback_data="meter_action_new")]
+        )
 
-            # Always show "New reading" action
+        # Show edit/delete only if there's a reading
+        if latest_reading:
             keyboard.append(
-                [InlineKeyboardButton(text=t("btn_meter_new"), callback_data="meter_action_new")]
+                [InlineKeyboardButton(text=t("btn_meter_edit"), callback_data="meter_action_edit")]
             )
-
-            # Show edit/delete only if there's a reading
-            if latest_reading:
-                keyboard.append(
-                    [
-                        InlineKeyboardButton(
-                            text=t("btn_meter_edit"), callback_data="meter_action_edit"
-                        )
-                    ]
-                )
-                keyboard.append(
-                    [
-                        InlineKeyboardButton(
-                            text=t("btn_meter_delete"), callback_data="meter_action_delete"
-                        )
-                    ]
-                )
-
             keyboard.append(
-                [InlineKeyboardButton(text=t("btn_cancel"), callback_data="meter_cancel")]
+                [
+                    InlineKeyboardButton(
+                        text=t("btn_meter_delete"), callback_data="meter_action_delete"
+                    )
+                ]
             )
 
-            # Show current reading if exists
-            property_name = property_obj.property_name
-            message_text = t("prompt_select_meter_action")
-            if latest_reading:
-                message_text = (
-                    t("msg_meter_current_reading").format(
-                        property_name=property_name,
-                        date=latest_reading.reading_date.strftime("%d.%m.%Y"),
-                        value=latest_reading.reading_value,
-                    )
-                    + "\n\n"
-                    + message_text
-                )
-            else:
-                message_text = t("msg_meter_no_previous_reading") + "\n\n" + message_text
+        keyboard.append([InlineKeyboardButton(text=t("btn_cancel"), callback_data="meter_cancel")])
 
-            await query.edit_message_text(
-                message_text,
-                reply_markup=InlineKeyboardMarkup(keyboard),
-                parse_mode="HTML",
+        # Show current reading if exists
+        property_name = property_obj.property_name
+        message_text = t("prompt_select_meter_action")
+        if latest_reading:
+            message_text = (
+                t("msg_meter_current_reading").format(
+                    property_name=property_name,
+                    date=latest_reading.reading_date.strftime("%d.%m.%Y"),
+                    value=latest_reading.reading_value,
+                )
+                + "\n\n"
+                + message_text
             )
+        else:
+            message_text = t("msg_meter_no_previous_reading") + "\n\n" + message_text
+
+        await query.edit_message_text(
+            message_text,
+            reply_markup=InlineKeyboardMarkup(keyboard),
+            parse_mode="HTML",
+        )
 
-            return States.SELECT_ACTION
+        return States.SELECT_ACTION
 
     except Exception as e:
         logger.exception(f"Error in property selection: {e}")
@@ -520,30 +511,30 @@ async def handle_action_selection(update: Update, context: ContextTypes.DEFAULT_
                 # For new readings, use the latest reading as the comparison baseline
                 context.user_data["meter_previous_reading"] = latest_property_reading
 
-            # Build message text (show the reading being edited)
-            if latest_property_reading:
-                message_text = t("msg_meter_previous_reading").format(
-                    property_name=property_name,
-                    date=latest_property_reading.reading_date.strftime("%d.%m.%Y"),
-                    value=latest_property_reading.reading_value,
-                )
-            else:
-                message_text = t("msg_meter_no_previous_reading")
+        # Build message text (show the reading being edited)
+        if latest_property_reading:
+            message_text = t("msg_meter_previous_reading").format(
+                property_name=property_name,
+                date=latest_property_reading.reading_date.strftime("%d.%m.%Y"),
+                value=latest_property_reading.reading_value,
+            )
+        else:
+            message_text = t("msg_meter_no_previous_reading")
 
-            await query.edit_message_text(message_text, parse_mode="HTML")
+        await query.edit_message_text(message_text, parse_mode="HTML")
 
-            # Send date keyboard with globally latest reading date (only if we have a global reading)
-            if latest_global_reading:
-                suggested_date_keyboard = _build_suggested_date_keyboard(
-                    latest_global_reading.reading_date
+        # Send date keyboard with globally latest reading date (only if we have a global reading)
+        if latest_global_reading:
+            suggested_date_keyboard = _build_suggested_date_keyboard(
+                latest_global_reading.reading_date
+            )
+            if suggested_date_keyboard:
+                await query.message.reply_text(
+                    t("prompt_enter_reading_date"),
+                    reply_markup=suggested_date_keyboard,
                 )
-                if suggested_date_keyboard:
-                    await query.message.reply_text(
-                        t("prompt_enter_reading_date"),
-                        reply_markup=suggested_date_keyboard,
-                    )
 
-            return States.ENTER_DATE
+        return States.ENTER_DATE
 
     else:
         await query.edit_message_text(t("err_invalid_action"))
@@ -586,36 +577,37 @@ async def handle_delete_confirmation(update: Update, context: ContextTypes.DEFAU
 
             # Get reading before deletion (for message)
             reading = await service.get_reading_by_id(reading_id)
-            if not reading:
-                await query.edit_message_text(t("err_meter_reading_not_found"))
-                _clear_meter_context(context)
-                return States.END
+            if reading:
+                reading_date = reading.reading_date
 
-            reading_date = reading.reading_date
+                # Delete reading
+                await service.delete_reading(reading_id=reading_id, actor_id=admin_id)
+                await session.commit()
 
-            # Delete reading
-            await service.delete_reading(reading_id=reading_id, actor_id=admin_id)
-            await session.commit()
+        if not reading:
+            await query.edit_message_text(t("err_meter_reading_not_found"))
+            _clear_meter_context(context)
+            return States.END
 
-            success_msg = t("msg_meter_reading_deleted").format(
-                property_name=property_name,
-                date=reading_date.strftime("%d.%m.%Y"),
-            )
+        success_msg = t("msg_meter_reading_deleted").format(
+            property_name=property_name,
+            date=reading_date.strftime("%d.%m.%Y"),
+        )
 
-            # Clear operation-specific context but keep admin context
-            for key in [
-                "meter_property_id",
-                "meter_property_name",
-                "meter_reading_id",
-                "meter_action",
-                "meter_date",
-                "meter_value",
-                "meter_previous_reading",
-            ]:
-                context.user_data.pop(key, None)
-
-            # Return to property selection
-            return await _show_property_selection(update, context, success_msg)
+        # Clear operation-specific context but keep admin context
+        for key in [
+            "meter_property_id",
+            "meter_property_name",
+            "meter_reading_id",
+            "meter_action",
+            "meter_date",
+            "meter_value",
+            "meter_previous_reading",
+        ]:
+            context.user_data.pop(key, None)
+
+        # Return to property selection
+        return await _show_property_selection(update, context, success_msg)
 
     except Exception as e:
         logger.exception(f"Error deleting reading: {e}")
@@ -804,15 +796,31 @@ async def handle_final_confirmation(update: Update, context: ContextTypes.DEFAUL
         _clear_meter_context(context)
         return States.END
 
+    operation_keys = [
+        "meter_property_id",
+        "meter_property_name",
+        "meter_reading_id",
+        "meter_action",
+        "meter_date",
+        "meter_value",
+        "meter_previous_reading",
+    ]
+
+    if action == "edit" and not reading_id:
+        await query.edit_message_text(t("err_meter_reading_not_found"))
+        # Clear only operation context, keep admin context
+        for key in operation_keys:
+            context.user_data.pop(key, None)
+        return States.END
+
     try:
+        message = None
         async with AsyncSessionLocal() as session:
             service = ElectricityReadingService(session)
 
-            success_msg = None
-
-            if action == "new":
-                # Create new reading
-                try:
+            try:
+                if action == "new":
+                    # Create new reading
                     new_reading = await service.create_reading(
                         property_id=property_id,
                         reading_date=reading_date,
@@ -827,61 +835,15 @@ async def handle_final_confirmation(update: Update, context: ContextTypes.DEFAUL
                     else:
                         difference = new_reading.reading_value
 
-                    success_msg = t("msg_meter_reading_created").format(
+                    message = t("msg_meter_reading_created").format(
                         property_name=property_name,
                         date=reading_date.strftime("%d.%m.%Y"),
                         value=reading_value,
                         difference=difference,
                     )
 
-                except ValueError as e:
-                    # Validation error from service
-                    if "must be greater than previous" in str(e):
-                        # Extract previous value from error message
-                        error_msg = None
-                        if previous_reading:
-                            error_msg = t("err_meter_value_less_than_previous").format(
-                                value=reading_value,
-                                previous=previous_reading.reading_value,
-                            )
-                        else:
-                            error_msg = str(e)
-
-                        # Clear only operation context, keep admin context
-                        for key in [
-                            "meter_property_id",
-                            "meter_property_name",
-                            "meter_reading_id",
-                            "meter_action",
-                            "meter_date",
-                            "meter_value",
-                            "meter_previous_reading",
-                        ]:
-                            context.user_data.pop(key, None)
-
-                        # Show error and loop back to property selection
-                        return await _show_property_selection(update, context, error_msg)
-                    else:
-                        raise
-
-            elif action == "edit":
-                # Update existing reading
-                if not reading_id:
-                    await query.edit_message_text(t("err_meter_reading_not_found"))
-                    # Clear only operation context, keep admin context
-                    for key in [
-                        "meter_property_id",
-                        "meter_property_name",
-                        "meter_reading_id",
-                        "meter_action",
-                        "meter_date",
-                        "meter_value",
-                        "meter_previous_reading",
-                    ]:
-                        context.user_data.pop(key, None)
-                    return States.END
-
-                try:
+                elif action == "edit":
+                    # Update existing reading
                     await service.update_reading(
                         reading_id=reading_id,
                         reading_date=reading_date,
@@ -897,56 +859,33 @@ async def handle_final_confirmation(update: Update, context: ContextTypes.DEFAUL
                     else:
                         difference_str = str(reading_value)
 
-                    success_msg = t("msg_meter_reading_updated").format(
+                    message = t("msg_meter_reading_updated").format(
                         property_name=property_name,
                         date=reading_date.strftime("%d.%m.%Y"),
                         value=reading_value,
                         difference=difference_str,
                     )
 
-                except ValueError as e:
-                    if "must be greater than previous" in str(e):
-                        # Extract previous value if available
-                        error_msg = None
-                        if previous_reading:
-                            error_msg = t("err_meter_value_less_than_previous").format(
-                                value=reading_value,
-                                previous=previous_reading.reading_value,
-                            )
-                        else:
-                            error_msg = str(e)
-
-                        # Clear only operation context, keep admin context
-                        for key in [
-                            "meter_property_id",
-                            "meter_property_name",
-                            "meter_reading_id",
-                            "meter_action",
-                            "meter_date",
-                            "meter_value",
-                            "meter_previous_reading",
-                        ]:
-                            context.user_data.pop(key, None)
-
-                        # Show error and loop back to property selection
-                        return await _show_property_selection(update, context, error_msg)
-                    else:
-                        raise
-
-            # Clear operation-specific context but keep admin context
-            for key in [
-                "meter_property_id",
-                "meter_property_name",
-                "meter_reading_id",
-                "meter_action",
-                "meter_date",
-                "meter_value",
-                "meter_previous_reading",
-            ]:
-                context.user_data.pop(key, None)
-
-            # Return to property selection with success message
-            return await _show_property_selection(update, context, success_msg)
+            except ValueError as e:
+                # Validation error from service
+                if "must be greater than previous" not in str(e):
+                    raise
+                await session.rollback()
+                if previous_reading:
+                    message = t("err_meter_value_less_than_previous").format(
+                        value=reading_value,
+                        previous=previous_reading.reading_value,
+                    )
+                else:
+                    message = str(e)
+
+        # Clear operation-specific context but keep admin context
+        for key in operation_keys:
+            context.user_data.pop(key, None)
+
+        # Return to property selection with the success or validation message
+        # (outside the session: it opens one of its own)
+        return await _show_property_selection(update, context, message)
 
     except Exception as e:
         logger.exception(f"Error processing meter reading: {e}")
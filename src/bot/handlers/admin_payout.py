@@ -151,40 +151,40 @@ async def handle_payout_command(update: Update, context: ContextTypes.DEFAULT_TY
             transaction_service = TransactionService(session)
             accounts = await transaction_service.get_accounts_by_from_frequency()
 
-            if not accounts:
-                await update.message.reply_text(t("err_no_accounts"))
-                return States.END
+        if not accounts:
+            await update.message.reply_text(t("err_no_accounts"))
+            return States.END
 
-            # Build inline buttons for account selection
-            buttons: list[list[InlineKeyboardButton]] = []
-            for account in accounts:
-                buttons.append(
-                    [
-                        InlineKeyboardButton(
-                            f"💳 {account.name}", callback_data=f"payout_from:{account.id}"
-                        )
-                    ]
-                )
+        # Build inline buttons for account selection
+        buttons: list[list[InlineKeyboardButton]] = []
+        for account in accounts:
+            buttons.append(
+                [
+                    InlineKeyboardButton(
+                        f"💳 {account.name}", callback_data=f"payout_from:{account.id}"
+                    )
+                ]
+            )
 
-            keyboard = InlineKeyboardMarkup(buttons)
+        keyboard = InlineKeyboardMarkup(buttons)
 
-            await update.message.reply_text(
-                t("prompt_select_from_account"),
-                reply_markup=keyboard,
-            )
+        await update.message.reply_text(
+            t("prompt_select_from_account"),
+            reply_markup=keyboard,
+        )
 
-            logger.info(
-                "Payout workflow started by admin user_id=%d (telegram_id=%d)",
-                admin_user.id,
-                telegram_id,
-            )
+        logger.info(
+            "Payout workflow started by admin user_id=%d (telegram_id=%d)",
+            admin_user.id,
+            telegram_id,
+        )
 
-            # Store authenticated admin user context
-            if context.user_data is not None:
-                context.user_data["authorized_admin"] = admin_user
-                context.user_data["payout_admin_id"] = telegram_id
+        # Store authenticated admin user context
+        if context.user_data is not None:
+            context.user_data["authorized_admin"] = admin_user
+            context.user_data["payout_admin_id"] = telegram_id
 
-            return States.SELECT_FROM
+        return States.SELECT_FROM
 
     except Exception as e:
         logger.error("Error starting payout workflow: %s", e, exc_info=True)
@@ -210,68 +210,64 @@ async def handle_from_selection(update: Update, context: ContextTypes.DEFAULT_TY
 
         await cq.answer()
 
+        # Extract account ID
+        try:
+            from_account_id = int(cq.data.split(":")[1])
+        except (IndexError, ValueError):
+            logger.warning("Invalid from account callback data: %s", cq.data)
+            await cq.edit_message_text(t("err_processing"), reply_markup=InlineKeyboardMarkup([]))
+            return States.END
+
         async with AsyncSessionLocal() as session:
             transaction_service = TransactionService(session)
 
-            # Extract account ID
-            try:
-                from_account_id = int(cq.data.split(":")[1])
-            except (IndexError, ValueError):
-                logger.warning("Invalid from account callback data: %s", cq.data)
-                await cq.edit_message_text(
-                    t("err_processing"), reply_markup=InlineKeyboardMarkup([])
-                )
-                return States.END
-
-            # Fetch and validate from account
+            # Fetch from account and the destination accounts ordered by frequency with it
             from_account = await transaction_service.get_account_by_id(from_account_id)
-            if not from_account:
-                logger.warning("From account %d not found", from_account_id)
-                await cq.edit_message_text(
-                    t("err_processing"), reply_markup=InlineKeyboardMarkup([])
+            if from_account:
+                to_accounts = await transaction_service.get_accounts_by_to_frequency(
+                    from_account_id
                 )
-                return States.END
 
-            # Store selected from account
-            if context.user_data is not None:
-                context.user_data["payout_from_account"] = from_account
+        if not from_account:
+            logger.warning("From account %d not found", from_account_id)
+            await cq.edit_message_text(t("err_processing"), reply_markup=InlineKeyboardMarkup([]))
+            return States.END
 
-            # Get destination accounts ordered by frequency with this source
-            to_accounts = await transaction_service.get_accounts_by_to_frequency(from_account_id)
+        # Store selected from account
+        if context.user_data is not None:
+            context.user_data["payout_from_account"] = from_account
 
-            if not to_accounts:
-                await cq.edit_message_text(
-                    t("err_no_accounts"), reply_markup=InlineKeyboardMarkup([])
-                )
-                return States.END
-
-            # Build inline buttons for destination account selection
-            buttons: list[list[InlineKeyboardButton]] = []
-            for account in to_accounts:
-                if account.id != from_account_id:  # Exclude self-transfers
-                    buttons.append(
-                        [
-                            InlineKeyboardButton(
-                                f"💳 {account.name}",
-                                callback_data=f"payout_to:{account.id}",
-                            )
-                        ]
-                    )
+        if not to_accounts:
+            await cq.edit_message_text(t("err_no_accounts"), reply_markup=InlineKeyboardMarkup([]))
+            return States.END
 
-            if not buttons:
-                await cq.edit_message_text(
-                    t("err_no_destination_accounts"), reply_markup=InlineKeyboardMarkup([])
+        # Build inline buttons for destination account selection
+        buttons: list[list[InlineKeyboardButton]] = []
+        for account in to_accounts:
+            if account.id != from_account_id:  # Exclude self-transfers
+                buttons.append(
+                    [
+                        InlineKeyboardButton(
+                            f"💳 {account.name}",
+                            callback_data=f"payout_to:{account.id}",
+                        )
+                    ]
                 )
-                return States.END
-
-            keyboard = InlineKeyboardMarkup(buttons)
 
+        if not buttons:
             await cq.edit_message_text(
-                t("prompt_select_to_account"),
-                reply_markup=keyboard,
+                t("err_no_destination_accounts"), reply_markup=InlineKeyboardMarkup([])
             )
+            return States.END
 
-            return States.SELECT_TO
+        keyboard = InlineKeyboardMarkup(buttons)
+
+        await cq.edit_message_text(
+            t("prompt_select_to_account"),
+            reply_markup=keyboard,
+        )
+
+        return States.SELECT_TO
 
     except Exception as e:
         logger.error("Error handling from selection: %s", e, exc_info=True)
@@ -299,94 +295,88 @@ async def handle_to_selection(update: Update, context: ContextTypes.DEFAULT_TYPE
 
         await cq.answer()
 
+        # Extract account ID
+        try:
+            to_account_id = int(cq.data.split(":")[1])
+        except (IndexError, ValueError):
+            logger.warning("Invalid to account callback data: %s", cq.data)
+            await cq.edit_message_text(t("err_processing"), reply_markup=InlineKeyboardMarkup([]))
+            return States.END
+
+        # Get from account from context
+        if context.user_data is None:
+            logger.warning("Context user_data is None")
+            await cq.edit_message_text(t("err_processing"), reply_markup=InlineKeyboardMarkup([]))
+            return States.END
+
+        from_account = context.user_data.get("payout_from_account")
+        if not from_account:
+            logger.warning("From account not found in context")
+            await cq.edit_message_text(t("err_processing"), reply_markup=InlineKeyboardMarkup([]))
+            return States.END
+
         async with AsyncSessionLocal() as session:
             transaction_service = TransactionService(session)
 
-            # Extract account ID
-            try:
-                to_account_id = int(cq.data.split(":")[1])
-            except (IndexError, ValueError):
-                logger.warning("Invalid to account callback data: %s", cq.data)
-                await cq.edit_message_text(
-                    t("err_processing"), reply_markup=InlineKeyboardMarkup([])
-                )
-                return States.END
-
             # Fetch and validate to account
             to_account = await transaction_service.get_account_by_id(to_account_id)
-            if not to_account:
-                logger.warning("To account %d not found", to_account_id)
-                await cq.edit_message_text(
-                    t("err_processing"), reply_markup=InlineKeyboardMarkup([])
+            if to_account:
+                # Calculate suggested amount and current debt
+                suggested_amount = await transaction_service.calculate_suggested_amount(
+                    from_account, to_account
                 )
-                return States.END
 
-            # Get from account from context
-            if context.user_data is None:
-                logger.warning("Context user_data is None")
-                await cq.edit_message_text(
-                    t("err_processing"), reply_markup=InlineKeyboardMarkup([])
-                )
-                return States.END
+                # For OWNER → ORGANIZATION with positive debt, show both debt and payout
+                balance = None
+                if (
+                    from_account.account_type == AccountType.OWNER
+                    and to_account.account_type == AccountType.ORGANIZATION
+                ):
+                    balance = await transaction_service.balance_service.calculate_account_balance(
+                        from_account.id
+                    )
 
-            from_account = context.user_data.get("payout_from_account")
-            if not from_account:
-                logger.warning("From account not found in context")
-                await cq.edit_message_text(
-                    t("err_processing"), reply_markup=InlineKeyboardMarkup([])
-                )
-                return States.END
+        if not to_account:
+            logger.warning("To account %d not found", to_account_id)
+            await cq.edit_message_text(t("err_processing"), reply_markup=InlineKeyboardMarkup([]))
+            return States.END
 
-            # Store selected to account
-            context.user_data["payout_to_account"] = to_account
+        # Store selected to account
+        context.user_data["payout_to_account"] = to_account
 
-            # Calculate suggested amount and current debt
-            suggested_amount = await transaction_service.calculate_suggested_amount(
-                from_account, to_account
+        # Default to showing suggested amount only
+        debt_info = t("hint_suggested_amount", amount=format_currency(suggested_amount))
+        if balance is not None and balance > 0:
+            debt_info = t(
+                "hint_debt_and_payout",
+                debt=format_currency(balance),
+                payout=format_currency(suggested_amount),
             )
 
-            # Default to showing suggested amount only
-            debt_info = t("hint_suggested_amount", amount=format_currency(suggested_amount))
+        # Build keyboard with suggested amount if available
+        keyboard = _build_suggested_amount_keyboard(suggested_amount)
 
-            # For OWNER → ORGANIZATION with positive debt, show both debt and payout
-            if (
-                from_account.account_type == AccountType.OWNER
-                and to_account.account_type == AccountType.ORGANIZATION
-            ):
-                balance = await transaction_service.balance_service.calculate_account_balance(
-                    from_account.id
-                )
-                if balance > 0:
-                    debt_info = t(
-                        "hint_debt_and_payout",
-                        debt=format_currency(balance),
-                        payout=format_currency(suggested_amount),
-                    )
-
-            # Build keyboard with suggested amount if available
-            keyboard = _build_suggested_amount_keyboard(suggested_amount)
-
-            # Send debt/payout info with optional suggested amount
-            if keyboard:
-                await cq.edit_message_text(
-                    debt_info,
-                    reply_markup=InlineKeyboardMarkup([]),
-                )
-                # Send keyboard in separate message to avoid keyboard state pollution
-                from telegram import Message
+        # Send debt/payout info with optional suggested amount
+        if keyboard:
+            await cq.edit_message_text(
+                debt_info,
+                reply_markup=InlineKeyboardMarkup([]),
+            )
+            # Send keyboard in separate message to avoid keyboard state pollution
+            from telegram import Message
 
-                if isinstance(cq.message, Message):
-                    await cq.message.reply_text(
-                        t("prompt_enter_or_use_suggested"),
-                        reply_markup=keyboard,
-                    )
-            else:
-                await cq.edit_message_text(
-                    debt_info,
-                    reply_markup=InlineKeyboardMarkup([]),
+            if isinstance(cq.message, Message):
+                await cq.message.reply_text(
+                    t("prompt_enter_or_use_suggested"),
+                    reply_markup=keyboard,
                 )
+        else:
+            await cq.edit_message_text(
+                debt_info,
+                reply_markup=InlineKeyboardMarkup([]),
+            )
 
-            return States.ENTER_AMOUNT
+        return States.ENTER_AMOUNT
 
     except Exception as e:
         logger.error("Error handling to selection: %s", e, exc_info=True)
@@ -499,14 +489,14 @@ async def handle_transaction_date_input(update: Update, context: ContextTypes.DE
                 from_account, to_account, amount
             )
 
-            keyboard = _build_suggested_description_keyboard(suggested_description)
+        keyboard = _build_suggested_description_keyboard(suggested_description)
 
-            await update.message.reply_text(
-                t("prompt_enter_description"),
-                reply_markup=keyboard,
-            )
+        await update.message.reply_text(
+            t("prompt_enter_description"),
+            reply_markup=keyboard,
+        )
 
-            return States.ENTER_DESCRIPTION
+        return States.ENTER_DESCRIPTION
 
     except Exception as e:
         logger.error("Error handling transaction date input: %s", e, exc_info=True)
@@ -651,6 +641,18 @@ async def handle_confirm(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         return States.END
 
 
+def _payout_idempotency_key(cq) -> str:
+    """Idempotency key for the payout confirmed through this callback.
+
+    Every payout flow ends in its own summary message, so the message identity
+    names the logical transaction; redelivered or repeated taps share it.
+    """
+    message = cq.message
+    if message is not None and message.chat is not None:
+        return f"payout:{message.chat.id}:{message.message_id}"
+    return f"payout:callback:{cq.id}"
+
+
 def _parse_confirm_action(callback_data: str) -> str:
     return callback_data.split(":")[1] if ":" in callback_data else ""
 
@@ -683,54 +685,79 @@ async def _create_and_notify_payout_transaction(
     transaction_date: date,
     admin_user,
 ) -> None:
+    idempotency_key = _payout_idempotency_key(cq)
+
+    # Only database work runs inside the session: the single writer connection is
+    # released before the confirmation edit and the owners' notification fan-out
+    existing = transaction = None
     async with AsyncSessionLocal() as session:
         try:
             transaction_service = TransactionService(session)
 
-            transaction = await transaction_service.create_transaction(
-                from_account_id=from_account.id,
-                to_account_id=to_account.id,
-                amount=amount,
-                description=description,
-                transaction_date=transaction_date,
-                actor_id=admin_user.id,
-            )
+            # A repeated confirmation of the same summary message is a no-op
+            existing = await transaction_service.get_transaction_by_idempotency_key(idempotency_key)
+            if existing is None:
+                transaction = await transaction_service.create_transaction(
+                    from_account_id=from_account.id,
+                    to_account_id=to_account.id,
+                    amount=amount,
+                    description=description,
+                    transaction_date=transaction_date,
+                    actor_id=admin_user.id,
+                    idempotency_key=idempotency_key,
+                )
 
             await session.commit()
 
-            logger.info(
-                "Transaction created by admin user_id=%d: transaction_id=%d",
-                admin_user.id,
-                transaction.id,
-            )
+        except Exception as e:
+            logger.error("Error creating transaction: %s", e, exc_info=True)
+            await session.rollback()
+            existing = transaction = None
 
-            success_text = t(
+    if existing is not None:
+        logger.info("Payout confirmation repeated: transaction_id=%d already exists", existing.id)
+        await cq.edit_message_text(
+            t(
                 "msg_transaction_created",
-                description=description,
-                date=transaction.transaction_date.strftime("%d.%m.%Y"),
-            )
+                description=existing.description,
+                date=existing.transaction_date.strftime("%d.%m.%Y"),
+            ),
+            reply_markup=InlineKeyboardMarkup([]),
+            parse_mode="HTML",
+        )
+        return
 
-            try:
-                if context.application:
-                    notifier = NotificationService(context.application)
-                    await notifier.notify_account_owners_and_representatives(
-                        session=session,
-                        account_ids=[from_account.id, to_account.id],
-                        text=success_text,
-                    )
-            except Exception:
-                logger.exception("Error notifying owners/representatives about payout")
+    if transaction is None:
+        await cq.edit_message_text(t("err_processing"), reply_markup=InlineKeyboardMarkup([]))
+        return
 
-            await cq.edit_message_text(
-                success_text,
-                reply_markup=InlineKeyboardMarkup([]),
-                parse_mode="HTML",
+    logger.info(
+        "Transaction created by admin user_id=%d: transaction_id=%d",
+        admin_user.id,
+        transaction.id,
+    )
+
+    success_text = t(
+        "msg_transaction_created",
+        description=description,
+        date=transaction.transaction_date.strftime("%d.%m.%Y"),
+    )
+
+    try:
+        if context.application:
+            notifier = NotificationService(context.application)
+            await notifier.notify_account_owners_and_representatives(
+                account_ids=[from_account.id, to_account.id],
+                text=success_text,
             )
+    except Exception:
+        logger.exception("Error notifying owners/representatives about payout")
 
-        except Exception as e:
-            logger.error("Error creating transaction: %s", e, exc_info=True)
-            await session.rollback()
-            await cq.edit_message_text(t("err_processing"), reply_markup=InlineKeyboardMarkup([]))
+    await cq.edit_message_text(
+        success_text,
+        reply_markup=InlineKeyboardMarkup([]),
+        parse_mode="HTML",
+    )
 
 
 __all__ = [
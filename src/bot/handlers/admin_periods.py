@@ -168,13 +168,13 @@ async def handle_period_action_selection(  # noqa: C901
                 period_service = ServicePeriodService(session)
                 last_period = await period_service.get_latest_period()
 
-                keyboard = None
-                if last_period and last_period.end_date:
-                    suggested_start_str = last_period.end_date.strftime("%d.%m.%Y")
-                    keyboard = _build_previous_value_keyboard(suggested_start_str)
+            keyboard = None
+            if last_period and last_period.end_date:
+                suggested_start_str = last_period.end_date.strftime("%d.%m.%Y")
+                keyboard = _build_previous_value_keyboard(suggested_start_str)
 
-                await cq.message.reply_text(t("prompt_period_start_date"), reply_markup=keyboard)
-                return States.INPUT_START_DATE
+            await cq.message.reply_text(t("prompt_period_start_date"), reply_markup=keyboard)
+            return States.INPUT_START_DATE
 
         elif cq.data == "period_action:view":
             # Show existing periods
@@ -182,50 +182,48 @@ async def handle_period_action_selection(  # noqa: C901
                 period_service = ServicePeriodService(session)
                 periods = await period_service.list_periods(limit=10)
 
-                if not periods:
-                    await cq.edit_message_text(t("empty_periods"))
-                    return States.END
-
-                periods_text = t("title_existing_periods") + "\n\n"
-                for period in periods:
-                    status_emoji = "🟢" if period.status == "open" else "🔴"
-                    status_text = (
-                        t("status_open") if period.status == "open" else t("status_closed")
-                    )
-                    periods_text += (
-                        f"{status_emoji} {period.name}\n   {t('title_status')} {status_text}\n\n"
-                    )
-
-                await cq.edit_message_text(periods_text, parse_mode="Markdown")
+            if not periods:
+                await cq.edit_message_text(t("empty_periods"))
                 return States.END
 
+            periods_text = t("title_existing_periods") + "\n\n"
+            for period in periods:
+                status_emoji = "🟢" if period.status == "open" else "🔴"
+                status_text = t("status_open") if period.status == "open" else t("status_closed")
+                periods_text += (
+                    f"{status_emoji} {period.name}\n   {t('title_status')} {status_text}\n\n"
+                )
+
+            await cq.edit_message_text(periods_text, parse_mode="Markdown")
+            return States.END
+
         elif cq.data == "period_action:close":
             # Show list of open periods to close
             async with AsyncSessionLocal() as session:
                 period_service = ServicePeriodService(session)
                 open_periods = await period_service.get_open_periods()
 
-                if not open_periods:
-                    await cq.edit_message_text(t("empty_periods_to_close"))
-                    return States.END
-
-                # Build buttons for each open period
-                buttons = []
-                for period in open_periods:
-                    buttons.append(
-                        [
-                            InlineKeyboardButton(
-                                f"🟢 {period.name}", callback_data=f"close_period:{period.id}"
-                            )
-                        ]
-                    )
-                keyboard = InlineKeyboardMarkup(buttons)
-
-                await cq.edit_message_text(
-                    t("prompt_select_period_to_close"),
-                    reply_markup=keyboard,
+            if not open_periods:
+                await cq.edit_message_text(t("empty_periods_to_close"))
+                return States.END
+
+            # Build buttons for each open period
+            buttons = []
+            for period in open_periods:
+                buttons.append(
+                    [
+                        InlineKeyboardButton(
+                            f"🟢 {period.name}", callback_data=f"close_period:{period.id}"
+                        )
+                    ]
                 )
-                return States.SELECT_ACTION
+            keyboard = InlineKeyboardMarkup(buttons)
+
+            await cq.edit_message_text(
+                t("prompt_select_period_to_close"),
+                reply_markup=keyboard,
+            )
+            return States.SELECT_ACTION
 
         else:
             logger.warning("Unknown period action: %s", cq.data)
@@ -320,29 +318,29 @@ async def handle_period_months_input(update: Update, context: ContextTypes.DEFAU
                 actor_id=admin_id,
             )
 
-            context.user_data["period_id"] = new_period.id
-            context.user_data["period_name"] = new_period.name
+        context.user_data["period_id"] = new_period.id
+        context.user_data["period_name"] = new_period.name
 
-            logger.info(
-                "Created new service period: id=%d, name=%s, dates=%s to %s, period_months=%d, admin_id=%d",
-                new_period.id,
-                new_period.name,
-                start_date,
-                new_period.end_date,
-                period_months,
-                context.user_data.get("periods_admin_id"),
-            )
+        logger.info(
+            "Created new service period: id=%d, name=%s, dates=%s to %s, period_months=%d, admin_id=%d",
+            new_period.id,
+            new_period.name,
+            start_date,
+            new_period.end_date,
+            period_months,
+            context.user_data.get("periods_admin_id"),
+        )
 
-            # Show confirmation with period details
-            status_emoji = "🟢"
-            message = (
-                f"✅ {t('msg_period_created')}\n\n"
-                f"{status_emoji} {new_period.name}\n"
-                f"   {t('title_status')} {t('status_open')}"
-            )
-            await update.message.reply_text(message)
+        # Show confirmation with period details
+        status_emoji = "🟢"
+        message = (
+            f"✅ {t('msg_period_created')}\n\n"
+            f"{status_emoji} {new_period.name}\n"
+            f"   {t('title_status')} {t('status_open')}"
+        )
+        await update.message.reply_text(message)
 
-            return States.END
+        return States.END
 
     except Exception as e:
         logger.error("Error in period months input: %s", e, exc_info=True)
@@ -375,33 +373,29 @@ async def handle_close_period_confirmation(
             await cq.edit_message_text(t("err_processing"))
             return States.END
 
+        admin_user = context.user_data.get("authorized_admin")
+        actor_id = admin_user.id if admin_user else None
+
         async with AsyncSessionLocal() as session:
             period_service = ServicePeriodService(session)
             period = await period_service.get_by_id(period_id)
 
-            if not period:
-                await cq.edit_message_text(t("err_processing"))
-                return States.END
-
-            admin_user = context.user_data.get("authorized_admin")
-            actor_id = admin_user.id if admin_user else None
-
             # Close the period using service method
-            success = await period_service.close_period(
+            success = period is not None and await period_service.close_period(
                 period_id=period_id,
                 actor_id=actor_id,
             )
 
-            if not success:
-                await cq.edit_message_text(t("err_processing"))
-                return States.END
+        if not success:
+            await cq.edit_message_text(t("err_processing"))
+            return States.END
 
-            await cq.edit_message_text(t("msg_period_closed", period_name=period.name))
+        await cq.edit_message_text(t("msg_period_closed", period_name=period.name))
 
-            # Clear any context
-            _clear_periods_context(context)
+        # Clear any context
+        _clear_periods_context(context)
 
-            return States.END
+        return States.END
 
     except Exception as e:
         logger.error("Error closing period: %s", e, exc_info=True)
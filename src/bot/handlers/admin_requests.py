@@ -50,25 +50,27 @@ async def _execute_admin_action(
                 admin_user=admin_user,
                 selected_user_id=selected_user_id,
             )
-            if not request:
-                return None, t("err_request_not_found_or_invalid")
-
-            # Send welcome notification to the approved user
-            notification_service = NotificationService(context.application)
-            await notification_service.send_welcome_message(requester_id=request.user_telegram_id)
-            return request, None
-
         else:  # reject
             request = await admin_service.reject_request(
                 request_id=request_id, admin_user=admin_user
             )
-            if not request:
-                return None, t("err_request_not_found")
 
-            # Send rejection notification to the user
-            notification_service = NotificationService(context.application)
-            await notification_service.send_rejection_message(requester_id=request.user_telegram_id)
-            return request, None
+    # Notify the requester once the session is closed
+    notification_service = NotificationService(context.application)
+    if action == "approve":
+        if not request:
+            return None, t("err_request_not_found_or_invalid")
+
+        # Send welcome notification to the approved user
+        await notification_service.send_welcome_message(requester_id=request.user_telegram_id)
+        return request, None
+
+    if not request:
+        return None, t("err_request_not_found")
+
+    # Send rejection notification to the user
+    await notification_service.send_rejection_message(requester_id=request.user_telegram_id)
+    return request, None
 
 
 async def handle_admin_response(  # noqa: C901
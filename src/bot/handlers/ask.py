@@ -2,6 +2,10 @@
 
 Provides conversational AI access to SOSenki data using Ollama with tool calling.
 Users can ask questions about their balance, bills, and periods in natural language.
+One reply message is edited as the answer progresses: tool-calling rounds
+show an interim status, then the answer replaces it (text the model writes
+before a tool call is never shown). While the model is busy with
+other users' questions, the message shows the position in the queue.
 """
 
 import logging
@@ -10,9 +14,12 @@ import os
 from telegram import Update
 from telegram.ext import ContextTypes
 
-from src.services import AsyncSessionLocal
+from src.bot.streaming_reply import StreamingReply
+from src.services import AsyncReadSessionLocal, AsyncSessionLocal
+from src.services.llm_pool import AdmissionTimeout
 from src.services.llm_service import OllamaService
 from src.services.localizer import t
+from src.services.prompt_assembler import get_conversation_memory
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +29,7 @@ def is_llm_enabled() -> bool:
     return bool(os.getenv("OLLAMA_MODEL"))
 
 
-async def handle_ask_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+async def handle_ask_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:  # noqa: C901
     """Handle /ask command for natural language queries.
 
     Usage:
@@ -70,43 +77,69 @@ async def handle_ask_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         # Import here to avoid circular import (auth_service -> bot_config -> bot/__init__)
         from src.services.auth_service import get_authenticated_user
 
+        user = None
         async with AsyncSessionLocal() as session:
             try:
                 user = await get_authenticated_user(session, telegram_id)
             except Exception as e:
                 logger.warning(f"Auth failed for telegram_id={telegram_id}: {e}")
-                await update.message.reply_text(t("err_not_authorized"))
-                return
 
-            # Send typing indicator while processing
-            await update.message.chat.send_action("typing")
+        if user is None:
+            await update.message.reply_text(t("err_not_authorized"))
+            return
+
+        # Send typing indicator while processing
+        await update.message.chat.send_action("typing")
 
+        # The chat session holds the single writer connection only while a write
+        # tool runs (each one commits straight away); reads use the reader pool
+        async with AsyncSessionLocal() as session:
             # Initialize Ollama service with user context
             ollama = OllamaService(
                 session=session,
                 user_id=user.id,
                 is_admin=user.is_administrator,
+                read_session_factory=AsyncReadSessionLocal,
+                memory=get_conversation_memory(),
             )
 
             logger.info(
                 f"Processing /ask from user_id={user.id} (admin={user.is_administrator}): {question[:50]}..."
             )
 
-            # Get AI response
+            # Stream the AI response into one progressively edited message
+            reply = StreamingReply(update.message)
+
+            async def show_tool_status(tool_names: list[str]) -> None:
+                await reply.update(t("msg_ask_tool_status", tools=", ".join(tool_names)))
+
+            async def show_queue_position(position: int) -> None:
+                await reply.update(t("msg_ask_queue_position", position=position))
+
             try:
-                response = await ollama.chat(question)
+                response = await ollama.chat(
+                    question,
+                    on_text=reply.update,
+                    on_tool_calls=show_tool_status,
+                    on_queue_position=show_queue_position,
+                )
+            except AdmissionTimeout:
+                logger.warning(f"/ask from user_id={user.id} timed out waiting for the LLM")
+                await reply.finish(t("err_llm_busy"))
+                return
             except Exception as e:
                 logger.error(f"Ollama chat error: {e}", exc_info=True)
-                await update.message.reply_text(
+                await reply.finish(
                     "Sorry, I couldn't process your question. "
                     "Please make sure the AI service is running and try again."
                 )
                 return
 
-            # Send response
-            await update.message.reply_text(response)
+            await reply.finish(response)
 
-            logger.info(f"Sent AI response to user_id={user.id}, length={len(response)}")
+            logger.info(
+                f"Sent AI response to user_id={user.id}, length={len(response)}, edits={reply.edits}"
+            )
 
     except Exception as e:
         logger.error(f"Error in /ask handler: {e}", exc_info=True)
@@ -99,55 +99,57 @@ async def handle_request_command(  # noqa: C901
             user_service = UserService(session)
             existing_user = await user_service.get_active_user_by_telegram_id(requester_id)
 
-            if existing_user:
-                logger.info("User %s (%s) already has access", requester_id, existing_user.name)
+            if not existing_user:
+                request_service = RequestService(session)
+                new_request = await request_service.create_request(
+                    user_telegram_id=requester_id,
+                    request_message=request_message,
+                    user_telegram_username=requester_username,
+                )
 
-                from src.bot.config import bot_config
+        # Replies and notifications are sent once the session is closed
+        if existing_user:
+            logger.info("User %s (%s) already has access", requester_id, existing_user.name)
+
+            from src.bot.config import bot_config
 
-                keyboard = InlineKeyboardMarkup(
+            keyboard = InlineKeyboardMarkup(
+                [
                     [
-                        [
-                            InlineKeyboardButton(
-                                text=t("btn_open_app"),
-                                web_app=WebAppInfo(url=bot_config.mini_app_url),
-                            )
-                        ]
+                        InlineKeyboardButton(
+                            text=t("btn_open_app"),
+                            web_app=WebAppInfo(url=bot_config.mini_app_url),
+                        )
                     ]
-                )
+                ]
+            )
+
+            await update.message.reply_text(t("msg_already_have_access"), reply_markup=keyboard)
+            return
+
+        if not new_request:
+            # T035: Handle duplicate pending request
+            logger.warning("Duplicate pending request from requester %s", requester_id)
+            await update.message.reply_text(t("msg_request_duplicate"))
+            return
 
-                await update.message.reply_text(t("msg_already_have_access"), reply_markup=keyboard)
-                return
+        # T029: Send confirmation to requester
+        notification_service = NotificationService(context.application)
+        await notification_service.send_confirmation_to_requester(requester_id=requester_id)
+        logger.info("Sent confirmation to requester %s", requester_id)
 
-            request_service = RequestService(session)
-            new_request = await request_service.create_request(
-                user_telegram_id=requester_id,
+        # T030: Send admin notification
+        try:
+            await notification_service.send_notification_to_admin(
+                request_id=new_request.id,
+                requester_id=requester_id,
+                requester_username=requester_username,
                 request_message=request_message,
-                user_telegram_username=requester_username,
             )
-
-            if not new_request:
-                # T035: Handle duplicate pending request
-                logger.warning("Duplicate pending request from requester %s", requester_id)
-                await update.message.reply_text(t("msg_request_duplicate"))
-                return
-
-            # T029: Send confirmation to requester
-            notification_service = NotificationService(context.application)
-            await notification_service.send_confirmation_to_requester(requester_id=requester_id)
-            logger.info("Sent confirmation to requester %s", requester_id)
-
-            # T030: Send admin notification
-            try:
-                await notification_service.send_notification_to_admin(
-                    request_id=new_request.id,
-                    requester_id=requester_id,
-                    requester_username=requester_username,
-                    request_message=request_message,
-                )
-                logger.info("Sent admin notification for request %d", new_request.id)
-            except Exception as e:
-                logger.error("Failed to send admin notification: %s", e)
-                # Don't fail the handler if admin notification fails
+            logger.info("Sent admin notification for request %d", new_request.id)
+        except Exception as e:
+            logger.error("Failed to send admin notification: %s", e)
+            # Don't fail the handler if admin notification fails
 
     except Exception as e:
         # T035: Handle and log errors
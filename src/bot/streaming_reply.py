@@ -0,0 +1,154 @@
+"""One Telegram message progressively edited while an answer is generated.
+
+``/ask`` used to reply only after the whole LLM completion, so the user saw
+"typing" for the full generation. StreamingReply shows the first tokens as
+soon as they arrive and keeps editing the same message:
+
+- Coalescing: ``update()`` only records the latest text; a single flusher task
+  edits the message with whatever is newest when the next edit is allowed, so
+  intermediate versions are skipped instead of queued.
+- Rate limits: every send/edit waits for the shared Telegram rate limiter
+  (per-chat and global buckets) and at least ``min_interval`` seconds pass
+  between edits. RetryAfter holds the chat back for the requested time.
+- ``finish()`` writes the final text; answers longer than a Telegram message
+  continue in follow-up messages. If nothing was shown yet, it is a plain reply.
+
+Tunables (environment variables):
+    ASK_STREAM_EDIT_INTERVAL    Minimum seconds between edits (default: 1.5)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any
+
+from telegram.error import BadRequest, RetryAfter
+
+from src.services.telegram_fanout import (
+    TelegramRateLimiter,
+    get_rate_limiter,
+    retry_after_seconds,
+)
+
+logger = logging.getLogger(__name__)
+
+ASK_STREAM_EDIT_INTERVAL = float(os.getenv("ASK_STREAM_EDIT_INTERVAL") or 1.5)
+MAX_MESSAGE_LENGTH = 4096
+CURSOR = " ▌"
+
+
+def split_message(text: str, limit: int = MAX_MESSAGE_LENGTH) -> list[str]:
+    """Split text into Telegram-sized parts, preferring line breaks."""
+    parts = []
+    while len(text) > limit:
+        cut = text.rfind("\n", 0, limit)
+        if cut <= 0:
+            cut = limit
+        parts.append(text[:cut])
+        text = text[cut:].lstrip("\n")
+    parts.append(text)
+    return parts
+
+
+class StreamingReply:
+    """Reply to ``message`` and keep editing the reply with the newest text."""
+
+    def __init__(
+        self,
+        message: Any,
+        min_interval: float = ASK_STREAM_EDIT_INTERVAL,
+        rate_limiter: TelegramRateLimiter | None = None,
+    ):
+        self.message = message
+        self.min_interval = min_interval
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.edits = 0
+        self._reply: Any = None
+        self._shown: str | None = None
+        self._pending: str | None = None
+        self._last_edit = float("-inf")
+        self._wake = asyncio.Event()
+        self._closed = False
+        self._flusher: asyncio.Task | None = None
+
+    @property
+    def started(self) -> bool:
+        """Whether a reply message has been sent."""
+        return self._reply is not None
+
+    async def update(self, text: str) -> None:
+        """Show ``text`` (with a cursor) as soon as the rate limits allow; never waits."""
+        if self._closed or not text.strip():
+            return
+        self._pending = text
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop(), name="streaming-reply")
+
+    async def finish(self, text: str) -> None:
+        """Replace the interim text with the final answer."""
+        self._closed = True
+        self._pending = None
+        if self._flusher is not None:
+            self._wake.set()
+            await self._flusher
+            self._flusher = None
+
+        parts = split_message(text or "…")
+        if self._reply is None:
+            for part in parts:
+                await self.message.reply_text(part)
+            return
+        await self._show(parts[0])
+        for part in parts[1:]:
+            await self._send_with_limits(self.message.reply_text, part)
+
+    async def _flush_loop(self) -> None:
+        while not self._closed:
+            delay = self._last_edit + self.min_interval - time.monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            text, self._pending = self._pending, None
+            if text is None:
+                return
+            try:
+                # Interim text is cut to one message; finish() splits the final answer
+                await self._show(text[: MAX_MESSAGE_LENGTH - len(CURSOR)] + CURSOR)
+            except Exception as e:
+                # Progress is best effort: finish() still delivers the answer
+                logger.warning("Streaming reply update failed: %s", e)
+                return
+
+    async def _show(self, text: str) -> None:
+        if text == self._shown:
+            return
+        try:
+            if self._reply is None:
+                self._reply = await self._send_with_limits(self.message.reply_text, text)
+            else:
+                await self._send_with_limits(self._reply.edit_text, text)
+                self.edits += 1
+            self._shown = text
+        except BadRequest as e:
+            # "Message is not modified" and similar are harmless for a progress view
+            logger.debug("Streaming reply edit skipped: %s", e)
+        finally:
+            self._last_edit = time.monotonic()
+
+    async def _send_with_limits(self, method, text: str) -> Any:
+        chat_id = self.message.chat_id
+        while True:
+            await self.rate_limiter.acquire(chat_id)
+            try:
+                return await method(text)
+            except RetryAfter as e:
+                delay = retry_after_seconds(e)
+                logger.info("Streaming reply flood control: waiting %.1fs", delay)
+                self.rate_limiter.penalize(chat_id, delay)
+
+
+__all__ = ["StreamingReply", "split_message"]
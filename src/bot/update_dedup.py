@@ -0,0 +1,153 @@
+"""Dedup window of recently accepted Telegram update_ids.
+
+Telegram redelivers an update when the webhook is slow or answers with an
+error, and a blind reprocess can repeat side effects such as a payout. The
+webhook asks UpdateDeduplicator before ``Update.de_json`` runs:
+
+- In memory: a ring buffer (insertion order, bounded) plus a set (O(1) lookup)
+  of the last ``window`` update_ids.
+- Persisted: new update_ids are written to ``processed_updates`` by a
+  background flusher (write-behind), so the webhook never waits on the single
+  SQLite writer connection. On startup the window is loaded back, so redeliveries
+  after a restart are dropped too; rows older than the window are pruned.
+
+Tunables (environment variables):
+    WEBHOOK_DEDUP_WINDOW            update_ids remembered (default: 10000)
+    WEBHOOK_DEDUP_FLUSH_INTERVAL    Seconds between flushes to SQLite (default: 1)
+"""
+
+import asyncio
+import logging
+import os
+from collections import deque
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.models.processed_update import ProcessedUpdate
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_DEDUP_WINDOW = int(os.getenv("WEBHOOK_DEDUP_WINDOW") or 10000)
+WEBHOOK_DEDUP_FLUSH_INTERVAL = float(os.getenv("WEBHOOK_DEDUP_FLUSH_INTERVAL") or 1)
+
+
+class UpdateDeduplicator:
+    """Ring buffer + set of recent update_ids with write-behind persistence."""
+
+    def __init__(self, window: int = WEBHOOK_DEDUP_WINDOW):
+        self.window = window
+        self.duplicates = 0
+        self._ring: deque[int] = deque()
+        self._seen: set[int] = set()
+        self._unsaved: set[int] = set()
+        self._flusher: asyncio.Task | None = None
+
+    def __contains__(self, update_id: int) -> bool:
+        return update_id in self._seen
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def remember(self, update_id: int) -> bool:
+        """Record an update_id.
+
+        Returns:
+            True for a new update_id, False for a duplicate inside the window
+        """
+        if update_id in self._seen:
+            self.duplicates += 1
+            return False
+        self._add(update_id)
+        self._unsaved.add(update_id)
+        return True
+
+    def forget(self, update_id: int) -> None:
+        """Drop an update_id whose processing failed, so Telegram's redelivery is handled."""
+        if update_id not in self._seen:
+            return
+        self._seen.discard(update_id)
+        self._unsaved.discard(update_id)
+        # Rare error path: O(window) removal keeps ring and set consistent
+        self._ring.remove(update_id)
+
+    def _add(self, update_id: int) -> None:
+        if len(self._ring) >= self.window:
+            self._seen.discard(self._ring.popleft())
+        self._ring.append(update_id)
+        self._seen.add(update_id)
+
+    async def load(self, session: AsyncSession) -> None:
+        """Load the most recent window of persisted update_ids."""
+        result = await session.execute(
+            select(ProcessedUpdate.update_id)
+            .order_by(ProcessedUpdate.update_id.desc())
+            .limit(self.window)
+        )
+        for update_id in reversed(result.scalars().all()):
+            if update_id not in self._seen:
+                self._add(update_id)
+        logger.info("Loaded %d processed update_ids into dedup window", len(self._seen))
+
+    async def flush(self, session: AsyncSession) -> int:
+        """Persist new update_ids and prune rows that fell out of the window (caller commits).
+
+        Returns:
+            Number of update_ids written
+        """
+        if not self._unsaved:
+            return 0
+        pending = sorted(self._unsaved)
+        self._unsaved.clear()
+
+        await session.execute(
+            sqlite_insert(ProcessedUpdate)
+            .values([{"update_id": update_id} for update_id in pending])
+            .on_conflict_do_nothing(index_elements=[ProcessedUpdate.update_id])
+        )
+        # update_ids increase monotonically, so the ring head is the window's lower bound
+        await session.execute(
+            delete(ProcessedUpdate).where(ProcessedUpdate.update_id < self._ring[0])
+        )
+        return len(pending)
+
+    def start(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        interval: float = WEBHOOK_DEDUP_FLUSH_INTERVAL,
+    ) -> None:
+        """Start the background flusher on the running event loop."""
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(
+                self._flush_periodically(session_factory, interval), name="update-dedup-flusher"
+            )
+
+    async def stop(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """Stop the background flusher and persist what is left."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        await self._flush_with(session_factory)
+
+    async def _flush_periodically(
+        self, session_factory: async_sessionmaker[AsyncSession], interval: float
+    ) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self._flush_with(session_factory)
+
+    async def _flush_with(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        pending = set(self._unsaved)
+        try:
+            async with session_factory() as session:
+                if await self.flush(session):
+                    await session.commit()
+        except Exception as e:
+            # Keep the update_ids for the next attempt; in-memory dedup still works
+            self._unsaved |= pending & self._seen
+            logger.error("Error persisting processed update_ids: %s", e)
+
+
+__all__ = ["UpdateDeduplicator"]
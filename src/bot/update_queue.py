@@ -0,0 +1,203 @@
+"""Bounded in-process queue for Telegram updates received by the webhook.
+
+The webhook used to await ``Application.process_update`` before answering
+Telegram, so a slow /ask LLM call or a bill-creation commit held the HTTP
+response and risked redelivery. UpdateQueue lets the webhook ack immediately:
+
+- Per-chat lanes: updates of one chat are processed strictly in arrival order,
+  and a chat is never handled by two workers at once (conversation state stays
+  consistent). Different chats run in parallel on a pool of worker tasks.
+- Backpressure: at most ``maxsize`` updates wait in the queue; ``submit`` refuses
+  more so the webhook can answer 503 and Telegram redelivers later.
+- Metrics: ``stats()`` reports queue depth, in-flight work and counters.
+- Graceful drain: ``stop()`` stops accepting updates and waits for queued ones.
+
+Tunables (environment variables):
+    WEBHOOK_WORKERS             Worker tasks draining the queue (default: 8)
+    WEBHOOK_QUEUE_MAXSIZE       Updates waiting before backpressure (default: 1000)
+    WEBHOOK_DRAIN_TIMEOUT       Seconds to wait for queued updates on shutdown (default: 10)
+"""
+
+import asyncio
+import logging
+import os
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable, Hashable
+
+from telegram import Update
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_WORKERS = int(os.getenv("WEBHOOK_WORKERS") or 8)
+WEBHOOK_QUEUE_MAXSIZE = int(os.getenv("WEBHOOK_QUEUE_MAXSIZE") or 1000)
+WEBHOOK_DRAIN_TIMEOUT = float(os.getenv("WEBHOOK_DRAIN_TIMEOUT") or 10)
+
+
+@dataclass(frozen=True)
+class QueueStats:
+    """Point-in-time backpressure metrics of an UpdateQueue."""
+
+    workers: int
+    maxsize: int
+    pending: int
+    """Updates waiting for a worker."""
+
+    in_flight: int
+    """Updates being processed right now."""
+
+    active_chats: int
+    """Chats with pending or in-flight updates."""
+
+    max_pending: int
+    """High-water mark of ``pending`` since start."""
+
+    processed: int
+    failed: int
+    rejected: int
+    """Updates refused because the queue was full or stopping."""
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def update_lane_key(update: Update) -> Hashable:
+    """Key that serializes updates: the chat, else the user, else the update itself."""
+    if update.effective_chat is not None:
+        return ("chat", update.effective_chat.id)
+    if update.effective_user is not None:
+        return ("user", update.effective_user.id)
+    return ("update", update.update_id)
+
+
+class UpdateQueue:
+    """Bounded update queue with per-chat ordering drained by worker tasks."""
+
+    def __init__(
+        self,
+        process: Callable[[Update], Awaitable[object]],
+        workers: int = WEBHOOK_WORKERS,
+        maxsize: int = WEBHOOK_QUEUE_MAXSIZE,
+    ):
+        self.process = process
+        self.workers = workers
+        self.maxsize = maxsize
+        self._lanes: dict[Hashable, deque[Update]] = {}
+        self._busy: set[Hashable] = set()
+        self._ready: asyncio.Queue[Hashable] = asyncio.Queue()
+        self._tasks: list[asyncio.Task] = []
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._accepting = False
+        self._pending = 0
+        self._in_flight = 0
+        self._max_pending = 0
+        self._processed = 0
+        self._failed = 0
+        self._rejected = 0
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """Spawn worker tasks on the running event loop."""
+        if self._tasks:
+            return
+        self._accepting = True
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"update-worker-{index}")
+            for index in range(self.workers)
+        ]
+        logger.info("Update queue started: workers=%d maxsize=%d", self.workers, self.maxsize)
+
+    def submit(self, update: Update) -> bool:
+        """Enqueue an update without waiting.
+
+        Returns:
+            False when the queue is full or shutting down (caller should ask for redelivery)
+        """
+        if not self._accepting or self._pending >= self.maxsize:
+            self._rejected += 1
+            logger.warning(
+                "Update queue rejected update_id=%s (pending=%d, accepting=%s)",
+                update.update_id,
+                self._pending,
+                self._accepting,
+            )
+            return False
+
+        key = update_lane_key(update)
+        lane = self._lanes.setdefault(key, deque())
+        lane.append(update)
+        self._pending += 1
+        self._max_pending = max(self._max_pending, self._pending)
+        self._idle.clear()
+        # A busy lane is re-scheduled by its worker once the current update finishes
+        if key not in self._busy and len(lane) == 1:
+            self._ready.put_nowait(key)
+        return True
+
+    def stats(self) -> QueueStats:
+        return QueueStats(
+            workers=len(self._tasks),
+            maxsize=self.maxsize,
+            pending=self._pending,
+            in_flight=self._in_flight,
+            active_chats=len(self._lanes),
+            max_pending=self._max_pending,
+            processed=self._processed,
+            failed=self._failed,
+            rejected=self._rejected,
+        )
+
+    async def join(self) -> None:
+        """Wait until every accepted update has been processed."""
+        await self._idle.wait()
+
+    async def stop(self, timeout: float = WEBHOOK_DRAIN_TIMEOUT) -> None:
+        """Stop accepting updates, drain queued ones (up to ``timeout``), stop workers."""
+        self._accepting = False
+        try:
+            await asyncio.wait_for(self.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Update queue drain timed out: %d pending, %d in flight dropped",
+                self._pending,
+                self._in_flight,
+            )
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Update queue stopped: %s", self.stats().as_dict())
+
+    async def _worker(self) -> None:
+        while True:
+            key = await self._ready.get()
+            lane = self._lanes[key]
+            update = lane.popleft()
+            self._busy.add(key)
+            self._pending -= 1
+            self._in_flight += 1
+            try:
+                await self.process(update)
+            except Exception as e:
+                self._failed += 1
+                logger.error(
+                    "Error processing update_id=%s: %s", update.update_id, e, exc_info=True
+                )
+            finally:
+                self._in_flight -= 1
+                self._processed += 1
+                self._busy.discard(key)
+                if lane:
+                    self._ready.put_nowait(key)
+                else:
+                    del self._lanes[key]
+                if self._pending == 0 and self._in_flight == 0:
+                    self._idle.set()
+
+
+__all__ = ["QueueStats", "UpdateQueue", "update_lane_key"]
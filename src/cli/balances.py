@@ -0,0 +1,80 @@
+"""CLI entry point for verifying and rebuilding the account balance ledger.
+
+Recomputes every account balance from transactions and bills, compares it
+with the materialized account_balances snapshot and reports drift.
+
+Usage:
+    python -m src.cli.balances            # verify only
+    python -m src.cli.balances --rebuild  # verify, then rebuild snapshots
+    make balances-verify / make balances-rebuild  (via Makefile)
+
+Exit Codes:
+    0 - Success: No drift found (or drift fixed with --rebuild)
+    1 - Failure: Drift found (verify only) or error encountered
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+
+from dotenv import load_dotenv
+
+
+async def main(rebuild: bool = False) -> int:
+    """Verify (and optionally rebuild) the balance ledger.
+
+    Args:
+        rebuild: Replace all snapshots with recomputed balances
+
+    Returns:
+        Exit code: 0 for success, 1 for drift or failure
+    """
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logger = logging.getLogger("sosenki.balances")
+
+    try:
+        from src.services import AsyncSessionLocal, async_engine
+        from src.services.balance_ledger_service import BalanceLedgerService
+
+        try:
+            async with AsyncSessionLocal() as session:
+                ledger_service = BalanceLedgerService(session)
+                if rebuild:
+                    drifts = await ledger_service.rebuild()
+                    await session.commit()
+                else:
+                    drifts = await ledger_service.verify()
+        finally:
+            # Close the aiosqlite connection thread so the process can exit
+            await async_engine.dispose()
+
+        for drift in drifts:
+            stored = "missing" if drift.stored_balance is None else f"{drift.stored_balance}"
+            logger.info(
+                "account_id=%d stored=%s actual=%s",
+                drift.account_id,
+                stored,
+                drift.actual_balance,
+            )
+
+        if not drifts:
+            logger.info("✓ Balance ledger is consistent")
+            return 0
+        if rebuild:
+            logger.info("✓ Rebuilt balance ledger, fixed %d drifted accounts", len(drifts))
+            return 0
+        logger.error("❌ %d accounts drifted; run with --rebuild to fix", len(drifts))
+        return 1
+
+    except Exception as e:
+        logger.error(f"Balance ledger check failed: {e}", exc_info=True)
+        return 1
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Verify or rebuild the account balance ledger")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild snapshots after verifying")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(rebuild=args.rebuild)))
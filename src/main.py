@@ -10,8 +10,9 @@ import uvicorn
 from dotenv import load_dotenv
 from telegram.ext import Application
 
-from src.api.webhook import app, setup_webhook_route
+from src.api.webhook import app, setup_webhook_route, shutdown_webhook_route
 from src.bot import create_bot_app
+from src.services.llm_pool import close_ollama_clients
 from src.services.logging import setup_server_logging
 
 
@@ -103,12 +104,21 @@ async def run_webhook_mode(host: str = "0.0.0.0", port: int = 8000):
 
     async def shutdown_bot():
         global bot_app
+        # Finish queued updates while the bot can still answer them
+        try:
+            await shutdown_webhook_route()
+        except Exception as e:
+            logger.error(f"Error draining update queue: {e}")
         if bot_app:
             try:
                 await bot_app.shutdown()
                 logger.info("Bot Application shutdown complete")
             except Exception as e:
                 logger.error(f"Error shutting down bot: {e}")
+        try:
+            await close_ollama_clients()
+        except Exception as e:
+            logger.error(f"Error closing Ollama clients: {e}")
 
     # Register shutdown with FastAPI
     app.add_event_handler("shutdown", shutdown_bot)
@@ -0,0 +1,76 @@
+"""add account_balances ledger table
+
+Revision ID: 7d3e1f2a9b4c
+Revises: c5aabb9221f4
+Create Date: 2026-10-16 10:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7d3e1f2a9b4c"
+down_revision = "c5aabb9221f4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "account_balances",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "account_id",
+            sa.Integer(),
+            nullable=False,
+            comment="Account this balance snapshot belongs to (1:1)",
+        ),
+        sa.Column(
+            "balance",
+            sa.Numeric(precision=12, scale=2),
+            nullable=False,
+            server_default="0",
+            comment="Raw balance in rubles: Incoming - Outgoing + Bills (not inverted)",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.current_timestamp(),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.current_timestamp(),
+        ),
+        sa.ForeignKeyConstraint(["account_id"], ["accounts.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("account_id"),
+    )
+
+    # Backfill snapshots from existing transactions and bills
+    op.execute(
+        """
+        INSERT INTO account_balances (account_id, balance, created_at, updated_at)
+        SELECT accounts.id, ROUND(COALESCE(totals.total, 0), 2),
+               CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+        FROM accounts
+        LEFT JOIN (
+            SELECT account_id, SUM(amount) AS total
+            FROM (
+                SELECT to_account_id AS account_id, amount FROM transactions
+                UNION ALL
+                SELECT from_account_id AS account_id, -amount FROM transactions
+                UNION ALL
+                SELECT account_id, bill_amount AS amount FROM bills
+            ) AS ledger
+            GROUP BY account_id
+        ) AS totals ON totals.account_id = accounts.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("account_balances")
@@ -0,0 +1,72 @@
+"""add latest_electricity_readings projection table
+
+Revision ID: 9e4b2c7d1f3a
+Revises: 7d3e1f2a9b4c
+Create Date: 2026-10-16 12:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9e4b2c7d1f3a"
+down_revision = "7d3e1f2a9b4c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "latest_electricity_readings",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "property_id",
+            sa.Integer(),
+            nullable=False,
+            comment="Property this projection row belongs to (1:1)",
+        ),
+        sa.Column(
+            "reading_id",
+            sa.Integer(),
+            nullable=False,
+            comment="Most recent reading for the property (by reading_date, then id)",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.current_timestamp(),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.current_timestamp(),
+        ),
+        sa.ForeignKeyConstraint(["property_id"], ["properties.id"]),
+        sa.ForeignKeyConstraint(["reading_id"], ["electricity_readings.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("property_id"),
+    )
+
+    # Backfill from existing readings: first row per property by date, then id
+    op.execute(
+        """
+        INSERT INTO latest_electricity_readings (property_id, reading_id, created_at, updated_at)
+        SELECT property_id, id, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+        FROM (
+            SELECT property_id, id,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY property_id ORDER BY reading_date DESC, id DESC
+                   ) AS row_number
+            FROM electricity_readings
+            WHERE property_id IS NOT NULL
+        ) AS ranked
+        WHERE row_number = 1
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("latest_electricity_readings")
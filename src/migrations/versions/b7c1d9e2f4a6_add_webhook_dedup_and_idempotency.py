@@ -0,0 +1,62 @@
+"""add processed_updates table and transactions.idempotency_key
+
+Revision ID: b7c1d9e2f4a6
+Revises: 9e4b2c7d1f3a
+Create Date: 2026-10-16 14:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b7c1d9e2f4a6"
+down_revision = "9e4b2c7d1f3a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "processed_updates",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "update_id",
+            sa.BigInteger(),
+            nullable=False,
+            comment="Telegram update_id (monotonically increasing per bot)",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.current_timestamp(),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.current_timestamp(),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("update_id"),
+    )
+
+    with op.batch_alter_table("transactions", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "idempotency_key",
+                sa.String(length=100),
+                nullable=True,
+                comment="Optional client key; a repeated create with the same key is a no-op",
+            )
+        )
+        batch_op.create_index("idx_transaction_idempotency_key", ["idempotency_key"], unique=True)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("transactions", schema=None) as batch_op:
+        batch_op.drop_index("idx_transaction_idempotency_key")
+        batch_op.drop_column("idempotency_key")
+
+    op.drop_table("processed_updates")
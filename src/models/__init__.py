@@ -30,10 +30,13 @@ class BaseModel:
 # This must be after Base declaration to avoid circular imports
 from src.models.access_request import AccessRequest, RequestStatus  # noqa: E402
 from src.models.account import Account, AccountType  # noqa: E402
+from src.models.account_balance import AccountBalance  # noqa: E402
 from src.models.audit_log import AuditLog  # noqa: E402
 from src.models.bill import Bill, BillType  # noqa: E402
 from src.models.budget_item import AllocationStrategy, BudgetItem  # noqa: E402
 from src.models.electricity_reading import ElectricityReading  # noqa: E402
+from src.models.latest_electricity_reading import LatestElectricityReading  # noqa: E402
+from src.models.processed_update import ProcessedUpdate  # noqa: E402
 from src.models.property import Property  # noqa: E402
 from src.models.service_period import PeriodStatus, ServicePeriod  # noqa: E402
 from src.models.transaction import Transaction  # noqa: E402
@@ -45,6 +48,7 @@ __all__ = [
     "User",
     "Account",
     "AccountType",
+    "AccountBalance",
     "Transaction",
     "AccessRequest",
     "RequestStatus",
@@ -54,7 +58,9 @@ __all__ = [
     "BudgetItem",
     "AllocationStrategy",
     "ElectricityReading",
+    "LatestElectricityReading",
     "Bill",
     "BillType",
     "AuditLog",
+    "ProcessedUpdate",
 ]
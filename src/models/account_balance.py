@@ -0,0 +1,39 @@
+"""Account balance ORM model for the materialized per-account balance ledger."""
+
+from decimal import Decimal
+
+from sqlalchemy import ForeignKey, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models import Base, BaseModel
+
+
+class AccountBalance(Base, BaseModel):
+    """Snapshot of an account's balance (Incoming - Outgoing + Bills).
+
+    Maintained incrementally by BalanceLedgerService whenever transactions or
+    bills are created, so balance reads are single-row lookups instead of scans
+    over the full ledger. Can be verified and rebuilt from transactions/bills.
+    """
+
+    __tablename__ = "account_balances"
+
+    account_id: Mapped[int] = mapped_column(
+        ForeignKey("accounts.id"),
+        nullable=False,
+        unique=True,
+        comment="Account this balance snapshot belongs to (1:1)",
+    )
+
+    balance: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2),
+        nullable=False,
+        default=Decimal("0"),
+        comment="Raw balance in rubles: Incoming - Outgoing + Bills (not inverted)",
+    )
+
+    def __repr__(self) -> str:
+        return f"<AccountBalance(account_id={self.account_id}, balance={self.balance})>"
+
+
+__all__ = ["AccountBalance"]
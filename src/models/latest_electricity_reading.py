@@ -0,0 +1,40 @@
+"""Latest electricity reading ORM model for the per-property reading projection."""
+
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models import Base, BaseModel
+
+
+class LatestElectricityReading(Base, BaseModel):
+    """Pointer from a property to its most recent electricity reading.
+
+    Maintained by ElectricityReadingService whenever readings are created,
+    updated or deleted, so the /meter menu resolves every property's latest
+    reading with one join instead of one query per property. Can be rebuilt
+    from electricity_readings at any time.
+    """
+
+    __tablename__ = "latest_electricity_readings"
+
+    property_id: Mapped[int] = mapped_column(
+        ForeignKey("properties.id"),
+        nullable=False,
+        unique=True,
+        comment="Property this projection row belongs to (1:1)",
+    )
+
+    reading_id: Mapped[int] = mapped_column(
+        ForeignKey("electricity_readings.id"),
+        nullable=False,
+        comment="Most recent reading for the property (by reading_date, then id)",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<LatestElectricityReading(property_id={self.property_id}, "
+            f"reading_id={self.reading_id})>"
+        )
+
+
+__all__ = ["LatestElectricityReading"]
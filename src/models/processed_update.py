@@ -0,0 +1,30 @@
+"""Processed update ORM model for the webhook update_id dedup window."""
+
+from sqlalchemy import BigInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models import Base, BaseModel
+
+
+class ProcessedUpdate(Base, BaseModel):
+    """Telegram update_id accepted by the webhook.
+
+    Persists the in-memory dedup window of UpdateDeduplicator so updates
+    redelivered by Telegram across a restart are still dropped. Only the most
+    recent window of update_ids is kept; older rows are pruned on flush.
+    """
+
+    __tablename__ = "processed_updates"
+
+    update_id: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        unique=True,
+        comment="Telegram update_id (monotonically increasing per bot)",
+    )
+
+    def __repr__(self) -> str:
+        return f"<ProcessedUpdate(update_id={self.update_id})>"
+
+
+__all__ = ["ProcessedUpdate"]
@@ -3,7 +3,7 @@
 from datetime import date
 from decimal import Decimal
 
-from sqlalchemy import Date, ForeignKey, Index, Numeric
+from sqlalchemy import Date, ForeignKey, Index, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models import Base, BaseModel
@@ -54,6 +54,11 @@ class Transaction(Base, BaseModel):
         nullable=True,
         comment="Optional transaction description",
     )
+    idempotency_key: Mapped[str | None] = mapped_column(
+        String(100),
+        nullable=True,
+        comment="Optional client key; a repeated create with the same key is a no-op",
+    )
 
     # Relationships
     from_account: Mapped["Account"] = relationship(  # noqa: F821
@@ -84,6 +89,7 @@ class Transaction(Base, BaseModel):
         Index("idx_transaction_from_to", "from_account_id", "to_account_id"),
         Index("idx_transaction_date", "transaction_date"),
         Index("idx_transaction_budget_item", "budget_item_id"),
+        Index("idx_transaction_idempotency_key", "idempotency_key", unique=True),
     )
 
     def __repr__(self) -> str:
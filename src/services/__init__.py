@@ -3,27 +3,25 @@
 import os
 from typing import AsyncGenerator, Generator
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+
+from src.services.database import create_async_engines, create_sync_engine
+from src.services.metrics import register_pool_metrics
+from src.services.query_stats import install_query_instrumentation
 
 # Get database URL from environment or use SQLite default
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-# Create engine (SQLite uses StaticPool for simplicity in dev/test)
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
-# For async operations, create async engine
-async_database_url = DATABASE_URL.replace("sqlite:///", "sqlite+aiosqlite:///")
-async_engine = create_async_engine(
-    async_database_url,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
+# Shared engines (see src.services.database): one per process, used by the
+# FastAPI app, bot handlers and MCP server alike
+engine = create_sync_engine(DATABASE_URL)
+# Writer engine (single connection) and reader pool for async operations
+async_engine, async_read_engine = create_async_engines(DATABASE_URL)
+# Per-request statement counts for debug logs and N+1 warnings
+install_query_instrumentation()
+# Pool usage gauges for /metrics
+register_pool_metrics({"writer": async_engine, "reader": async_read_engine})
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -32,6 +30,12 @@ AsyncSessionLocal = async_sessionmaker(
     class_=AsyncSession,
     expire_on_commit=False,
 )
+# Read-only sessions (query_only connections from the reader pool)
+AsyncReadSessionLocal = async_sessionmaker(
+    async_read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -49,6 +53,20 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def get_async_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get read-only async database session from the reader pool."""
+    async with AsyncReadSessionLocal() as session:
+        yield session
+
+
+async def dispose_engines() -> None:
+    """Close pooled connections of the shared engines (application shutdown)."""
+    await async_engine.dispose()
+    if async_read_engine is not async_engine:
+        await async_read_engine.dispose()
+    engine.dispose()
+
+
 # Import services for convenience (must be after SessionLocal/engine definitions to avoid circular imports)
 from src.services.audit_service import AuditService  # noqa: E402
 from src.services.bills_service import BillsService  # noqa: E402
@@ -58,9 +76,13 @@ __all__ = [
     "engine",
     "SessionLocal",
     "AsyncSessionLocal",
+    "AsyncReadSessionLocal",
     "get_db",
     "get_async_session",
+    "get_async_read_session",
+    "dispose_engines",
     "async_engine",
+    "async_read_engine",
     # Services
     "AuditService",
     "BillsService",
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.access_request import AccessRequest, RequestStatus
 from src.models.user import User
 from src.services.audit_service import AuditService
+from src.services.identity_cache import invalidate_identities
 
 logger = logging.getLogger(__name__)
 
@@ -111,6 +112,7 @@ class AdminService:
             )
 
             await self.session.commit()
+            invalidate_identities()
             logger.info(
                 "Request %d approved by admin telegram_id=%d", request_id, admin_user.telegram_id
             )
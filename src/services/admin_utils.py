@@ -1,15 +1,33 @@
-"""Admin utility functions for retrieving admin user information."""
+"""Admin utility functions for retrieving admin user information.
+
+Sync helpers take a Session (seeding, CLI); async code must use the ``_async``
+counterparts on an AsyncSession so admin lookups never block the event loop.
+
+The admin recipient set (telegram IDs of active administrators) is cached in
+process. Any flushed insert, delete or role/activity/telegram_id change of a
+User drops the cache, and a TTL bounds staleness from raw SQL writes.
+"""
 
 import logging
+import time
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.models.user import User
 
 logger = logging.getLogger(__name__)
 
+ADMIN_CACHE_TTL_SECONDS = 300.0
+
+# (telegram IDs of active admins ordered by user id, expires_at)
+_admin_recipients: tuple[tuple[str, ...], float] | None = None
+
+# User columns that decide whether someone is an admin recipient
+_ADMIN_ATTRIBUTES = ("is_administrator", "is_active", "telegram_id")
+
 
 def get_admin_telegram_id(db: Session) -> Optional[str]:
     """
@@ -74,3 +92,112 @@ def get_admin_user(db: Session) -> Optional[User]:
     except Exception as e:
         logger.error("Error retrieving admin user: %s", e, exc_info=True)
         return None
+
+
+async def get_admin_telegram_ids_async(session: AsyncSession) -> tuple[str, ...]:
+    """
+    Get telegram IDs of all active admins (cached).
+
+    Args:
+        session: SQLAlchemy async session (used only on cache miss)
+
+    Returns:
+        Tuple of telegram_id strings ordered by user id (empty if there are no admins)
+    """
+    global _admin_recipients
+    if _admin_recipients is not None and _admin_recipients[1] > time.monotonic():
+        return _admin_recipients[0]
+
+    result = await session.execute(
+        select(User.telegram_id)
+        .where(
+            User.is_administrator.is_(True),
+            User.is_active.is_(True),
+            User.telegram_id.is_not(None),
+        )
+        .order_by(User.id)
+    )
+    recipients = tuple(str(telegram_id) for telegram_id in result.scalars())
+    _admin_recipients = (recipients, time.monotonic() + ADMIN_CACHE_TTL_SECONDS)
+    return recipients
+
+
+async def get_admin_telegram_id_async(session: AsyncSession) -> Optional[str]:
+    """
+    Get the admin's telegram ID (async counterpart of get_admin_telegram_id).
+
+    Args:
+        session: SQLAlchemy async session
+
+    Returns:
+        First active admin's telegram_id as string, or None if no admin user found
+    """
+    try:
+        recipients = await get_admin_telegram_ids_async(session)
+    except Exception as e:
+        logger.error("Error retrieving admin telegram ID: %s", e, exc_info=True)
+        return None
+
+    if recipients:
+        logger.debug("Retrieved admin telegram ID: %s", recipients[0])
+        return recipients[0]
+
+    logger.warning("No admin user found in database")
+    return None
+
+
+async def get_admin_user_async(session: AsyncSession) -> Optional[User]:
+    """
+    Get the admin user (async counterpart of get_admin_user).
+
+    Args:
+        session: SQLAlchemy async session
+
+    Returns:
+        Admin User instance, or None if no admin user found
+    """
+    try:
+        result = await session.execute(
+            select(User).where(User.is_administrator.is_(True)).order_by(User.id).limit(1)
+        )
+        admin_user = result.scalar_one_or_none()
+
+        if admin_user:
+            logger.debug("Retrieved admin user: %s", admin_user.name)
+            return admin_user
+
+        logger.warning("No admin user found in database")
+        return None
+
+    except Exception as e:
+        logger.error("Error retrieving admin user: %s", e, exc_info=True)
+        return None
+
+
+def invalidate_admin_cache() -> None:
+    """Drop the cached admin recipient set."""
+    global _admin_recipients
+    _admin_recipients = None
+
+
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_delete")
+def _invalidate_on_user_change(_mapper, _connection, _target) -> None:
+    invalidate_admin_cache()
+
+
+@event.listens_for(User, "after_update")
+def _invalidate_on_role_change(_mapper, _connection, target: User) -> None:
+    state = inspect(target)
+    if any(state.attrs[name].history.has_changes() for name in _ADMIN_ATTRIBUTES):
+        invalidate_admin_cache()
+
+
+__all__ = [
+    "get_admin_telegram_id",
+    "get_admin_user",
+    "get_admin_telegram_id_async",
+    "get_admin_telegram_ids_async",
+    "get_admin_user_async",
+    "invalidate_admin_cache",
+]
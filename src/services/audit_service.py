@@ -2,6 +2,7 @@
 
 from typing import Any
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.audit_log import AuditLog
@@ -10,7 +11,7 @@ from src.models.audit_log import AuditLog
 class AuditService:
     """Service for audit log operations.
 
-    Provides static method to create minimal audit log entries.
+    Provides static methods to create minimal audit log entries.
     """
 
     @staticmethod
@@ -45,5 +46,45 @@ class AuditService:
         session.add(audit)
         return audit
 
+    @staticmethod
+    async def log_many(
+        session: AsyncSession,
+        entity_type: str,
+        action: str,
+        entries: list[tuple[int, dict[str, Any] | None]],
+        actor_id: int | None = None,
+    ) -> int:
+        """Create audit log entries for many entities in a single INSERT (async).
+
+        Used by batch writers (e.g., period billing) instead of one log() per row.
+
+        Args:
+            session: Async database session
+            entity_type: Type of entity (lowercase: "transaction", "bill", "period", etc.)
+            action: Action performed (present tense: "create", "update", "delete", "close", etc.)
+            entries: (entity_id, changes) pairs, one per audited entity
+            actor_id: User (admin) who performed the action
+
+        Returns:
+            Number of audit entries inserted (not yet committed)
+        """
+        if not entries:
+            return 0
+
+        await session.execute(
+            insert(AuditLog),
+            [
+                {
+                    "entity_type": entity_type,
+                    "entity_id": entity_id,
+                    "action": action,
+                    "actor_id": actor_id,
+                    "changes": changes,
+                }
+                for entity_id, changes in entries
+            ],
+        )
+        return len(entries)
+
 
 __all__ = ["AuditService"]
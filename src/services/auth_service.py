@@ -6,9 +6,12 @@ Provides unified helpers for:
 - Account access authorization (admin override, owner/staff checking)
 """
 
+import hashlib
 import json
 import logging
 import os
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any
 
@@ -18,7 +21,17 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.account import Account, AccountType
 from src.models.user import User
-from src.services.user_service import UserService, UserStatusService
+from src.services.identity_cache import (
+    CachedIdentity,
+    attach,
+    detached_copy,
+    identity_cache,
+)
+from src.services.user_service import (
+    INIT_DATA_MAX_AGE_SECONDS,
+    UserService,
+    UserStatusService,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +54,49 @@ async def _get_account_or_404(session: AsyncSession, account_id: int) -> Account
     return account
 
 
+def _cached_identity(user: User) -> CachedIdentity | None:
+    """Return the cached identity of an authenticated user, if still warm."""
+    if not user.telegram_id:
+        return None
+    identity = identity_cache.get(user.telegram_id)
+    if identity is None or identity.user.id != user.id:
+        return None
+    return identity
+
+
+async def _get_cached_account_or_404(
+    session: AsyncSession, authenticated_user: User, account_id: int
+) -> Account:
+    # Accounts already authorized for this identity are attached without a SELECT
+    identity = _cached_identity(authenticated_user)
+    if identity is not None and account_id in identity.accounts:
+        return await attach(session, identity.accounts[account_id])
+    return await _get_account_or_404(session, account_id)
+
+
+def _remember_account(authenticated_user: User, account: Account) -> None:
+    identity = _cached_identity(authenticated_user)
+    if identity is not None and account.id not in identity.accounts:
+        identity.accounts[account.id] = detached_copy(account)
+
+
+async def _get_represented_user(session: AsyncSession, user: User) -> User | None:
+    """Get the user represented by ``user``, using the identity cache when warm."""
+    identity = _cached_identity(user)
+    if identity is not None and identity.represented_resolved:
+        if identity.represented_user is None:
+            return None
+        return await attach(session, identity.represented_user)
+
+    user_status_service = UserStatusService(session)
+    represented_user = await user_status_service.get_represented_user(user.id)
+
+    if identity is not None:
+        identity.represented_user = detached_copy(represented_user) if represented_user else None
+        identity.represented_resolved = True
+    return represented_user
+
+
 @dataclass
 class AuthorizedUser:
     """Encapsulates authorization context for a request."""
@@ -58,6 +114,52 @@ class AuthorizedUser:
     """True if target_user != authenticated_user (admin switch or representation)."""
 
 
+class _VerifiedInitDataCache:
+    """LRU cache of verified init data → telegram_id with per-entry expiry.
+
+    The Mini App sends the same init data with every API call of a screen, so
+    caching the verification result skips re-parsing and HMAC work. Keys are
+    SHA-256 digests of the bot token and the full raw string (never the client
+    supplied ``hash`` field alone), and entries never outlive the auth_date window.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[bytes, tuple[int, float]] = OrderedDict()
+
+    @staticmethod
+    def key(bot_token: str, raw_init: str) -> bytes:
+        return hashlib.sha256(f"{bot_token}\n{raw_init}".encode()).digest()
+
+    def get(self, key: bytes) -> int | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        telegram_id, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return telegram_id
+
+    def put(self, key: bytes, telegram_id: int, auth_date: int) -> None:
+        remaining = auth_date + INIT_DATA_MAX_AGE_SECONDS - time.time()
+        lifetime = min(self.ttl, remaining)
+        if lifetime <= 0:
+            return
+        self._entries[key] = (telegram_id, time.monotonic() + lifetime)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_verified_init_data = _VerifiedInitDataCache()
+
+
 def _extract_init_data(
     authorization: str | None,
     x_telegram_init_data: str | None,
@@ -133,13 +235,18 @@ async def verify_telegram_auth(
         logger.error("TELEGRAM_BOT_TOKEN is not set")
         raise HTTPException(status_code=500, detail="Server error")
 
+    cache_key = _VerifiedInitDataCache.key(bot_token, raw_init)
+    cached_telegram_id = _verified_init_data.get(cache_key)
+    if cached_telegram_id is not None:
+        return cached_telegram_id
+
     parsed_data = UserService.verify_telegram_webapp_signature(
         init_data=raw_init,
         bot_token=bot_token,
     )
 
     if not parsed_data:
-        logger.warning("Invalid Telegram signature")
+        logger.warning("Invalid or expired Telegram init data")
         raise HTTPException(status_code=401, detail="NOT_AUTHORIZED")
 
     # Extract user info from parsed data
@@ -149,6 +256,9 @@ async def verify_telegram_auth(
     if not telegram_id:
         raise HTTPException(status_code=401, detail="NOT_AUTHORIZED")
 
+    if "auth_date" in parsed_data:
+        _verified_init_data.put(cache_key, telegram_id, int(parsed_data["auth_date"]))
+
     return telegram_id
 
 
@@ -165,6 +275,10 @@ async def get_authenticated_user(session: AsyncSession, telegram_id: int) -> Use
     Raises:
         HTTPException 401: User not found or inactive
     """
+    identity = identity_cache.get(telegram_id)
+    if identity is not None:
+        return await attach(session, identity.user)
+
     user_service = UserService(session)
     user = await user_service.get_by_telegram_id(telegram_id)
 
@@ -172,6 +286,8 @@ async def get_authenticated_user(session: AsyncSession, telegram_id: int) -> Use
         logger.warning(f"Inactive or unregistered user: telegram_id={telegram_id}")
         raise HTTPException(status_code=401, detail="NOT_AUTHORIZED")
 
+    # Only active users are cached; deactivation goes through invalidate_identities()
+    identity_cache.put(telegram_id, user)
     return user
 
 
@@ -213,8 +329,7 @@ async def resolve_target_user(
         switched = True
     # Representation fallback: use represented user if no admin context switch
     elif authenticated_user.representative_id:
-        user_status_service = UserStatusService(session)
-        represented_user = await user_status_service.get_represented_user(authenticated_user.id)
+        represented_user = await _get_represented_user(session, authenticated_user)
         if represented_user:
             target_user = represented_user
             switched = True
@@ -364,33 +479,37 @@ async def authorize_account_access(
         HTTPException 401: User not authorized to access account
         HTTPException 404: Account not found
     """
-    account = await _get_account_or_404(session, account_id)
+    account = await _get_cached_account_or_404(session, authenticated_user, account_id)
+
+    if not _can_access_account(authenticated_user, account):
+        logger.warning(
+            f"User {authenticated_user.id} attempted unauthorized access to account {account_id}"
+        )
+        raise HTTPException(status_code=401, detail="NOT_AUTHORIZED")
+
+    _remember_account(authenticated_user, account)
+    return account
+
 
+def _can_access_account(authenticated_user: User, account: Account) -> bool:
     # Authorization: Admin and Staff can access any account
     if authenticated_user.is_administrator or authenticated_user.is_staff:
-        return account
+        return True
 
     # Authorization: User can access their own personal account (OWNER/STAFF)
     if account.user_id == authenticated_user.id:
-        return account
+        return True
 
     # Authorization: Owner can access ORGANIZATION or STAFF accounts (shared funds)
     if (
         account.account_type in (AccountType.ORGANIZATION, AccountType.STAFF)
         and authenticated_user.is_owner
     ):
-        return account
+        return True
 
     # Authorization: Representative can access the account of the user they represent
     # If authenticated_user.representative_id == account.user_id, then authenticated user represents the account owner
-    if account.user_id and authenticated_user.representative_id == account.user_id:
-        return account
-
-    # Authorization failed
-    logger.warning(
-        f"User {authenticated_user.id} attempted unauthorized access to account {account_id}"
-    )
-    raise HTTPException(status_code=401, detail="NOT_AUTHORIZED")
+    return bool(account.user_id and authenticated_user.representative_id == account.user_id)
 
 
 async def authorize_account_access_for_roles(
@@ -418,17 +537,14 @@ async def authorize_account_access_for_roles(
         HTTPException 401: User does not have required role or not authorized to access account
         HTTPException 404: Account not found
     """
-    account = await _get_account_or_404(session, account_id)
+    account = await _get_cached_account_or_404(session, authenticated_user, account_id)
 
     # Check role authorization (admin always allowed)
     has_role = _has_any_role(authenticated_user, allowed_roles)
 
     # If user doesn't have role directly, check if they represent someone who does
     if not has_role and authenticated_user.representative_id:
-        # Fetch the user being represented
-        stmt = select(User).where(User.id == authenticated_user.representative_id)
-        result = await session.execute(stmt)
-        represented_user = result.scalar_one_or_none()
+        represented_user = await _get_represented_user(session, authenticated_user)
 
         if represented_user:
             has_role = _has_any_role(represented_user, allowed_roles)
@@ -437,6 +553,7 @@ async def authorize_account_access_for_roles(
         logger.warning(f"User {authenticated_user.id} lacks required role for account access")
         raise HTTPException(status_code=401, detail="NOT_AUTHORIZED")
 
+    _remember_account(authenticated_user, account)
     return account
 
 
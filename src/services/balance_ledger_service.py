@@ -0,0 +1,208 @@
+"""Materialized balance ledger service.
+
+Keeps the account_balances snapshot table in sync with transactions and bills:
+- Incremental maintenance: writers call apply_deltas() inside their own transaction
+- O(1) reads: get_account_balances() is a single indexed lookup per request
+- Verification: verify() recomputes every balance from the full ledger and reports drift
+- Rebuild: rebuild() replaces the snapshot with freshly aggregated balances
+
+Balance Formula (same as BalanceCalculationService): Incoming(To) - Outgoing(From) + Bills
+"""
+
+import logging
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Dict, Iterable, NamedTuple
+
+from sqlalchemy import DateTime, Executable, delete, func, literal, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.account import Account
+from src.models.account_balance import AccountBalance
+from src.services.balance_service import (
+    BalanceCalculationService,
+    BalanceResult,
+    build_balances_stmt,
+    is_owner_account,
+)
+
+logger = logging.getLogger(__name__)
+
+# Differences below half a kopeck are rounding noise, not drift
+DRIFT_TOLERANCE = Decimal("0.005")
+
+
+class BalanceDrift(NamedTuple):
+    """Mismatch between the stored snapshot and the recomputed balance."""
+
+    account_id: int
+    stored_balance: Decimal | None  # None when the snapshot row is missing
+    actual_balance: Decimal
+
+
+class BalanceLedgerService:
+    """Maintain and read the materialized per-account balance ledger."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize with database session.
+
+        Args:
+            session: AsyncSession for database operations
+        """
+        self.session = session
+
+    async def apply_deltas(self, deltas: Iterable[tuple[int | None, Decimal]]) -> None:
+        """Add balance deltas to account snapshots in a single UPSERT statement.
+
+        Must be called in the same transaction as the write it reflects
+        (after flush, before commit) so the snapshot never diverges.
+
+        Args:
+            deltas: (account_id, delta) pairs; None account IDs and zero deltas are ignored
+        """
+        totals: Dict[int, Decimal] = {}
+        for account_id, delta in deltas:
+            if account_id is None or not delta:
+                continue
+            totals[account_id] = totals.get(account_id, Decimal(0)) + Decimal(str(delta))
+
+        if not totals:
+            return
+
+        now = datetime.now(timezone.utc)
+        stmt = sqlite_insert(AccountBalance).values(
+            [
+                {
+                    "account_id": account_id,
+                    "balance": delta,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for account_id, delta in totals.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AccountBalance.account_id],
+            set_={
+                "balance": func.round(AccountBalance.balance + stmt.excluded.balance, 2),
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await self.session.execute(stmt)
+
+    async def get_account_balance(self, account_id: int) -> BalanceResult:
+        """Get balance for an account from the snapshot.
+
+        Args:
+            account_id: Account ID to look up
+
+        Returns:
+            BalanceResult (zero balance for unknown accounts)
+        """
+        balances = await self.get_account_balances([account_id])
+        return balances.get(account_id, BalanceResult(balance=0.0, invert_for_display=False))
+
+    async def get_account_balances(self, account_ids: Iterable[int]) -> Dict[int, BalanceResult]:
+        """Get balances for accounts from the snapshot.
+
+        Accounts without a snapshot row (created after the last rebuild and not
+        yet touched by a transaction or bill) fall back to SQL aggregation.
+
+        Args:
+            account_ids: Account IDs to look up
+
+        Returns:
+            Dict mapping account_id to BalanceResult (unknown IDs are omitted)
+        """
+        account_ids = list(account_ids)
+        if not account_ids:
+            return {}
+
+        stmt = (
+            select(Account.id, Account.account_type, AccountBalance.balance)
+            .outerjoin(AccountBalance, AccountBalance.account_id == Account.id)
+            .where(Account.id.in_(account_ids))
+        )
+        result = await self.session.execute(stmt)
+
+        balances: Dict[int, BalanceResult] = {}
+        missing: list[int] = []
+        for account_id, account_type, balance in result.all():
+            if balance is None:
+                missing.append(account_id)
+                continue
+            balances[account_id] = BalanceResult(
+                balance=float(balance),
+                invert_for_display=is_owner_account(account_type),
+            )
+
+        if missing:
+            calculator = BalanceCalculationService(self.session)
+            balances.update(await calculator.calculate_account_balances(missing))
+
+        return balances
+
+    async def verify(self) -> list[BalanceDrift]:
+        """Recompute all balances from transactions and bills and compare with snapshots.
+
+        Returns:
+            List of BalanceDrift for accounts whose snapshot is wrong or missing
+        """
+        actual = build_balances_stmt(None).subquery("actual")
+        stmt = (
+            select(actual.c.id, AccountBalance.balance, actual.c.balance)
+            .outerjoin(AccountBalance, AccountBalance.account_id == actual.c.id)
+            .order_by(actual.c.id)
+        )
+        result = await self.session.execute(stmt)
+
+        drifts = []
+        for account_id, stored, computed in result.all():
+            actual_balance = _to_decimal(computed)
+            stored_balance = None if stored is None else _to_decimal(stored)
+            if stored_balance is None:
+                if actual_balance == 0:
+                    continue  # Missing row for an untouched account is equivalent to 0
+            elif abs(stored_balance - actual_balance) < DRIFT_TOLERANCE:
+                continue
+            drifts.append(BalanceDrift(account_id, stored_balance, actual_balance))
+        return drifts
+
+    async def rebuild(self) -> list[BalanceDrift]:
+        """Rebuild every snapshot from the full ledger (caller commits).
+
+        Returns:
+            Drift detected before the rebuild (empty if snapshots were correct)
+        """
+        drifts = await self.verify()
+        for stmt in build_rebuild_statements():
+            await self.session.execute(stmt)
+        logger.info("Balance ledger rebuilt (%d drifted accounts fixed)", len(drifts))
+        return drifts
+
+
+def build_rebuild_statements() -> list[Executable]:
+    """Build statements that replace all snapshots with aggregated balances.
+
+    Returned as plain statements so both async services and the synchronous
+    seeding session can execute them inside their own transaction.
+
+    Returns:
+        [DELETE all snapshots, INSERT ... SELECT aggregated balances]
+    """
+    now = literal(datetime.now(timezone.utc), DateTime(timezone=True))
+    totals = build_balances_stmt(None).subquery("totals")
+    insert_stmt = sqlite_insert(AccountBalance).from_select(
+        ["account_id", "balance", "created_at", "updated_at"],
+        select(totals.c.id, func.round(totals.c.balance, 2), now, now),
+    )
+    return [delete(AccountBalance), insert_stmt]
+
+
+def _to_decimal(value) -> Decimal:
+    """Convert an SQL numeric value to a kopeck-rounded Decimal."""
+    return Decimal(str(value or 0)).quantize(Decimal("0.01"))
+
+
+__all__ = ["BalanceLedgerService", "BalanceDrift", "build_rebuild_statements"]
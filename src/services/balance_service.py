@@ -10,12 +10,12 @@ making it testable and reusable across endpoints.
 """
 
 import logging
-from typing import Dict, NamedTuple
+from typing import Dict, Iterable, NamedTuple
 
-from sqlalchemy import select
+from sqlalchemy import Select, func, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.account import Account
+from src.models.account import Account, AccountType
 from src.models.bill import Bill
 from src.models.transaction import Transaction
 from src.models.user import User
@@ -52,9 +52,7 @@ class BalanceCalculationService:
         self.session = session
 
     async def calculate_user_balance(self, user_id: int) -> float:
-        """Calculate balance for a user via their account.
-
-        Delegates to calculate_account_balance using the user's account.
+        """Calculate balance for a user via their OWNER account.
 
         Args:
             user_id: User ID to calculate balance for
@@ -62,18 +60,15 @@ class BalanceCalculationService:
         Returns:
             Balance as float (positive = credit, negative = debt)
         """
-        # Get user's account
-        stmt = select(Account).filter(Account.user_id == user_id)
-        result = await self.session.execute(stmt)
-        account = result.scalar_one_or_none()
-
-        if not account:
-            return 0.0
-
-        return await self.calculate_account_balance(account.id)
+        balances = await self.calculate_multiple_user_balances([user_id])
+        return balances[user_id]
 
     async def calculate_multiple_user_balances(self, user_ids: list[int]) -> Dict[int, float]:
-        """Calculate balances for multiple users efficiently.
+        """Calculate balances for multiple users in a single query.
+
+        A user's balance is that of their OWNER account; STAFF accounts of
+        the same user are not included. Users without an OWNER account get a
+        0.0 balance.
 
         Args:
             user_ids: List of user IDs
@@ -81,9 +76,17 @@ class BalanceCalculationService:
         Returns:
             Dict mapping user_id to balance (float)
         """
-        balances = {}
-        for user_id in user_ids:
-            balances[user_id] = await self.calculate_user_balance(user_id)
+        balances = dict.fromkeys(user_ids, 0.0)
+        if not user_ids:
+            return balances
+
+        # (user_id, account_type) is unique, so each user has at most one OWNER account
+        scope = select(Account.id).where(
+            Account.user_id.in_(user_ids), Account.account_type == AccountType.OWNER
+        )
+        result = await self.session.execute(build_balances_stmt(scope))
+        for _account_id, user_id, _account_type, total in result.all():
+            balances[user_id] = _to_balance(total)
         return balances
 
     async def calculate_account_balance(self, account_id: int) -> float:
@@ -118,46 +121,38 @@ class BalanceCalculationService:
         Returns:
             BalanceResult with balance and invert_for_display flag
         """
-        # Get account to determine type
-        account_stmt = select(Account).filter(Account.id == account_id)
-        result = await self.session.execute(account_stmt)
-        account = result.scalar_one_or_none()
+        balances = await self.calculate_account_balances([account_id])
+        return balances.get(account_id, BalanceResult(balance=0.0, invert_for_display=False))
 
-        if not account:
-            return BalanceResult(balance=0.0, invert_for_display=False)
-
-        # Get incoming transactions (to_account_id = account_id)
-        incoming_stmt = select(Transaction).filter(Transaction.to_account_id == account_id)
-        result = await self.session.execute(incoming_stmt)
-        incoming = result.scalars().all()
-        incoming_total = sum(t.amount for t in incoming if t.amount) or 0
-
-        # Get outgoing transactions (from_account_id = account_id)
-        outgoing_stmt = select(Transaction).filter(Transaction.from_account_id == account_id)
-        result = await self.session.execute(outgoing_stmt)
-        outgoing = result.scalars().all()
-        outgoing_total = sum(t.amount for t in outgoing if t.amount) or 0
-
-        # Get bills for this account
-        bills_stmt = select(Bill).filter(Bill.account_id == account_id)
-        result = await self.session.execute(bills_stmt)
-        bills = result.scalars().all()
-        bills_total = sum(b.bill_amount for b in bills if b.bill_amount) or 0
+    async def calculate_account_balances(
+        self, account_ids: Iterable[int] | None = None
+    ) -> Dict[int, BalanceResult]:
+        """Calculate balances for a set of accounts in a single query.
 
-        # Unified formula: Incoming - Outgoing + Bills
-        balance = float(incoming_total - outgoing_total + bills_total)
+        Incoming, outgoing and bill amounts are summed in SQL (SUM/GROUP BY)
+        instead of materializing every Transaction and Bill row.
 
-        # Determine account type (handle both enum and string)
-        account_type = (
-            account.account_type.value
-            if hasattr(account.account_type, "value")
-            else str(account.account_type)
-        )
-
-        # OWNER accounts display inverted (from org perspective, their credits are positive)
-        invert_for_display = account_type == "owner"
+        Args:
+            account_ids: Account IDs to calculate; None means all accounts
 
-        return BalanceResult(balance=balance, invert_for_display=invert_for_display)
+        Returns:
+            Dict mapping account_id to BalanceResult (unknown IDs are omitted)
+        """
+        scope = None
+        if account_ids is not None:
+            account_ids = list(account_ids)
+            if not account_ids:
+                return {}
+            scope = select(Account.id).where(Account.id.in_(account_ids))
+
+        result = await self.session.execute(build_balances_stmt(scope))
+        return {
+            account_id: BalanceResult(
+                balance=_to_balance(total),
+                invert_for_display=is_owner_account(account_type),
+            )
+            for account_id, _user_id, account_type, total in result.all()
+        }
 
     async def get_user_by_id(self, user_id: int) -> User | None:
         """Get user by ID.
@@ -221,3 +216,73 @@ class BalanceCalculationService:
             )
             for bill in bills
         ]
+
+
+def build_balances_stmt(scope: Select | None) -> Select:
+    """Build the aggregate balance statement.
+
+    Unions incoming (+), outgoing (-) and bill (+) amounts into one signed
+    ledger, sums it per account and left-joins the totals onto accounts.
+
+    Args:
+        scope: Optional SELECT of account IDs restricting the calculation
+
+    Returns:
+        SELECT yielding (account_id, user_id, account_type, balance) rows
+    """
+    incoming = select(
+        Transaction.to_account_id.label("account_id"),
+        Transaction.amount.label("amount"),
+    )
+    outgoing = select(
+        Transaction.from_account_id.label("account_id"),
+        (-Transaction.amount).label("amount"),
+    )
+    bills = select(
+        Bill.account_id.label("account_id"),
+        Bill.bill_amount.label("amount"),
+    )
+    if scope is not None:
+        incoming = incoming.where(Transaction.to_account_id.in_(scope))
+        outgoing = outgoing.where(Transaction.from_account_id.in_(scope))
+        bills = bills.where(Bill.account_id.in_(scope))
+
+    ledger = union_all(incoming, outgoing, bills).subquery("ledger")
+    totals = (
+        select(ledger.c.account_id, func.sum(ledger.c.amount).label("total"))
+        .group_by(ledger.c.account_id)
+        .subquery("totals")
+    )
+
+    stmt = select(
+        Account.id,
+        Account.user_id,
+        Account.account_type,
+        func.coalesce(totals.c.total, 0).label("balance"),
+    ).outerjoin(totals, totals.c.account_id == Account.id)
+    if scope is not None:
+        stmt = stmt.where(Account.id.in_(scope))
+    return stmt
+
+
+def _to_balance(total) -> float:
+    """Convert an SQL SUM result to a balance rounded to kopecks."""
+    return round(float(total or 0), 2)
+
+
+def is_owner_account(account_type) -> bool:
+    """Check whether account_type (enum or raw string) is OWNER.
+
+    OWNER accounts display inverted (from org perspective, their credits are positive).
+    """
+    value = account_type.value if hasattr(account_type, "value") else str(account_type)
+    return value == "owner"
+
+
+__all__ = [
+    "BalanceCalculationService",
+    "BalanceResult",
+    "UserBillInfo",
+    "build_balances_stmt",
+    "is_owner_account",
+]
@@ -1,11 +1,11 @@
 """Unified service for all bill calculations and database operations."""
 
 import logging
-from datetime import date
+from datetime import date, datetime, timezone
 from decimal import ROUND_HALF_UP, Decimal
 from typing import NamedTuple
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.account import Account
@@ -15,9 +15,13 @@ from src.models.property import Property
 from src.models.service_period import ServicePeriod
 from src.models.user import User
 from src.services.audit_service import AuditService
+from src.services.balance_ledger_service import BalanceLedgerService
+from src.services.query_stats import query_budget
 
 logger = logging.getLogger(__name__)
 
+_KOPECK = Decimal("0.01")
+
 
 class OwnerShare(NamedTuple):
     """Unified owner share information for bill calculations.
@@ -46,6 +50,16 @@ class PersonalElectricityBill(NamedTuple):
     bill_amount: Decimal
 
 
+class _BillDraft(NamedTuple):
+    """Bill to be created for an owner, before the owner account is resolved."""
+
+    user_id: int
+    bill_type: BillType
+    amount: Decimal
+    property_id: int | None = None
+    audit_extra: dict | None = None  # Additional audit fields (property, readings)
+
+
 class BillsService:
     """Async service for bill database operations.
 
@@ -57,6 +71,7 @@ class BillsService:
         """Initialize with async database session."""
         self.session = session
 
+    @query_budget(4)
     async def create_shared_electricity_bills(
         self,
         period_id: int,
@@ -202,6 +217,7 @@ class BillsService:
 
         return bills, total
 
+    @query_budget(4)
     async def create_personal_electricity_bills(
         self,
         *,
@@ -218,6 +234,7 @@ class BillsService:
         await self.session.commit()
         return bills_created
 
+    @query_budget(9)
     async def create_personal_and_shared_electricity_bills(
         self,
         *,
@@ -255,46 +272,15 @@ class BillsService:
         owner_shares: list[OwnerShare],
         actor_id: int | None,
     ) -> int:
-        bills_created = 0
-
-        for share in owner_shares:
-            stmt = select(Account).filter(
-                Account.user_id == share.user_id,
-                Account.account_type == "owner",
-            )
-            result = await self.session.execute(stmt)
-            account = result.scalar_one_or_none()
-
-            if not account:
-                continue
-
-            bill = Bill(
-                service_period_id=period_id,
-                account_id=account.id,
-                property_id=None,
+        drafts = [
+            _BillDraft(
+                user_id=share.user_id,
                 bill_type=BillType.SHARED_ELECTRICITY,
-                bill_amount=share.calculated_bill_amount,
-            )
-            self.session.add(bill)
-            await self.session.flush()
-
-            await AuditService.log(
-                session=self.session,
-                entity_type="bill",
-                entity_id=bill.id,
-                action="create",
-                actor_id=actor_id,
-                changes={
-                    "bill_type": "shared_electricity",
-                    "account_id": account.id,
-                    "account_name": account.name,
-                    "period_id": period_id,
-                    "amount": float(share.calculated_bill_amount),
-                },
+                amount=share.calculated_bill_amount,
             )
-            bills_created += 1
-
-        return bills_created
+            for share in owner_shares
+        ]
+        return await self._insert_owner_bills(period_id, drafts, actor_id)
 
     async def _add_personal_electricity_bills(
         self,
@@ -303,52 +289,119 @@ class BillsService:
         personal_bills: list[PersonalElectricityBill],
         actor_id: int | None,
     ) -> int:
-        bills_created = 0
-
-        for personal in personal_bills:
-            stmt = select(Account).filter(
-                Account.user_id == personal.owner_id,
-                Account.account_type == "owner",
-            )
-            result = await self.session.execute(stmt)
-            account = result.scalar_one_or_none()
-
-            if not account:
-                continue
-
-            bill = Bill(
-                service_period_id=period_id,
-                account_id=account.id,
-                property_id=personal.property_id,
+        drafts = [
+            _BillDraft(
+                user_id=personal.owner_id,
                 bill_type=BillType.ELECTRICITY,
-                bill_amount=personal.bill_amount,
-            )
-            self.session.add(bill)
-            await self.session.flush()
-
-            await AuditService.log(
-                session=self.session,
-                entity_type="bill",
-                entity_id=bill.id,
-                action="create",
-                actor_id=actor_id,
-                changes={
-                    "bill_type": "electricity",
-                    "account_id": account.id,
-                    "account_name": account.name,
+                amount=personal.bill_amount,
+                property_id=personal.property_id,
+                audit_extra={
                     "property_id": personal.property_id,
                     "property_name": personal.property_name,
-                    "period_id": period_id,
-                    "amount": float(personal.bill_amount),
                     "start_reading_date": personal.start_reading_date.isoformat(),
                     "start_reading_value": str(personal.start_reading_value),
                     "end_reading_date": personal.end_reading_date.isoformat(),
                     "end_reading_value": str(personal.end_reading_value),
                 },
             )
-            bills_created += 1
+            for personal in personal_bills
+        ]
+        return await self._insert_owner_bills(period_id, drafts, actor_id)
 
-        return bills_created
+    async def _get_owner_accounts(self, user_ids: set[int]) -> dict[int, Account]:
+        """Resolve OWNER accounts for many users in one IN query.
+
+        Args:
+            user_ids: User IDs to look up
+
+        Returns:
+            Dict mapping user_id → Account (users without an owner account are omitted)
+        """
+        if not user_ids:
+            return {}
+
+        stmt = select(Account).filter(
+            Account.user_id.in_(user_ids),
+            Account.account_type == "owner",
+        )
+        result = await self.session.execute(stmt)
+        return {account.user_id: account for account in result.scalars().all()}
+
+    async def _insert_owner_bills(
+        self,
+        period_id: int,
+        drafts: list[_BillDraft],
+        actor_id: int | None,
+    ) -> int:
+        """Create bills for owners in a fixed number of statements.
+
+        Pipeline: resolve all owner accounts (one IN query) → bulk INSERT bills
+        with RETURNING ids → bulk INSERT audit logs → one balance ledger UPSERT.
+        Drafts for users without an owner account are skipped.
+
+        Args:
+            period_id: Service period ID
+            drafts: Bills to create, one per owner (or per property)
+            actor_id: Admin user ID who created bills (optional)
+
+        Returns:
+            Count of bills created
+        """
+        accounts = await self._get_owner_accounts({draft.user_id for draft in drafts})
+        resolved = [
+            (draft, accounts[draft.user_id]) for draft in drafts if draft.user_id in accounts
+        ]
+        if not resolved:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        result = await self.session.execute(
+            insert(Bill)
+            .values(
+                [
+                    {
+                        "service_period_id": period_id,
+                        "account_id": account.id,
+                        "property_id": draft.property_id,
+                        "bill_type": draft.bill_type,
+                        "bill_amount": draft.amount,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for draft, account in resolved
+                ]
+            )
+            .returning(Bill.id)
+        )
+        # RETURNING row order is unspecified in SQLite, but rowids of a single
+        # multi-row INSERT are assigned in VALUES order, so sorted ids match drafts
+        bill_ids = sorted(result.scalars().all())
+
+        await AuditService.log_many(
+            session=self.session,
+            entity_type="bill",
+            action="create",
+            actor_id=actor_id,
+            entries=[
+                (
+                    bill_id,
+                    {
+                        "bill_type": draft.bill_type.value,
+                        "account_id": account.id,
+                        "account_name": account.name,
+                        "period_id": period_id,
+                        "amount": float(draft.amount),
+                        **(draft.audit_extra or {}),
+                    },
+                )
+                for bill_id, (draft, account) in zip(bill_ids, resolved, strict=True)
+            ],
+        )
+
+        await BalanceLedgerService(self.session).apply_deltas(
+            (account.id, draft.amount) for draft, account in resolved
+        )
+        return len(resolved)
 
     async def calculate_main_bills(
         self, year_budget: Decimal, period_months: int
@@ -450,6 +503,7 @@ class BillsService:
 
         return list(owner_totals.items())
 
+    @query_budget(4)
     async def create_main_bills(
         self,
         period_id: int,
@@ -466,50 +520,11 @@ class BillsService:
         Returns:
             Number of bills created
         """
-        bills_created = 0
-
-        for calculation in calculations:
-            # Support both tuple and OwnerShare formats
-            if isinstance(calculation, OwnerShare):
-                user_id = calculation.user_id
-                amount = calculation.calculated_bill_amount
-            else:
-                user_id, amount = calculation
-            # Find owner account for this user
-            stmt = select(Account).filter(
-                Account.user_id == user_id,
-                Account.account_type == "owner",
-            )
-            result = await self.session.execute(stmt)
-            account = result.scalar_one_or_none()
-
-            if account:
-                bill = Bill(
-                    service_period_id=period_id,
-                    account_id=account.id,
-                    property_id=None,
-                    bill_type=BillType.MAIN,
-                    bill_amount=amount,
-                )
-                self.session.add(bill)
-                await self.session.flush()  # Get bill ID
-
-                # Audit log
-                await AuditService.log(
-                    session=self.session,
-                    entity_type="bill",
-                    entity_id=bill.id,
-                    action="create",
-                    actor_id=actor_id,
-                    changes={
-                        "bill_type": "main",
-                        "account_id": account.id,
-                        "account_name": account.name,
-                        "period_id": period_id,
-                        "amount": float(amount),
-                    },
-                )
-                bills_created += 1
+        drafts = [
+            _BillDraft(user_id=user_id, bill_type=BillType.MAIN, amount=amount)
+            for user_id, amount in _owner_amounts(calculations)
+        ]
+        bills_created = await self._insert_owner_bills(period_id, drafts, actor_id)
 
         await self.session.commit()
 
@@ -522,6 +537,7 @@ class BillsService:
 
         return bills_created
 
+    @query_budget(4)
     async def create_conservation_bills(
         self,
         period_id: int,
@@ -538,50 +554,11 @@ class BillsService:
         Returns:
             Number of bills created
         """
-        bills_created = 0
-
-        for calculation in calculations:
-            # Support both tuple and OwnerShare formats
-            if isinstance(calculation, OwnerShare):
-                user_id = calculation.user_id
-                amount = calculation.calculated_bill_amount
-            else:
-                user_id, amount = calculation
-            # Find owner account for this user
-            stmt = select(Account).filter(
-                Account.user_id == user_id,
-                Account.account_type == "owner",
-            )
-            result = await self.session.execute(stmt)
-            account = result.scalar_one_or_none()
-
-            if account:
-                bill = Bill(
-                    service_period_id=period_id,
-                    account_id=account.id,
-                    property_id=None,
-                    bill_type=BillType.CONSERVATION,
-                    bill_amount=amount,
-                )
-                self.session.add(bill)
-                await self.session.flush()  # Get bill ID
-
-                # Audit log
-                await AuditService.log(
-                    session=self.session,
-                    entity_type="bill",
-                    entity_id=bill.id,
-                    action="create",
-                    actor_id=actor_id,
-                    changes={
-                        "bill_type": "conservation",
-                        "account_id": account.id,
-                        "account_name": account.name,
-                        "period_id": period_id,
-                        "amount": float(amount),
-                    },
-                )
-                bills_created += 1
+        drafts = [
+            _BillDraft(user_id=user_id, bill_type=BillType.CONSERVATION, amount=amount)
+            for user_id, amount in _owner_amounts(calculations)
+        ]
+        bills_created = await self._insert_owner_bills(period_id, drafts, actor_id)
 
         await self.session.commit()
 
@@ -701,14 +678,19 @@ class BillsService:
         self,
         total_shared_cost: Decimal,
         service_period: ServicePeriod,
+        exact: bool = False,
     ) -> list[OwnerShare]:
         """Calculate proportional distribution of shared electricity costs.
 
         Distribution formula: user_share = total × (user_weight_sum / total_weight_sum)
 
+        Owner weights and names come from a single joined GROUP BY query.
+
         Args:
             total_shared_cost: Total shared electricity cost to distribute (>= 0)
             service_period: Service period for context
+            exact: Use largest-remainder rounding so shares sum to the total to the
+                kopeck (default rounds each share half-up independently)
 
         Returns:
             List of OwnerShare tuples with calculated amounts per owner
@@ -716,46 +698,54 @@ class BillsService:
         if total_shared_cost < 0:
             raise ValueError("Total shared cost cannot be negative")
 
-        # Get owner shares (weight aggregation)
-        owner_shares = await self.calculate_owner_shares(service_period)
+        stmt = (
+            select(
+                Property.owner_id,
+                User.name,
+                func.sum(Property.share_weight).label("total_weight"),
+            )
+            .join(User, User.id == Property.owner_id)
+            .where(Property.is_active == True)  # noqa: E712
+            .group_by(Property.owner_id, User.name)
+            .order_by(Property.owner_id)
+        )
+        rows = [
+            (owner_id, name, Decimal(str(total_weight)))
+            for owner_id, name, total_weight in (await self.session.execute(stmt)).all()
+            if total_weight is not None
+        ]
 
-        if not owner_shares:
+        if not rows:
             logger.warning("No active properties found for distribution")
             return []
 
         # Calculate total weight sum
-        total_weight_sum = sum(owner_shares.values())
+        weights = [owner_weight for _, _, owner_weight in rows]
+        total_weight_sum = sum(weights)
 
         if total_weight_sum == 0:
             logger.warning("Total weight sum is zero, cannot distribute")
             return []
 
-        # Calculate per-owner shares
-        result = []
-        for owner_id, owner_weight in owner_shares.items():
-            # Get user name
-            stmt = select(User).where(User.id == owner_id)
-            user_result = await self.session.execute(stmt)
-            user = user_result.scalar_one_or_none()
-            if not user:
-                logger.warning("User %d not found for owner_id", owner_id)
-                continue
-
-            # Calculate proportional share
-            user_share_amount = (total_shared_cost * (owner_weight / total_weight_sum)).quantize(
-                Decimal("0.01"), rounding=ROUND_HALF_UP
-            )
-
-            result.append(
-                OwnerShare(
-                    user_id=owner_id,
-                    user_name=user.name or f"User {owner_id}",
-                    total_share_weight=owner_weight,
-                    calculated_bill_amount=user_share_amount,
+        if exact:
+            amounts = _largest_remainder_amounts(total_shared_cost, weights)
+        else:
+            amounts = [
+                (total_shared_cost * (owner_weight / total_weight_sum)).quantize(
+                    _KOPECK, rounding=ROUND_HALF_UP
                 )
+                for owner_weight in weights
+            ]
+
+        return [
+            OwnerShare(
+                user_id=owner_id,
+                user_name=name or f"User {owner_id}",
+                total_share_weight=owner_weight,
+                calculated_bill_amount=amount,
             )
-
-        return result
+            for (owner_id, name, owner_weight), amount in zip(rows, amounts, strict=True)
+        ]
 
     async def get_previous_service_period(self) -> ServicePeriod | None:
         """Get the most recent open service period.
@@ -776,4 +766,37 @@ class BillsService:
         return result.scalar_one_or_none()
 
 
+def _largest_remainder_amounts(total: Decimal, weights: list[Decimal]) -> list[Decimal]:
+    """Split ``total`` by ``weights`` into kopecks that sum exactly to ``total``.
+
+    Each share is floored to the kopeck, then the leftover kopecks go one by one
+    to the largest remainders (ties to the earliest weight).
+    """
+    total_kopecks = int(total.quantize(_KOPECK, rounding=ROUND_HALF_UP) / _KOPECK)
+    weight_sum = sum(weights)
+    raw_shares = [total_kopecks * weight / weight_sum for weight in weights]
+    kopecks = [int(share) for share in raw_shares]
+
+    leftover = total_kopecks - sum(kopecks)
+    by_remainder = sorted(
+        range(len(weights)), key=lambda index: (kopecks[index] - raw_shares[index], index)
+    )
+    for index in by_remainder[:leftover]:
+        kopecks[index] += 1
+
+    return [Decimal(amount) * _KOPECK for amount in kopecks]
+
+
+def _owner_amounts(
+    calculations: list[tuple[int, Decimal]] | list[OwnerShare],
+) -> list[tuple[int, Decimal]]:
+    """Normalize (user_id, amount) tuples and OwnerShare objects to tuples."""
+    return [
+        (calculation.user_id, calculation.calculated_bill_amount)
+        if isinstance(calculation, OwnerShare)
+        else (calculation[0], calculation[1])
+        for calculation in calculations
+    ]
+
+
 __all__ = ["BillsService", "OwnerShare", "PersonalElectricityBill"]
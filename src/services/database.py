@@ -0,0 +1,221 @@
+"""Engine factory for the SQLite database.
+
+One process-wide set of engines is shared by the FastAPI app, the bot handlers
+and the MCP server (see ``src.services``):
+
+- writer: a single pooled connection (``pool_size=1, max_overflow=0``). SQLite
+  allows one writer at a time anyway, so writes queue in the pool instead of
+  spinning on ``SQLITE_BUSY``.
+- reader: a real pool of ``query_only`` connections. In WAL mode readers never
+  block the writer or each other, so concurrent Mini App reads run in parallel.
+
+Every new connection gets WAL, ``synchronous=NORMAL``, busy_timeout, cache_size
+and mmap_size pragmas. In-memory databases cannot be shared across connections,
+so they fall back to a single StaticPool engine used for both roles.
+
+Tunables (environment variables):
+    DB_READ_POOL_SIZE       Reader pool size (default: 5)
+    DB_READ_MAX_OVERFLOW    Extra reader connections under burst (default: 10)
+    DB_POOL_TIMEOUT         Seconds to wait for a pooled connection (default: 30)
+    SQLITE_BUSY_TIMEOUT_MS  busy_timeout pragma (default: 5000)
+    SQLITE_CACHE_SIZE_KIB   Page cache per connection in KiB (default: 16384)
+    SQLITE_MMAP_SIZE        mmap_size pragma in bytes (default: 134217728)
+"""
+
+import asyncio
+import os
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+@dataclass(frozen=True)
+class DatabaseSettings:
+    """Pool sizes and SQLite pragmas applied by the engine factory."""
+
+    read_pool_size: int = 5
+    read_max_overflow: int = 10
+    pool_timeout: int = 30
+    busy_timeout_ms: int = 5000
+    cache_size_kib: int = 16384
+    mmap_size: int = 128 * 1024 * 1024
+
+    @classmethod
+    def from_env(cls) -> "DatabaseSettings":
+        defaults = cls()
+        return cls(
+            read_pool_size=_env_int("DB_READ_POOL_SIZE", defaults.read_pool_size),
+            read_max_overflow=_env_int("DB_READ_MAX_OVERFLOW", defaults.read_max_overflow),
+            pool_timeout=_env_int("DB_POOL_TIMEOUT", defaults.pool_timeout),
+            busy_timeout_ms=_env_int("SQLITE_BUSY_TIMEOUT_MS", defaults.busy_timeout_ms),
+            cache_size_kib=_env_int("SQLITE_CACHE_SIZE_KIB", defaults.cache_size_kib),
+            mmap_size=_env_int("SQLITE_MMAP_SIZE", defaults.mmap_size),
+        )
+
+
+def to_async_url(database_url: str) -> str:
+    """Map a ``sqlite:///`` URL to its aiosqlite equivalent."""
+    return database_url.replace("sqlite:///", "sqlite+aiosqlite:///")
+
+
+def is_memory_database(database_url: str) -> bool:
+    """True for SQLite URLs that point at a private in-memory database."""
+    path = database_url.split("///", 1)[1] if "///" in database_url else ""
+    return path in ("", ":memory:") or "mode=memory" in path
+
+
+def sqlite_pragmas(settings: DatabaseSettings, read_only: bool = False) -> list[str]:
+    """PRAGMA statements executed on every new connection."""
+    pragmas = [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA busy_timeout={settings.busy_timeout_ms}",
+        # Negative cache_size is in KiB rather than pages
+        f"PRAGMA cache_size=-{settings.cache_size_kib}",
+        f"PRAGMA mmap_size={settings.mmap_size}",
+        "PRAGMA temp_store=MEMORY",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only=ON")
+    return pragmas
+
+
+def install_sqlite_pragmas(engine: Engine, pragmas: list[str]) -> None:
+    """Run ``pragmas`` on each DBAPI connection as the pool opens it."""
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def _pool_kwargs(database_url: str, settings: DatabaseSettings, read_only: bool) -> dict[str, Any]:
+    if is_memory_database(database_url):
+        return {"poolclass": StaticPool}
+    if read_only:
+        return {
+            "pool_size": settings.read_pool_size,
+            "max_overflow": settings.read_max_overflow,
+            "pool_timeout": settings.pool_timeout,
+        }
+    return {"pool_size": 1, "max_overflow": 0, "pool_timeout": settings.pool_timeout}
+
+
+def create_sync_engine(database_url: str, settings: DatabaseSettings | None = None) -> Engine:
+    """Create the sync writer engine (seeding, CLI and other code outside the event loop)."""
+    settings = settings or DatabaseSettings.from_env()
+    engine = create_engine(
+        database_url,
+        connect_args={"check_same_thread": False},
+        **_pool_kwargs(database_url, settings, read_only=False),
+    )
+    install_sqlite_pragmas(engine, sqlite_pragmas(settings))
+    return engine
+
+
+def create_async_engines(
+    database_url: str, settings: DatabaseSettings | None = None
+) -> tuple[AsyncEngine, AsyncEngine]:
+    """Create the shared async ``(writer, reader)`` engines.
+
+    For in-memory databases both roles are the same StaticPool engine.
+    """
+    settings = settings or DatabaseSettings.from_env()
+    async_url = to_async_url(database_url)
+
+    writer = create_async_engine(
+        async_url,
+        connect_args={"check_same_thread": False},
+        **_pool_kwargs(database_url, settings, read_only=False),
+    )
+    install_sqlite_pragmas(writer.sync_engine, sqlite_pragmas(settings))
+    if is_memory_database(database_url):
+        return writer, writer
+
+    reader = create_async_engine(
+        async_url,
+        connect_args={"check_same_thread": False},
+        **_pool_kwargs(database_url, settings, read_only=True),
+    )
+    install_sqlite_pragmas(reader.sync_engine, sqlite_pragmas(settings, read_only=True))
+    return writer, reader
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _sql_caller_filename() -> str:
+    """Filename of the nearest stack frame outside SQLAlchemy and this module."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        # "<string>" frames are SQLAlchemy's generated decorator wrappers
+        if (
+            filename != __file__
+            and not filename.startswith("<")
+            and f"{os.sep}sqlalchemy{os.sep}" not in filename
+        ):
+            return filename
+        frame = frame.f_back
+    return ""
+
+
+@contextmanager
+def detect_blocking_sync_access(ignore_callers: tuple[str, ...] = ()) -> Iterator[list[str]]:
+    """Record SQL run through a sync (blocking) engine while an event loop is running.
+
+    A sync engine used from a coroutine blocks the loop that also serves the
+    webhook and the Mini App. Async engines run their DBAPI calls inside a
+    greenlet on the loop thread too, so they are told apart by ``dialect.is_async``.
+
+    Args:
+        ignore_callers: Path prefixes whose own queries are allowed (e.g. test helpers)
+
+    Yields:
+        List collecting offending SQL statements (empty when the code is clean)
+    """
+    violations: list[str] = []
+
+    def _check(conn, _cursor, statement, _parameters, _context, _executemany) -> None:
+        if conn.dialect.is_async or not _in_event_loop():
+            return
+        if ignore_callers and _sql_caller_filename().startswith(ignore_callers):
+            return
+        violations.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", _check)
+    try:
+        yield violations
+    finally:
+        event.remove(Engine, "before_cursor_execute", _check)
+
+
+__all__ = [
+    "DatabaseSettings",
+    "detect_blocking_sync_access",
+    "create_sync_engine",
+    "create_async_engines",
+    "install_sqlite_pragmas",
+    "is_memory_database",
+    "sqlite_pragmas",
+    "to_async_url",
+]
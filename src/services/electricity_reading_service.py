@@ -1,12 +1,14 @@
 """Service for managing electricity meter readings with audit logging."""
 
-from datetime import date
+from datetime import date, datetime, timezone
 from decimal import Decimal
 
-from sqlalchemy import desc, select
+from sqlalchemy import DateTime, Executable, Select, delete, desc, func, literal, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.electricity_reading import ElectricityReading
+from src.models.latest_electricity_reading import LatestElectricityReading
 from src.models.property import Property
 from src.services.audit_service import AuditService
 
@@ -27,21 +29,27 @@ class ElectricityReadingService:
     ) -> list[tuple[Property, ElectricityReading | None]]:
         """Get all properties with their latest electricity readings.
 
+        Resolved in one query through the latest_electricity_readings projection,
+        regardless of how many properties exist.
+
         Returns:
             List of tuples (Property, ElectricityReading or None)
         """
-        # Get all properties
-        stmt = select(Property).where(Property.is_active).order_by(Property.property_name)
+        stmt = (
+            select(Property, ElectricityReading)
+            .outerjoin(
+                LatestElectricityReading,
+                LatestElectricityReading.property_id == Property.id,
+            )
+            .outerjoin(
+                ElectricityReading,
+                ElectricityReading.id == LatestElectricityReading.reading_id,
+            )
+            .where(Property.is_active)
+            .order_by(Property.property_name)
+        )
         result = await self.session.execute(stmt)
-        properties = result.scalars().all()
-
-        # Get latest reading for each property
-        results = []
-        for property_obj in properties:
-            latest_reading = await self.get_latest_reading_for_property(property_obj.id)
-            results.append((property_obj, latest_reading))
-
-        return results
+        return [(property_obj, reading) for property_obj, reading in result.all()]
 
     async def get_reading_by_id(self, reading_id: int) -> ElectricityReading | None:
         """Get electricity reading by ID.
@@ -175,6 +183,7 @@ class ElectricityReadingService:
         )
         self.session.add(reading)
         await self.session.flush()  # Ensure ID is assigned
+        await self._refresh_latest_reading(property_id)
 
         # Audit log
         await AuditService.log(
@@ -267,6 +276,11 @@ class ElectricityReadingService:
                 "new": str(reading_value),
             }
 
+        # A new date can change which reading is the latest for the property
+        if "reading_date" in changes and reading.property_id is not None:
+            await self.session.flush()
+            await self._refresh_latest_reading(reading.property_id)
+
         # Audit log if there were changes
         if changes and actor_id:
             await AuditService.log(
@@ -311,5 +325,92 @@ class ElectricityReadingService:
             changes=deleted_data,
         )
 
+        # Drop the projection pointer first so it never references a deleted row
+        await self.session.execute(
+            delete(LatestElectricityReading).where(
+                LatestElectricityReading.reading_id == reading.id
+            )
+        )
+
         # Hard delete
         await self.session.delete(reading)
+
+        if reading.property_id is not None:
+            await self.session.flush()
+            await self._refresh_latest_reading(reading.property_id)
+
+    async def _refresh_latest_reading(self, property_id: int) -> None:
+        """Recompute the latest-reading projection row for one property.
+
+        Must be called after the reading change is flushed, in the same transaction.
+
+        Args:
+            property_id: Property whose projection row to replace
+        """
+        for stmt in build_latest_reading_rebuild_statements(property_id):
+            await self.session.execute(stmt)
+
+
+def build_latest_readings_stmt(property_id: int | None = None) -> Select:
+    """Build a windowed query for the latest reading of each property.
+
+    Ranks readings per property with ROW_NUMBER() by reading_date, then id,
+    and keeps the first row.
+
+    Args:
+        property_id: Restrict to one property (None for all properties)
+
+    Returns:
+        SELECT of (property_id, reading_id) rows
+    """
+    row_number = (
+        func.row_number()
+        .over(
+            partition_by=ElectricityReading.property_id,
+            order_by=(desc(ElectricityReading.reading_date), desc(ElectricityReading.id)),
+        )
+        .label("row_number")
+    )
+    ranked = select(
+        ElectricityReading.property_id,
+        ElectricityReading.id.label("reading_id"),
+        row_number,
+    ).where(ElectricityReading.property_id.is_not(None))
+    if property_id is not None:
+        ranked = ranked.where(ElectricityReading.property_id == property_id)
+    ranked = ranked.subquery("ranked")
+
+    return select(ranked.c.property_id, ranked.c.reading_id).where(ranked.c.row_number == 1)
+
+
+def build_latest_reading_rebuild_statements(property_id: int | None = None) -> list[Executable]:
+    """Build statements that replace latest-reading projection rows.
+
+    Returned as plain statements so both async services and the synchronous
+    seeding session can execute them inside their own transaction.
+
+    Args:
+        property_id: Rebuild one property's row (None rebuilds the whole projection)
+
+    Returns:
+        [DELETE projection rows, INSERT ... SELECT windowed latest readings]
+    """
+    now = literal(datetime.now(timezone.utc), DateTime(timezone=True))
+    latest = build_latest_readings_stmt(property_id).subquery("latest")
+
+    delete_stmt = delete(LatestElectricityReading)
+    if property_id is not None:
+        delete_stmt = delete_stmt.where(LatestElectricityReading.property_id == property_id)
+
+    insert_stmt = sqlite_insert(LatestElectricityReading).from_select(
+        ["property_id", "reading_id", "created_at", "updated_at"],
+        select(latest.c.property_id, latest.c.reading_id, now, now),
+    )
+    return [delete_stmt, insert_stmt]
+
+
+__all__ = [
+    "ElectricityReadingService",
+    "build_latest_readings_stmt",
+    "build_latest_reading_rebuild_statements",
+]
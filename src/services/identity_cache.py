@@ -0,0 +1,109 @@
+"""In-process cache of authenticated Mini App identities.
+
+Every Mini App endpoint resolves the same identity chain (User by telegram_id,
+the Account being accessed, the represented User). The Mini App fires several
+API calls per screen, so the chain is cached here for a short TTL and attached
+to each request session with ``session.merge(..., load=False)`` - zero queries
+on warm requests.
+
+Cached instances are detached copies holding column values only; they are never
+the objects owned by a request session, so a rollback or refresh in one request
+cannot expire or mutate the cache.
+
+Writes that can change identity (UserService, AdminService.approve_request,
+seeding) call ``invalidate_identities()``. Representation links make per-user
+invalidation incomplete, and these writes are rare, so the whole cache is dropped.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TypeVar
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from src.models.account import Account
+from src.models.user import User
+
+IDENTITY_TTL_SECONDS = 60.0
+IDENTITY_CACHE_MAXSIZE = 1024
+
+_ModelT = TypeVar("_ModelT", User, Account)
+
+
+@dataclass
+class CachedIdentity:
+    """Identity chain for one telegram_id (detached snapshots)."""
+
+    user: User
+    accounts: dict[int, Account] = field(default_factory=dict)
+    """Accounts this user was already authorized for, keyed by account_id."""
+
+    represented_user: User | None = None
+    represented_resolved: bool = False
+    """True once represented_user was looked up (None is then a cached answer)."""
+
+    expires_at: float = 0.0
+
+
+class IdentityCache:
+    """LRU cache of CachedIdentity keyed by telegram_id with a short TTL."""
+
+    def __init__(self, maxsize: int = IDENTITY_CACHE_MAXSIZE, ttl: float = IDENTITY_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[int, CachedIdentity] = OrderedDict()
+
+    def get(self, telegram_id: int) -> CachedIdentity | None:
+        identity = self._entries.get(telegram_id)
+        if identity is None:
+            return None
+        if identity.expires_at <= time.monotonic():
+            del self._entries[telegram_id]
+            return None
+        self._entries.move_to_end(telegram_id)
+        return identity
+
+    def put(self, telegram_id: int, user: User) -> CachedIdentity:
+        identity = CachedIdentity(user=detached_copy(user), expires_at=time.monotonic() + self.ttl)
+        self._entries[telegram_id] = identity
+        self._entries.move_to_end(telegram_id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return identity
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+identity_cache = IdentityCache()
+
+
+def invalidate_identities() -> None:
+    """Drop all cached identities (call after writes to users or accounts)."""
+    identity_cache.clear()
+
+
+def detached_copy(instance: _ModelT) -> _ModelT:
+    """Copy loaded column values of an ORM instance into a new detached instance."""
+    mapper = inspect(instance).mapper
+    copy = mapper.class_(**{attr.key: getattr(instance, attr.key) for attr in mapper.column_attrs})
+    make_transient_to_detached(copy)
+    return copy
+
+
+async def attach(session: AsyncSession, instance: _ModelT) -> _ModelT:
+    """Attach a cached detached instance to a session without emitting SELECT."""
+    return await session.merge(instance, load=False)
+
+
+__all__ = [
+    "CachedIdentity",
+    "IdentityCache",
+    "identity_cache",
+    "invalidate_identities",
+    "detached_copy",
+    "attach",
+]
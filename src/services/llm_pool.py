@@ -0,0 +1,247 @@
+"""Process-wide Ollama client and admission queue for LLM requests.
+
+Every /ask used to build its own ``AsyncClient`` (a fresh HTTP connection
+pool) and nothing bounded how many conversations hit the single local Ollama
+server at once, so under load all of them slowed down together. This module
+provides:
+
+- ``get_ollama_client(host)``: one shared client per host; its httpx pool keeps
+  connections alive between requests.
+- ``LLMAdmissionQueue``: at most ``limit`` conversations talk to the model at
+  a time. Others wait in strict FIFO order, are told their queue position as
+  it changes, and give up with AdmissionTimeout after ``timeout`` seconds.
+  Waits and the queue state are reported on ``/metrics``.
+
+Tunables (environment variables):
+    OLLAMA_MAX_CONCURRENCY      Conversations served at once (default: 2)
+    OLLAMA_QUEUE_TIMEOUT        Seconds a request may wait for admission (default: 60)
+"""
+
+import asyncio
+import logging
+import os
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from typing import AsyncIterator, Awaitable, Callable
+
+import httpx
+from ollama import AsyncClient
+
+from src.services.metrics import LLM_ADMISSION_WAIT_SECONDS, registry
+
+logger = logging.getLogger(__name__)
+
+OLLAMA_MAX_CONCURRENCY = int(os.getenv("OLLAMA_MAX_CONCURRENCY") or 2)
+OLLAMA_QUEUE_TIMEOUT = float(os.getenv("OLLAMA_QUEUE_TIMEOUT") or 60)
+
+PositionCallback = Callable[[int], Awaitable[None]]
+
+
+class AdmissionTimeout(Exception):
+    """Raised when an LLM request waited longer than the admission timeout."""
+
+
+@dataclass(frozen=True)
+class AdmissionStats:
+    """Point-in-time metrics of an LLMAdmissionQueue."""
+
+    limit: int
+    active: int
+    waiting: int
+    admitted: int
+    timed_out: int
+    max_waiting: int
+    """High-water mark of ``waiting`` since start."""
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class _Waiter:
+    __slots__ = ("admitted", "moved")
+
+    def __init__(self):
+        self.admitted = False
+        # Set when the waiter is admitted or moves up in the queue
+        self.moved = asyncio.Event()
+
+
+class LLMAdmissionQueue:
+    """FIFO admission with a fixed number of concurrent slots."""
+
+    def __init__(self, limit: int = OLLAMA_MAX_CONCURRENCY, timeout: float = OLLAMA_QUEUE_TIMEOUT):
+        self.limit = limit
+        self.timeout = timeout
+        self._active = 0
+        self._waiters: deque[_Waiter] = deque()
+        self._admitted = 0
+        self._timed_out = 0
+        self._max_waiting = 0
+
+    async def acquire(self, on_position: PositionCallback | None = None) -> None:
+        """Take a slot, waiting in line if all are busy.
+
+        Args:
+            on_position: Awaited with the 1-based queue position whenever it changes
+                (not called when a slot is free right away)
+
+        Raises:
+            AdmissionTimeout: No slot within ``timeout`` seconds
+        """
+        if self._active < self.limit and not self._waiters:
+            self._active += 1
+            self._admitted += 1
+            LLM_ADMISSION_WAIT_SECONDS.observe(0.0)
+            return
+
+        waiter = _Waiter()
+        self._waiters.append(waiter)
+        self._max_waiting = max(self._max_waiting, len(self._waiters))
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + self.timeout
+        reported = None
+        try:
+            while not waiter.admitted:
+                waiter.moved.clear()
+                position = self._waiters.index(waiter) + 1
+                if on_position is not None and position != reported:
+                    reported = position
+                    await on_position(position)
+                if waiter.admitted:
+                    break
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                await asyncio.wait_for(waiter.moved.wait(), remaining)
+        except asyncio.TimeoutError:
+            if waiter.admitted:
+                # Handed a slot just as the deadline passed
+                LLM_ADMISSION_WAIT_SECONDS.observe(loop.time() - started)
+                return
+            self._leave(waiter)
+            self._timed_out += 1
+            logger.warning("LLM request gave up after waiting %.0fs for admission", self.timeout)
+            raise AdmissionTimeout(f"No LLM slot within {self.timeout:.0f}s") from None
+        except BaseException:
+            self._leave(waiter)
+            raise
+        LLM_ADMISSION_WAIT_SECONDS.observe(loop.time() - started)
+
+    def release(self) -> None:
+        """Free a slot; the longest-waiting request takes it over."""
+        if self._waiters:
+            waiter = self._waiters.popleft()
+            waiter.admitted = True
+            self._admitted += 1
+            waiter.moved.set()
+            self._notify_waiters()
+        else:
+            self._active -= 1
+
+    @asynccontextmanager
+    async def slot(self, on_position: PositionCallback | None = None) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the ``async with`` block."""
+        await self.acquire(on_position)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> AdmissionStats:
+        return AdmissionStats(
+            limit=self.limit,
+            active=self._active,
+            waiting=len(self._waiters),
+            admitted=self._admitted,
+            timed_out=self._timed_out,
+            max_waiting=self._max_waiting,
+        )
+
+    def _leave(self, waiter: _Waiter) -> None:
+        if waiter.admitted:
+            # Cancelled right after being handed a slot: pass it on
+            self.release()
+            return
+        self._waiters.remove(waiter)
+        self._notify_waiters()
+
+    def _notify_waiters(self) -> None:
+        for waiter in self._waiters:
+            waiter.moved.set()
+
+
+_clients: dict[str, AsyncClient] = {}
+_admission_queue: LLMAdmissionQueue | None = None
+
+
+def get_ollama_client(host: str) -> AsyncClient:
+    """Get the shared Ollama client for ``host`` (created on first use)."""
+    client = _clients.get(host)
+    if client is None:
+        limits = httpx.Limits(
+            max_connections=OLLAMA_MAX_CONCURRENCY * 2,
+            max_keepalive_connections=OLLAMA_MAX_CONCURRENCY,
+        )
+        client = AsyncClient(host=host, limits=limits)
+        _clients[host] = client
+    return client
+
+
+def get_admission_queue() -> LLMAdmissionQueue:
+    """Get the process-wide LLM admission queue (created on first use)."""
+    global _admission_queue
+    if _admission_queue is None:
+        _admission_queue = LLMAdmissionQueue()
+    return _admission_queue
+
+
+async def close_ollama_clients() -> None:
+    """Close the shared clients' connections (application shutdown)."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.close()
+
+
+_admission_gauge = registry.gauge(
+    "sosenki_llm_admission_requests", "LLM conversations by admission state", ("state",)
+)
+_admission_totals = registry.gauge(
+    "sosenki_llm_admission_total",
+    "LLM conversations admitted or timed out since start",
+    ("outcome",),
+    kind="counter",
+)
+
+
+def _collect_admission_metrics() -> None:
+    if _admission_queue is None:
+        return
+    stats = _admission_queue.stats()
+    _admission_gauge.set(stats.active, "active")
+    _admission_gauge.set(stats.waiting, "waiting")
+    _admission_totals.set(stats.admitted, "admitted")
+    _admission_totals.set(stats.timed_out, "timed_out")
+
+
+registry.add_collector(_collect_admission_metrics)
+
+
+def reset_llm_pool() -> None:
+    """Drop the shared clients and queue (their connections are bound to one event loop)."""
+    global _admission_queue
+    _clients.clear()
+    _admission_queue = None
+
+
+__all__ = [
+    "AdmissionStats",
+    "AdmissionTimeout",
+    "LLMAdmissionQueue",
+    "close_ollama_clients",
+    "get_admission_queue",
+    "get_ollama_client",
+    "reset_llm_pool",
+]
@@ -5,21 +5,38 @@ Provides a wrapper around Ollama's async client with:
 - Role-based tool filtering (user vs admin)
 - Auto-injection of user context
 - Tool-calling loop for multi-step queries
+- Optional streaming: partial answer text and tool-call rounds are reported
+  through callbacks while the completion is generated
+- Read-only tools requested in one turn run concurrently (each on its own
+  session) and their results are memoized for the rest of the question
+- A shared client per Ollama host and a FIFO admission queue that bounds how
+  many conversations use the model at once (see src.services.llm_pool)
+- Token-budgeted prompts with a byte-stable system/tools prefix and optional
+  per-user conversation memory (see src.services.prompt_assembler)
 """
 
+import asyncio
 import json
 import logging
 import os
 from dataclasses import dataclass
 from datetime import date
-from typing import Any
+from typing import Any, Awaitable, Callable
 
-from ollama import AsyncClient
+from ollama import Message
 
 from src.prompts import ADMIN_SYSTEM_PROMPT, USER_SYSTEM_PROMPT
 from src.services.balance_service import BalanceCalculationService
+from src.services.llm_pool import (
+    LLMAdmissionQueue,
+    PositionCallback,
+    get_admission_queue,
+    get_ollama_client,
+)
 from src.services.locale_service import CURRENCY, format_local_datetime
+from src.services.metrics import OLLAMA_REQUEST_SECONDS
 from src.services.period_service import AsyncServicePeriodService
+from src.services.prompt_assembler import ConversationMemory, PromptAssembler
 from src.services.transaction_service import TransactionService
 from src.utils.parsers import parse_date
 
@@ -33,6 +50,10 @@ logger = logging.getLogger(__name__)
 # Default model if OLLAMA_MODEL not set
 DEFAULT_MODEL = "qwen2.5:latest"
 
+# Streaming callbacks: answer text generated so far / names of tools being called
+TextCallback = Callable[[str], Awaitable[None]]
+ToolCallsCallback = Callable[[list[str]], Awaitable[None]]
+
 
 # Prompts are loaded from external .prompt.md files via src.prompts module
 # Re-export for backward compatibility (deprecated - use src.prompts directly)
@@ -215,6 +236,10 @@ def get_admin_tools() -> list[dict[str, Any]]:
 # ============================================================================
 
 
+# Tools without side effects: safe to run concurrently and to memoize
+READ_ONLY_TOOLS = frozenset({"get_balance", "list_bills", "get_period_info"})
+
+
 @dataclass
 class ToolContext:
     """Context for tool execution."""
@@ -224,6 +249,34 @@ class ToolContext:
     session: Any  # AsyncSession
 
 
+class ToolResultCache:
+    """Read-only tool results of one chat invocation, keyed on tool name and arguments.
+
+    Entries are tasks, so identical calls requested in the same turn share one
+    execution. A write tool invalidates everything, so later reads see the write.
+    """
+
+    def __init__(self):
+        self._tasks: dict[tuple[str, str], asyncio.Task] = {}
+        self.hits = 0
+
+    @staticmethod
+    def key(tool_name: str, arguments: dict[str, Any] | None) -> tuple[str, str]:
+        return tool_name, json.dumps(arguments or {}, sort_keys=True, default=str)
+
+    def get(self, tool_name: str, arguments: dict[str, Any] | None) -> asyncio.Task | None:
+        task = self._tasks.get(self.key(tool_name, arguments))
+        if task is not None:
+            self.hits += 1
+        return task
+
+    def put(self, tool_name: str, arguments: dict[str, Any] | None, task: asyncio.Task) -> None:
+        self._tasks[self.key(tool_name, arguments)] = task
+
+    def invalidate(self) -> None:
+        self._tasks.clear()
+
+
 async def execute_tool(
     tool_name: str,
     arguments: dict[str, Any],
@@ -369,7 +422,7 @@ async def _execute_create_service_period(
 
     service = AsyncServicePeriodService(ctx.session)
     try:
-        new_period = await service.create_period(start, end, name)
+        new_period = await service.create_period_until(start, end, name=name)
         return json.dumps(
             {
                 "success": True,
@@ -456,6 +509,9 @@ class OllamaService:
         is_admin: bool = False,
         model: str | None = None,
         host: str | None = None,
+        read_session_factory: Callable[[], Any] | None = None,
+        admission: LLMAdmissionQueue | None = None,
+        memory: ConversationMemory | None = None,
     ):
         """Initialize Ollama service.
 
@@ -465,13 +521,23 @@ class OllamaService:
             is_admin: Whether user has admin privileges
             model: Ollama model to use (default from OLLAMA_MODEL env)
             host: Ollama host URL (default from OLLAMA_HOST env or localhost)
+            read_session_factory: Session factory for read-only tools (e.g.
+                AsyncReadSessionLocal); when given, read-only tools of one turn run
+                concurrently, each on its own session. Otherwise they run in turn
+                on ``session``.
+            admission: Admission queue bounding concurrent conversations
+                (default: the process-wide queue)
+            memory: Conversation memory to continue the user's recent questions from
         """
         self.session = session
+        self.read_session_factory = read_session_factory
         self.user_id = user_id
         self.is_admin = is_admin
         self.model = model or os.getenv("OLLAMA_MODEL", DEFAULT_MODEL)
         host = host or os.getenv("OLLAMA_HOST", "http://localhost:11434")
-        self.client = AsyncClient(host=host)
+        self.client = get_ollama_client(host)
+        self.admission = admission or get_admission_queue()
+        self.memory = memory
         self.tool_context = ToolContext(
             user_id=user_id,
             is_admin=is_admin,
@@ -486,7 +552,114 @@ class OllamaService:
         """Get system prompt based on user role."""
         return ADMIN_SYSTEM_PROMPT if self.is_admin else USER_SYSTEM_PROMPT
 
-    async def chat(self, user_message: str, max_tool_calls: int = 5) -> str:
+    async def _complete(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]],
+        on_text: TextCallback | None,
+    ) -> Message:
+        """Run one model round; stream it when ``on_text`` is given.
+
+        Whether a round calls tools is only known once its stream ends, and
+        models may write a preamble before the call. The round's text is
+        therefore buffered and passed to ``on_text`` only when the round turns
+        out to be the answer, so the reply never shows a discarded preamble.
+        """
+        if on_text is None:
+            with OLLAMA_REQUEST_SECONDS.time("single"):
+                response = await self.client.chat(model=self.model, messages=messages, tools=tools)
+            return response.message
+
+        content = ""
+        tool_calls = []
+        with OLLAMA_REQUEST_SECONDS.time("stream"):
+            stream = await self.client.chat(
+                model=self.model, messages=messages, tools=tools, stream=True
+            )
+            async for chunk in stream:
+                if chunk.message.tool_calls:
+                    tool_calls.extend(chunk.message.tool_calls)
+                if chunk.message.content:
+                    content += chunk.message.content
+        if content and not tool_calls:
+            await on_text(content)
+        return Message(role="assistant", content=content, tool_calls=tool_calls or None)
+
+    async def _execute_tool_calls(self, tool_calls: list[Any], cache: ToolResultCache) -> list[str]:
+        """Execute one turn's tool calls.
+
+        Consecutive read-only calls form a batch that runs concurrently (when a
+        read session factory is available); a write tool runs alone on the
+        conversation session, after the reads requested before it, and is committed.
+        """
+        results: list[str] = [""] * len(tool_calls)
+        batch: list[int] = []
+
+        async def run_batch() -> None:
+            reads = [self._run_read_tool(tool_calls[index], cache) for index in batch]
+            if self.read_session_factory is not None:
+                outputs = await asyncio.gather(*reads)
+            else:
+                outputs = [await read for read in reads]
+            for index, output in zip(batch, outputs, strict=True):
+                results[index] = output
+            batch.clear()
+
+        for index, tool_call in enumerate(tool_calls):
+            if tool_call.function.name in READ_ONLY_TOOLS:
+                batch.append(index)
+                continue
+            await run_batch()
+            results[index] = await self._execute_write_tool(tool_call)
+            cache.invalidate()
+        await run_batch()
+        return results
+
+    async def _execute_write_tool(self, tool_call: Any) -> str:
+        """Run a write tool on the conversation session and end its transaction.
+
+        A successful write is committed at once rather than when the question
+        is answered, so it is not lost and neither the writer connection nor
+        the SQLite write lock stays held through the remaining model rounds.
+        """
+        tool_name = tool_call.function.name
+        arguments = tool_call.function.arguments
+        logger.info(f"Executing tool: {tool_name} with args: {arguments}")
+        result = await execute_tool(tool_name, arguments, self.tool_context)
+        if "error" in json.loads(result):
+            await self.session.rollback()
+        else:
+            await self.session.commit()
+        return result
+
+    async def _run_read_tool(self, tool_call: Any, cache: ToolResultCache) -> str:
+        """Run a read-only tool once per conversation (memoized in ``cache``)."""
+        tool_name = tool_call.function.name
+        arguments = tool_call.function.arguments
+        task = cache.get(tool_name, arguments)
+        if task is None:
+            logger.info(f"Executing tool: {tool_name} with args: {arguments}")
+            task = asyncio.ensure_future(self._execute_read_tool(tool_name, arguments))
+            cache.put(tool_name, arguments, task)
+        else:
+            logger.info(f"Reusing cached result of tool: {tool_name} with args: {arguments}")
+        return await task
+
+    async def _execute_read_tool(self, tool_name: str, arguments: dict[str, Any]) -> str:
+        if self.read_session_factory is None:
+            return await execute_tool(tool_name, arguments, self.tool_context)
+        async with self.read_session_factory() as session:
+            ctx = ToolContext(user_id=self.user_id, is_admin=self.is_admin, session=session)
+            return await execute_tool(tool_name, arguments, ctx)
+
+    async def chat(
+        self,
+        user_message: str,
+        max_tool_calls: int = 5,
+        on_text: TextCallback | None = None,
+        on_tool_calls: ToolCallsCallback | None = None,
+        on_queue_position: PositionCallback | None = None,
+    ) -> str:
         """Process a user message with optional tool calling.
 
         Implements tool-calling loop:
@@ -497,74 +670,82 @@ class OllamaService:
         Args:
             user_message: The user's question or request
             max_tool_calls: Maximum tool calls before forcing response
+            on_text: If given, the completion is streamed and this is awaited with
+                the answer text once a round ends without tool calls
+            on_tool_calls: Awaited with the tool names before each tool-calling round
+            on_queue_position: Awaited with the queue position while waiting for
+                an admission slot
 
         Returns:
             Final text response from LLM
+
+        Raises:
+            AdmissionTimeout: The model stayed busy for longer than the queue timeout
         """
-        messages = [
-            {"role": "system", "content": self._get_system_prompt()},
-            {"role": "user", "content": user_message},
-        ]
+        # The whole conversation holds one slot so it is not interleaved mid-answer
+        async with self.admission.slot(on_queue_position):
+            return await self._chat(user_message, max_tool_calls, on_text, on_tool_calls)
 
-        tools = self._get_tools()
+    async def _chat(
+        self,
+        user_message: str,
+        max_tool_calls: int,
+        on_text: TextCallback | None,
+        on_tool_calls: ToolCallsCallback | None,
+    ) -> str:
+        prompt = PromptAssembler(self.is_admin)
+        history = self.memory.history(self.user_id) if self.memory is not None else []
+        messages = prompt.start(user_message, history)
+
+        tools = prompt.tools
         tool_call_count = 0
+        cache = ToolResultCache()
 
         while tool_call_count < max_tool_calls:
             try:
-                response = await self.client.chat(
-                    model=self.model,
-                    messages=messages,
-                    tools=tools,
-                )
+                message = await self._complete(messages, tools, on_text)
             except Exception as e:
                 logger.error(f"Ollama chat error: {e}", exc_info=True)
                 return f"Sorry, I encountered an error connecting to the AI service: {e}"
 
-            message = response.message
-
             # Check if LLM wants to call tools
             if message.tool_calls:
+                if on_tool_calls is not None:
+                    await on_tool_calls([tc.function.name for tc in message.tool_calls])
+
                 # Append assistant message with tool calls
                 messages.append(
-                    {
-                        "role": "assistant",
-                        "content": message.content or "",
-                        "tool_calls": [
-                            {
-                                "id": tc.id if hasattr(tc, "id") else f"call_{tool_call_count}",
-                                "type": "function",
-                                "function": {
-                                    "name": tc.function.name,
-                                    "arguments": tc.function.arguments,
-                                },
-                            }
-                            for tc in message.tool_calls
-                        ],
-                    }
-                )
-
-                # Execute each tool call
-                for tool_call in message.tool_calls:
-                    tool_name = tool_call.function.name
-                    arguments = tool_call.function.arguments
-
-                    logger.info(f"Executing tool: {tool_name} with args: {arguments}")
-
-                    result = await execute_tool(tool_name, arguments, self.tool_context)
-
-                    # Add tool result to messages
-                    messages.append(
+                    prompt.assistant_message(
                         {
-                            "role": "tool",
-                            "content": result,
-                            "name": tool_name,
+                            "role": "assistant",
+                            "content": message.content or "",
+                            "tool_calls": [
+                                {
+                                    "id": tc.id if hasattr(tc, "id") else f"call_{tool_call_count}",
+                                    "type": "function",
+                                    "function": {
+                                        "name": tc.function.name,
+                                        "arguments": tc.function.arguments,
+                                    },
+                                }
+                                for tc in message.tool_calls
+                            ],
                         }
                     )
+                )
+
+                # Execute the tool calls; results keep the requested order and
+                # are fitted into the remaining token budget
+                results = await self._execute_tool_calls(message.tool_calls, cache)
+                names = [tool_call.function.name for tool_call in message.tool_calls]
+                messages.extend(prompt.tool_messages(list(zip(names, results, strict=True))))
 
-                    tool_call_count += 1
+                tool_call_count += len(message.tool_calls)
 
             else:
                 # No tool calls - return final response
+                if message.content and self.memory is not None:
+                    self.memory.remember(self.user_id, user_message, message.content)
                 return message.content or "I couldn't generate a response."
 
         # Max tool calls reached
@@ -578,4 +759,8 @@ __all__ = [
     "get_admin_tools",
     "execute_tool",
     "ToolContext",
+    "ToolResultCache",
+    "READ_ONLY_TOOLS",
+    "TextCallback",
+    "ToolCallsCallback",
 ]
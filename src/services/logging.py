@@ -3,12 +3,37 @@
 Provides dual output (stdout + file) with configurable level via LOG_LEVEL env var.
 Default: INFO. Set LOG_LEVEL=WARNING for production, DEBUG for verbose output.
 Suitable for both real-time developer feedback and audit trails.
+
+Records are handed to a queue on the calling thread and written by a
+background listener thread, so ``logger.info`` in request handlers and bot
+callbacks never waits for the disk or the terminal. The file rotates by size
+and by time, keeping ``LOG_BACKUP_COUNT`` old files.
+
+With ``LOG_FORMAT=json`` every line is a JSON object carrying the request
+context bound with ``log_context`` (request_id, telegram_id, ...) and any
+``extra`` fields such as duration_ms.
+
+Tunables (environment variables):
+    LOG_LEVEL           Minimum level (default: INFO)
+    LOG_FORMAT          text or json (default: text)
+    LOG_MAX_BYTES       Rotate the file once it reaches this size (default: 10485760)
+    LOG_ROTATE_WHEN     TimedRotatingFileHandler interval, e.g. midnight, H (default: midnight)
+    LOG_BACKUP_COUNT    Rotated files kept (default: 7)
 """
 
+import atexit
+import copy
+import json
 import logging
 import os
+import queue
 import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
+from typing import Any, Iterator
 
 # Map string level names to logging constants
 LOG_LEVEL_MAP = {
@@ -19,6 +44,22 @@ LOG_LEVEL_MAP = {
     "CRITICAL": logging.CRITICAL,
 }
 
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES") or 10 * 1024 * 1024)
+LOG_ROTATE_WHEN = os.getenv("LOG_ROTATE_WHEN") or "midnight"
+LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT") or 7)
+
+# Attributes every LogRecord has; anything else on a record came from ``extra``
+_RECORD_ATTRIBUTES = frozenset(logging.LogRecord("", 0, "", 0, "", None, None).__dict__) | {
+    "message",
+    "asctime",
+    "taskName",
+}
+
+_log_context: ContextVar[dict[str, Any] | None] = ContextVar("log_context", default=None)
+
+# Listener writing queued records (None until setup_server_logging)
+_listener: QueueListener | None = None
+
 
 def get_log_level() -> int:
     """Get logging level from LOG_LEVEL environment variable.
@@ -30,6 +71,104 @@ def get_log_level() -> int:
     return LOG_LEVEL_MAP.get(level_str, logging.INFO)
 
 
+@contextmanager
+def log_context(**fields: Any) -> Iterator[None]:
+    """Attach ``fields`` to every record logged in the current context until the block exits."""
+    token = _log_context.set({**(_log_context.get() or {}), **fields})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """Copy the bound log context onto records (runs in the caller's context, before queuing)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for key, value in (_log_context.get() or {}).items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, message and extra fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_") and value is not None:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class SizedTimedRotatingFileHandler(TimedRotatingFileHandler):
+    """Rotate at the ``when`` interval or once the file reaches ``max_bytes``."""
+
+    def __init__(self, filename: str, max_bytes: int, **kwargs: Any):
+        super().__init__(filename, **kwargs)
+        self.max_bytes = max_bytes
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:  # noqa: N802
+        if super().shouldRollover(record):
+            return True
+        if self.max_bytes <= 0 or self.stream is None:
+            return False
+        self.stream.seek(0, os.SEEK_END)
+        return self.stream.tell() + len(self.format(record)) + 1 >= self.max_bytes
+
+    def rotation_filename(self, default_name: str) -> str:
+        # Several size-based rotations within one interval must not overwrite each other
+        name = super().rotation_filename(default_name)
+        index = 1
+        candidate = name
+        while os.path.exists(candidate):
+            candidate = f"{name}.{index}"
+            index += 1
+        return candidate
+
+
+def _create_formatter() -> logging.Formatter:
+    if os.getenv("LOG_FORMAT", "text").lower() == "json":
+        return JsonFormatter()
+    # ISO format: [YYYY-MM-DD HH:MM:SS]
+    return logging.Formatter(
+        fmt="[%(asctime)s] %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+
+class _RecordQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting to the listener's handlers.
+
+    The stock ``prepare`` renders the record with this handler's formatter;
+    here only the message is merged, so each output keeps its own format.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        # Merge args now: they may reference objects that change before the write
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            # The traceback keeps its frames alive until written; the text is enough
+            record.exc_info = None
+        return record
+
+
 def setup_server_logging(log_file: str = "logs/server.log") -> None:
     """
     Configure root logger for bot + mini app server.
@@ -38,19 +177,19 @@ def setup_server_logging(log_file: str = "logs/server.log") -> None:
         log_file: Path to log file (default: logs/server.log)
 
     Behavior:
-        - Sets up all loggers to output to both stdout and file
-        - ISO format timestamps for consistency
+        - Sets up all loggers to output to both stdout and file, written by a
+          background thread fed through a queue
+        - ISO format timestamps (or JSON lines with LOG_FORMAT=json)
+        - File rotates by size (LOG_MAX_BYTES) and time (LOG_ROTATE_WHEN)
         - Suitable for both real-time debugging and audit trails
     """
+    global _listener
+
     # Create logs directory if it doesn't exist
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # ISO format: [YYYY-MM-DD HH:MM:SS]
-    formatter = logging.Formatter(
-        fmt="[%(asctime)s] %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    formatter = _create_formatter()
 
     # Get configured log level from environment
     log_level = get_log_level()
@@ -60,16 +199,60 @@ def setup_server_logging(log_file: str = "logs/server.log") -> None:
     root_logger.setLevel(log_level)
 
     # Remove any existing handlers to avoid duplicates
+    stop_server_logging()
     root_logger.handlers.clear()
 
     # Handler 1: stdout (console)
     stdout_handler = logging.StreamHandler(sys.stdout)
     stdout_handler.setLevel(log_level)
     stdout_handler.setFormatter(formatter)
-    root_logger.addHandler(stdout_handler)
 
-    # Handler 2: file (logs/server.log)
-    file_handler = logging.FileHandler(log_path)
+    # Handler 2: file (logs/server.log), rotated by size and time
+    file_handler = SizedTimedRotatingFileHandler(
+        str(log_path),
+        max_bytes=LOG_MAX_BYTES,
+        when=LOG_ROTATE_WHEN,
+        backupCount=LOG_BACKUP_COUNT,
+        encoding="utf-8",
+    )
     file_handler.setLevel(log_level)
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+
+    # The root logger only enqueues; the listener thread does the I/O
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = _RecordQueueHandler(records)
+    queue_handler.setLevel(log_level)
+    queue_handler.addFilter(ContextFilter())
+    root_logger.addHandler(queue_handler)
+
+    _listener = QueueListener(records, stdout_handler, file_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_server_logging() -> None:
+    """Write out queued records and close the output handlers (shutdown, tests)."""
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def server_log_handlers() -> tuple[logging.Handler, ...]:
+    """Handlers the background listener writes to (empty before setup)."""
+    return _listener.handlers if _listener is not None else ()
+
+
+atexit.register(stop_server_logging)
+
+
+__all__ = [
+    "JsonFormatter",
+    "get_log_level",
+    "log_context",
+    "server_log_handlers",
+    "setup_server_logging",
+    "stop_server_logging",
+]
@@ -0,0 +1,286 @@
+"""In-process metrics registry rendered in the Prometheus text format.
+
+The app runs as a single process, so metrics are plain in-memory counters
+served by ``GET /metrics`` (no client library, no push gateway):
+
+- Histograms: latency of Mini App/API routes, bot handler callbacks, MCP
+  tools, Ollama round trips and LLM admission waits. Observing a value is a
+  bisect over fixed buckets plus two additions.
+- Gauges: point-in-time values (queue depths, DB pool usage) filled in at
+  scrape time by collectors the owning modules register with
+  ``add_collector``. A gauge of kind ``counter`` exposes a running total kept
+  elsewhere (e.g. in a ``stats()`` snapshot).
+
+Label values should come from a small fixed set (route templates, handler and
+tool names), never from user input.
+"""
+
+import logging
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Awaitable, Callable, Iterator, TypeVar
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; covers fast Mini App reads up to slow LLM conversations
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_T = TypeVar("_T")
+Collector = Callable[[], None]
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+@dataclass
+class _HistogramSeries:
+    counts: list[int]
+    total: float = 0.0
+    count: int = 0
+
+
+class Histogram:
+    """Distribution of observed values per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.label_names = labels
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[tuple[str, ...], _HistogramSeries] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record ``value`` for the label values given in ``labels`` order."""
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = _HistogramSeries(counts=[0] * len(self.buckets))
+        index = bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            series.counts[index] += 1
+        series.total += value
+        series.count += 1
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        """Observe the duration of the ``with`` block (also when it raises)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *labels)
+
+    def timed(
+        self, *labels: str
+    ) -> Callable[[Callable[..., Awaitable[_T]]], Callable[..., Awaitable[_T]]]:
+        """Decorate a coroutine function to observe its duration."""
+
+        def decorate(func: Callable[..., Awaitable[_T]]) -> Callable[..., Awaitable[_T]]:
+            @wraps(func)
+            async def wrapper(*args: Any, **kwargs: Any) -> _T:
+                with self.time(*labels):
+                    return await func(*args, **kwargs)
+
+            return wrapper
+
+        return decorate
+
+    def count(self, *labels: str) -> int:
+        """Observations recorded for ``labels`` (0 when none)."""
+        series = self._series.get(labels)
+        return series.count if series else 0
+
+    def clear(self) -> None:
+        self._series.clear()
+
+    def render(self) -> list[str]:
+        lines = []
+        for labels, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, series.counts, strict=True):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.label_names, labels, le)} {cumulative}"
+                )
+            inf = _format_labels(self.label_names, labels, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{inf} {series.count}")
+            plain = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{plain} {_format_value(series.total)}")
+            lines.append(f"{self.name}_count{plain} {series.count}")
+        return lines
+
+
+class Gauge:
+    """Last value set per label set (``kind="counter"`` for externally kept totals)."""
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = (), kind: str = "gauge"):
+        self.name = name
+        self.help = help
+        self.label_names = labels
+        self.kind = kind
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, *labels: str) -> None:
+        self._values[labels] = value
+
+    def value(self, *labels: str) -> float | None:
+        return self._values.get(labels)
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    def render(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}"
+            for labels, value in sorted(self._values.items())
+        ]
+
+
+class MetricsRegistry:
+    """Named metrics plus the collectors refreshing gauges before each scrape."""
+
+    def __init__(self):
+        self._metrics: dict[str, Histogram | Gauge] = {}
+        self._collectors: list[Collector] = []
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help, labels, buckets))
+
+    def gauge(
+        self, name: str, help: str, labels: tuple[str, ...] = (), kind: str = "gauge"
+    ) -> Gauge:
+        return self._register(Gauge(name, help, labels, kind))
+
+    def add_collector(self, collector: Collector) -> None:
+        """Run ``collector`` before every render (it sets gauge values)."""
+        self._collectors.append(collector)
+
+    def clear(self) -> None:
+        """Forget all observed values (metrics and collectors stay registered)."""
+        for metric in self._metrics.values():
+            metric.clear()
+
+    def render(self) -> str:
+        for collector in self._collectors:
+            try:
+                collector()
+            except Exception as e:
+                logger.warning("Metrics collector %s failed: %s", collector.__name__, e)
+
+        lines = []
+        for metric in self._metrics.values():
+            samples = metric.render()
+            if not samples:
+                continue
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: Any) -> Any:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = registry.histogram(
+    "sosenki_http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route"),
+)
+BOT_HANDLER_SECONDS = registry.histogram(
+    "sosenki_bot_handler_duration_seconds",
+    "Telegram handler callback latency",
+    ("handler",),
+)
+MCP_TOOL_SECONDS = registry.histogram(
+    "sosenki_mcp_tool_duration_seconds",
+    "MCP tool call latency",
+    ("tool",),
+)
+OLLAMA_REQUEST_SECONDS = registry.histogram(
+    "sosenki_ollama_request_duration_seconds",
+    "Ollama chat round trip latency (whole stream when streaming)",
+    ("mode",),
+)
+LLM_ADMISSION_WAIT_SECONDS = registry.histogram(
+    "sosenki_llm_admission_wait_seconds",
+    "Time /ask conversations waited for an LLM slot",
+)
+
+
+def register_pool_metrics(engines: dict[str, Any], metrics: MetricsRegistry = registry) -> None:
+    """Report connection pool usage of the given (sync or async) engines by name."""
+    connections = metrics.gauge(
+        "sosenki_db_pool_connections",
+        "Pooled database connections by state",
+        ("engine", "state"),
+    )
+    size = metrics.gauge("sosenki_db_pool_size", "Configured pool size", ("engine",))
+    unique = {id(engine): (name, engine) for name, engine in engines.items()}.values()
+
+    def collect() -> None:
+        for name, engine in unique:
+            pool = engine.pool
+            # StaticPool (in-memory databases) keeps no statistics
+            if not hasattr(pool, "checkedout"):
+                continue
+            size.set(pool.size(), name)
+            connections.set(pool.checkedout(), name, "checked_out")
+            connections.set(pool.checkedin(), name, "idle")
+            connections.set(max(pool.overflow(), 0), name, "overflow")
+
+    metrics.add_collector(collect)
+
+
+__all__ = [
+    "BOT_HANDLER_SECONDS",
+    "CONTENT_TYPE",
+    "DEFAULT_BUCKETS",
+    "Gauge",
+    "HTTP_REQUEST_SECONDS",
+    "Histogram",
+    "LLM_ADMISSION_WAIT_SECONDS",
+    "MCP_TOOL_SECONDS",
+    "MetricsRegistry",
+    "OLLAMA_REQUEST_SECONDS",
+    "register_pool_metrics",
+    "registry",
+]
@@ -1,5 +1,8 @@
 """Notification service for sending Telegram messages."""
 
+import logging
+from typing import Iterable
+
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, WebAppInfo
@@ -8,6 +11,9 @@ from telegram.ext import Application
 from src.models.account import Account, AccountType
 from src.models.user import User
 from src.services.localizer import t
+from src.services.telegram_fanout import DeliveryResult, TelegramFanout
+
+logger = logging.getLogger(__name__)
 
 
 class NotificationService:
@@ -16,6 +22,7 @@ class NotificationService:
     def __init__(self, app: Application):
         self.app = app
         self.bot = app.bot
+        self.fanout = TelegramFanout(self.bot)
 
     async def send_message(
         self, chat_id: str, text: str, reply_markup=None, parse_mode="HTML"
@@ -34,9 +41,31 @@ class NotificationService:
                 chat_id=int(chat_id), text=text, reply_markup=reply_markup, parse_mode=parse_mode
             )
         except Exception as e:
-            print(f"Error sending message to {chat_id}: {e}")
+            logger.error("Error sending message to %s: %s", chat_id, e)
             raise
 
+    async def broadcast(
+        self,
+        chat_ids: Iterable[int],
+        text: str,
+        reply_markup=None,
+        parse_mode="HTML",
+    ) -> list[DeliveryResult]:
+        """Send the same message to many chats concurrently within Telegram rate limits.
+
+        Args:
+            chat_ids: Telegram chat IDs (duplicates are sent once)
+            text: Message text
+            reply_markup: Optional telegram reply_markup
+            parse_mode: Message parse mode (HTML or Markdown). Default: HTML for link support.
+
+        Returns:
+            DeliveryResult per recipient; failures are reported, not raised
+        """
+        return await self.fanout.send(
+            chat_ids, text, reply_markup=reply_markup, parse_mode=parse_mode
+        )
+
     async def send_confirmation_to_requester(self, requester_id: str, message: str = None) -> None:
         """Send confirmation message to requester after request submission.
 
@@ -63,68 +92,61 @@ class NotificationService:
             request_message: The requester's request message
         """
         # Import here to avoid circular import
-        from sqlalchemy import select
-
-        from src.models.user import User
-        from src.services import SessionLocal
-        from src.services.admin_utils import get_admin_telegram_id
+        from src.services import AsyncReadSessionLocal
+        from src.services.admin_utils import get_admin_telegram_id_async
 
-        db = SessionLocal()
-        try:
-            # Get admin telegram ID from database
-            admin_telegram_id = get_admin_telegram_id(db)
+        # Reader pool: callers may still hold the single writer connection
+        async with AsyncReadSessionLocal() as session:
+            # Get admin telegram ID (cached admin recipient set)
+            admin_telegram_id = await get_admin_telegram_id_async(session)
             if not admin_telegram_id:
                 raise ValueError("No admin user found in database")
 
-            # T030: Send notification with [Approve] [Reject] reply keyboard
-            # Include clickable link to requester's Telegram profile so admin can chat with them
-            notification_text = t(
-                "msg_admin_notification",
-                request_id=request_id,
-                requester_id=requester_id,
-                requester_username=requester_username,
-                request_message=request_message or "(no message)",
-            )
             # Get users without telegram_id or inactive to help admin identify who is requesting
-            users_without_telegram = (
-                db.execute(
-                    select(User)
-                    .where((User.telegram_id.is_(None)) | (~User.is_active))
-                    .order_by(User.name)
-                )
-                .scalars()
-                .all()
+            result = await session.execute(
+                select(User)
+                .where((User.telegram_id.is_(None)) | (~User.is_active))
+                .order_by(User.name)
             )
+            users_without_telegram = result.scalars().all()
+
+        # T030: Send notification with [Approve] [Reject] reply keyboard
+        # Include clickable link to requester's Telegram profile so admin can chat with them
+        notification_text = t(
+            "msg_admin_notification",
+            request_id=request_id,
+            requester_id=requester_id,
+            requester_username=requester_username,
+            request_message=request_message or "(no message)",
+        )
 
-            if users_without_telegram:
-                notification_text += t("msg_admin_users_without_telegram")
-                for user in users_without_telegram:
-                    notification_text += f"{user.id}. {user.name}\n"
-                notification_text += t("msg_admin_reply_with_id")
-                notification_text += t("msg_admin_or_use_buttons")
-
-            # Note: Reply keyboard implementation requires storing request_id
-            # in the message context for admin handlers to parse.
-            # For now, send the message. Admin handlers will need to track
-            # which message replies correspond to which requests.
-
-            # Provide inline buttons with callback_data so admin can approve/reject with a tap
-            keyboard = InlineKeyboardMarkup(
+        if users_without_telegram:
+            notification_text += t("msg_admin_users_without_telegram")
+            for user in users_without_telegram:
+                notification_text += f"{user.id}. {user.name}\n"
+            notification_text += t("msg_admin_reply_with_id")
+            notification_text += t("msg_admin_or_use_buttons")
+
+        # Note: Reply keyboard implementation requires storing request_id
+        # in the message context for admin handlers to parse.
+        # For now, send the message. Admin handlers will need to track
+        # which message replies correspond to which requests.
+
+        # Provide inline buttons with callback_data so admin can approve/reject with a tap
+        keyboard = InlineKeyboardMarkup(
+            [
                 [
-                    [
-                        InlineKeyboardButton(
-                            text=t("btn_approve"), callback_data=f"approve:{request_id}"
-                        ),
-                        InlineKeyboardButton(
-                            text=t("btn_reject"), callback_data=f"reject:{request_id}"
-                        ),
-                    ]
+                    InlineKeyboardButton(
+                        text=t("btn_approve"), callback_data=f"approve:{request_id}"
+                    ),
+                    InlineKeyboardButton(
+                        text=t("btn_reject"), callback_data=f"reject:{request_id}"
+                    ),
                 ]
-            )
+            ]
+        )
 
-            await self.send_message(admin_telegram_id, notification_text, reply_markup=keyboard)
-        finally:
-            db.close()
+        await self.send_message(admin_telegram_id, notification_text, reply_markup=keyboard)
 
     async def send_welcome_message(self, requester_id: str) -> None:
         """Send welcome message to approved requester with Mini App button.
@@ -165,20 +187,43 @@ class NotificationService:
 
     async def notify_account_owners_and_representatives(
         self,
-        session,
         account_ids: list[int],
         text: str,
         skip_telegram_id: int | None = None,
-    ) -> None:
+        session=None,
+    ) -> list[DeliveryResult]:
         """Notify owners and their representatives for the given accounts.
 
         Filters recipients to active users with telegram_id, and deduplicates
         by telegram_id. Optionally skips a specific telegram_id (e.g., the
-        initiating admin).
+        initiating admin). Messages are sent through the rate-limited fan-out.
+
+        Recipients are looked up on the reader pool unless a session is given;
+        the fan-out starts only after that lookup's session is closed.
+
+        Returns:
+            DeliveryResult per notified telegram_id
         """
         if not account_ids:
-            return
+            return []
+
+        if session is not None:
+            chat_ids = await self._owner_and_representative_chat_ids(
+                session, account_ids, skip_telegram_id
+            )
+        else:
+            # Import here to avoid circular import
+            from src.services import AsyncReadSessionLocal
+
+            async with AsyncReadSessionLocal() as read_session:
+                chat_ids = await self._owner_and_representative_chat_ids(
+                    read_session, account_ids, skip_telegram_id
+                )
+        return await self.broadcast(chat_ids, text)
 
+    async def _owner_and_representative_chat_ids(
+        self, session, account_ids: list[int], skip_telegram_id: int | None
+    ) -> list[int]:
         account_result = await session.execute(
             select(Account)
             .options(selectinload(Account.user))
@@ -192,7 +237,7 @@ class NotificationService:
 
         owner_ids = {user.id for user in owner_users}
         if not owner_ids:
-            return
+            return []
 
         reps_result = await session.execute(
             select(User).where(
@@ -203,15 +248,12 @@ class NotificationService:
         )
         representatives = reps_result.scalars().all()
 
-        seen: set[int] = set()
         recipients = [*owner_users, *representatives]
-        for user in recipients:
-            if not user.telegram_id or user.telegram_id == skip_telegram_id:
-                continue
-            if user.telegram_id in seen:
-                continue
-            seen.add(user.telegram_id)
-            await self.send_message(chat_id=user.telegram_id, text=text)
+        return [
+            user.telegram_id
+            for user in recipients
+            if user.telegram_id and user.telegram_id != skip_telegram_id
+        ]
 
 
 __all__ = ["NotificationService"]
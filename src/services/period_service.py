@@ -270,6 +270,38 @@ class ServicePeriodService:
 
         return new_period
 
+    async def create_period_until(
+        self,
+        start_date: date,
+        end_date: date,
+        name: str | None = None,
+        actor_id: int | None = None,
+    ) -> ServicePeriod:
+        """Create a service period given its end date instead of its length.
+
+        Used by the MCP and /ask create_service_period tools, which take both dates.
+
+        Args:
+            start_date: Period start date (must be first day of month)
+            end_date: Period end date (must be first day of a later month)
+            name: Optional custom name (auto-generated if not provided)
+            actor_id: Admin user ID who created the period (optional, for audit)
+
+        Returns:
+            Created ServicePeriod object
+
+        Raises:
+            ValueError: If end_date is not the first day of a month, or the
+                period is not 1-12 months long
+        """
+        if end_date.day != 1:
+            raise ValueError("end_date must be the first day of the month")
+
+        period_months = (end_date.year - start_date.year) * 12 + end_date.month - start_date.month
+        return await self.create_period(
+            start_date, period_months=period_months, name=name, actor_id=actor_id
+        )
+
     async def update_electricity_data(
         self,
         period_id: int,
@@ -0,0 +1,267 @@
+"""Token-budgeted prompt assembly for /ask conversations.
+
+Every model round re-sends the whole conversation, so its size is paid for in
+prompt-processing time on every turn. PromptAssembler keeps it small and
+cache-friendly:
+
+- Stable prefix: the system message and tool schemas of each role are built
+  once per process and sent byte-for-byte identical, so Ollama can reuse the
+  KV cache of that prefix across rounds and questions.
+- Tool results: oversized outputs (e.g. a long ``list_bills``) are shrunk to a
+  per-result token budget, dropping list items first and keeping valid JSON.
+- Conversation memory (optional): the last few question/answer pairs of a
+  user are inserted after the prefix, oldest dropped first when over budget.
+
+Token counts are estimated from the text length (no tokenizer dependency).
+
+Tunables (environment variables):
+    ASK_PROMPT_TOKEN_BUDGET     Total prompt tokens per round (default: 4096)
+    ASK_TOOL_RESULT_TOKENS      Max tokens of one tool result (default: 512)
+    ASK_MEMORY_TURNS            Question/answer pairs remembered per user (default: 0, off)
+    ASK_MEMORY_TTL              Seconds a remembered conversation stays relevant (default: 1800)
+"""
+
+import json
+import logging
+import math
+import os
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterable
+
+from src.prompts import ADMIN_SYSTEM_PROMPT, USER_SYSTEM_PROMPT
+
+logger = logging.getLogger(__name__)
+
+ASK_PROMPT_TOKEN_BUDGET = int(os.getenv("ASK_PROMPT_TOKEN_BUDGET") or 4096)
+ASK_TOOL_RESULT_TOKENS = int(os.getenv("ASK_TOOL_RESULT_TOKENS") or 512)
+ASK_MEMORY_TURNS = int(os.getenv("ASK_MEMORY_TURNS") or 0)
+ASK_MEMORY_TTL = float(os.getenv("ASK_MEMORY_TTL") or 1800)
+
+# Conservative for mixed Russian/English text and JSON
+CHARS_PER_TOKEN = 3
+# A tool result never gets less than this, even when the budget is spent
+MIN_TOOL_RESULT_TOKENS = 64
+MEMORY_MAX_USERS = 1024
+TRUNCATED_MARKER = "…[truncated]"
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of ``text``."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def message_tokens(message: dict[str, Any]) -> int:
+    """Rough token count of a chat message (content plus tool calls)."""
+    tokens = estimate_tokens(message.get("content") or "")
+    if message.get("tool_calls"):
+        tokens += estimate_tokens(json.dumps(message["tool_calls"], default=str))
+    return tokens
+
+
+@dataclass(frozen=True)
+class PromptPrefix:
+    """System message and tool schemas shared by every conversation of a role."""
+
+    system: dict[str, str]
+    tools: list[dict[str, Any]]
+    tokens: int
+
+
+@lru_cache(maxsize=2)
+def get_prompt_prefix(is_admin: bool) -> PromptPrefix:
+    """Build the role's prefix once; later calls return the very same objects."""
+    # Imported here: llm_service imports this module for PromptAssembler
+    from src.services.llm_service import get_admin_tools, get_user_tools
+
+    system = {"role": "system", "content": ADMIN_SYSTEM_PROMPT if is_admin else USER_SYSTEM_PROMPT}
+    tools = get_admin_tools() if is_admin else get_user_tools()
+    tokens = message_tokens(system) + estimate_tokens(json.dumps(tools))
+    return PromptPrefix(system=system, tools=tools, tokens=tokens)
+
+
+def fit_tool_result(result: str, max_tokens: int) -> str:
+    """Shrink a tool result to ``max_tokens``.
+
+    JSON objects lose items from their longest lists first and get a
+    ``truncated`` note with shown/total counts; anything else is cut.
+    """
+    if estimate_tokens(result) <= max_tokens:
+        return result
+
+    try:
+        data = json.loads(result)
+    except ValueError:
+        data = None
+
+    if isinstance(data, dict):
+        lists = {key: value for key, value in data.items() if isinstance(value, list)}
+        totals = {key: len(value) for key, value in lists.items()}
+        while lists:
+            key = max(lists, key=lambda k: len(lists[k]))
+            if not lists[key]:
+                break
+            lists[key] = lists[key][: len(lists[key]) // 2]
+            truncated = {
+                **data,
+                **lists,
+                "truncated": {
+                    name: {"shown": len(items), "total": totals[name]}
+                    for name, items in lists.items()
+                    if len(items) < totals[name]
+                },
+            }
+            encoded = json.dumps(truncated)
+            if estimate_tokens(encoded) <= max_tokens:
+                return encoded
+
+    keep = max(max_tokens * CHARS_PER_TOKEN - len(TRUNCATED_MARKER), 0)
+    return result[:keep] + TRUNCATED_MARKER
+
+
+class PromptAssembler:
+    """Builds the messages of one conversation within a token budget."""
+
+    def __init__(
+        self,
+        is_admin: bool,
+        budget: int = ASK_PROMPT_TOKEN_BUDGET,
+        tool_result_tokens: int = ASK_TOOL_RESULT_TOKENS,
+    ):
+        self.prefix = get_prompt_prefix(is_admin)
+        self.budget = budget
+        self.tool_result_tokens = tool_result_tokens
+        self.used = self.prefix.tokens
+
+    @property
+    def tools(self) -> list[dict[str, Any]]:
+        return self.prefix.tools
+
+    @property
+    def remaining(self) -> int:
+        return max(self.budget - self.used, 0)
+
+    def start(self, user_message: str, history: Iterable[dict[str, str]] = ()) -> list[dict]:
+        """Messages for the first round: prefix, fitting history, the question."""
+        question = {"role": "user", "content": user_message}
+        self.used += message_tokens(question)
+
+        # Newest history first; leave room for at least one tool result
+        available = self.remaining - self.tool_result_tokens
+        kept: list[dict[str, str]] = []
+        for message in reversed(list(history)):
+            tokens = message_tokens(message)
+            if tokens > available:
+                break
+            kept.insert(0, message)
+            available -= tokens
+            self.used += tokens
+        # Keep whole question/answer pairs
+        if kept and kept[0]["role"] != "user":
+            self.used -= message_tokens(kept.pop(0))
+
+        return [self.prefix.system, *kept, question]
+
+    def assistant_message(self, message: dict[str, Any]) -> dict[str, Any]:
+        """Account for an assistant message appended to the conversation."""
+        self.used += message_tokens(message)
+        return message
+
+    def tool_messages(self, results: list[tuple[str, str]]) -> list[dict[str, str]]:
+        """Tool messages for one round; the remaining budget is shared between them."""
+        if not results:
+            return []
+        share = max(
+            min(self.tool_result_tokens, self.remaining // len(results)), MIN_TOOL_RESULT_TOKENS
+        )
+        messages = []
+        for tool_name, result in results:
+            content = fit_tool_result(result, share)
+            if content is not result:
+                logger.info(
+                    "Tool result of %s cut from ~%d to ~%d tokens",
+                    tool_name,
+                    estimate_tokens(result),
+                    estimate_tokens(content),
+                )
+            self.used += estimate_tokens(content)
+            messages.append({"role": "tool", "content": content, "name": tool_name})
+        return messages
+
+
+class ConversationMemory:
+    """Last few question/answer pairs per user, forgotten after ``ttl`` seconds."""
+
+    def __init__(
+        self,
+        max_turns: int = ASK_MEMORY_TURNS,
+        ttl: float = ASK_MEMORY_TTL,
+        max_users: int = MEMORY_MAX_USERS,
+    ):
+        self.max_turns = max_turns
+        self.ttl = ttl
+        self.max_users = max_users
+        self._turns: OrderedDict[int, deque[tuple[float, str, str]]] = OrderedDict()
+
+    def history(self, user_id: int) -> list[dict[str, str]]:
+        """Remembered turns of the user as chat messages, oldest first."""
+        turns = self._turns.get(user_id)
+        if not turns:
+            return []
+        cutoff = time.monotonic() - self.ttl
+        while turns and turns[0][0] < cutoff:
+            turns.popleft()
+        messages = []
+        for _, question, answer in turns:
+            messages.append({"role": "user", "content": question})
+            messages.append({"role": "assistant", "content": answer})
+        return messages
+
+    def remember(self, user_id: int, question: str, answer: str) -> None:
+        if self.max_turns <= 0:
+            return
+        turns = self._turns.get(user_id)
+        if turns is None:
+            turns = self._turns[user_id] = deque(maxlen=self.max_turns)
+            if len(self._turns) > self.max_users:
+                self._turns.popitem(last=False)
+        else:
+            self._turns.move_to_end(user_id)
+        turns.append((time.monotonic(), question, answer))
+
+    def forget(self, user_id: int | None = None) -> None:
+        """Drop one user's conversation, or all of them."""
+        if user_id is None:
+            self._turns.clear()
+        else:
+            self._turns.pop(user_id, None)
+
+
+_memory: ConversationMemory | None = None
+
+
+def get_conversation_memory() -> ConversationMemory:
+    """Get the process-wide conversation memory (created on first use)."""
+    global _memory
+    if _memory is None:
+        _memory = ConversationMemory()
+    return _memory
+
+
+def reset_conversation_memory() -> None:
+    global _memory
+    _memory = None
+
+
+__all__ = [
+    "ConversationMemory",
+    "PromptAssembler",
+    "PromptPrefix",
+    "estimate_tokens",
+    "fit_tool_result",
+    "get_conversation_memory",
+    "get_prompt_prefix",
+    "reset_conversation_memory",
+]
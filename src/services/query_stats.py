@@ -0,0 +1,186 @@
+"""Per-request SQL statistics and N+1 detection.
+
+SQLAlchemy cursor events on every Engine (sync engines and the sync side of
+the async ones) feed the QueryStats of the scope running in the current
+context. A scope is opened with ``track_queries()`` around one FastAPI
+request or one bot update; outside a scope the listeners do nothing.
+
+Per scope the statistics hold:
+
+- statements executed and total time spent in the database
+- rows fetched (buffered result rows of async connections; sync connections
+  stream their rows and are not counted)
+- how often each statement shape ran: the SQL text with its ``IN (?, ?, …)``
+  lists collapsed. A shape repeated ``QUERY_REPEAT_THRESHOLD`` times is
+  logged as a likely N+1 pattern (a query issued once per row of another).
+
+The scope lives in a context variable, so tasks spawned inside it (e.g.
+``asyncio.gather`` of Mini App sub-queries) count towards the same request.
+Scopes nest: statements of an inner scope count towards the outer ones too.
+
+``@query_budget(n)`` declares the most statements one call of an endpoint,
+MCP tool or service method may run. Budgets must not depend on data size (a
+path whose statement count grows with rows is an N+1); calls over budget are
+logged, and tests/unit/test_query_budgets.py enforces them at two data scales.
+
+Tunables (environment variables):
+    QUERY_REPEAT_THRESHOLD      Runs of one statement shape flagged as N+1 (default: 5)
+"""
+
+import logging
+import os
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Awaitable, Callable, Iterator, TypeVar
+
+from sqlalchemy import Engine, event
+
+logger = logging.getLogger(__name__)
+
+QUERY_REPEAT_THRESHOLD = int(os.getenv("QUERY_REPEAT_THRESHOLD") or 5)
+
+# Longest statement shape quoted in logs
+SHAPE_LOG_LENGTH = 200
+
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+_current: ContextVar["QueryStats | None"] = ContextVar("query_stats", default=None)
+
+_T = TypeVar("_T")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize SQL so statements differing only in IN-list length compare equal."""
+    return _IN_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+@dataclass
+class QueryStats:
+    """SQL statistics of one request or bot update."""
+
+    statements: int = 0
+    db_time: float = 0.0
+    rows: int = 0
+    shapes: Counter[str] = field(default_factory=Counter)
+    # Enclosing scope, which counts this scope's statements as well
+    parent: "QueryStats | None" = field(default=None, repr=False, compare=False)
+
+    @property
+    def db_ms(self) -> float:
+        return round(self.db_time * 1000, 1)
+
+    def repeated(self, threshold: int = QUERY_REPEAT_THRESHOLD) -> dict[str, int]:
+        """Statement shapes run at least ``threshold`` times, most frequent first."""
+        return {shape: count for shape, count in self.shapes.most_common() if count >= threshold}
+
+    def summary(self) -> str:
+        """``key=value`` fields for log lines and the debug response header."""
+        return (
+            f"queries={self.statements} db_ms={self.db_ms} rows={self.rows} "
+            f"repeated={len(self.repeated())}"
+        )
+
+
+def current_query_stats() -> QueryStats | None:
+    """Statistics of the scope running in the current context (None outside scopes)."""
+    return _current.get()
+
+
+@contextmanager
+def track_queries(label: str | None = None) -> Iterator[QueryStats]:
+    """Collect statistics of SQL run in the current context until the block exits.
+
+    Args:
+        label: Scope name for the N+1 warning (None: do not warn)
+
+    Yields:
+        QueryStats filled in as statements run
+    """
+    stats = QueryStats(parent=_current.get())
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+        if label is not None:
+            for shape, count in stats.repeated().items():
+                logger.warning(
+                    "Possible N+1 in %s: %d runs of %s", label, count, shape[:SHAPE_LOG_LENGTH]
+                )
+
+
+def _before_cursor_execute(_conn, _cursor, _statement, _parameters, context, _executemany):
+    if context is not None and _current.get() is not None:
+        context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(_conn, cursor, statement, _parameters, context, _executemany):
+    stats = _current.get()
+    started = getattr(context, "_query_started", None)
+    if stats is None or started is None:
+        return
+    elapsed = time.perf_counter() - started
+    shape = statement_shape(statement)
+    # Async DBAPI adapters buffer the whole result before returning
+    rows: Any = getattr(cursor, "_rows", None)
+    while stats is not None:
+        stats.db_time += elapsed
+        stats.statements += 1
+        stats.shapes[shape] += 1
+        if rows is not None:
+            stats.rows += len(rows)
+        stats = stats.parent
+
+
+def query_budget(
+    limit: int,
+) -> Callable[[Callable[..., Awaitable[_T]]], Callable[..., Awaitable[_T]]]:
+    """Declare the most SQL statements one call of a coroutine function may run.
+
+    The limit is exposed as ``func.query_budget``. Calls that run more
+    statements are logged as warnings (statements run after the call returns,
+    e.g. while a StreamingResponse is sent, are not counted).
+    """
+
+    def decorate(func: Callable[..., Awaitable[_T]]) -> Callable[..., Awaitable[_T]]:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> _T:
+            with track_queries() as stats:
+                result = await func(*args, **kwargs)
+            if stats.statements > limit:
+                logger.warning(
+                    "%s ran %d SQL statements (budget %d)",
+                    func.__qualname__,
+                    stats.statements,
+                    limit,
+                )
+            return result
+
+        wrapper.query_budget = limit
+        return wrapper
+
+    return decorate
+
+
+def install_query_instrumentation() -> None:
+    """Listen to cursor events of every Engine (idempotent)."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+__all__ = [
+    "QUERY_REPEAT_THRESHOLD",
+    "QueryStats",
+    "current_query_stats",
+    "install_query_instrumentation",
+    "query_budget",
+    "statement_shape",
+    "track_queries",
+]
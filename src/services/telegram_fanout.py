@@ -0,0 +1,265 @@
+"""Concurrent, rate-limited Telegram message fan-out.
+
+Broadcasting period bills or payouts to the whole community used to await
+``send_message`` once per recipient. TelegramFanout sends to many chats at once
+while staying inside the Bot API limits:
+
+- Bounded concurrency: at most FANOUT_CONCURRENCY requests in flight
+- Global token bucket: ~30 messages/second across all chats
+- Per-chat token bucket: ~1 message/second to the same chat
+- Retries: RetryAfter (flood control) waits the requested time; transient
+  network errors back off exponentially
+- Per-recipient DeliveryResult instead of raising on the first failure
+
+The rate limiter is shared process-wide, because NotificationService is created
+per handler call while Telegram counts messages per bot token.
+"""
+
+import asyncio
+import logging
+import time
+import warnings
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Iterable
+
+from telegram.error import BadRequest, NetworkError, RetryAfter
+from telegram.warnings import PTBDeprecationWarning
+
+logger = logging.getLogger(__name__)
+
+FANOUT_CONCURRENCY = 8
+GLOBAL_MESSAGES_PER_SECOND = 30.0
+PER_CHAT_MESSAGES_PER_SECOND = 1.0
+MAX_ATTEMPTS = 4
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 30.0
+CHAT_BUCKETS_MAXSIZE = 4096
+
+
+class TokenBucket:
+    """Async token bucket refilled continuously at ``rate`` tokens per second."""
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it (FIFO across waiters)."""
+        async with self._lock:
+            self._refill()
+            # Loop because penalize() may drain the bucket while we sleep
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def penalize(self, seconds: float) -> None:
+        """Drain the bucket so the next token is available only after ``seconds``."""
+        self._refill()
+        self._tokens = min(self._tokens, 1 - seconds * self.rate)
+
+    @property
+    def is_full(self) -> bool:
+        self._refill()
+        return self._tokens >= self.capacity
+
+
+class TelegramRateLimiter:
+    """Global plus per-chat token buckets for one bot token."""
+
+    def __init__(
+        self,
+        global_rate: float = GLOBAL_MESSAGES_PER_SECOND,
+        per_chat_rate: float = PER_CHAT_MESSAGES_PER_SECOND,
+        max_chats: int = CHAT_BUCKETS_MAXSIZE,
+    ):
+        self.global_bucket = TokenBucket(global_rate)
+        self.per_chat_rate = per_chat_rate
+        self.max_chats = max_chats
+        self._chat_buckets: OrderedDict[int, TokenBucket] = OrderedDict()
+
+    def chat_bucket(self, chat_id: int) -> TokenBucket:
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = TokenBucket(self.per_chat_rate, capacity=1.0)
+            self._chat_buckets[chat_id] = bucket
+            self._evict_idle()
+        else:
+            self._chat_buckets.move_to_end(chat_id)
+        return bucket
+
+    def _evict_idle(self) -> None:
+        # Full buckets carry no state, so dropping them never loosens the limit
+        for chat_id in list(self._chat_buckets):
+            if len(self._chat_buckets) <= self.max_chats:
+                break
+            if self._chat_buckets[chat_id].is_full:
+                del self._chat_buckets[chat_id]
+
+    async def acquire(self, chat_id: int) -> None:
+        """Wait for both the chat's and the global budget."""
+        await self.chat_bucket(chat_id).acquire()
+        await self.global_bucket.acquire()
+
+    def penalize(self, chat_id: int, seconds: float) -> None:
+        """Apply a flood-control wait to the chat and the whole bot."""
+        self.chat_bucket(chat_id).penalize(seconds)
+        self.global_bucket.penalize(seconds)
+
+
+_default_rate_limiter: TelegramRateLimiter | None = None
+
+
+def get_rate_limiter() -> TelegramRateLimiter:
+    """Get the process-wide rate limiter (created on first use)."""
+    global _default_rate_limiter
+    if _default_rate_limiter is None:
+        _default_rate_limiter = TelegramRateLimiter()
+    return _default_rate_limiter
+
+
+def reset_rate_limiter() -> None:
+    """Drop the process-wide rate limiter (its locks are bound to one event loop)."""
+    global _default_rate_limiter
+    _default_rate_limiter = None
+
+
+@dataclass(frozen=True)
+class DeliveryResult:
+    """Outcome of sending one message to one chat."""
+
+    chat_id: int
+    delivered: bool
+    attempts: int
+    error: str | None = None
+
+
+def retry_after_seconds(exc: RetryAfter) -> float:
+    """Read RetryAfter.retry_after as seconds (int or timedelta depending on PTB)."""
+    with warnings.catch_warnings():
+        # PTB 22.2+ warns that the int form will become a timedelta; both are handled
+        warnings.simplefilter("ignore", PTBDeprecationWarning)
+        value = exc.retry_after
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return float(value)
+
+
+class TelegramFanout:
+    """Send one message to many chats with bounded concurrency and rate limits."""
+
+    def __init__(
+        self,
+        bot: Any,
+        concurrency: int = FANOUT_CONCURRENCY,
+        rate_limiter: TelegramRateLimiter | None = None,
+        max_attempts: int = MAX_ATTEMPTS,
+        backoff_base: float = BACKOFF_BASE_SECONDS,
+    ):
+        self.bot = bot
+        self.concurrency = concurrency
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+
+    async def send(
+        self,
+        chat_ids: Iterable[int],
+        text: str,
+        reply_markup=None,
+        parse_mode: str = "HTML",
+    ) -> list[DeliveryResult]:
+        """Send ``text`` to every chat; never raises for individual failures.
+
+        Args:
+            chat_ids: Telegram chat IDs (duplicates are sent once)
+            text: Message text
+            reply_markup: Optional telegram reply_markup
+            parse_mode: Message parse mode (HTML or Markdown)
+
+        Returns:
+            DeliveryResult per unique chat, in input order
+        """
+        unique_chat_ids = list(dict.fromkeys(int(chat_id) for chat_id in chat_ids))
+        if not unique_chat_ids:
+            return []
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def deliver(chat_id: int) -> DeliveryResult:
+            async with semaphore:
+                return await self._send_one(chat_id, text, reply_markup, parse_mode)
+
+        results = await asyncio.gather(*(deliver(chat_id) for chat_id in unique_chat_ids))
+
+        failed = [result for result in results if not result.delivered]
+        if failed:
+            logger.warning(
+                "Fan-out delivered %d/%d messages; failed chats: %s",
+                len(results) - len(failed),
+                len(results),
+                [result.chat_id for result in failed],
+            )
+        return results
+
+    async def _send_one(
+        self, chat_id: int, text: str, reply_markup, parse_mode: str
+    ) -> DeliveryResult:
+        attempt = 0
+        while True:
+            attempt += 1
+            await self.rate_limiter.acquire(chat_id)
+            try:
+                await self.bot.send_message(
+                    chat_id=chat_id, text=text, reply_markup=reply_markup, parse_mode=parse_mode
+                )
+                return DeliveryResult(chat_id=chat_id, delivered=True, attempts=attempt)
+            except RetryAfter as e:
+                # Flood control: hold back the chat and the whole bot; acquire() waits it out
+                delay = retry_after_seconds(e)
+                self.rate_limiter.penalize(chat_id, delay)
+                wait = 0.0
+                error = e
+            except BadRequest as e:
+                return _failure(chat_id, attempt, e)
+            except NetworkError as e:
+                # Transient (includes TimedOut); Forbidden and other errors are not retried
+                delay = min(self.backoff_base * 2 ** (attempt - 1), BACKOFF_MAX_SECONDS)
+                wait = delay
+                error = e
+            except Exception as e:
+                return _failure(chat_id, attempt, e)
+
+            if attempt >= self.max_attempts:
+                return _failure(chat_id, attempt, error)
+            logger.info(
+                "Retrying message to %s in %.1fs (attempt %d): %s", chat_id, delay, attempt, error
+            )
+            if wait:
+                await asyncio.sleep(wait)
+
+
+def _failure(chat_id: int, attempts: int, exc: Exception) -> DeliveryResult:
+    logger.error("Error sending message to %s: %s", chat_id, exc)
+    return DeliveryResult(chat_id=chat_id, delivered=False, attempts=attempts, error=str(exc))
+
+
+__all__ = [
+    "DeliveryResult",
+    "TelegramFanout",
+    "TelegramRateLimiter",
+    "TokenBucket",
+    "get_rate_limiter",
+    "reset_rate_limiter",
+    "retry_after_seconds",
+]
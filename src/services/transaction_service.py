@@ -18,6 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.account import Account, AccountType
 from src.models.transaction import Transaction
 from src.services.audit_service import AuditService
+from src.services.balance_ledger_service import BalanceLedgerService
 from src.services.balance_service import BalanceCalculationService
 from src.services.locale_service import format_currency
 
@@ -168,9 +169,14 @@ class TransactionService:
         description: str,
         actor_id: int | None = None,
         transaction_date: date | None = None,
+        idempotency_key: str | None = None,
     ) -> Transaction:
         """Create a new transaction with validation.
 
+        With an idempotency_key, repeating the call (e.g. a redelivered payout
+        confirmation) returns the transaction created the first time and writes
+        nothing: no new row, audit entry or balance delta.
+
         Args:
             from_account_id: Source account ID
             to_account_id: Destination account ID
@@ -178,13 +184,24 @@ class TransactionService:
             description: Transaction description
             actor_id: User ID performing the action (for audit logging)
             transaction_date: Date of the transaction (defaults to today)
+            idempotency_key: Optional client key identifying this logical transaction
 
         Returns:
-            Created Transaction object
+            Created Transaction object (or the existing one for a repeated idempotency_key)
 
         Raises:
             ValueError: If amount is not positive or accounts don't exist
         """
+        if idempotency_key is not None:
+            existing = await self.get_transaction_by_idempotency_key(idempotency_key)
+            if existing is not None:
+                logger.info(
+                    "Transaction %d already created for idempotency_key=%s",
+                    existing.id,
+                    idempotency_key,
+                )
+                return existing
+
         # Validate amount
         if amount <= 0:
             raise ValueError("Amount must be positive")
@@ -208,6 +225,7 @@ class TransactionService:
             transaction_date=resolved_date,
             description=description,
             budget_item_id=None,
+            idempotency_key=idempotency_key,
         )
 
         self.session.add(transaction)
@@ -231,6 +249,11 @@ class TransactionService:
             },
         )
 
+        # Keep materialized balances in sync within the same transaction
+        await BalanceLedgerService(self.session).apply_deltas(
+            [(to_account_id, amount), (from_account_id, -amount)]
+        )
+
         logger.info(
             "Transaction created: from=%d to=%d amount=%s description='%s'",
             from_account_id,
@@ -241,6 +264,20 @@ class TransactionService:
 
         return transaction
 
+    async def get_transaction_by_idempotency_key(self, idempotency_key: str) -> Transaction | None:
+        """Get the transaction created with an idempotency key.
+
+        Args:
+            idempotency_key: Key passed to create_transaction
+
+        Returns:
+            Transaction if one was created with this key, None otherwise
+        """
+        result = await self.session.execute(
+            select(Transaction).where(Transaction.idempotency_key == idempotency_key)
+        )
+        return result.scalar_one_or_none()
+
     async def get_account_by_id(self, account_id: int) -> Account | None:
         """Get account by ID.
 
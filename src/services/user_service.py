@@ -2,6 +2,8 @@
 
 import hashlib
 import hmac
+import time
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import parse_qsl
 
@@ -9,6 +11,19 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.user import User
+from src.services.identity_cache import invalidate_identities
+
+# initData is issued when the Mini App opens and reused for every API call of that
+# session, so the window has to cover a long-lived screen, not a single request
+INIT_DATA_MAX_AGE_SECONDS = 24 * 60 * 60
+# Tolerated clock skew for auth_date values slightly in the future
+INIT_DATA_CLOCK_SKEW_SECONDS = 5 * 60
+
+
+@lru_cache(maxsize=4)
+def _webapp_secret_key(bot_token: str) -> bytes:
+    """Derive the WebApp secret key once per bot token (HMAC-SHA256 of token with "WebAppData")."""
+    return hmac.new(key=b"WebAppData", msg=bot_token.encode(), digestmod=hashlib.sha256).digest()
 
 
 class UserService:
@@ -19,18 +34,22 @@ class UserService:
         self.session = session
 
     @staticmethod
-    def verify_telegram_webapp_signature(init_data: str, bot_token: str) -> Optional[dict]:
+    def verify_telegram_webapp_signature(
+        init_data: str, bot_token: str, max_age: int = INIT_DATA_MAX_AGE_SECONDS
+    ) -> Optional[dict]:
         """
-        Verify Telegram WebApp init data signature.
+        Verify Telegram WebApp init data signature and freshness.
 
         Algorithm per https://core.telegram.org/bots/webapps#validating-data-received-via-the-mini-app
 
         Args:
             init_data: The initData string from Telegram.WebApp.initData
             bot_token: Telegram bot token
+            max_age: Maximum accepted age of auth_date in seconds
 
         Returns:
-            Parsed data dict if signature is valid, None otherwise
+            Parsed data dict if signature is valid and auth_date is within the window,
+            None otherwise
         """
         try:
             # Parse query string
@@ -45,22 +64,21 @@ class UserService:
             data_check_arr = [f"{k}={v}" for k, v in sorted(parsed_data.items())]
             data_check_string = "\n".join(data_check_arr)
 
-            # Calculate secret key
-            secret_key = hmac.new(
-                key=b"WebAppData", msg=bot_token.encode(), digestmod=hashlib.sha256
-            ).digest()
-
-            # Calculate hash
+            # Calculate hash with the precomputed secret key
             calculated_hash = hmac.new(
-                key=secret_key, msg=data_check_string.encode(), digestmod=hashlib.sha256
+                key=_webapp_secret_key(bot_token),
+                msg=data_check_string.encode(),
+                digestmod=hashlib.sha256,
             ).hexdigest()
 
             # Compare hashes
-            if calculated_hash != received_hash:
+            if not hmac.compare_digest(calculated_hash, received_hash):
                 return None
 
-            # TODO: Check auth_date is within acceptable time window (±5 minutes)
-            # For now, accepting any auth_date
+            # Reject stale (or far-future) init data so a leaked string cannot be replayed forever
+            age = time.time() - int(parsed_data["auth_date"])
+            if not -INIT_DATA_CLOCK_SKEW_SECONDS <= age <= max_age:
+                return None
 
             return parsed_data
 
@@ -175,6 +193,7 @@ class UserService:
         )
         self.session.add(user)
         await self.session.commit()
+        invalidate_identities()
         await self.session.refresh(user)
         return user
 
@@ -192,6 +211,7 @@ class UserService:
         if user:
             user.is_active = True
             await self.session.commit()
+            invalidate_identities()
             await self.session.refresh(user)
         return user
 
@@ -209,6 +229,7 @@ class UserService:
         if user:
             user.is_active = False
             await self.session.commit()
+            invalidate_identities()
             await self.session.refresh(user)
         return user
 
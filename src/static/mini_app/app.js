@@ -678,44 +678,6 @@ function renderTransactionsList(transactions, containerId = 'transactions-list')
     });
 }
 
-/**
- * Load and render bills from backend
- * @param {string} containerId - ID of container to render bills into
- */
-async function loadBills(containerId = 'bills-list') {
-    try {
-        const initData = getInitData();
-        
-        if (!initData) {
-            return;
-        }
-
-        if (!__currentAccountId) {
-            console.warn('Account ID not available, cannot load bills');
-            return;
-        }
-        
-        // Build URL with account_id parameter
-        let url = `/api/mini-app/bills?account_id=${__currentAccountId}`;
-        
-        const response = await fetchWithTmaAuth(url, initData);
-
-        if (!response.ok) {
-            return;
-        }
-        
-        const data = await response.json();
-        
-        // Render bills
-        if (data.bills && Array.isArray(data.bills)) {
-            renderBills(data.bills, containerId);
-        }
-        
-    } catch (error) {
-        // Error silently handled
-    }
-}
-
 /**
  * Render bills list into specified container (all bill types), grouped by service periods
  * @param {Array} bills - Array of bill objects
@@ -1067,6 +1029,44 @@ async function handleMenuAction(action) {
     tg.showAlert(t('err_feature_coming_soon', { action: action }));
 }
 
+/**
+ * Load all welcome-screen datasets (properties, balance, transactions, bills) in one request
+ * @returns {Promise<Object|null>} DashboardResponse payload or null on failure
+ */
+async function loadDashboard() {
+    try {
+        const initData = getInitData();
+        
+        if (!initData) {
+            return null;
+        }
+
+        if (!__currentAccountId) {
+            console.warn('Account ID not available, cannot load dashboard');
+            return null;
+        }
+        
+        // Build URL with account_id (and selected user for admin context switching)
+        let url = `/api/mini-app/dashboard?account_id=${__currentAccountId}&scope=personal`;
+        if (__selectedUserId !== null) {
+            url += `&selected_user_id=${__selectedUserId}`;
+        }
+        
+        const response = await fetchWithTmaAuth(url, initData);
+
+        if (!response.ok) {
+            console.error('Failed to load dashboard:', response.status, response.statusText);
+            return null;
+        }
+        
+        return await response.json();
+        
+    } catch (error) {
+        console.error('Error loading dashboard:', error);
+        return null;
+    }
+}
+
 /**
  * Reload all datasets (statuses, stakeholder link, properties, balance, transactions, bills)
  * Used when context changes (admin switch or representing user change)
@@ -1079,23 +1079,33 @@ async function reloadAllDatasets(context) {
     renderUserStatuses(context.roles);
     renderStakeholderLink(context.stakeholderUrl, context.isOwner, context.isStakeholder);
     
-    // Reload dynamic data from backend
-    if (context.isOwner) {
-        await loadProperties();
+    // Reload dynamic data from backend in a single round trip
+    const data = await loadDashboard();
+    
+    if (context.isOwner && data && data.properties && Array.isArray(data.properties.properties)) {
+        renderProperties(data.properties.properties);
     } else {
-        // Hide properties if not owner
+        // Hide properties if not owner (or not available)
         const propsContainer = document.getElementById('properties-container');
         if (propsContainer) {
             propsContainer.classList.remove('visible');
         }
     }
     
-    // Load balance for all users (owners and staff)
-    await loadBalance();
+    if (!data) return;
+    
+    // Balance for all users (owners and staff)
+    if (data.account && data.account.balance !== undefined) {
+        renderBalance(data.account.balance, data.account.invert_for_display || false);
+    }
     
-    // Load transactions and bills
-    await loadTransactions('transactions-list', 'personal');
-    await loadBills('bills-list');
+    // Transactions and bills
+    if (data.transactions && Array.isArray(data.transactions.transactions)) {
+        renderTransactionsList(data.transactions.transactions, 'transactions-list');
+    }
+    if (data.bills && Array.isArray(data.bills.bills)) {
+        renderBills(data.bills.bills, 'bills-list');
+    }
 }
 
 // ---------------------------------------------------------------------------
@@ -1249,42 +1259,6 @@ async function loadAccountDetails(accountId) {
 /**
  * Initialize Mini App
  */
-/**
- * Load and render balance from backend
- */
-async function loadBalance() {
-    try {
-        const initData = getInitData();
-        
-        if (!initData) {
-            return;
-        }
-
-        if (!__currentAccountId) {
-            console.warn('Account ID not available, cannot load balance');
-            return;
-        }
-        
-        // Build URL with account_id parameter
-        let url = `/api/mini-app/account?account_id=${__currentAccountId}`;
-        
-        const response = await fetchWithTmaAuth(url, initData);
-
-        if (!response.ok) {
-            return;
-        }
-        
-        const data = await response.json();
-        
-        if (data.balance !== undefined) {
-            renderBalance(data.balance, data.invert_for_display || false);
-        }
-        
-    } catch (error) {
-        // Error silently handled
-    }
-}
-
 /**
  * Render balance into the balance-container
  * @param {number} balance - Balance amount (raw value)
@@ -1725,50 +1699,6 @@ function renderProperties(properties) {
     });
 }
 
-/**
- * Load properties from backend and render list
- */
-async function loadProperties() {
-    try {
-        const initData = getInitData();
-
-        if (!initData) {
-            console.error('No Telegram init data available');
-            return;
-        }
-
-        // Build URL with selected_user_id if admin has selected a user, otherwise no parameters needed
-        let url = '/api/mini-app/properties';
-        if (__selectedUserId !== null) {
-            url += `?selected_user_id=${__selectedUserId}`;
-        }
-        
-        const response = await fetchWithTmaAuth(url, initData);
-
-        if (!response.ok) {
-            if (response.status === 403) {
-                // User is not an owner, hide properties section
-                const container = document.getElementById('properties-container');
-                if (container) {
-                    container.classList.remove('visible');
-                }
-                return;
-            }
-            console.error('Failed to load properties:', response.status, response.statusText);
-            return;
-        }
-
-        const data = await response.json();
-
-        if (data.properties && Array.isArray(data.properties)) {
-            renderProperties(data.properties);
-        }
-
-    } catch (error) {
-        console.error('Error loading properties:', error);
-    }
-}
-
 /**
  * Start the app when DOM is ready
  */
@@ -68,9 +68,76 @@ except Exception as e:
 
 # NOW safe to import from src (after env vars set)
 from src.models import Base  # noqa: E402
-from src.models.account import Account  # noqa: E402
+from src.models.account import Account, AccountType  # noqa: E402
 from src.models.service_period import ServicePeriod  # noqa: E402
 from src.models.user import User  # noqa: E402
+from src.services.admin_utils import invalidate_admin_cache  # noqa: E402
+from src.services.auth_service import _verified_init_data  # noqa: E402
+from src.services.database import detect_blocking_sync_access  # noqa: E402
+from src.services.identity_cache import invalidate_identities  # noqa: E402
+from src.services.llm_pool import reset_llm_pool  # noqa: E402
+from src.services.prompt_assembler import reset_conversation_memory  # noqa: E402
+from src.services.query_stats import install_query_instrumentation, track_queries  # noqa: E402
+from src.services.telegram_fanout import reset_rate_limiter  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _reset_auth_caches():
+    """Clear process-wide auth caches so tests never see each other's identities."""
+    _verified_init_data.clear()
+    invalidate_identities()
+    invalidate_admin_cache()
+    yield
+    _verified_init_data.clear()
+    invalidate_identities()
+    invalidate_admin_cache()
+
+
+@pytest.fixture(autouse=True)
+def _reset_rate_limiter():
+    """Give each test (and its event loop) a fresh Telegram rate limiter."""
+    reset_rate_limiter()
+    yield
+    reset_rate_limiter()
+
+
+@pytest.fixture(autouse=True)
+def _reset_llm_pool():
+    """Give each test (and its event loop) fresh shared Ollama clients and admission queue."""
+    reset_llm_pool()
+    yield
+    reset_llm_pool()
+
+
+@pytest.fixture(autouse=True)
+def _reset_conversation_memory():
+    """Keep remembered /ask conversations from leaking between tests."""
+    reset_conversation_memory()
+    yield
+    reset_conversation_memory()
+
+
+@pytest.fixture(autouse=True)
+def _fail_on_blocking_sync_access():
+    """Fail tests whose async code paths run SQL through a sync (loop-blocking) engine."""
+    # Direct sync queries written in test bodies (setup/assertions) are allowed
+    with detect_blocking_sync_access(ignore_callers=(str(project_root / "tests"),)) as violations:
+        yield
+    if violations:
+        pytest.fail(
+            "Sync engine used inside a running event loop:\n" + "\n".join(violations[:5]),
+            pytrace=False,
+        )
+
+
+@pytest.fixture
+def count_queries():
+    """Count SQL statements run in a block on any engine (see src.services.query_stats).
+
+    Usage: ``with count_queries() as stats: ...`` then ``stats.statements``.
+    """
+    install_query_instrumentation()
+    return track_queries
 
 
 @pytest.fixture
@@ -123,7 +190,7 @@ async def sample_account(session: AsyncSession, sample_user: User):
     account = Account(
         name="Test Account",
         user_id=sample_user.id,
-        account_type="user",
+        account_type=AccountType.OWNER,
     )
     session.add(account)
     await session.commit()
@@ -4,10 +4,12 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete
 from telegram import Bot
 from telegram.ext import Application
 
-from src.api.webhook import app, setup_webhook_route
+from src.api.webhook import app, setup_webhook_route, shutdown_webhook_route
 
 
 @pytest.fixture
@@ -77,6 +79,37 @@ class TestWebhookTelegramEndpoint:
         assert response.json() == {"ok": True}
         mock_bot_app.process_update.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_telegram_webhook_drops_redelivered_update(self, client, mock_bot_app):
+        """Test webhook acks a redelivered update_id without processing it again."""
+        from src.api import webhook
+        from src.bot.update_dedup import UpdateDeduplicator
+
+        webhook._bot_app = mock_bot_app
+        webhook._update_dedup = UpdateDeduplicator(window=10)
+        try:
+            update_data = {
+                "update_id": 42,
+                "message": {
+                    "message_id": 1,
+                    "date": 1234567890,
+                    "chat": {"id": 123, "type": "private"},
+                    "from": {"id": 123, "is_bot": False, "first_name": "Test"},
+                    "text": "Hello bot",
+                },
+            }
+
+            first = client.post("/webhook/telegram", json=update_data)
+            second = client.post("/webhook/telegram", json=update_data)
+
+            assert first.status_code == 200
+            assert second.status_code == 200
+            assert second.json() == {"ok": True}
+            mock_bot_app.process_update.assert_called_once()
+            assert webhook._update_dedup.duplicates == 1
+        finally:
+            webhook._update_dedup = None
+
     @pytest.mark.asyncio
     async def test_telegram_webhook_empty_update(self, client, mock_bot_app):
         """Test webhook handles empty/null update gracefully."""
@@ -150,18 +183,28 @@ class TestSetupWebhookRoute:
         # Call setup_webhook_route
         await setup_webhook_route(mock_bot_app)
 
-        # Verify bot app was set
+        # Verify bot app was set and the update queue started
         assert webhook_module._bot_app is mock_bot_app
+        assert webhook_module._update_queue.running
 
         # Clean up
+        await shutdown_webhook_route()
         webhook_module._bot_app = None
 
     @pytest.mark.asyncio
     async def test_setup_webhook_route_endpoint_processes_update(self, mock_bot_app):
-        """Test webhook endpoint created by setup processes updates."""
+        """Test webhook endpoint created by setup acks first and processes via the queue."""
+        import src.api.webhook as webhook_module
+        from src.models.processed_update import ProcessedUpdate
+        from src.services import AsyncSessionLocal
+
+        # update_ids persisted by earlier runs would be dropped as redeliveries
+        async with AsyncSessionLocal() as session:
+            await session.execute(delete(ProcessedUpdate))
+            await session.commit()
+
         await setup_webhook_route(mock_bot_app)
 
-        client = TestClient(app)
         update_data = {
             "update_id": 1,
             "message": {
@@ -173,10 +216,21 @@ class TestSetupWebhookRoute:
             },
         }
 
-        response = client.post("/webhook/telegram", json=update_data)
-
-        assert response.status_code == 200
-        mock_bot_app.process_update.assert_called()
+        try:
+            # Same event loop as the queue workers (TestClient runs its own loop)
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.post("/webhook/telegram", json=update_data)
+                await webhook_module._update_queue.join()
+                stats = (await client.get("/health/updates")).json()
+
+            assert response.status_code == 200
+            mock_bot_app.process_update.assert_called()
+            assert stats["running"] is True
+            assert stats["processed"] == 1
+        finally:
+            await shutdown_webhook_route()
+            webhook_module._bot_app = None
 
 
 class TestWebhookStaticFiles:
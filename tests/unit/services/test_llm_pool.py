@@ -0,0 +1,115 @@
+"""Tests for the shared Ollama client and LLM admission queue."""
+
+import asyncio
+
+import pytest
+
+from src.services.llm_pool import (
+    AdmissionTimeout,
+    LLMAdmissionQueue,
+    get_admission_queue,
+    get_ollama_client,
+    reset_llm_pool,
+)
+
+
+@pytest.mark.unit
+def test_ollama_client_is_shared_per_host():
+    client = get_ollama_client("http://localhost:11434")
+
+    assert get_ollama_client("http://localhost:11434") is client
+    assert get_ollama_client("http://other:11434") is not client
+
+    reset_llm_pool()
+    assert get_ollama_client("http://localhost:11434") is not client
+    assert get_admission_queue() is get_admission_queue()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_admission_is_fifo_with_bounded_concurrency():
+    queue = LLMAdmissionQueue(limit=2, timeout=5)
+    order = []
+    running = 0
+    peak = 0
+
+    async def conversation(name):
+        nonlocal running, peak
+        async with queue.slot():
+            running += 1
+            peak = max(peak, running)
+            order.append(name)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(conversation(i) for i in range(6)))
+
+    assert order == list(range(6))
+    assert peak == 2
+    stats = queue.stats()
+    assert stats.active == 0 and stats.waiting == 0
+    assert stats.admitted == 6 and stats.max_waiting == 4
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_waiters_are_told_their_position():
+    queue = LLMAdmissionQueue(limit=1, timeout=5)
+    await queue.acquire()
+    positions = {"first": [], "second": []}
+
+    def report(name):
+        async def on_position(position):
+            positions[name].append(position)
+
+        return on_position
+
+    first = asyncio.create_task(queue.acquire(report("first")))
+    second = asyncio.create_task(queue.acquire(report("second")))
+    await asyncio.sleep(0)
+
+    queue.release()
+    await first
+    await asyncio.sleep(0)
+    queue.release()
+    await second
+    queue.release()
+
+    assert positions == {"first": [1], "second": [2, 1]}
+    assert queue.stats().active == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_waiting_too_long_is_cancelled_and_leaves_the_line():
+    queue = LLMAdmissionQueue(limit=1, timeout=0.02)
+    await queue.acquire()
+
+    with pytest.raises(AdmissionTimeout):
+        await queue.acquire()
+
+    assert queue.stats().waiting == 0
+    assert queue.stats().timed_out == 1
+    queue.release()
+    # The freed slot is usable right away
+    await asyncio.wait_for(queue.acquire(), 0.1)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_line():
+    queue = LLMAdmissionQueue(limit=1, timeout=5)
+    await queue.acquire()
+    cancelled = asyncio.create_task(queue.acquire())
+    behind = asyncio.create_task(queue.acquire())
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    await asyncio.gather(cancelled, return_exceptions=True)
+    queue.release()
+
+    # The slot goes to the next waiter, not to the cancelled one
+    await asyncio.wait_for(behind, 0.1)
+    assert queue.stats().waiting == 0
+    queue.release()
+    assert queue.stats().active == 0
@@ -0,0 +1,158 @@
+"""Tests for the in-process metrics registry and its instrumentation points."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi.testclient import TestClient
+from telegram.ext import CommandHandler, ConversationHandler
+
+from src.api.mcp_server import ToolMetricsMiddleware
+from src.bot import _instrument_handler
+from src.services.database import create_async_engines
+from src.services.llm_pool import LLMAdmissionQueue
+from src.services.metrics import (
+    BOT_HANDLER_SECONDS,
+    CONTENT_TYPE,
+    HTTP_REQUEST_SECONDS,
+    LLM_ADMISSION_WAIT_SECONDS,
+    MCP_TOOL_SECONDS,
+    MetricsRegistry,
+    register_pool_metrics,
+    registry,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_metrics():
+    registry.clear()
+    yield
+    registry.clear()
+
+
+@pytest.mark.unit
+def test_histogram_renders_cumulative_buckets_sum_and_count():
+    metrics = MetricsRegistry()
+    latency = metrics.histogram("req_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 3.0):
+        latency.observe(value, '/a"b')
+
+    lines = metrics.render().splitlines()
+
+    assert lines[:2] == ["# HELP req_seconds Latency", "# TYPE req_seconds histogram"]
+    assert lines[2:] == [
+        'req_seconds_bucket{route="/a\\"b",le="0.1"} 1',
+        'req_seconds_bucket{route="/a\\"b",le="1"} 3',
+        'req_seconds_bucket{route="/a\\"b",le="+Inf"} 4',
+        'req_seconds_sum{route="/a\\"b"} 4.25',
+        'req_seconds_count{route="/a\\"b"} 4',
+    ]
+    assert latency.count('/a"b') == 4
+
+
+@pytest.mark.unit
+def test_collectors_refresh_gauges_and_a_failing_one_is_skipped():
+    metrics = MetricsRegistry()
+    depth = metrics.gauge("queue_depth", "Queue depth", ("state",))
+    total = metrics.gauge("jobs_total", "Jobs done", kind="counter")
+    backlog = [3]
+
+    def collect():
+        depth.set(backlog[0], "pending")
+        total.set(10)
+
+    def broken():
+        raise RuntimeError("boom")
+
+    metrics.add_collector(broken)
+    metrics.add_collector(collect)
+
+    assert 'queue_depth{state="pending"} 3' in metrics.render()
+    backlog[0] = 1
+    rendered = metrics.render()
+    assert 'queue_depth{state="pending"} 1' in rendered
+    assert "# TYPE jobs_total counter\njobs_total 10" in rendered
+
+
+@pytest.mark.unit
+async def test_pool_metrics_report_checked_out_connections(tmp_path):
+    writer, reader = create_async_engines(f"sqlite:///{tmp_path / 'pool.db'}")
+    metrics = MetricsRegistry()
+    register_pool_metrics({"writer": writer, "reader": reader}, metrics)
+    try:
+        async with reader.connect():
+            rendered = metrics.render()
+    finally:
+        await writer.dispose()
+        await reader.dispose()
+
+    assert 'sosenki_db_pool_connections{engine="reader",state="checked_out"} 1' in rendered
+    assert 'sosenki_db_pool_size{engine="writer"} 1' in rendered
+
+
+@pytest.mark.unit
+def test_metrics_endpoint_reports_route_latency():
+    from src.api.webhook import app
+
+    client = TestClient(app)
+    client.get("/health")
+    client.get("/no-such-route")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == CONTENT_TYPE
+    assert HTTP_REQUEST_SECONDS.count("GET", "/health") == 1
+    assert 'sosenki_http_request_duration_seconds_count{method="GET",route="/health"} 1' in (
+        response.text
+    )
+    assert "/no-such-route" not in response.text
+
+
+@pytest.mark.unit
+async def test_conversation_state_handlers_are_timed():
+    async def start(update, context):
+        return 1
+
+    async def amount(update, context):
+        return ConversationHandler.END
+
+    conversation = ConversationHandler(
+        entry_points=[CommandHandler("start", start)],
+        states={1: [CommandHandler("amount", amount)]},
+        fallbacks=[],
+    )
+
+    _instrument_handler(conversation)
+    result = await conversation.states[1][0].callback(None, None)
+
+    assert result == ConversationHandler.END
+    assert BOT_HANDLER_SECONDS.count("test_metrics.amount") == 1
+    assert BOT_HANDLER_SECONDS.count("test_metrics.start") == 0
+
+
+@pytest.mark.unit
+async def test_mcp_tool_calls_and_admission_waits_are_timed():
+    context = SimpleNamespace(message=SimpleNamespace(name="get_balance"))
+    call_next = AsyncMock(return_value="result")
+
+    assert await ToolMetricsMiddleware().on_call_tool(context, call_next) == "result"
+    assert MCP_TOOL_SECONDS.count("get_balance") == 1
+
+    queue = LLMAdmissionQueue(limit=1, timeout=5)
+    async with queue.slot():
+        pass
+    assert LLM_ADMISSION_WAIT_SECONDS.count() == 1
+
+
+@pytest.mark.unit
+def test_request_id_is_echoed_or_generated():
+    from src.api.webhook import app
+
+    client = TestClient(app)
+
+    assert client.get("/health", headers={"X-Request-ID": "req-42"}).headers["X-Request-ID"] == (
+        "req-42"
+    )
+    generated = client.get("/health", headers={"X-Request-ID": "bad id\n"}).headers
+    assert len(generated["X-Request-ID"]) == 16
@@ -1,7 +1,8 @@
 from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.models.account import Account, AccountType
 from src.models.user import User
@@ -80,3 +81,28 @@ async def test_notify_account_owners_and_representatives_skips_inactive_and_skip
     # Should notify only active_rep (555); owner skipped by skip_telegram_id; inactive rep skipped
     assert {m["chat_id"] for m in bot.sent} == {555}
     assert all(m["text"] == "world" for m in bot.sent)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_notify_account_owners_and_representatives_looks_up_on_reader_pool(
+    session: AsyncSession, async_engine
+):
+    bot = DummyBot()
+    notifier = NotificationService(SimpleNamespace(bot=bot))
+
+    owner = User(name="Owner3", telegram_id=666, is_active=True, is_owner=True)
+    session.add(owner)
+    await session.flush()
+    account = Account(name="Owner Account 3", account_type=AccountType.OWNER, user_id=owner.id)
+    session.add(account)
+    await session.commit()
+
+    reader = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    with patch("src.services.AsyncReadSessionLocal", reader):
+        await notifier.notify_account_owners_and_representatives(
+            account_ids=[account.id],
+            text="payout",
+        )
+
+    assert [m["chat_id"] for m in bot.sent] == [666]
@@ -0,0 +1,121 @@
+"""Tests for token-budgeted prompt assembly and conversation memory."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.services.prompt_assembler import (
+    TRUNCATED_MARKER,
+    ConversationMemory,
+    PromptAssembler,
+    estimate_tokens,
+    fit_tool_result,
+    get_prompt_prefix,
+)
+
+
+@pytest.mark.unit
+def test_prompt_prefix_is_built_once_per_role():
+    user_prefix = get_prompt_prefix(False)
+    admin_prefix = get_prompt_prefix(True)
+
+    first = PromptAssembler(is_admin=False).start("What is my balance?")
+    second = PromptAssembler(is_admin=False).start("Show my bills")
+
+    assert first[0] is second[0] is user_prefix.system
+    assert PromptAssembler(is_admin=False).tools is user_prefix.tools
+    assert admin_prefix.system["content"] != user_prefix.system["content"]
+    assert len(admin_prefix.tools) > len(user_prefix.tools)
+
+
+@pytest.mark.unit
+def test_small_tool_result_is_kept_verbatim():
+    result = json.dumps({"balance": 100.5})
+
+    assert fit_tool_result(result, 64) is result
+
+
+@pytest.mark.unit
+def test_long_lists_are_shortened_into_valid_json():
+    bills = [{"period": f"Period {i}", "amount": 1000 + i} for i in range(200)]
+    result = json.dumps({"account": "Owner", "bills": bills, "count": 200})
+
+    fitted = fit_tool_result(result, 128)
+
+    assert estimate_tokens(fitted) <= 128
+    data = json.loads(fitted)
+    assert data["account"] == "Owner"
+    assert data["bills"] == bills[: len(data["bills"])]
+    assert data["truncated"] == {"bills": {"shown": len(data["bills"]), "total": 200}}
+
+
+@pytest.mark.unit
+def test_non_json_result_is_cut():
+    fitted = fit_tool_result("x" * 3000, 100)
+
+    assert fitted.endswith(TRUNCATED_MARKER)
+    assert estimate_tokens(fitted) <= 100
+
+
+@pytest.mark.unit
+def test_tool_results_share_the_remaining_budget():
+    prompt = PromptAssembler(is_admin=False, budget=10_000, tool_result_tokens=2_000)
+    prompt.start("Show my bills")
+    big = json.dumps({"bills": [{"amount": i} for i in range(5_000)]})
+    prompt.used = prompt.budget - 600
+
+    messages = prompt.tool_messages([("list_bills", big), ("get_balance", big)])
+
+    assert [m["name"] for m in messages] == ["list_bills", "get_balance"]
+    assert all(estimate_tokens(m["content"]) <= 300 for m in messages)
+    assert prompt.remaining <= 600
+
+
+@pytest.mark.unit
+def test_history_keeps_newest_whole_pairs_within_budget():
+    history = []
+    for i in range(10):
+        history.append({"role": "user", "content": f"question {i} " + "q" * 300})
+        history.append({"role": "assistant", "content": f"answer {i} " + "a" * 300})
+    prefix_tokens = get_prompt_prefix(False).tokens
+    budget = prefix_tokens + 100 + 3 * 2 * 110
+
+    messages = PromptAssembler(is_admin=False, budget=budget, tool_result_tokens=100).start(
+        "And now?", history
+    )
+
+    kept = messages[1:-1]
+    assert kept == history[-len(kept) :]
+    assert kept and kept[0]["role"] == "user" and len(kept) % 2 == 0
+    assert len(kept) < len(history)
+    assert messages[-1] == {"role": "user", "content": "And now?"}
+
+
+@pytest.mark.unit
+def test_memory_keeps_last_turns_and_forgets_after_ttl():
+    memory = ConversationMemory(max_turns=2, ttl=60)
+    with patch("src.services.prompt_assembler.time.monotonic", return_value=1000.0):
+        for i in range(3):
+            memory.remember(1, f"q{i}", f"a{i}")
+        assert [m["content"] for m in memory.history(1)] == ["q1", "a1", "q2", "a2"]
+        assert memory.history(2) == []
+
+    with patch("src.services.prompt_assembler.time.monotonic", return_value=1061.0):
+        assert memory.history(1) == []
+
+
+@pytest.mark.unit
+def test_memory_is_off_by_default_and_bounded_in_users():
+    disabled = ConversationMemory(max_turns=0)
+    disabled.remember(1, "q", "a")
+    assert disabled.history(1) == []
+
+    memory = ConversationMemory(max_turns=1, max_users=2)
+    for user_id in (1, 2, 3):
+        memory.remember(user_id, "q", "a")
+    assert memory.history(1) == []
+    assert memory.history(3)
+
+    memory.forget(3)
+    assert memory.history(3) == []
@@ -0,0 +1,125 @@
+"""Tests for per-request SQL statistics and the N+1 detector."""
+
+import asyncio
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.api.middleware import QUERY_STATS_HEADER, QueryStatsMiddleware
+from src.services.query_stats import (
+    current_query_stats,
+    install_query_instrumentation,
+    query_budget,
+    statement_shape,
+    track_queries,
+)
+
+
+@pytest.fixture
+async def engine():
+    install_query_instrumentation()
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE item (id INTEGER PRIMARY KEY, owner INTEGER)"))
+        await conn.execute(
+            text("INSERT INTO item (owner) VALUES (:owner)"), [{"owner": i % 3} for i in range(9)]
+        )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.unit
+def test_statement_shape_collapses_in_lists_and_whitespace():
+    assert statement_shape("SELECT *\n  FROM item WHERE id IN (?, ?,?)") == (
+        "SELECT * FROM item WHERE id IN (?)"
+    )
+    assert statement_shape("SELECT * FROM item WHERE id IN (?)") == statement_shape(
+        "SELECT * FROM item WHERE id IN (?, ?)"
+    )
+
+
+@pytest.mark.unit
+async def test_track_queries_counts_statements_rows_and_child_tasks(engine):
+    async def owner_items(owner):
+        async with engine.connect() as conn:
+            rows = await conn.execute(text("SELECT id FROM item WHERE owner = :o"), {"o": owner})
+            return rows.all()
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    assert current_query_stats() is None
+
+    with track_queries() as stats:
+        assert current_query_stats() is stats
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT id FROM item"))
+        await asyncio.gather(*(owner_items(owner) for owner in range(3)))
+
+    assert current_query_stats() is None
+    assert stats.statements == 4
+    assert stats.rows == 18
+    assert stats.db_time > 0
+    assert stats.repeated(threshold=3) == {"SELECT id FROM item WHERE owner = ?": 3}
+    assert stats.summary().startswith("queries=4 ")
+
+
+@pytest.mark.unit
+async def test_repeated_statement_shapes_are_flagged_as_n_plus_one(engine, caplog):
+    with caplog.at_level(logging.WARNING, logger="src.services.query_stats"):
+        with track_queries("GET /items"):
+            async with engine.connect() as conn:
+                for item_id in range(1, 7):
+                    await conn.execute(text("SELECT * FROM item WHERE id = :i"), {"i": item_id})
+        with track_queries("GET /batched"):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT * FROM item WHERE id IN (1, 2, 3, 4, 5, 6)"))
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages == ["Possible N+1 in GET /items: 6 runs of SELECT * FROM item WHERE id = ?"]
+
+
+@pytest.mark.unit
+async def test_query_budget_counts_into_enclosing_scope_and_warns_over_budget(engine, caplog):
+    @query_budget(1)
+    async def lookup(item_ids):
+        async with engine.connect() as conn:
+            for item_id in item_ids:
+                await conn.execute(text("SELECT * FROM item WHERE id = :i"), {"i": item_id})
+
+    assert lookup.query_budget == 1
+    with caplog.at_level(logging.WARNING, logger="src.services.query_stats"):
+        with track_queries() as stats:
+            await lookup([1])
+            assert not caplog.records
+            await lookup([1, 2, 3])
+
+    assert stats.statements == 4
+    assert "lookup ran 3 SQL statements (budget 1)" in caplog.text
+
+
+@pytest.mark.unit
+def test_middleware_reports_stats_in_header_only_with_debug_logging(engine, caplog):
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/items")
+    async def items():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT id FROM item"))
+            await conn.execute(text("SELECT id FROM item WHERE owner = 1"))
+        return {"ok": True}
+
+    client = TestClient(app)
+    assert QUERY_STATS_HEADER not in client.get("/items").headers
+
+    with caplog.at_level(logging.DEBUG, logger="src.api.middleware"):
+        response = client.get("/items")
+
+    assert response.headers[QUERY_STATS_HEADER].startswith("queries=2 ")
+    assert "rows=12" in response.headers[QUERY_STATS_HEADER]
+    assert any("http GET /items: queries=2" in r.getMessage() for r in caplog.records)
@@ -0,0 +1,95 @@
+import time
+
+import pytest
+from telegram.error import BadRequest, Forbidden, RetryAfter, TimedOut
+
+from src.services.telegram_fanout import TelegramFanout, TelegramRateLimiter, TokenBucket
+
+
+class FlakyBot:
+    """Bot stub that raises queued errors per chat before succeeding."""
+
+    def __init__(self, errors=None):
+        self.errors = {chat_id: list(queue) for chat_id, queue in (errors or {}).items()}
+        self.sent = []
+
+    async def send_message(self, chat_id, text, reply_markup=None, parse_mode=None):
+        queue = self.errors.get(chat_id)
+        if queue:
+            raise queue.pop(0)
+        self.sent.append(chat_id)
+
+
+def _fanout(bot, **kwargs):
+    limiter = TelegramRateLimiter(global_rate=1000.0, per_chat_rate=1000.0)
+    return TelegramFanout(bot, rate_limiter=limiter, backoff_base=0.0, **kwargs)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_send_returns_result_per_unique_chat_in_order():
+    bot = FlakyBot()
+
+    results = await _fanout(bot).send([3, 1, 3, 2], "hi")
+
+    assert [r.chat_id for r in results] == [3, 1, 2]
+    assert all(r.delivered and r.attempts == 1 for r in results)
+    assert sorted(bot.sent) == [1, 2, 3]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_send_retries_flood_control_and_timeouts():
+    bot = FlakyBot({1: [RetryAfter(0)], 2: [TimedOut(), TimedOut()]})
+
+    results = await _fanout(bot).send([1, 2], "hi")
+
+    assert [(r.chat_id, r.delivered, r.attempts) for r in results] == [(1, True, 2), (2, True, 3)]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_send_reports_permanent_and_exhausted_failures():
+    bot = FlakyBot(
+        {
+            1: [Forbidden("bot was blocked by the user")],
+            2: [BadRequest("chat not found")],
+            3: [TimedOut()] * 5,
+        }
+    )
+
+    results = await _fanout(bot, max_attempts=3).send([1, 2, 3, 4], "hi")
+
+    assert [(r.chat_id, r.delivered, r.attempts) for r in results] == [
+        (1, False, 1),
+        (2, False, 1),
+        (3, False, 3),
+        (4, True, 1),
+    ]
+    assert "blocked" in results[0].error
+    assert bot.sent == [4]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=100.0, capacity=1.0)
+
+    started = time.monotonic()
+    for _ in range(6):
+        await bucket.acquire()
+
+    # First token is free, the next five are paced at 10ms each
+    assert time.monotonic() - started >= 0.045
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_penalize_delays_next_token():
+    bucket = TokenBucket(rate=100.0)
+
+    bucket.penalize(0.05)
+    started = time.monotonic()
+    await bucket.acquire()
+
+    assert time.monotonic() - started >= 0.045
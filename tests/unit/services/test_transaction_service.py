@@ -144,3 +144,34 @@ async def test_create_transaction_defaults_to_today(session):
     await session.commit()
 
     assert tx.transaction_date == date.today()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_create_transaction_with_same_idempotency_key_returns_existing(session):
+    a1 = Account(name="From", account_type=AccountType.STAFF)
+    a2 = Account(name="To", account_type=AccountType.ORGANIZATION)
+    session.add_all([a1, a2])
+    await session.commit()
+
+    service = TransactionService(session)
+    kwargs = {
+        "from_account_id": a1.id,
+        "to_account_id": a2.id,
+        "amount": Decimal("75"),
+        "description": "payout",
+        "transaction_date": date(2025, 1, 1),
+        "actor_id": 7,
+        "idempotency_key": "payout:1:2",
+    }
+    first = await service.create_transaction(**kwargs)
+    await session.commit()
+    second = await service.create_transaction(**kwargs)
+    await session.commit()
+
+    assert second.id == first.id
+    rows = (await session.execute(select(type(first)))).scalars().all()
+    assert len(rows) == 1
+    assert len((await session.execute(select(AuditLog))).scalars().all()) == 1
+    assert (await service.get_transaction_by_idempotency_key("payout:1:2")).id == first.id
+    assert await service.get_transaction_by_idempotency_key("payout:1:3") is None
@@ -2,11 +2,18 @@
 
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.models import Base
 from src.models.user import User
-from src.services.admin_utils import get_admin_telegram_id, get_admin_user
+from src.services.admin_utils import (
+    get_admin_telegram_id,
+    get_admin_telegram_id_async,
+    get_admin_telegram_ids_async,
+    get_admin_user,
+    get_admin_user_async,
+)
 
 
 @pytest.fixture
@@ -81,3 +88,37 @@ def test_get_admin_user_returns_first_admin_when_multiple_exist(db_session: Sess
     # Should return one of them (database order)
     assert admin_user is not None
     assert admin_user.is_administrator is True
+
+
+async def test_get_admin_telegram_id_async_caches_until_role_change(
+    session: AsyncSession, count_queries
+):
+    """Test the async lookup is cached and dropped when a user's admin role changes."""
+    admin = User(name="Admin", telegram_id=111111111, is_administrator=True, is_active=True)
+    other = User(name="Other", telegram_id=222222222, is_administrator=False, is_active=True)
+    session.add_all([admin, other])
+    await session.commit()
+
+    assert await get_admin_telegram_id_async(session) == "111111111"
+
+    with count_queries() as stats:
+        assert await get_admin_telegram_ids_async(session) == ("111111111",)
+    assert stats.statements == 0
+
+    admin.is_administrator = False
+    other.is_administrator = True
+    await session.commit()
+
+    assert await get_admin_telegram_ids_async(session) == ("222222222",)
+
+
+async def test_get_admin_user_async(session: AsyncSession):
+    """Test the async admin user lookup."""
+    assert await get_admin_user_async(session) is None
+
+    session.add(User(name="Admin", telegram_id=111111111, is_administrator=True, is_active=True))
+    await session.commit()
+
+    admin_user = await get_admin_user_async(session)
+    assert admin_user is not None
+    assert admin_user.name == "Admin"
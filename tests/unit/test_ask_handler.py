@@ -1,6 +1,6 @@
 """Unit tests for /ask command handler."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import HTTPException
@@ -120,7 +120,12 @@ class TestAskHandler:
 
                         mock_auth.assert_called_once_with(mock_session, 12345)
                         mock_ollama_cls.assert_called_once()
-                        mock_ollama.chat.assert_called_once_with("What is my balance?")
+                        mock_ollama.chat.assert_called_once_with(
+                            "What is my balance?",
+                            on_text=ANY,
+                            on_tool_calls=ANY,
+                            on_queue_position=ANY,
+                        )
                         update.message.reply_text.assert_called_once_with("Your balance is $100.50")
 
     @pytest.mark.asyncio
@@ -282,7 +287,12 @@ class TestAskHandler:
                         await handle_ask_command(update, context)
 
                         # Should strip whitespace
-                        mock_ollama.chat.assert_called_once_with("What is my current balance?")
+                        mock_ollama.chat.assert_called_once_with(
+                            "What is my current balance?",
+                            on_text=ANY,
+                            on_tool_calls=ANY,
+                            on_queue_position=ANY,
+                        )
 
     @pytest.mark.asyncio
     async def test_handle_ask_llm_disabled(self):
@@ -1,12 +1,17 @@
 """Unit tests for src.services.auth_service."""
 
+import time
 from dataclasses import dataclass
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.models.account import Account, AccountType
+from src.models.user import User
+from src.services import auth_service
 from src.services.auth_service import (
     AuthorizedUser,
     authorize_account_access,
@@ -16,6 +21,7 @@ from src.services.auth_service import (
     resolve_target_user,
     verify_telegram_auth,
 )
+from src.services.identity_cache import invalidate_identities
 
 
 @dataclass
@@ -81,7 +87,44 @@ async def test_verify_telegram_auth_success(async_session):
 
 
 @pytest.mark.asyncio
-async def test_get_authenticated_user_active(async_session, active_user):
+async def test_verify_telegram_auth_caches_verified_init_data(async_session):
+    auth_service._verified_init_data.clear()
+    parsed = {"user": '{"id": 777}', "auth_date": str(int(time.time()))}
+    try:
+        with patch(
+            "src.services.auth_service.UserService.verify_telegram_webapp_signature",
+            return_value=parsed,
+        ) as mock_verify:
+            first = await verify_telegram_auth(async_session, authorization="tma cached")
+            second = await verify_telegram_auth(async_session, x_telegram_init_data="cached")
+            other = await verify_telegram_auth(async_session, authorization="tma other")
+    finally:
+        auth_service._verified_init_data.clear()
+
+    assert first == second == other == 777
+    # Same raw init data is verified once; different init data is verified again
+    assert mock_verify.call_count == 2
+
+
+def test_verified_init_data_cache_expiry_and_lru():
+    cache = auth_service._VerifiedInitDataCache(maxsize=2, ttl=300.0)
+    now = int(time.time())
+
+    cache.put(b"expired", 1, auth_date=now - auth_service.INIT_DATA_MAX_AGE_SECONDS - 1)
+    assert cache.get(b"expired") is None
+
+    cache.put(b"a", 1, auth_date=now)
+    cache.put(b"b", 2, auth_date=now)
+    assert cache.get(b"a") == 1  # "a" becomes most recently used
+    cache.put(b"c", 3, auth_date=now)
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == 1
+    assert cache.get(b"c") == 3
+
+
+@pytest.mark.asyncio
+async def test_get_authenticated_user_active(async_session):
+    active_user = User(id=1, telegram_id=111, name="Active", is_active=True)
     with patch("src.services.auth_service.UserService") as mock_service:
         instance = MagicMock()
         instance.get_by_telegram_id = AsyncMock(return_value=active_user)
@@ -90,6 +133,44 @@ async def test_get_authenticated_user_active(async_session, active_user):
     assert user == active_user
 
 
+@pytest.mark.asyncio
+async def test_get_authenticated_user_uses_identity_cache(async_session):
+    active_user = User(id=1, telegram_id=111, name="Active", is_active=True)
+    async_session.merge = AsyncMock(side_effect=lambda instance, load: instance)
+    with patch("src.services.auth_service.UserService") as mock_service:
+        instance = MagicMock()
+        instance.get_by_telegram_id = AsyncMock(return_value=active_user)
+        mock_service.return_value = instance
+        first = await get_authenticated_user(async_session, telegram_id=111)
+        second = await get_authenticated_user(async_session, telegram_id=111)
+
+        invalidate_identities()
+        await get_authenticated_user(async_session, telegram_id=111)
+
+    # Warm request is served from a detached copy attached with merge(load=False)
+    assert first is active_user
+    assert second is not active_user
+    assert (second.id, second.telegram_id, second.name) == (1, 111, "Active")
+    async_session.merge.assert_awaited_once_with(second, load=False)
+    assert instance.get_by_telegram_id.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_authorize_account_access_reuses_cached_account(async_session):
+    user = User(id=1, telegram_id=111, name="Owner", is_active=True, is_owner=True)
+    account = Account(id=5, name="Own", user_id=1, account_type=AccountType.OWNER)
+    auth_service.identity_cache.put(111, user)
+    async_session.merge = AsyncMock(side_effect=lambda instance, load: instance)
+    with patch(
+        "src.services.auth_service._get_account_or_404", AsyncMock(return_value=account)
+    ) as mock_get:
+        await authorize_account_access(async_session, user, 5)
+        cached = await authorize_account_access(async_session, user, 5)
+
+    mock_get.assert_awaited_once()
+    assert cached.id == 5 and cached.user_id == 1
+
+
 @pytest.mark.asyncio
 async def test_get_authenticated_user_inactive(async_session):
     inactive_user = DummyUser(id=10, telegram_id=999, is_active=False)
@@ -292,3 +373,35 @@ async def test_authorize_account_access_for_roles_representative(async_session):
         async_session, representative, 1, ["is_owner"]
     )
     assert result == account
+
+
+@pytest.mark.asyncio
+async def test_warm_auth_preamble_issues_no_queries(async_engine):
+    """Second request resolves user and account with zero SQL statements."""
+    session_factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as setup:
+        user = User(name="Owner", telegram_id=4242, is_active=True, is_owner=True)
+        setup.add(user)
+        await setup.flush()
+        account = Account(name="Owner", user_id=user.id, account_type=AccountType.OWNER)
+        setup.add(account)
+        await setup.commit()
+        account_id = account.id
+
+    async with session_factory() as cold:
+        authenticated = await get_authenticated_user(cold, 4242)
+        await authorize_account_access(cold, authenticated, account_id)
+
+    statements: list[str] = []
+    event.listen(
+        async_engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    async with session_factory() as warm:
+        authenticated = await get_authenticated_user(warm, 4242)
+        authorized = await authorize_account_access(warm, authenticated, account_id)
+
+        assert authenticated in warm
+        assert authorized.user_id == authenticated.id
+    assert statements == []
@@ -0,0 +1,122 @@
+"""Unit tests for BalanceLedgerService (materialized account balances)."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.account import Account, AccountType
+from src.models.account_balance import AccountBalance
+from src.models.bill import Bill, BillType
+from src.models.service_period import ServicePeriod
+from src.models.transaction import Transaction
+from src.models.user import User
+from src.services.balance_ledger_service import BalanceLedgerService
+from src.services.bills_service import BillsService
+from src.services.transaction_service import TransactionService
+
+
+@pytest.fixture
+async def owner_and_fund(session: AsyncSession, sample_user: User):
+    """Create an owner account and an organization fund."""
+    owner = Account(name="Owner", user_id=sample_user.id, account_type=AccountType.OWNER)
+    fund = Account(name="Fund", account_type=AccountType.ORGANIZATION)
+    session.add_all([owner, fund])
+    await session.commit()
+    return owner, fund
+
+
+async def _stored_balance(session: AsyncSession, account_id: int) -> Decimal | None:
+    result = await session.execute(
+        select(AccountBalance.balance).where(AccountBalance.account_id == account_id)
+    )
+    return result.scalar_one_or_none()
+
+
+@pytest.mark.asyncio
+async def test_create_transaction_updates_snapshots(session: AsyncSession, owner_and_fund):
+    """Transactions add to the destination and subtract from the source snapshot."""
+    owner, fund = owner_and_fund
+    service = TransactionService(session)
+
+    await service.create_transaction(owner.id, fund.id, Decimal("100.10"), "first")
+    await service.create_transaction(owner.id, fund.id, Decimal("0.20"), "second")
+    await session.commit()
+
+    assert await _stored_balance(session, owner.id) == Decimal("-100.30")
+    assert await _stored_balance(session, fund.id) == Decimal("100.30")
+
+
+@pytest.mark.asyncio
+async def test_create_bills_updates_snapshots(
+    session: AsyncSession, owner_and_fund, sample_user: User, service_period: ServicePeriod
+):
+    """Bill creation adds bill amounts to owner snapshots."""
+    owner, _fund = owner_and_fund
+    bills_service = BillsService(session)
+
+    await bills_service.create_main_bills(service_period.id, [(sample_user.id, Decimal("500"))])
+    await bills_service.create_conservation_bills(
+        service_period.id, [(sample_user.id, Decimal("25.50"))]
+    )
+
+    ledger = BalanceLedgerService(session)
+    result = await ledger.get_account_balance(owner.id)
+    assert result.balance == 525.5
+    assert result.invert_for_display is True
+    assert await ledger.verify() == []
+
+
+@pytest.mark.asyncio
+async def test_missing_snapshot_falls_back_to_aggregation(session: AsyncSession, owner_and_fund):
+    """Accounts without a snapshot row are computed from transactions and bills."""
+    owner, fund = owner_and_fund
+    session.add(
+        Transaction(
+            from_account_id=owner.id,
+            to_account_id=fund.id,
+            amount=Decimal("40"),
+            transaction_date=date(2024, 1, 1),
+        )
+    )
+    await session.commit()
+
+    balances = await BalanceLedgerService(session).get_account_balances([owner.id, fund.id])
+    assert balances[owner.id].balance == -40.0
+    assert balances[fund.id].balance == 40.0
+
+
+@pytest.mark.asyncio
+async def test_verify_reports_drift_and_rebuild_fixes_it(
+    session: AsyncSession, owner_and_fund, service_period: ServicePeriod
+):
+    """Writes that bypass the service layer show up as drift until rebuilt."""
+    owner, fund = owner_and_fund
+    await TransactionService(session).create_transaction(
+        owner.id, fund.id, Decimal("100"), "tracked"
+    )
+    session.add(
+        Bill(
+            account_id=owner.id,
+            service_period_id=service_period.id,
+            bill_amount=Decimal("30"),
+            bill_type=BillType.MAIN,
+        )
+    )
+    await session.commit()
+
+    ledger = BalanceLedgerService(session)
+    drifts = await ledger.verify()
+    assert [(d.account_id, d.stored_balance, d.actual_balance) for d in drifts] == [
+        (owner.id, Decimal("-100.00"), Decimal("-70.00"))
+    ]
+
+    fixed = await ledger.rebuild()
+    await session.commit()
+
+    assert fixed == drifts
+    assert await ledger.verify() == []
+    assert await _stored_balance(session, owner.id) == Decimal("-70.00")
+    assert await _stored_balance(session, fund.id) == Decimal("100.00")
@@ -255,6 +255,44 @@ async def test_multiple_user_balances(
     assert balances[another_user.id] == 0.0
 
 
+@pytest.mark.asyncio
+async def test_user_balance_uses_owner_account_not_staff_account(
+    session: AsyncSession, sample_user: User, sample_account: Account
+):
+    """A user with OWNER and STAFF accounts gets the OWNER account's balance."""
+    community_fund = Account(name="Community Fund", account_type=AccountType.ORGANIZATION)
+    staff_account = Account(
+        name="Test Staff", user_id=sample_user.id, account_type=AccountType.STAFF
+    )
+    session.add_all([community_fund, staff_account])
+    await session.commit()
+
+    session.add_all(
+        [
+            Bill(
+                account_id=sample_account.id,
+                service_period_id=1,
+                bill_amount=40.0,
+                bill_type=BillType.MAIN,
+            ),
+            Transaction(
+                from_account_id=community_fund.id,
+                to_account_id=staff_account.id,
+                amount=500.0,
+                transaction_date=date(2024, 1, 1),
+            ),
+        ]
+    )
+    await session.commit()
+
+    service = BalanceCalculationService(session)
+
+    assert await service.calculate_user_balance(sample_user.id) == 40.0
+    assert await service.calculate_multiple_user_balances([sample_user.id]) == {
+        sample_user.id: 40.0
+    }
+
+
 @pytest.mark.asyncio
 async def test_user_balance_credit_and_debt_states(
     session: AsyncSession, sample_user: User, sample_account: Account
@@ -304,3 +342,71 @@ async def test_user_balance_credit_and_debt_states(
     # Balance = 0 - 100 + 200 = 100
     balance = await service.calculate_user_balance(sample_user.id)
     assert balance > 0, "Debt balance should be positive (owes money)"
+
+
+@pytest.mark.asyncio
+async def test_account_balances_aggregated_in_single_query(
+    session: AsyncSession, sample_user: User, sample_account: Account, count_queries
+):
+    """Test batch balances match per-account formula and flag OWNER accounts."""
+    sample_account.account_type = AccountType.OWNER
+    community_fund = Account(
+        name="Community Fund",
+        account_type=AccountType.ORGANIZATION,
+    )
+    session.add(community_fund)
+    await session.commit()
+
+    session.add_all(
+        [
+            Transaction(
+                from_account_id=sample_account.id,
+                to_account_id=community_fund.id,
+                amount=100.10,
+                transaction_date=date(2024, 1, 1),
+            ),
+            Transaction(
+                from_account_id=sample_account.id,
+                to_account_id=community_fund.id,
+                amount=0.20,
+                transaction_date=date(2024, 1, 2),
+            ),
+            Bill(
+                account_id=sample_account.id,
+                service_period_id=1,
+                bill_amount=50.0,
+                bill_type=BillType.MAIN,
+            ),
+        ]
+    )
+    await session.commit()
+
+    with count_queries() as stats:
+        service = BalanceCalculationService(session)
+        balances = await service.calculate_account_balances()
+
+    assert stats.statements == 1
+    # Owner: 0 - 100.30 + 50 = -50.30 (rounded to kopecks)
+    assert balances[sample_account.id].balance == -50.3
+    assert balances[sample_account.id].invert_for_display is True
+    # Organization: 100.30 incoming
+    assert balances[community_fund.id].balance == 100.3
+    assert balances[community_fund.id].invert_for_display is False
+
+
+@pytest.mark.asyncio
+async def test_account_balances_subset_and_unknown_ids(
+    session: AsyncSession, sample_account: Account
+):
+    """Test batch balances respect the requested subset and skip unknown IDs."""
+    service = BalanceCalculationService(session)
+
+    balances = await service.calculate_account_balances([sample_account.id, 9999])
+    assert set(balances) == {sample_account.id}
+    assert balances[sample_account.id].balance == 0.0
+
+    assert await service.calculate_account_balances([]) == {}
+
+    missing = await service.calculate_account_balance_with_display(9999)
+    assert missing.balance == 0.0
+    assert missing.invert_for_display is False
@@ -474,3 +474,81 @@ __all__ = [
     "test_calculate_main_bills",
     "test_calculate_conservation_bills",
 ]
+
+
+async def test_create_bills_uses_constant_statement_count(
+    async_db_session, service_period, count_queries
+):
+    """Test bill creation issues the same number of statements for any owner count."""
+    from sqlalchemy import select
+
+    from src.models.audit_log import AuditLog
+
+    users = [User(telegram_id=2000 + i, name=f"Bulk Owner {i}") for i in range(12)]
+    async_db_session.add_all(users)
+    await async_db_session.flush()
+    async_db_session.add_all(
+        Account(user_id=user.id, name=f"Bulk Account {user.id}", account_type="owner")
+        for user in users
+    )
+    await async_db_session.commit()
+
+    async def create_for(owner_count: int) -> int:
+        calculations = [(user.id, Decimal("10.00")) for user in users[:owner_count]]
+        with count_queries() as stats:
+            created = await BillsService(async_db_session).create_main_bills(
+                period_id=service_period.id, calculations=calculations, actor_id=None
+            )
+        assert created == owner_count
+        return stats.statements
+
+    assert await create_for(2) == await create_for(12)
+
+    audits = await async_db_session.execute(select(AuditLog).where(AuditLog.entity_type == "bill"))
+    bills = await async_db_session.execute(select(Bill.id))
+    audit_ids = sorted(audit.entity_id for audit in audits.scalars().all())
+    assert audit_ids == sorted(bills.scalars().all())
+
+
+async def test_distribute_shared_costs_exact_sums_to_total(
+    async_db_session, owner_users, count_queries
+):
+    """Test largest-remainder distribution sums to the total in one query."""
+    for user in owner_users:
+        async_db_session.add(
+            Property(
+                owner_id=user.id,
+                property_name=f"House {user.id}",
+                type="house",
+                is_active=True,
+                share_weight=Decimal("1"),
+            )
+        )
+    await async_db_session.commit()
+
+    service = BillsService(async_db_session)
+    with count_queries() as stats:
+        exact_shares = await service.distribute_shared_costs(Decimal("1.00"), None, exact=True)
+    rounded_shares = await service.distribute_shared_costs(Decimal("1.00"), None)
+
+    assert stats.statements == 1
+    assert [share.user_name for share in exact_shares] == ["Owner 0", "Owner 1", "Owner 2"]
+    assert [share.calculated_bill_amount for share in exact_shares] == [
+        Decimal("0.34"),
+        Decimal("0.33"),
+        Decimal("0.33"),
+    ]
+    assert sum(share.calculated_bill_amount for share in rounded_shares) == Decimal("0.99")
+
+
+def test_largest_remainder_amounts():
+    """Test leftover kopecks go to the largest remainders."""
+    from src.services.bills_service import _largest_remainder_amounts
+
+    amounts = _largest_remainder_amounts(
+        Decimal("10.00"), [Decimal("1"), Decimal("2"), Decimal("4")]
+    )
+
+    # Raw shares: 1.428.., 2.857.., 5.714..
+    assert amounts == [Decimal("1.43"), Decimal("2.86"), Decimal("5.71")]
+    assert sum(amounts) == Decimal("10.00")
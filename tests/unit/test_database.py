@@ -0,0 +1,165 @@
+"""Unit tests for the shared engine factory (src.services.database)."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import StaticPool
+
+from src.services.database import (
+    DatabaseSettings,
+    create_async_engines,
+    create_sync_engine,
+    detect_blocking_sync_access,
+    is_memory_database,
+)
+
+
+class TestDatabaseSettings:
+    """Tests for DatabaseSettings.from_env."""
+
+    def test_defaults(self, monkeypatch):
+        for name in ("DB_READ_POOL_SIZE", "SQLITE_CACHE_SIZE_KIB", "SQLITE_MMAP_SIZE"):
+            monkeypatch.delenv(name, raising=False)
+
+        assert DatabaseSettings.from_env() == DatabaseSettings()
+
+    def test_reads_environment(self, monkeypatch):
+        monkeypatch.setenv("DB_READ_POOL_SIZE", "8")
+        monkeypatch.setenv("SQLITE_MMAP_SIZE", "0")
+
+        settings = DatabaseSettings.from_env()
+
+        assert settings.read_pool_size == 8
+        assert settings.mmap_size == 0
+
+
+class TestIsMemoryDatabase:
+    """Tests for in-memory URL detection."""
+
+    @pytest.mark.parametrize(
+        "url",
+        ["sqlite://", "sqlite:///:memory:", "sqlite+aiosqlite:///:memory:"],
+    )
+    def test_memory_urls(self, url):
+        assert is_memory_database(url)
+
+    def test_file_url(self):
+        assert not is_memory_database("sqlite:///./sosenki.db")
+
+
+class TestCreateAsyncEngines:
+    """Tests for the writer/reader engine pair."""
+
+    @pytest.mark.asyncio
+    async def test_file_database_pragmas_and_pools(self, tmp_path):
+        settings = DatabaseSettings(read_pool_size=3, cache_size_kib=2048, mmap_size=1048576)
+        writer, reader = create_async_engines(f"sqlite:///{tmp_path / 'app.db'}", settings)
+        try:
+            assert writer is not reader
+            assert writer.pool.size() == 1
+            assert reader.pool.size() == 3
+
+            async with writer.connect() as conn:
+                journal_mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+                synchronous = (await conn.execute(text("PRAGMA synchronous"))).scalar()
+                cache_size = (await conn.execute(text("PRAGMA cache_size"))).scalar()
+                mmap_size = (await conn.execute(text("PRAGMA mmap_size"))).scalar()
+                query_only = (await conn.execute(text("PRAGMA query_only"))).scalar()
+
+            assert journal_mode == "wal"
+            assert synchronous == 1  # NORMAL
+            assert cache_size == -2048
+            assert mmap_size == 1048576
+            assert query_only == 0
+        finally:
+            await writer.dispose()
+            await reader.dispose()
+
+    @pytest.mark.asyncio
+    async def test_reader_connections_are_read_only(self, tmp_path):
+        writer, reader = create_async_engines(f"sqlite:///{tmp_path / 'app.db'}")
+        try:
+            async with writer.begin() as conn:
+                await conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+                await conn.execute(text("INSERT INTO items (id) VALUES (1)"))
+
+            async with reader.connect() as conn:
+                assert (await conn.execute(text("SELECT count(*) FROM items"))).scalar() == 1
+                with pytest.raises(OperationalError, match="readonly"):
+                    await conn.execute(text("INSERT INTO items (id) VALUES (2)"))
+        finally:
+            await writer.dispose()
+            await reader.dispose()
+
+    @pytest.mark.asyncio
+    async def test_memory_database_shares_one_static_engine(self):
+        writer, reader = create_async_engines("sqlite:///:memory:")
+        try:
+            assert writer is reader
+            assert isinstance(writer.pool, StaticPool)
+        finally:
+            await writer.dispose()
+
+
+class TestCreateSyncEngine:
+    """Tests for the sync engine."""
+
+    def test_pragmas_applied(self, tmp_path):
+        engine = create_sync_engine(f"sqlite:///{tmp_path / 'app.db'}")
+        try:
+            with engine.connect() as conn:
+                assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+                assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+        finally:
+            engine.dispose()
+
+
+class TestSharedEngine:
+    """The MCP server reuses the process-wide engine."""
+
+    @pytest.mark.asyncio
+    async def test_mcp_lifespan_uses_shared_session_factory(self):
+        import src.api.mcp_server as mcp_module
+        from src.services import AsyncSessionLocal, async_engine
+
+        async with mcp_module.mcp_lifespan():
+            assert mcp_module._engine is async_engine
+            assert mcp_module._session_maker is AsyncSessionLocal
+
+
+class TestDetectBlockingSyncAccess:
+    """Tests for the loop-blocking sync engine detector."""
+
+    async def test_flags_sync_engine_inside_event_loop(self):
+        engine = create_sync_engine("sqlite:///:memory:", DatabaseSettings())
+
+        with detect_blocking_sync_access() as violations:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+        assert violations == ["SELECT 1"]
+        engine.dispose()
+
+    async def test_ignores_async_engine_and_ignored_callers(self):
+        writer, _reader = create_async_engines("sqlite:///:memory:", DatabaseSettings())
+        engine = create_sync_engine("sqlite:///:memory:", DatabaseSettings())
+
+        with detect_blocking_sync_access(ignore_callers=(__file__,)) as violations:
+            async with writer.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 2"))
+
+        assert violations == []
+        await writer.dispose()
+        engine.dispose()
+
+    def test_allows_sync_engine_outside_event_loop(self):
+        engine = create_sync_engine("sqlite:///:memory:", DatabaseSettings())
+
+        with detect_blocking_sync_access() as violations:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+        assert violations == []
+        engine.dispose()
@@ -5,9 +5,11 @@ from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.electricity_reading import ElectricityReading
+from src.models.latest_electricity_reading import LatestElectricityReading
 from src.models.property import Property
 from src.services.electricity_reading_service import ElectricityReadingService
 
@@ -66,20 +68,10 @@ class TestGetPropertiesWithLatestReadings:
             id=2, property_id=2, reading_value=Decimal("2000.0"), reading_date=date(2025, 1, 10)
         )
 
-        # Mock execute for properties query
-        mock_props_result = MagicMock()
-        mock_props_result.scalars.return_value.all.return_value = [property_a, property_b]
-
-        # Mock execute for latest readings queries
-        mock_reading_a = MagicMock()
-        mock_reading_a.scalar_one_or_none.return_value = reading_a
-        mock_reading_b = MagicMock()
-        mock_reading_b.scalar_one_or_none.return_value = reading_b
-
-        # Set up execute mock to return different results for each call
-        mock_session.execute = AsyncMock(
-            side_effect=[mock_props_result, mock_reading_a, mock_reading_b]
-        )
+        # Mock execute for the single joined query
+        mock_result = MagicMock()
+        mock_result.all.return_value = [(property_a, reading_a), (property_b, reading_b)]
+        mock_session.execute = AsyncMock(return_value=mock_result)
 
         service = ElectricityReadingService(mock_session)
         result = await service.get_properties_with_latest_readings()
@@ -94,7 +86,7 @@ class TestGetPropertiesWithLatestReadings:
     async def test_get_properties_no_readings(self, mock_session):
         """Test getting properties when no readings exist."""
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
+        mock_result.all.return_value = []
 
         mock_session.execute = AsyncMock(return_value=mock_result)
 
@@ -102,6 +94,7 @@ class TestGetPropertiesWithLatestReadings:
         result = await service.get_properties_with_latest_readings()
 
         assert result == []
+        mock_session.execute.assert_called_once()
 
 
 class TestGetReadingById:
@@ -314,3 +307,96 @@ class TestDeleteReading:
 
         with pytest.raises(ValueError, match="Reading with ID 999 not found"):
             await service.delete_reading(reading_id=999, actor_id=1)
+
+
+class TestLatestReadingProjection:
+    """Tests for the latest_electricity_readings projection against a real database."""
+
+    @pytest.fixture
+    async def properties(self, session: AsyncSession, sample_user):
+        """Create two active properties."""
+        props = [
+            Property(owner_id=sample_user.id, property_name=name, type="house", is_active=True)
+            for name in ("A", "B")
+        ]
+        session.add_all(props)
+        await session.commit()
+        return props
+
+    @pytest.mark.asyncio
+    async def test_writes_keep_projection_current(self, session: AsyncSession, properties):
+        """Create, update and delete keep the latest reading per property."""
+        prop_a, prop_b = properties
+        service = ElectricityReadingService(session)
+
+        first = await service.create_reading(prop_a.id, date(2025, 1, 1), Decimal("100"), 1)
+        second = await service.create_reading(prop_a.id, date(2025, 2, 1), Decimal("150"), 1)
+        await session.commit()
+        assert [
+            (prop.property_name, reading and reading.id)
+            for prop, reading in await service.get_properties_with_latest_readings()
+        ] == [("A", second.id), ("B", None)]
+
+        # Moving the newest reading before the first one makes the first one latest
+        await service.update_reading(second.id, reading_date=date(2024, 12, 1), actor_id=1)
+        await session.commit()
+        latest = await service.get_properties_with_latest_readings()
+        assert latest[0][1].id == first.id
+
+        await service.delete_reading(first.id, actor_id=1)
+        await session.commit()
+        latest = await service.get_properties_with_latest_readings()
+        assert latest[0][1].id == second.id
+
+        await service.delete_reading(second.id, actor_id=1)
+        await session.commit()
+        latest = await service.get_properties_with_latest_readings()
+        assert latest[0][1] is None
+        rows = await session.execute(select(LatestElectricityReading))
+        assert rows.scalars().all() == []
+
+    @pytest.mark.asyncio
+    async def test_menu_uses_one_query(self, session: AsyncSession, properties, count_queries):
+        """Listing properties with readings costs one statement."""
+        service = ElectricityReadingService(session)
+        for prop in properties:
+            await service.create_reading(prop.id, date(2025, 1, 1), Decimal("10"), 1)
+        await session.commit()
+
+        with count_queries() as stats:
+            latest = await service.get_properties_with_latest_readings()
+
+        assert stats.statements == 1
+        assert [reading.reading_value for _prop, reading in latest] == [
+            Decimal("10"),
+            Decimal("10"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rebuild_statements_use_window_ranking(self, session: AsyncSession, properties):
+        """A full rebuild picks the newest reading per property."""
+        from src.services.electricity_reading_service import (
+            build_latest_reading_rebuild_statements,
+        )
+
+        prop_a, prop_b = properties
+        old = ElectricityReading(
+            property_id=prop_a.id, reading_value=Decimal("1"), reading_date=date(2025, 1, 1)
+        )
+        new = ElectricityReading(
+            property_id=prop_a.id, reading_value=Decimal("2"), reading_date=date(2025, 3, 1)
+        )
+        other = ElectricityReading(
+            property_id=prop_b.id, reading_value=Decimal("3"), reading_date=date(2025, 2, 1)
+        )
+        session.add_all([old, new, other])
+        await session.flush()
+
+        for stmt in build_latest_reading_rebuild_statements():
+            await session.execute(stmt)
+        await session.commit()
+
+        rows = await session.execute(
+            select(LatestElectricityReading.property_id, LatestElectricityReading.reading_id)
+        )
+        assert dict(rows.all()) == {prop_a.id: new.id, prop_b.id: other.id}
@@ -0,0 +1,60 @@
+"""Tests for the offline LLM benchmark harness and its fake Ollama server."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from benchmarks.fake_ollama import FakeOllama, FakeOllamaServer, Latency
+from benchmarks.llm_bench import percentile, run_level
+from benchmarks.synthetic import Scale, build_community
+from src.services.database import create_async_engines
+
+
+@pytest.mark.unit
+def test_fake_ollama_replays_script_turns_by_assistant_count():
+    fake = FakeOllama()
+    question = {"role": "user", "content": "What is my balance?"}
+
+    first = fake.select_turn([question])
+    second = fake.select_turn([question, {"role": "assistant", "content": ""}])
+
+    assert first.tool_calls == (("get_balance", {}),)
+    assert second.content and not second.tool_calls
+    assert not fake.select_turn([{"role": "user", "content": "Hi"}]).tool_calls
+
+
+@pytest.mark.unit
+def test_percentile_uses_nearest_rank():
+    values = [float(v) for v in range(1, 21)]
+
+    assert percentile(values, 50) == 10.0
+    assert percentile(values, 95) == 19.0
+    assert percentile([3.0], 95) == 3.0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream", [False, True])
+async def test_run_level_measures_questions_end_to_end(tmp_path, stream):
+    writer_engine, reader_engine = create_async_engines(f"sqlite:///{tmp_path / 'bench.db'}")
+    try:
+        community = await build_community(writer_engine, Scale(owners=3, years=1))
+        user_ids = list(community.owner_ids)
+        writer = async_sessionmaker(writer_engine, class_=AsyncSession, expire_on_commit=False)
+        reader = async_sessionmaker(reader_engine, class_=AsyncSession, expire_on_commit=False)
+
+        async with FakeOllamaServer(latency=Latency(first_token=0, per_token=0)) as server:
+            report = await run_level(
+                2, 5, user_ids, writer, reader, server.url, slots=2, stream=stream
+            )
+            stats = server.fake.stats
+    finally:
+        await writer_engine.dispose()
+        await reader_engine.dispose()
+
+    assert report.questions == 5
+    assert report.p50 <= report.p95 <= report.max
+    # balance, bills, period: one tool each; overview: three; hello: none
+    assert report.tool_calls_per_question == pytest.approx(6 / 5)
+    assert report.max_queries_per_question > 0
+    assert stats.requests == 9
+    assert stats.streamed == (9 if stream else 0)
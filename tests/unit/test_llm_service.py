@@ -228,19 +228,23 @@ class TestToolExecution:
             mock_period.id = 5
             mock_period.name = "Q1 2025"
             mock_period.start_date = date(2025, 1, 1)
-            mock_period.end_date = date(2025, 3, 31)
+            mock_period.end_date = date(2025, 4, 1)
 
             mock_service = MagicMock()
-            mock_service.create_period = AsyncMock(return_value=mock_period)
+            mock_service.create_period_until = AsyncMock(return_value=mock_period)
             mock_service_cls.return_value = mock_service
 
             result = await execute_tool(
                 "create_service_period",
-                {"name": "Q1 2025", "start_date": "2025-01-01", "end_date": "2025-03-31"},
+                {"name": "Q1 2025", "start_date": "2025-01-01", "end_date": "2025-04-01"},
                 ctx,
             )
             data = json.loads(result)
 
+            mock_service.create_period_until.assert_awaited_once_with(
+                date(2025, 1, 1), date(2025, 4, 1), name="Q1 2025"
+            )
+
             assert data["success"] is True
             assert data["period_id"] == 5
             assert data["name"] == "Q1 2025"
@@ -396,5 +400,246 @@ class TestOllamaService:
                 result = await service.chat("Hello", max_tool_calls=3)
 
                 assert "limit" in result.lower() or "simpler" in result.lower()
-                # Should have called tool 3 times (max_tool_calls)
-                assert mock_execute.call_count == 3
+                # Should have asked for tools 3 times (max_tool_calls)
+                assert mock_chat.call_count == 3
+                # The repeated identical read is served from the per-question cache
+                assert mock_execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_chat_streams_text_and_reports_tool_rounds(self):
+        """Test streaming mode reports the answer and tool-calling rounds, not preambles."""
+        from ollama import ChatResponse, Message
+
+        service = OllamaService(session=MagicMock(), user_id=1)
+
+        def stream(*chunks):
+            async def iterate():
+                for chunk in chunks:
+                    yield ChatResponse(message=chunk)
+
+            return iterate()
+
+        tool_call = Message.ToolCall(
+            function=Message.ToolCall.Function(name="get_balance", arguments={})
+        )
+        rounds = [
+            stream(
+                Message(role="assistant", content="Let me look "),
+                Message(role="assistant", content="that up."),
+                Message(role="assistant", content="", tool_calls=[tool_call]),
+            ),
+            stream(
+                Message(role="assistant", content="Your balance "),
+                Message(role="assistant", content="is $100.50"),
+            ),
+        ]
+        texts = []
+        tool_rounds = []
+
+        async def on_text(text):
+            texts.append(text)
+
+        async def on_tool_calls(names):
+            tool_rounds.append(names)
+
+        with patch.object(service.client, "chat", new_callable=AsyncMock) as mock_chat:
+            mock_chat.side_effect = rounds
+            with patch(
+                "src.services.llm_service.execute_tool", new_callable=AsyncMock
+            ) as mock_execute:
+                mock_execute.return_value = json.dumps({"balance": 100.50})
+
+                result = await service.chat(
+                    "What is my balance?", on_text=on_text, on_tool_calls=on_tool_calls
+                )
+
+        assert result == "Your balance is $100.50"
+        assert texts == ["Your balance is $100.50"]
+        assert tool_rounds == [["get_balance"]]
+        assert all(call.kwargs["stream"] is True for call in mock_chat.call_args_list)
+        mock_execute.assert_called_once_with("get_balance", {}, service.tool_context)
+
+    @pytest.mark.asyncio
+    async def test_chat_continues_remembered_conversation_and_fits_tool_results(self):
+        """Test follow-ups see earlier turns and big tool results are shrunk."""
+        from src.services.prompt_assembler import ConversationMemory
+
+        memory = ConversationMemory(max_turns=3)
+        service = OllamaService(session=MagicMock(), user_id=1, memory=memory)
+
+        def respond(content, tool_calls=None):
+            response = MagicMock()
+            response.message.content = content
+            response.message.tool_calls = tool_calls
+            return response
+
+        tool_call = MagicMock()
+        tool_call.function.name = "list_bills"
+        tool_call.function.arguments = {}
+        tool_call.id = "call_1"
+        sent = []
+
+        async def chat(**kwargs):
+            sent.append([dict(m) for m in kwargs["messages"]])
+            return replies.pop(0)
+
+        replies = [
+            respond("Your balance is $100.50"),
+            respond("", [tool_call]),
+            respond("You have 5000 bills"),
+        ]
+        bills = json.dumps({"bills": [{"amount": i} for i in range(5000)]})
+
+        with patch.object(service.client, "chat", side_effect=chat):
+            with patch(
+                "src.services.llm_service.execute_tool", new_callable=AsyncMock
+            ) as mock_execute:
+                mock_execute.return_value = bills
+                await service.chat("What is my balance?")
+                result = await service.chat("And my bills?")
+
+        assert result == "You have 5000 bills"
+        assert [m["content"] for m in sent[1][1:]] == [
+            "What is my balance?",
+            "Your balance is $100.50",
+            "And my bills?",
+        ]
+        # Both questions share the same system message
+        assert sent[0][0] == sent[1][0] and sent[0][0]["role"] == "system"
+        tool_message = sent[2][-1]
+        assert tool_message["role"] == "tool"
+        assert len(tool_message["content"]) < len(bills)
+        assert "truncated" in json.loads(tool_message["content"])
+        assert len(memory.history(1)) == 4
+
+
+class TestToolCallExecution:
+    """Tests for concurrent read tools and the per-question result cache."""
+
+    @staticmethod
+    def _tool_call(name, arguments=None):
+        tool_call = MagicMock()
+        tool_call.function.name = name
+        tool_call.function.arguments = arguments or {}
+        return tool_call
+
+    @staticmethod
+    def _session_factory(sessions):
+        def factory():
+            session = MagicMock()
+            session.__aenter__ = AsyncMock(return_value=session)
+            session.__aexit__ = AsyncMock(return_value=None)
+            sessions.append(session)
+            return session
+
+        return factory
+
+    @pytest.mark.asyncio
+    async def test_read_tools_run_concurrently_on_own_sessions(self):
+        """Test read-only tools of one turn overlap and each gets its own session."""
+        import asyncio
+
+        from src.services.llm_service import ToolResultCache
+
+        sessions = []
+        service = OllamaService(
+            session=MagicMock(),
+            user_id=1,
+            read_session_factory=self._session_factory(sessions),
+        )
+        running = 0
+        peak = 0
+        used_sessions = []
+
+        async def fake_execute(tool_name, arguments, ctx):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            used_sessions.append(ctx.session)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return json.dumps({"tool": tool_name})
+
+        calls = [
+            self._tool_call("get_balance"),
+            self._tool_call("list_bills", {"limit": 5}),
+            self._tool_call("get_period_info", {"period_id": 1}),
+        ]
+        with patch("src.services.llm_service.execute_tool", side_effect=fake_execute):
+            results = await service._execute_tool_calls(calls, ToolResultCache())
+
+        assert [json.loads(r)["tool"] for r in results] == [
+            "get_balance",
+            "list_bills",
+            "get_period_info",
+        ]
+        assert peak == 3
+        assert used_sessions == sessions and service.session not in used_sessions
+
+    @pytest.mark.asyncio
+    async def test_identical_reads_are_memoized_and_writes_invalidate(self):
+        """Test repeated reads reuse results until a write tool runs."""
+        from src.services.llm_service import ToolResultCache
+
+        service = OllamaService(session=AsyncMock(), user_id=1, is_admin=True)
+        cache = ToolResultCache()
+
+        with patch("src.services.llm_service.execute_tool", new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = json.dumps({"ok": True})
+
+            await service._execute_tool_calls(
+                [self._tool_call("get_balance"), self._tool_call("get_balance")], cache
+            )
+            await service._execute_tool_calls([self._tool_call("get_balance")], cache)
+            assert mock_execute.call_count == 1
+            assert cache.hits == 2
+
+            await service._execute_tool_calls(
+                [
+                    self._tool_call("create_service_period", {"name": "P"}),
+                    self._tool_call("get_balance"),
+                ],
+                cache,
+            )
+
+        assert mock_execute.call_count == 3
+        service.session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_write_tools_commit_and_later_reads_use_own_sessions(self):
+        """Test a write is committed at once, so following reads need not share its session."""
+        from src.services.llm_service import ToolResultCache
+
+        sessions = []
+        service = OllamaService(
+            session=AsyncMock(),
+            user_id=1,
+            is_admin=True,
+            read_session_factory=self._session_factory(sessions),
+        )
+        used_sessions = []
+
+        async def fake_execute(tool_name, arguments, ctx):
+            used_sessions.append(ctx.session)
+            if arguments.get("name") == "bad":
+                return json.dumps({"error": "Invalid date format"})
+            return json.dumps({"tool": tool_name})
+
+        with patch("src.services.llm_service.execute_tool", side_effect=fake_execute):
+            await service._execute_tool_calls(
+                [
+                    self._tool_call("create_service_period", {"name": "P"}),
+                    self._tool_call("get_balance"),
+                ],
+                ToolResultCache(),
+            )
+            service.session.commit.assert_awaited_once()
+            service.session.rollback.assert_not_awaited()
+
+            await service._execute_tool_calls(
+                [self._tool_call("create_service_period", {"name": "bad"})], ToolResultCache()
+            )
+
+        service.session.commit.assert_awaited_once()
+        service.session.rollback.assert_awaited_once()
+        assert used_sessions == [service.session, sessions[0], service.session]
@@ -1,11 +1,18 @@
 """Tests for logging service configuration."""
 
+import json
 import logging
 import tempfile
+from logging.handlers import QueueHandler
 from pathlib import Path
 from unittest.mock import patch
 
-from src.services.logging import setup_server_logging
+from src.services.logging import (
+    log_context,
+    server_log_handlers,
+    setup_server_logging,
+    stop_server_logging,
+)
 
 
 class TestServerLogging:
@@ -19,6 +26,7 @@ class TestServerLogging:
 
     def teardown_method(self):
         """Restore original handlers after each test."""
+        stop_server_logging()
         self.root_logger = logging.getLogger()
         # Remove all handlers
         for handler in self.root_logger.handlers[:]:
@@ -51,8 +59,10 @@ class TestServerLogging:
 
             setup_server_logging(str(log_file))
 
-            # Should have 2 handlers (stdout + file)
-            assert len(self.root_logger.handlers) == 2
+            # Root only enqueues; the listener writes to 2 handlers (stdout + file)
+            assert len(self.root_logger.handlers) == 1
+            assert isinstance(self.root_logger.handlers[0], QueueHandler)
+            assert len(server_log_handlers()) == 2
 
     def test_setup_server_logging_sets_info_level(self) -> None:
         """Verify setup_server_logging sets log level to INFO by default."""
@@ -74,7 +84,7 @@ class TestServerLogging:
             with patch.dict("os.environ", {"LOG_LEVEL": "INFO"}, clear=False):
                 setup_server_logging(str(log_file))
 
-                for handler in self.root_logger.handlers:
+                for handler in [*self.root_logger.handlers, *server_log_handlers()]:
                     assert handler.level == logging.INFO
 
     def test_setup_server_logging_writes_to_file(self) -> None:
@@ -91,6 +101,7 @@ class TestServerLogging:
 
             # Verify file exists and contains message
             assert log_file.exists()
+            stop_server_logging()
             log_contents = log_file.read_text()
             assert test_message in log_contents
 
@@ -106,6 +117,7 @@ class TestServerLogging:
             test_logger.info("Timestamp test")
 
             # Verify ISO format timestamp in log
+            stop_server_logging()
             log_contents = log_file.read_text()
             # ISO format: [YYYY-MM-DD HH:MM:SS]
             assert "[202" in log_contents  # Year starts with 202x
@@ -122,6 +134,7 @@ class TestServerLogging:
             test_logger.info("Test message")
 
             # Verify logger name in output
+            stop_server_logging()
             log_contents = log_file.read_text()
             assert "custom.logger" in log_contents
 
@@ -137,6 +150,7 @@ class TestServerLogging:
             test_logger.info("Info message")
             test_logger.warning("Warning message")
 
+            stop_server_logging()
             log_contents = log_file.read_text()
             assert "INFO" in log_contents
             assert "WARNING" in log_contents
@@ -152,10 +166,58 @@ class TestServerLogging:
 
             setup_server_logging(str(log_file))
 
-            # Should have 2 new handlers (stdout + file), not including the dummy
-            assert len(self.root_logger.handlers) == 2
+            # Should have the queue handler only, not including the dummy
+            assert len(self.root_logger.handlers) == 1
             setup_server_logging(str(log_file))
 
-            # Should have exactly 2 handlers (not 3+)
-            assert len(self.root_logger.handlers) == 2
+            # Should still have exactly 1 root handler writing to stdout + file
+            assert len(self.root_logger.handlers) == 1
+            assert len(server_log_handlers()) == 2
             assert dummy_handler not in self.root_logger.handlers
+
+    def test_json_format_carries_log_context_and_extra_fields(self) -> None:
+        """Verify LOG_FORMAT=json writes one object per line with context fields."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = Path(temp_dir) / "server.log"
+
+            with patch.dict("os.environ", {"LOG_FORMAT": "json", "LOG_LEVEL": "INFO"}):
+                setup_server_logging(str(log_file))
+
+            test_logger = logging.getLogger("test.json")
+            with log_context(request_id="abc123", telegram_id=42):
+                test_logger.info("Paid %s", "100.00", extra={"duration_ms": 12})
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                test_logger.exception("Failed")
+
+            stop_server_logging()
+            first, second = [json.loads(line) for line in log_file.read_text().splitlines()]
+            assert first["message"] == "Paid 100.00"
+            assert first["logger"] == "test.json"
+            assert first["level"] == "INFO"
+            assert (first["request_id"], first["telegram_id"], first["duration_ms"]) == (
+                "abc123",
+                42,
+                12,
+            )
+            assert "request_id" not in second
+            assert "ValueError: boom" in second["exc_info"]
+
+    def test_file_rotates_by_size(self) -> None:
+        """Verify the log file is rotated once it reaches LOG_MAX_BYTES."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = Path(temp_dir) / "server.log"
+
+            with patch("src.services.logging.LOG_MAX_BYTES", 500):
+                setup_server_logging(str(log_file))
+
+            test_logger = logging.getLogger("test.rotation")
+            for index in range(30):
+                test_logger.warning("Message number %d padded to some length", index)
+
+            stop_server_logging()
+            rotated = sorted(Path(temp_dir).glob("server.log.*"))
+            assert len(rotated) >= 2
+            assert log_file.stat().st_size < 500
+            assert all(path.stat().st_size < 500 for path in rotated)
@@ -1,5 +1,6 @@
 """Unit tests for mini app endpoint functions with mocked dependencies."""
 
+from contextlib import ExitStack
 from datetime import date, datetime
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -11,6 +12,7 @@ from src.api.mini_app import (
     AccountResponse,
     AccountsResponse,
     BillsResponse,
+    DashboardResponse,
     InitResponse,
     PropertiesResponse,
     TransactionsResponse,
@@ -18,6 +20,7 @@ from src.api.mini_app import (
     get_account,
     get_accounts,
     get_bills,
+    get_dashboard,
     get_properties,
     get_transactions,
     get_user_context,
@@ -188,6 +191,7 @@ async def test_get_properties_returns_response(async_session):
 async def test_get_transactions_personal_scope(async_session):
     """Transactions endpoint formats rows into response objects."""
     row = (
+        900,
         1,
         "Owner",
         2,
@@ -231,9 +235,6 @@ async def test_get_bills_returns_electricity_data(async_session):
     """Bills endpoint joins period and property data."""
     account = SimpleNamespace(user_id=50)
 
-    properties_result = MagicMock()
-    properties_result.all.return_value = [(201,), (202,)]
-
     bill = SimpleNamespace(
         comment="",
         bill_amount=300,
@@ -248,7 +249,7 @@ async def test_get_bills_returns_electricity_data(async_session):
     bills_result = MagicMock()
     bills_result.all.return_value = [(bill, service_period, property_obj, 100.0, 150.0)]
 
-    async_session.execute = AsyncMock(side_effect=[properties_result, bills_result])
+    async_session.execute = AsyncMock(return_value=bills_result)
 
     with (
         patch(
@@ -269,6 +270,8 @@ async def test_get_bills_returns_electricity_data(async_session):
     assert isinstance(response, BillsResponse)
     assert response.bills[0].consumption == 50.0
     assert response.bills[0].property_name == "Villa"
+    # Owner properties and meter readings are resolved inside the single bills query
+    async_session.execute.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -290,13 +293,11 @@ async def test_get_account_returns_balance(async_session):
             new=AsyncMock(),
         ),
         patch(
-            "src.services.balance_service.BalanceCalculationService",
+            "src.services.balance_ledger_service.BalanceLedgerService",
         ) as mock_balance,
     ):
         balance_instance = MagicMock()
-        balance_instance.calculate_account_balance_with_display = AsyncMock(
-            return_value=balance_result
-        )
+        balance_instance.get_account_balance = AsyncMock(return_value=balance_result)
         mock_balance.return_value = balance_instance
 
         response = await get_account(account_id=7, authorization="tma", session=async_session)
@@ -323,10 +324,10 @@ async def test_get_accounts_lists_all_accounts(async_session):
     result.scalars.return_value = scalars
     async_session.execute = AsyncMock(return_value=result)
 
-    balance_results = [
-        SimpleNamespace(balance=100.0, invert_for_display=False),
-        SimpleNamespace(balance=-50.0, invert_for_display=True),
-    ]
+    balance_results = {
+        1: SimpleNamespace(balance=100.0, invert_for_display=False),
+        2: SimpleNamespace(balance=-50.0, invert_for_display=True),
+    }
 
     with (
         patch(
@@ -342,18 +343,112 @@ async def test_get_accounts_lists_all_accounts(async_session):
             new=AsyncMock(),
         ),
         patch(
-            "src.services.balance_service.BalanceCalculationService",
+            "src.services.balance_ledger_service.BalanceLedgerService",
         ) as mock_balance,
     ):
         balance_instance = MagicMock()
-        balance_instance.calculate_account_balance_with_display = AsyncMock(
-            side_effect=balance_results
-        )
+        balance_instance.get_account_balances = AsyncMock(return_value=balance_results)
         mock_balance.return_value = balance_instance
 
         response = await get_accounts(authorization="tma", session=async_session)
 
+    balance_instance.get_account_balances.assert_awaited_once_with([1, 2])
+
     assert isinstance(response, AccountsResponse)
     assert len(response.accounts) == 2
     assert response.accounts[0].account_type == "owner"
     assert response.accounts[1].invert_for_display is True
+
+
+def _patch_dashboard_builders(account_user_id=50):
+    """Patch auth helpers and payload builders used by the dashboard endpoint."""
+    own_session = AsyncMock()
+    session_factory = MagicMock()
+    session_factory.return_value.__aenter__ = AsyncMock(return_value=own_session)
+    session_factory.return_value.__aexit__ = AsyncMock(return_value=False)
+    return own_session, [
+        patch("src.api.mini_app.AsyncReadSessionLocal", session_factory),
+        patch("src.api.mini_app.verify_telegram_auth", new=AsyncMock(return_value=999)),
+        patch(
+            "src.api.mini_app.authorize_account_access",
+            new=AsyncMock(return_value=SimpleNamespace(user_id=account_user_id)),
+        ),
+        patch(
+            "src.api.mini_app._build_account_response",
+            new=AsyncMock(return_value=AccountResponse(balance=10.0, invert_for_display=True)),
+        ),
+        patch(
+            "src.api.mini_app._build_transactions_response",
+            new=AsyncMock(return_value=TransactionsResponse(transactions=[])),
+        ),
+        patch(
+            "src.api.mini_app._build_bills_response",
+            new=AsyncMock(return_value=BillsResponse(bills=[])),
+        ),
+        patch(
+            "src.api.mini_app._build_properties_response",
+            new=AsyncMock(return_value=PropertiesResponse(properties=[], total_count=0)),
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_dashboard_builds_all_datasets_for_owner(async_session):
+    """Dashboard verifies auth once and returns all four datasets."""
+    auth_user = SimpleNamespace(id=1, is_owner=True)
+    auth_context = SimpleNamespace(target_user=SimpleNamespace(id=42))
+    own_session, patches = _patch_dashboard_builders()
+
+    with ExitStack() as stack:
+        mocks = [stack.enter_context(p) for p in patches]
+        stack.enter_context(
+            patch(
+                "src.api.mini_app.get_authenticated_user",
+                new=AsyncMock(return_value=auth_user),
+            )
+        )
+        mock_context = stack.enter_context(
+            patch(
+                "src.api.mini_app.authorize_user_context_access",
+                new=AsyncMock(return_value=auth_context),
+            )
+        )
+        response = await get_dashboard(
+            account_id=7, selected_user_id=42, authorization="tma", session=async_session
+        )
+
+    verify, authorize, build_account, build_transactions, build_bills, build_properties = mocks[1:]
+    assert isinstance(response, DashboardResponse)
+    assert response.account.balance == 10.0
+    assert response.properties is not None
+    verify.assert_awaited_once()
+    authorize.assert_awaited_once_with(async_session, auth_user, 7)
+    mock_context.assert_awaited_once()
+    # Each payload is built in its own session, never the request session
+    build_account.assert_awaited_once_with(own_session, 7)
+    build_transactions.assert_awaited_once_with(own_session, 7, "personal")
+    build_bills.assert_awaited_once_with(own_session, 7, 50)
+    build_properties.assert_awaited_once_with(own_session, 42)
+
+
+@pytest.mark.asyncio
+async def test_get_dashboard_omits_properties_for_non_owner(async_session):
+    """Non-owners get the dashboard without properties."""
+    _, patches = _patch_dashboard_builders(account_user_id=None)
+
+    with ExitStack() as stack:
+        mocks = [stack.enter_context(p) for p in patches]
+        stack.enter_context(
+            patch(
+                "src.api.mini_app.get_authenticated_user",
+                new=AsyncMock(return_value=SimpleNamespace(id=3, is_owner=False)),
+            )
+        )
+        mock_context = stack.enter_context(
+            patch("src.api.mini_app.authorize_user_context_access", new=AsyncMock())
+        )
+        response = await get_dashboard(account_id=8, authorization="tma", session=async_session)
+
+    assert response.properties is None
+    mock_context.assert_not_awaited()
+    mocks[-1].assert_not_awaited()
@@ -6,7 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import HTTPException
-from sqlalchemy.sql.selectable import ScalarSelect
+from sqlalchemy.sql.selectable import CTE
 
 
 class TestExtractInitData:
@@ -425,14 +425,22 @@ class TestBillFormattingHelpers:
         assert response["consumption"] is None
         assert response["property_name"] is None
 
-    def test_build_electricity_reading_subqueries_returns_scalar(self):
-        """Verify helper returns scalar select statements."""
-        from src.api.mini_app import _build_electricity_reading_subqueries
+    def test_build_reading_intervals_cte_exposes_lookup_columns(self):
+        """Verify helper returns a CTE with the reading interval columns."""
+        from sqlalchemy import select
 
-        start_alias, end_alias = _build_electricity_reading_subqueries()
+        from src.api.mini_app import _build_reading_intervals_cte
+        from src.models.property import Property
 
-        assert isinstance(start_alias, ScalarSelect)
-        assert isinstance(end_alias, ScalarSelect)
+        intervals = _build_reading_intervals_cte(select(Property.id))
+
+        assert isinstance(intervals, CTE)
+        assert set(intervals.c.keys()) == {
+            "property_id",
+            "reading_value",
+            "reading_date",
+            "next_reading_date",
+        }
 
 
 class TestUserContextResponseBuilder:
@@ -463,3 +471,153 @@ class TestUserContextResponseBuilder:
         context = await _build_user_context_data(session, target_user)
 
         assert context.roles == ["member"]
+
+
+class TestTransactionsKeysetPagination:
+    """Keyset (date, id) pagination and NDJSON streaming for /transactions."""
+
+    @pytest.fixture
+    async def ledger(self, session):
+        """Two accounts with five transactions, three of them on the same date."""
+        from decimal import Decimal
+
+        from src.models.account import Account, AccountType
+        from src.models.transaction import Transaction
+
+        org = Account(name="Org", account_type=AccountType.ORGANIZATION)
+        owner = Account(name="Owner", account_type=AccountType.OWNER)
+        session.add_all([org, owner])
+        await session.flush()
+        dates = [
+            date(2025, 1, 1),
+            date(2025, 2, 1),
+            date(2025, 2, 1),
+            date(2025, 2, 1),
+            date(2025, 3, 1),
+        ]
+        for index, transaction_date in enumerate(dates, start=1):
+            session.add(
+                Transaction(
+                    from_account_id=owner.id,
+                    to_account_id=org.id,
+                    amount=Decimal(index),
+                    transaction_date=transaction_date,
+                )
+            )
+        await session.commit()
+        return org
+
+    async def test_pages_cover_all_rows_in_order(self, session, ledger):
+        from src.api.mini_app import _build_transactions_response
+
+        full = await _build_transactions_response(session, ledger.id, "all")
+        assert full.next_cursor is None
+        assert [t.amount for t in full.transactions] == [5.0, 4.0, 3.0, 2.0, 1.0]
+
+        pages, cursor = [], None
+        while True:
+            page = await _build_transactions_response(session, ledger.id, "all", 2, cursor)
+            pages.append([t.amount for t in page.transactions])
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        # Same-date rows are split across pages without gaps or duplicates
+        assert pages == [[5.0, 4.0], [3.0, 2.0], [1.0]]
+
+    async def test_invalid_cursor_rejected(self, session, ledger):
+        from src.api.mini_app import _build_transactions_response
+
+        with pytest.raises(HTTPException) as exc:
+            await _build_transactions_response(session, ledger.id, "all", 2, "not-a-cursor")
+        assert exc.value.status_code == 400
+
+    async def test_stream_emits_ndjson_with_next_cursor(self, async_engine, ledger):
+        import json
+
+        from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+        from src.api.mini_app import _stream_transactions_ndjson
+
+        session_factory = async_sessionmaker(async_engine, class_=AsyncSession)
+        with (
+            patch("src.api.mini_app.AsyncReadSessionLocal", session_factory),
+            patch("src.api.mini_app.TRANSACTIONS_STREAM_BATCH_SIZE", 2),
+        ):
+            lines = [
+                json.loads(chunk)
+                async for chunk in _stream_transactions_ndjson(ledger.id, "all", limit=3)
+            ]
+            assert [line["amount"] for line in lines[:3]] == [5.0, 4.0, 3.0]
+            rest = [
+                json.loads(chunk)
+                async for chunk in _stream_transactions_ndjson(
+                    ledger.id, "all", cursor=lines[3]["next_cursor"]
+                )
+            ]
+
+        assert [line["amount"] for line in rest] == [2.0, 1.0]
+
+
+class TestBillsReadingLookup:
+    """Meter readings for /bills come from the windowed reading-interval lookup."""
+
+    async def test_readings_at_period_boundaries(self, session, sample_user):
+        from decimal import Decimal
+
+        from src.api.mini_app import _build_bills_response
+        from src.models.account import Account, AccountType
+        from src.models.bill import Bill, BillType
+        from src.models.electricity_reading import ElectricityReading
+        from src.models.property import Property
+        from src.models.service_period import ServicePeriod
+
+        account = Account(name="Owner", user_id=sample_user.id, account_type=AccountType.OWNER)
+        prop = Property(owner_id=sample_user.id, property_name="House 1", type="house")
+        january = ServicePeriod(
+            name="2025-01", start_date=date(2025, 1, 1), end_date=date(2025, 1, 31)
+        )
+        november = ServicePeriod(
+            name="2024-11", start_date=date(2024, 11, 1), end_date=date(2024, 11, 30)
+        )
+        session.add_all([account, prop, january, november])
+        await session.flush()
+        for reading_date, value in [
+            (date(2024, 12, 1), 100),
+            (date(2024, 12, 20), 120),
+            (date(2025, 1, 15), 150),
+            (date(2025, 2, 10), 200),
+        ]:
+            session.add(
+                ElectricityReading(
+                    property_id=prop.id, reading_date=reading_date, reading_value=Decimal(value)
+                )
+            )
+        for period, bill_type in [
+            (january, BillType.ELECTRICITY),
+            (january, BillType.MAIN),
+            (november, BillType.ELECTRICITY),
+        ]:
+            session.add(
+                Bill(
+                    service_period_id=period.id,
+                    account_id=account.id,
+                    property_id=prop.id,
+                    bill_type=bill_type,
+                    bill_amount=Decimal("10"),
+                )
+            )
+        await session.commit()
+
+        response = await _build_bills_response(session, account.id, sample_user.id)
+
+        readings = {
+            (bill.period_name, bill.bill_type): (bill.start_reading, bill.end_reading)
+            for bill in response.bills
+        }
+        assert len(response.bills) == 3
+        # Latest reading on or before period start (Dec 20) and end (Jan 15)
+        assert readings[("2025-01", "electricity")] == (120.0, 150.0)
+        assert readings[("2025-01", "main")] == (None, None)
+        # No reading exists yet for November
+        assert readings[("2024-11", "electricity")] == (None, None)
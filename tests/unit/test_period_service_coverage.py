@@ -214,6 +214,25 @@ async def test_period_service_list_periods_limit(async_db_session):
     assert len(periods) == 2
 
 
+async def test_period_service_create_period_until(async_db_session):
+    """Test creating a period from its start and end dates."""
+    service = ServicePeriodService(async_db_session)
+    period = await service.create_period_until(date(2025, 9, 1), date(2026, 2, 1), name="Winter")
+
+    assert period.name == "Winter"
+    assert period.period_months == 5
+    assert period.end_date == date(2026, 2, 1)
+
+
+async def test_period_service_create_period_until_rejects_mid_month_end(async_db_session):
+    """Test an end date that is not the first of a month is rejected, not truncated."""
+    service = ServicePeriodService(async_db_session)
+
+    with pytest.raises(ValueError, match="end_date must be the first day"):
+        await service.create_period_until(date(2025, 9, 1), date(2026, 1, 31))
+    assert await service.list_periods() == []
+
+
 def test_period_defaults_dataclass():
     """Test PeriodDefaults dataclass."""
     defaults = PeriodDefaults(
@@ -0,0 +1,300 @@
+"""Query budgets of Mini App endpoints, MCP tools and bill-creation methods.
+
+Each path declares the most SQL statements one call may run with
+``@query_budget`` (src.services.query_stats). Every case here runs on two
+synthetic communities (benchmarks.synthetic) of very different size and fails
+when a call exceeds its budget or issues more statements on the larger
+community, i.e. when a query runs once per row (N+1).
+"""
+
+import asyncio
+import os
+import shutil
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+import src.api.mcp_server as mcp_server
+from benchmarks.service_bench import endpoint_cases, mini_app_client, sign_init_data
+from benchmarks.synthetic import ELECTRICITY_RATE, Community, Scale, build_community
+from src.api.mini_app import router
+from src.models.service_period import PeriodStatus, ServicePeriod
+from src.services.admin_utils import invalidate_admin_cache
+from src.services.auth_service import _verified_init_data
+from src.services.bills_service import BillsService
+from src.services.database import create_async_engines
+from src.services.identity_cache import invalidate_identities
+
+SMALL = Scale(owners=4, years=1)
+LARGE = Scale(owners=40, years=3)
+
+MCP_TOOLS = (
+    "get_balance",
+    "list_bills",
+    "get_period_info",
+    "create_service_period",
+    "create_transaction",
+)
+
+
+@dataclass(frozen=True)
+class _Env:
+    community: Community
+    writer: async_sessionmaker[AsyncSession]
+    reader: async_sessionmaker[AsyncSession]
+
+
+Case = Callable[[_Env, Callable], Awaitable[int]]
+
+
+@pytest.fixture(scope="module")
+def community_databases(tmp_path_factory) -> dict[Scale, tuple[Path, Community]]:
+    """Community database files for both scales, generated once per module."""
+    directory = tmp_path_factory.mktemp("communities")
+
+    async def build(scale: Scale, path: Path) -> Community:
+        writer_engine, reader_engine = create_async_engines(f"sqlite:///{path}")
+        try:
+            return await build_community(writer_engine, scale)
+        finally:
+            await writer_engine.dispose()
+            await reader_engine.dispose()
+
+    databases = {}
+    for scale in (SMALL, LARGE):
+        path = directory / f"community-{scale.owners}.db"
+        databases[scale] = (path, asyncio.run(build(scale, path)))
+    return databases
+
+
+@asynccontextmanager
+async def _open(database: tuple[Path, Community], tmp_path: Path) -> AsyncIterator[_Env]:
+    """Sessions on a private copy of a community database, with cold auth caches."""
+    path, community = database
+    copy = tmp_path / path.name
+    shutil.copy(path, copy)
+    _verified_init_data.clear()
+    invalidate_identities()
+    invalidate_admin_cache()
+
+    writer_engine, reader_engine = create_async_engines(f"sqlite:///{copy}")
+    try:
+        yield _Env(
+            community=community,
+            writer=async_sessionmaker(writer_engine, class_=AsyncSession, expire_on_commit=False),
+            reader=async_sessionmaker(reader_engine, class_=AsyncSession, expire_on_commit=False),
+        )
+    finally:
+        await writer_engine.dispose()
+        await reader_engine.dispose()
+        copy.unlink()
+
+
+def _tool_fn(name: str) -> Callable[..., Awaitable[str]]:
+    # fastmcp 2 wraps decorated tools in a FunctionTool, later versions return the function
+    tool = getattr(mcp_server, name)
+    return getattr(tool, "fn", tool)
+
+
+# === Cases: run the budgeted call once and return its statement count ===
+
+
+def _endpoint_case(name: str) -> Case:
+    async def case(env: _Env, count_queries: Callable) -> int:
+        user_id, path, params = endpoint_cases(env.community)[name]
+        init_data = sign_init_data(
+            env.community.telegram_id(user_id), os.environ["TELEGRAM_BOT_TOKEN"]
+        )
+        async with mini_app_client(env.reader) as client:
+            with count_queries() as stats:
+                response = await client.post(
+                    f"/api/mini-app{path}",
+                    params=params,
+                    headers={"Authorization": f"tma {init_data}"},
+                    json={},
+                )
+        assert response.status_code == 200, response.text
+        return stats.statements
+
+    return case
+
+
+def _tool_case(name: str, arguments: Callable[[Community], dict[str, Any]]) -> Case:
+    async def case(env: _Env, count_queries: Callable) -> int:
+        with patch.object(mcp_server, "_session_maker", env.writer):
+            with count_queries() as stats:
+                result = await _tool_fn(name)(**arguments(env.community))
+        assert '"error"' not in result, result
+        return stats.statements
+
+    return case
+
+
+async def _new_period(env: _Env) -> tuple[int, ServicePeriod]:
+    """Add an empty period to bill and return it with the latest generated period."""
+    async with env.writer() as session:
+        period = ServicePeriod(
+            name="Budget period",
+            start_date=date(2040, 7, 1),
+            end_date=date(2041, 7, 1),
+            status=PeriodStatus.OPEN,
+        )
+        session.add(period)
+        await session.commit()
+        latest = await session.get(ServicePeriod, env.community.latest_period_id)
+        return period.id, latest
+
+
+Creation = Callable[[], Awaitable[Any]]
+
+
+def _bills_case(prepare: Callable[[BillsService, int, ServicePeriod], Awaitable[Creation]]) -> Case:
+    async def case(env: _Env, count_queries: Callable) -> int:
+        period_id, latest = await _new_period(env)
+        async with env.writer() as session:
+            create = await prepare(BillsService(session), period_id, latest)
+            with count_queries() as stats:
+                await create()
+        return stats.statements
+
+    return case
+
+
+# Each prepares the inputs of one create_* call and returns that call, unstarted
+
+
+async def _main(service: BillsService, period_id: int, latest: ServicePeriod) -> Creation:
+    calculations = await service.calculate_main_bills(Decimal("3000000"), 12)
+    return lambda: service.create_main_bills(period_id, calculations)
+
+
+async def _conservation(service: BillsService, period_id: int, latest: ServicePeriod) -> Creation:
+    calculations = await service.calculate_conservation_bills(Decimal("300000"), 12)
+    return lambda: service.create_conservation_bills(period_id, calculations)
+
+
+async def _shared(service: BillsService, period_id: int, latest: ServicePeriod) -> Creation:
+    shares = await service.distribute_shared_costs(Decimal("150000"), latest)
+    return lambda: service.create_shared_electricity_bills(period_id, shares)
+
+
+async def _personal(service: BillsService, period_id: int, latest: ServicePeriod) -> Creation:
+    personal, _total = await service.calculate_personal_electricity_bills_from_readings(
+        service_period=latest, electricity_rate=ELECTRICITY_RATE
+    )
+    return lambda: service.create_personal_electricity_bills(
+        period_id=period_id, personal_bills=personal
+    )
+
+
+async def _personal_and_shared(
+    service: BillsService, period_id: int, latest: ServicePeriod
+) -> Creation:
+    personal, _total = await service.calculate_personal_electricity_bills_from_readings(
+        service_period=latest, electricity_rate=ELECTRICITY_RATE
+    )
+    shares = await service.distribute_shared_costs(Decimal("150000"), latest)
+    return lambda: service.create_personal_and_shared_electricity_bills(
+        period_id=period_id, personal_bills=personal, owner_shares=shares
+    )
+
+
+def _bills_budget(method: str, prepare: Callable) -> tuple[Callable, Case]:
+    return getattr(BillsService, method), _bills_case(prepare)
+
+
+# Case name -> (budgeted function, case)
+CASES: dict[str, tuple[Callable, Case]] = {
+    **{
+        f"mini_app:{name}": (
+            next(r.endpoint for r in router.routes if r.path == f"{router.prefix}{path}"),
+            _endpoint_case(name),
+        )
+        for name, (_user, path, _params) in endpoint_cases(
+            Community(SMALL, 0, (0,), (0,), 0, 0)
+        ).items()
+    },
+    "mcp:get_balance": (
+        _tool_fn("get_balance"),
+        _tool_case("get_balance", lambda c: {"user_id": c.owner_ids[0]}),
+    ),
+    "mcp:list_bills": (
+        _tool_fn("list_bills"),
+        _tool_case("list_bills", lambda c: {"user_id": c.owner_ids[0]}),
+    ),
+    "mcp:get_period_info": (
+        _tool_fn("get_period_info"),
+        _tool_case("get_period_info", lambda c: {"period_id": c.latest_period_id}),
+    ),
+    "mcp:create_service_period": (
+        _tool_fn("create_service_period"),
+        _tool_case(
+            "create_service_period",
+            lambda c: {"name": "Next", "start_date": "2050-07-01", "end_date": "2051-07-01"},
+        ),
+    ),
+    "mcp:create_transaction": (
+        _tool_fn("create_transaction"),
+        _tool_case(
+            "create_transaction",
+            lambda c: {
+                "from_account_id": c.owner_account_ids[0],
+                "to_account_id": c.organization_account_id,
+                "amount": 100.0,
+                "description": "Contribution",
+            },
+        ),
+    ),
+    "bills:create_main_bills": _bills_budget("create_main_bills", _main),
+    "bills:create_conservation_bills": _bills_budget("create_conservation_bills", _conservation),
+    "bills:create_shared_electricity_bills": _bills_budget(
+        "create_shared_electricity_bills", _shared
+    ),
+    "bills:create_personal_electricity_bills": _bills_budget(
+        "create_personal_electricity_bills", _personal
+    ),
+    "bills:create_personal_and_shared_electricity_bills": _bills_budget(
+        "create_personal_and_shared_electricity_bills", _personal_and_shared
+    ),
+}
+
+
+@pytest.mark.unit
+def test_every_endpoint_tool_and_bill_creation_method_declares_a_budget():
+    budgeted = [
+        *(route.endpoint for route in router.routes),
+        *(_tool_fn(name) for name in MCP_TOOLS),
+        *(getattr(BillsService, name) for name in dir(BillsService) if name.startswith("create_")),
+    ]
+
+    assert [f.__qualname__ for f in budgeted if not hasattr(f, "query_budget")] == []
+    assert {id(f) for f in budgeted} == {id(function) for function, _case in CASES.values()}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("name", list(CASES))
+async def test_statement_count_is_within_budget_and_independent_of_data_size(
+    name, community_databases, tmp_path, count_queries
+):
+    budgeted, case = CASES[name]
+
+    counts = []
+    for scale in (SMALL, LARGE):
+        async with _open(community_databases[scale], tmp_path) as env:
+            counts.append(await case(env, count_queries))
+
+    small, large = counts
+    assert large == small, (
+        f"{name} ran {small} statements for {SMALL.owners} owners but {large} for "
+        f"{LARGE.owners}: a query runs per row (N+1)"
+    )
+    assert large <= budgeted.query_budget, (
+        f"{name} ran {large} statements, over its budget of {budgeted.query_budget}"
+    )
@@ -0,0 +1,75 @@
+"""Tests for the synthetic community generator and the service benchmark harness."""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from benchmarks.service_bench import SERVICE_CASES, endpoint_cases, run_scale
+from benchmarks.synthetic import ELECTRICITY_RATE, Scale, build_community, generate_rows
+from src.api.mini_app import router
+from src.models.bill import Bill, BillType
+from src.models.service_period import ServicePeriod
+from src.services.bills_service import BillsService
+from src.services.database import create_async_engines
+
+
+@pytest.mark.unit
+def test_generate_rows_is_deterministic_per_seed():
+    scale = Scale(owners=12, years=2)
+
+    first, community = generate_rows(scale)
+    second, _ = generate_rows(scale)
+    other_seed, _ = generate_rows(Scale(owners=12, years=2, seed=7))
+
+    assert first.tables == second.tables
+    assert first.tables != other_seed.tables
+    assert len(community.owner_ids) == 12
+    assert community.latest_period_id == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_electricity_bills_match_generated_readings(tmp_path):
+    writer_engine, reader_engine = create_async_engines(f"sqlite:///{tmp_path / 'synthetic.db'}")
+    try:
+        community = await build_community(writer_engine, Scale(owners=10, years=2))
+        reader = async_sessionmaker(reader_engine, class_=AsyncSession, expire_on_commit=False)
+        async with reader() as session:
+            period = await session.get(ServicePeriod, community.latest_period_id)
+            personal, total = await BillsService(
+                session
+            ).calculate_personal_electricity_bills_from_readings(
+                service_period=period, electricity_rate=ELECTRICITY_RATE
+            )
+            billed = (
+                await session.execute(
+                    select(func.sum(Bill.bill_amount)).where(
+                        Bill.service_period_id == period.id,
+                        Bill.bill_type == BillType.ELECTRICITY,
+                    )
+                )
+            ).scalar_one()
+    finally:
+        await writer_engine.dispose()
+        await reader_engine.dispose()
+
+    assert personal
+    assert total == Decimal(billed)
+    assert community.rows["account_balances"] == community.rows["accounts"]
+    assert community.rows["latest_electricity_readings"] == len(personal)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_scale_covers_services_and_every_mini_app_endpoint(tmp_path):
+    report = await run_scale(Scale(owners=6, years=1), repeat=1, database_dir=tmp_path)
+
+    measured = {(case.group, case.name) for case in report.cases}
+    assert {(group, name) for group, cases in SERVICE_CASES.items() for name in cases} <= measured
+    _, community = generate_rows(report.scale)
+    endpoints = {path for _, path, _ in endpoint_cases(community).values()}
+    assert {route.path.removeprefix(router.prefix) for route in router.routes} == endpoints
+    assert all(case.runs == 1 and case.p50 <= case.max for case in report.cases)
+    assert report.rows["transactions"] > 0
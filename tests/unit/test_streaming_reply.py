@@ -0,0 +1,79 @@
+"""Tests for the progressively edited /ask reply."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.bot.streaming_reply import CURSOR, StreamingReply, split_message
+from src.services.telegram_fanout import TelegramRateLimiter
+
+
+def _message():
+    reply = MagicMock()
+    reply.edit_text = AsyncMock()
+    message = MagicMock()
+    message.chat_id = 123
+    message.reply_text = AsyncMock(return_value=reply)
+    return message, reply
+
+
+def _limiter():
+    return TelegramRateLimiter(global_rate=1000, per_chat_rate=1000)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_finish_without_updates_is_a_plain_reply():
+    message, reply = _message()
+    streaming = StreamingReply(message, rate_limiter=_limiter())
+
+    await streaming.finish("Answer")
+
+    message.reply_text.assert_awaited_once_with("Answer")
+    reply.edit_text.assert_not_awaited()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_updates_are_coalesced_between_edits():
+    message, reply = _message()
+    streaming = StreamingReply(message, min_interval=0.05, rate_limiter=_limiter())
+
+    await streaming.update("Y")
+    await asyncio.sleep(0.01)  # first token is shown right away
+    for text in ("Yo", "You", "Your"):
+        await streaming.update(text)
+    await asyncio.sleep(0.1)
+
+    message.reply_text.assert_awaited_once_with("Y" + CURSOR)
+    # The three quick updates collapse into one edit with the newest text
+    reply.edit_text.assert_awaited_once_with("Your" + CURSOR)
+
+    await streaming.finish("Your balance")
+
+    assert reply.edit_text.await_args_list[-1].args == ("Your balance",)
+    assert streaming.edits == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_finish_continues_long_answer_in_new_messages():
+    message, reply = _message()
+    streaming = StreamingReply(message, min_interval=0, rate_limiter=_limiter())
+    await streaming.update("Start")
+    await asyncio.sleep(0.01)
+
+    await streaming.finish("a" * 5000)
+
+    assert reply.edit_text.await_args.args == ("a" * 4096,)
+    assert message.reply_text.await_args.args == ("a" * 904,)
+
+
+@pytest.mark.unit
+def test_split_message_prefers_line_breaks():
+    text = "x" * 10 + "\n" + "y" * 10
+
+    assert split_message(text, limit=15) == ["x" * 10, "y" * 10]
+    assert split_message("z" * 20, limit=15) == ["z" * 15, "z" * 5]
+    assert split_message("short") == ["short"]
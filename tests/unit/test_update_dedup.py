@@ -0,0 +1,59 @@
+"""Tests for the webhook update_id dedup window."""
+
+import pytest
+from sqlalchemy import select
+
+from src.bot.update_dedup import UpdateDeduplicator
+from src.models.processed_update import ProcessedUpdate
+
+
+@pytest.mark.unit
+def test_remember_reports_duplicates_within_window():
+    dedup = UpdateDeduplicator(window=3)
+
+    assert dedup.remember(1) is True
+    assert dedup.remember(1) is False
+    assert dedup.duplicates == 1
+
+    for update_id in (2, 3, 4):
+        assert dedup.remember(update_id) is True
+    # 1 fell out of the window
+    assert 1 not in dedup
+    assert len(dedup) == 3
+    assert dedup.remember(1) is True
+
+
+@pytest.mark.unit
+def test_forget_allows_redelivery():
+    dedup = UpdateDeduplicator(window=3)
+    dedup.remember(10)
+    dedup.remember(11)
+
+    dedup.forget(10)
+
+    assert 10 not in dedup
+    assert dedup.remember(10) is True
+    dedup.forget(999)  # unknown ids are ignored
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_flush_and_load_roundtrip_prunes_old_rows(session):
+    dedup = UpdateDeduplicator(window=2)
+    for update_id in (100, 101):
+        dedup.remember(update_id)
+    assert await dedup.flush(session) == 2
+    await session.commit()
+
+    dedup.remember(102)
+    assert await dedup.flush(session) == 1
+    await session.commit()
+    assert await dedup.flush(session) == 0
+
+    stored = (await session.execute(select(ProcessedUpdate.update_id))).scalars().all()
+    assert sorted(stored) == [101, 102]
+
+    restored = UpdateDeduplicator(window=2)
+    await restored.load(session)
+    assert restored.remember(102) is False
+    assert restored.remember(100) is True
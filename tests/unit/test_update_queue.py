@@ -0,0 +1,102 @@
+"""Unit tests for the webhook UpdateQueue."""
+
+import asyncio
+
+import pytest
+from telegram import Update
+
+from src.bot.update_queue import UpdateQueue
+
+
+def _update(update_id: int, chat_id: int) -> Update:
+    return Update.de_json(
+        {
+            "update_id": update_id,
+            "message": {
+                "message_id": update_id,
+                "date": 1234567890,
+                "chat": {"id": chat_id, "type": "private"},
+                "from": {"id": chat_id, "is_bot": False, "first_name": "Test"},
+                "text": f"message {update_id}",
+            },
+        },
+        None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_keeps_chat_order_and_runs_chats_in_parallel():
+    """Updates of one chat run in order; a slow chat does not block another."""
+    events = []
+    release_slow_chat = asyncio.Event()
+
+    async def process(update: Update):
+        chat_id = update.effective_chat.id
+        events.append(("start", update.update_id))
+        if chat_id == 1:
+            await release_slow_chat.wait()
+        events.append(("end", update.update_id))
+
+    queue = UpdateQueue(process, workers=4, maxsize=10)
+    queue.start()
+    for update_id, chat_id in [(1, 1), (2, 1), (3, 2), (4, 2)]:
+        assert queue.submit(_update(update_id, chat_id))
+
+    # Chat 2 finishes while chat 1 is still stuck on its first update
+    while ("end", 4) not in events:
+        await asyncio.sleep(0)
+    assert ("start", 2) not in events
+    assert queue.stats().in_flight == 1
+
+    release_slow_chat.set()
+    await queue.join()
+    await queue.stop()
+
+    chat_1 = [event for event in events if event[1] in (1, 2)]
+    assert chat_1 == [("start", 1), ("end", 1), ("start", 2), ("end", 2)]
+    assert queue.stats().processed == 4
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_full_and_counts_failures():
+    """A full queue refuses updates; handler errors are counted, not raised."""
+    gate = asyncio.Event()
+
+    async def process(update: Update):
+        await gate.wait()
+        raise RuntimeError("handler failed")
+
+    queue = UpdateQueue(process, workers=1, maxsize=2)
+    queue.start()
+    assert queue.submit(_update(1, 1))
+    await asyncio.sleep(0)  # Worker picks up update 1
+    assert queue.submit(_update(2, 1))
+    assert queue.submit(_update(3, 1))
+    assert not queue.submit(_update(4, 1))
+
+    gate.set()
+    await queue.stop()
+
+    stats = queue.stats()
+    assert (stats.processed, stats.failed, stats.rejected, stats.max_pending) == (3, 3, 1, 2)
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_queued_updates_and_refuses_new_ones():
+    """stop() waits for accepted updates and then stops accepting."""
+    processed = []
+
+    async def process(update: Update):
+        await asyncio.sleep(0.01)
+        processed.append(update.update_id)
+
+    queue = UpdateQueue(process, workers=2, maxsize=10)
+    queue.start()
+    for update_id in range(5):
+        queue.submit(_update(update_id, update_id % 2))
+
+    await queue.stop(timeout=5)
+
+    assert sorted(processed) == [0, 1, 2, 3, 4]
+    assert not queue.running
+    assert not queue.submit(_update(99, 1))
@@ -1,6 +1,10 @@
 """Expanded tests for UserService covering all methods and branches."""
 
+import hashlib
+import hmac
+import time
 from unittest.mock import AsyncMock, MagicMock
+from urllib.parse import urlencode
 
 import pytest
 
@@ -8,6 +12,15 @@ from src.models.user import User
 from src.services.user_service import UserService
 
 
+def _signed_init_data(bot_token: str, auth_date: int) -> str:
+    """Build init data signed the way Telegram does."""
+    fields = {"auth_date": str(auth_date), "user": '{"id":123}'}
+    data_check_string = "\n".join(f"{k}={v}" for k, v in sorted(fields.items()))
+    secret_key = hmac.new(b"WebAppData", bot_token.encode(), hashlib.sha256).digest()
+    fields["hash"] = hmac.new(secret_key, data_check_string.encode(), hashlib.sha256).hexdigest()
+    return urlencode(fields)
+
+
 class TestUserServiceGetByTelegramId:
     """Tests for get_by_telegram_id method."""
 
@@ -322,3 +335,37 @@ class TestUserServiceVerifyTelegramSignature:
             bot_token="test_token",  # type: ignore
         )
         assert result is None
+
+    def test_verify_signature_valid_fresh(self) -> None:
+        """Test verify signature accepts correctly signed, fresh init data."""
+        init_data = _signed_init_data("test_token", int(time.time()))
+        result = UserService.verify_telegram_webapp_signature(
+            init_data=init_data, bot_token="test_token"
+        )
+        assert result is not None
+        assert result["user"] == '{"id":123}'
+        assert "hash" not in result
+
+    def test_verify_signature_rejects_expired_auth_date(self) -> None:
+        """Test verify signature returns None when auth_date is outside the window."""
+        init_data = _signed_init_data("test_token", int(time.time()) - 3600)
+        result = UserService.verify_telegram_webapp_signature(
+            init_data=init_data, bot_token="test_token", max_age=60
+        )
+        assert result is None
+
+    def test_verify_signature_rejects_future_auth_date(self) -> None:
+        """Test verify signature returns None when auth_date is far in the future."""
+        init_data = _signed_init_data("test_token", int(time.time()) + 3600)
+        result = UserService.verify_telegram_webapp_signature(
+            init_data=init_data, bot_token="test_token"
+        )
+        assert result is None
+
+    def test_verify_signature_wrong_token(self) -> None:
+        """Test verify signature returns None when signed with another bot token."""
+        init_data = _signed_init_data("other_token", int(time.time()))
+        result = UserService.verify_telegram_webapp_signature(
+            init_data=init_data, bot_token="test_token"
+        )
+        assert result is None